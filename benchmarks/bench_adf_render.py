@@ -0,0 +1,55 @@
+"""
+ADFドキュメントのテキスト変換速度を計測するベンチマーク。
+
+fixtures.py の合成ドキュメント (ネストしたテーブル・リスト) を使い、
+従来の AdfDocument.to_plain_text() と adf_renderer の各レンダラー (検証済みモデル / 生の dict) を比較します。
+
+Usage:
+    cd benchmarks && PYTHONPATH=../src python bench_adf_render.py [--repeat 10] [--depth 3]
+"""
+import argparse
+import io
+import statistics
+import time
+import typing
+
+from fixtures import build_document, count_nodes
+
+from jira_api_client.adf_renderer import render_html, render_markdown, render_plain_text
+from jira_api_client.models.issue import AdfDocument
+
+
+def measure(func: typing.Callable[[], typing.Any], repeat: int) -> typing.List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="計測回数 (デフォルト: 10)")
+    parser.add_argument("--depth", type=int, default=3, help="テーブル・リストのネストの深さ (デフォルト: 3)")
+    args = parser.parse_args()
+
+    raw = build_document(args.depth, with_unknown=True)
+    document = AdfDocument.model_validate(raw)
+    cases = {
+        "to_plain_text (legacy)": document.to_plain_text,
+        "render_plain_text (model)": lambda: render_plain_text(document),
+        "render_plain_text (dict)": lambda: render_plain_text(raw),
+        "render_markdown (dict)": lambda: render_markdown(raw),
+        "render_html (dict)": lambda: render_html(raw),
+        "render_html (stream)": lambda: render_html(raw, io.StringIO()),
+    }
+    print(f"nodes: {count_nodes(raw)}, depth: {args.depth}, repeat: {args.repeat}")
+    for name, func in cases.items():
+        func()  # ウォームアップ
+        timings = measure(func, args.repeat)
+        print(f"{name:<28} median {statistics.median(timings) * 1000:8.2f} ms   min {min(timings) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+ADFドキュメントの検証速度を計測するベンチマーク。
+
+深くネストしたテーブル・リストを含む説明文を合成し、AdfDocument.model_validate() の所要時間を計測します。
+未知のノード (panel, mention, emoji, status など) を混ぜたドキュメントも検証できることを確認します。
+
+Usage:
+    cd benchmarks && PYTHONPATH=../src python bench_adf_validation.py [--repeat 20] [--depth 4]
+"""
+import argparse
+import statistics
+import time
+import typing
+
+from fixtures import build_document, count_nodes
+from pydantic import ValidationError
+
+from jira_api_client.models.issue import AdfDocument
+
+
+def measure(document: typing.Dict[str, typing.Any], repeat: int) -> typing.List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        AdfDocument.model_validate(document)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="計測回数 (デフォルト: 20)")
+    parser.add_argument("--depth", type=int, default=4, help="テーブル・リストのネストの深さ (デフォルト: 4)")
+    args = parser.parse_args()
+
+    document = build_document(args.depth)
+    AdfDocument.model_validate(document)  # ウォームアップ
+    timings = measure(document, args.repeat)
+    print(f"nodes: {count_nodes(document)}, depth: {args.depth}, repeat: {args.repeat}")
+    print(f"validate: median {statistics.median(timings) * 1000:.2f} ms, min {min(timings) * 1000:.2f} ms")
+
+    try:
+        AdfDocument.model_validate(build_document(args.depth, with_unknown=True))
+        print("unknown nodes: accepted")
+    except ValidationError as e:
+        print(f"unknown nodes: rejected ({e.error_count()} errors)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+パッケージのインポートとクライアント生成のコールドスタート時間を計測するベンチマーク。
+
+CLIツールやサーバーレス関数の起動を想定し、毎回新しいPythonプロセスで以下の時間を計測して中央値・最小値を表示します。
+    import jira_api_client                    パッケージのインポート
+    from jira_api_client import JiraClinet    クライアントクラスのインポート (requests とモデルの読み込み)
+    JiraClinet(...)                           クライアントの生成
+    create_ticket payload                     チケット作成の応答 (JiraCreatedIssue) の初回検証
+    first JiraIssue validation                課題の初回検証 (遅延していたスキーマ構築を含む)
+
+--profile を指定すると、python -X importtime の結果から累積時間の大きいモジュールを表示します。
+
+Usage:
+    cd benchmarks && PYTHONPATH=../src python bench_import_time.py [--runs 10] [--profile]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import typing
+
+from fixtures import build_issue
+
+# 新しいプロセスで実行する計測コード。各段階の累積ではなく、段階ごとの所要時間 (ミリ秒) を出力する
+_SCRIPT = """
+import json, sys, time
+timings = {}
+t = time.perf_counter()
+import jira_api_client
+timings["import jira_api_client"] = time.perf_counter() - t
+t = time.perf_counter()
+from jira_api_client import JiraClinet
+timings["from jira_api_client import JiraClinet"] = time.perf_counter() - t
+t = time.perf_counter()
+client = JiraClinet("https://example.atlassian.net/rest/api/3", "bench@example.com", "token")
+timings["JiraClinet(...)"] = time.perf_counter() - t
+t = time.perf_counter()
+from jira_api_client.models.ticket_create import JiraCreatedIssue
+JiraCreatedIssue.model_validate_json(b'{"id": "1", "key": "PROJ-1", "self": "https://example/1"}')
+timings["create_ticket payload"] = time.perf_counter() - t
+t = time.perf_counter()
+from jira_api_client.models.issue import JiraIssue
+JiraIssue.model_validate_json(sys.stdin.buffer.read())
+timings["first JiraIssue validation"] = time.perf_counter() - t
+client.close()
+print(json.dumps({name: seconds * 1000 for name, seconds in timings.items()}))
+"""
+
+
+def _env() -> typing.Dict[str, str]:
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_once(issue: bytes) -> typing.Dict[str, float]:
+    """新しいPythonプロセスで1回計測し、段階ごとの所要時間 (ミリ秒) を返します。"""
+    completed = subprocess.run([sys.executable, "-c", _SCRIPT],
+                               input=issue,
+                               capture_output=True,
+                               env=_env(),
+                               check=True)
+    return json.loads(completed.stdout)
+
+
+def profile_imports(top: int) -> typing.List[typing.Tuple[str, int]]:
+    """python -X importtime で JiraClinet のインポートを計測し、累積時間 (マイクロ秒) の大きい順にモジュールを返します。"""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", "from jira_api_client import JiraClinet"],
+                               capture_output=True,
+                               text=True,
+                               env=_env(),
+                               check=True)
+    modules = []
+    for line in completed.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        modules.append((parts[2].rstrip(), int(parts[1])))
+    return sorted(modules, key=lambda module: module[1], reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="計測するプロセスの数 (デフォルト: 10)")
+    parser.add_argument("--profile", action="store_true", help="インポート時間の大きいモジュールを表示する")
+    parser.add_argument("--top", type=int, default=20, help="--profile で表示するモジュール数 (デフォルト: 20)")
+    args = parser.parse_args()
+
+    issue = json.dumps(build_issue(1)).encode()
+    runs = [measure_once(issue) for _ in range(args.runs)]
+    print(f"runs: {args.runs}, python: {sys.version.split()[0]}")
+    for name in runs[0]:
+        values = [run[name] for run in runs]
+        print(f"{name:<40} median {statistics.median(values):8.1f} ms   min {min(values):8.1f} ms")
+
+    if args.profile:
+        print()
+        print(f"{'cumulative':>12}  module")
+        for module, cumulative in profile_imports(args.top):
+            print(f"{cumulative / 1000:9.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
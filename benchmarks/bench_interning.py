@@ -0,0 +1,53 @@
+"""
+検索結果のエンティティ共有 (JiraInternCache) によるメモリ使用量と解析時間の変化を計測するベンチマーク。
+
+少数のユーザー・ステータス・プロジェクトを使い回した合成の検索結果ページを作り、
+JiraSearchPageParser で共有なし / ありの FULL モードで解析したときの確保メモリ (tracemalloc) と所要時間を比較します。
+
+Usage:
+    cd benchmarks && PYTHONPATH=../src python bench_interning.py [--issues 5000] [--users 20]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+import typing
+
+from fixtures import build_issue
+
+from jira_api_client.models.base import JiraParseModeEnum
+from jira_api_client.models.interning import JiraInternCache
+from jira_api_client.parsing import JiraSearchPageParser
+
+
+def measure(content: bytes, cache: typing.Optional[JiraInternCache]) -> typing.Tuple[float, int]:
+    """解析に要した時間 (秒) と、解析結果が保持しているメモリ (バイト) を返します。"""
+    parser = JiraSearchPageParser(False, JiraParseModeEnum.FULL, intern_cache=cache)
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = parser.parse_json(content)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return elapsed, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, default=5000, help="1ページの課題数 (デフォルト: 5000)")
+    parser.add_argument("--users", type=int, default=20, help="課題に現れるユーザーの種類 (デフォルト: 20)")
+    args = parser.parse_args()
+
+    content = json.dumps({
+        "issues": [build_issue(n, users=args.users, adf_depth=0, attachments=0) for n in range(args.issues)],
+        "isLast": True
+    }).encode()
+    print(f"issues: {args.issues}, users: {args.users}, body: {len(content) / 1024 / 1024:.1f} MiB")
+    for name, cache in (("no interning", None), ("interning", JiraInternCache())):
+        elapsed, memory = measure(content, cache)
+        print(f"{name:<14} parse {elapsed * 1000:8.1f} ms   retained {memory / 1024 / 1024:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
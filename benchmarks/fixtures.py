@@ -0,0 +1,286 @@
+"""
+ベンチマーク用の合成データ (Jira REST API のレスポンスと同じ形式の課題・ADFドキュメント)。
+
+課題は実際の Jira Cloud のレスポンスに近い構造 (ユーザー・ステータス・プロジェクトの入れ子、カスタムフィールド、
+添付ファイル、深くネストした説明 (ADF)) を持ち、同じ番号からは常に同じ内容が生成されます。
+実際の Jira から記録したレスポンスを使う場合は record_search_page() で保存し、load_search_page() で読み込みます。
+"""
+import json
+import typing
+
+if typing.TYPE_CHECKING:
+    from jira_api_client.jira_client import JiraClinet
+
+BASE_URL = "https://example.atlassian.net/rest/api/3"
+
+# --- ADF (Atlassian Document Format) ---
+
+
+def _text(value: str) -> typing.Dict[str, typing.Any]:
+    return {"type": "text", "text": value}
+
+
+def _paragraph(value: str) -> typing.Dict[str, typing.Any]:
+    return {"type": "paragraph", "content": [_text(value), {"type": "hardBreak"}, _text(value.upper())]}
+
+
+def nested_list(depth: int, width: int) -> typing.Dict[str, typing.Any]:
+    """depth 段にネストした箇条書き・番号付きリストを返します。"""
+    items = []
+    for i in range(width):
+        content = [_paragraph(f"item {depth}-{i}")]
+        if depth > 1:
+            content.append(nested_list(depth - 1, width))
+        items.append({"type": "listItem", "content": content})
+    return {"type": "bulletList" if depth % 2 else "orderedList", "content": items}
+
+
+def nested_table(depth: int, rows: int, cols: int) -> typing.Dict[str, typing.Any]:
+    """各セルに段落・リスト・さらに内側のテーブルを含む、depth 段にネストしたテーブルを返します。"""
+    table_rows = []
+    for r in range(rows):
+        cells = []
+        for c in range(cols):
+            content: typing.List[typing.Dict[str, typing.Any]] = [_paragraph(f"cell {depth}-{r}-{c}")]
+            if depth > 1 and c == 0:
+                content.append(nested_table(depth - 1, rows, cols))
+            else:
+                content.append(nested_list(2, 2))
+            cells.append({"type": "tableHeader" if r == 0 else "tableCell", "attrs": {}, "content": content})
+        table_rows.append({"type": "tableRow", "content": cells})
+    return {"type": "table", "attrs": {"layout": "default"}, "content": table_rows}
+
+
+def _node(node_type: str, **attrs: typing.Any) -> typing.Dict[str, typing.Any]:
+    return {"type": node_type, "attrs": attrs}
+
+
+def unknown_nodes() -> typing.List[typing.Dict[str, typing.Any]]:
+    """このライブラリがモデルを持たないノードを含むブロックのリストを返します。"""
+    panel = {**_node("panel", panelType="info"), "content": [_paragraph("panel body")]}
+    inline = [
+        _node("mention", id="acc-1", text="@User"),
+        _node("emoji", shortName=":smile:"),
+        _node("status", text="DONE", color="green"),
+        _node("date", timestamp="1700000000000"),
+    ]
+    return [panel, {"type": "paragraph", "content": inline}]
+
+
+def build_document(depth: int, with_unknown: bool = False) -> typing.Dict[str, typing.Any]:
+    """ネストしたテーブル・リストを含むADFドキュメントを返します。depth が 0 の場合は段落のみ。"""
+    content = [_paragraph("intro")]
+    if depth > 0:
+        content.extend([nested_table(depth, 3, 3), nested_list(depth + 1, 3)])
+    if with_unknown:
+        content.extend(unknown_nodes())
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def count_nodes(node: typing.Any) -> int:
+    if isinstance(node, dict):
+        return 1 + sum(count_nodes(child) for child in node.get("content", ()))
+    return 0
+
+
+# --- 課題 ---
+
+
+def user(index: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "self": f"{BASE_URL}/user?accountId=acc-{index}",
+        "accountId": f"acc-{index}",
+        "emailAddress": f"user{index}@example.com",
+        "displayName": f"User {index}",
+        "active": True,
+        "timeZone": "Asia/Tokyo",
+        "avatarUrls": {
+            size: f"https://avatar.example.com/acc-{index}/{size}"
+            for size in ("16x16", "24x24", "32x32", "48x48")
+        },
+        "accountType": "atlassian",
+    }
+
+
+_STATUS_CATEGORIES = [
+    {
+        "self": f"{BASE_URL}/statuscategory/2",
+        "id": 2,
+        "key": "new",
+        "colorName": "blue-gray",
+        "name": "To Do"
+    },
+    {
+        "self": f"{BASE_URL}/statuscategory/4",
+        "id": 4,
+        "key": "indeterminate",
+        "colorName": "yellow",
+        "name": "In Progress"
+    },
+    {
+        "self": f"{BASE_URL}/statuscategory/3",
+        "id": 3,
+        "key": "done",
+        "colorName": "green",
+        "name": "Done"
+    },
+]
+
+
+def status(index: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "self": f"{BASE_URL}/status/{index}",
+        "description": "",
+        "iconUrl": f"https://example.atlassian.net/images/icons/statuses/{index}.png",
+        "name": f"Status {index}",
+        "id": str(index),
+        "statusCategory": _STATUS_CATEGORIES[index % len(_STATUS_CATEGORIES)],
+    }
+
+
+def _progress() -> typing.Dict[str, int]:
+    return {"progress": 0, "total": 0}
+
+
+def _timestamp(day: int, hour: int = 9) -> str:
+    return f"2024-{1 + day // 28 % 12:02d}-{1 + day % 28:02d}T{hour:02d}:00:00.000+0900"
+
+
+def attachment(issue_number: int, index: int, size: int = 1024) -> typing.Dict[str, typing.Any]:
+    attachment_id = str(issue_number * 10 + index)
+    return {
+        "id": attachment_id,
+        "self": f"{BASE_URL}/attachment/{attachment_id}",
+        "filename": f"file-{attachment_id}.bin",
+        "author": user(index),
+        "created": _timestamp(issue_number),
+        "size": size,
+        "mimeType": "application/octet-stream",
+        "content": f"{BASE_URL}/attachment/content/{attachment_id}",
+    }
+
+
+def build_issue(n: int,
+                users: int = 20,
+                adf_depth: int = 1,
+                attachments: int = 1,
+                project_key: str = "PROJ",
+                base_url: str = BASE_URL) -> typing.Dict[str, typing.Any]:
+    """
+    番号 n の課題 (/search/jql のレスポンスの issues の要素) を返します。
+
+    Args:
+        n (int): 課題の番号 (キーは '{project_key}-{n}')。
+        users (int): 担当者・報告者などに使うユーザーの種類。
+        adf_depth (int): 説明 (ADF) のテーブル・リストのネストの深さ。
+        attachments (int): 添付ファイルの数。
+        project_key (str): プロジェクトキー。
+        base_url (str): self や添付ファイルのURLに使うベースURL。
+    """
+    fields = {
+        "summary": f"Issue {n}: synthetic benchmark payload",
+        "statuscategorychangedate": _timestamp(n),
+        "statusCategory": _STATUS_CATEGORIES[n % len(_STATUS_CATEGORIES)],
+        "resolution": None,
+        "labels": [f"label-{n % 7}", "benchmark"],
+        "lastViewed": None,
+        "priority": {
+            "self": f"{base_url}/priority/3",
+            "iconUrl": "https://example/p.svg",
+            "name": "Medium",
+            "id": "3"
+        },
+        "versions": [],
+        "fixVersions": [],
+        "issuelinks": [],
+        "assignee": user(n % users) if n % 5 else None,
+        "status": status(n % 4),
+        "components": [],
+        "timeestimate": 3600 * (n % 8) if n % 3 else None,
+        "creator": user((n + 1) % users),
+        "subtasks": [],
+        "reporter": user((n + 2) % users),
+        "aggregateprogress": _progress(),
+        "progress": _progress(),
+        "votes": {
+            "self": f"{base_url}/issue/{n}/votes",
+            "votes": 0,
+            "hasVoted": False
+        },
+        "issuetype": {
+            "self": f"{base_url}/issuetype/1",
+            "id": "1",
+            "name": "Task",
+            "subtask": False
+        },
+        "timespent": 600 * (n % 13) if n % 2 else None,
+        "project": {
+            "self": f"{base_url}/project/1",
+            "id": "1",
+            "key": project_key,
+            "name": "Benchmark Project",
+            "projectTypeKey": "software",
+            "simplified": False,
+            "avatarUrls": {
+                "48x48": "https://avatar.example.com/project/48"
+            },
+        },
+        "resolutiondate": _timestamp(n + 3, 18) if n % 4 == 0 else None,
+        "workratio": -1,
+        "watches": {
+            "self": f"{base_url}/issue/{n}/watchers",
+            "watchCount": 1,
+            "isWatching": False
+        },
+        "created": _timestamp(n),
+        "updated": _timestamp(n + 1, 12),
+        "attachment": [attachment(n, i) for i in range(attachments)],
+        "timeoriginalestimate": 7200 if n % 3 else None,
+        "description": build_document(adf_depth, with_unknown=n % 2 == 0),
+        "duedate": None,
+        "customfield_10010": None,
+        "customfield_10020": [{
+            "id": n % 10,
+            "name": f"Sprint {n % 10}",
+            "state": "active"
+        }],
+    }
+    for attachment_dict in fields["attachment"]:
+        attachment_dict["self"] = attachment_dict["self"].replace(BASE_URL, base_url)
+        attachment_dict["content"] = attachment_dict["content"].replace(BASE_URL, base_url)
+    return {
+        "expand": "renderedFields,names,schema,operations,editmeta,changelog,versionedRepresentations",
+        "id": str(10000 + n),
+        "self": f"{base_url}/issue/{10000 + n}",
+        "key": f"{project_key}-{n}",
+        "fields": fields,
+    }
+
+
+def build_search_page(start: int, count: int, **kwargs: typing.Any) -> typing.Dict[str, typing.Any]:
+    """番号 start から count 件の課題を含む /search/jql のレスポンス (最後のページ) を返します。"""
+    return {"issues": [build_issue(n, **kwargs) for n in range(start, start + count)], "isLast": True}
+
+
+# --- 記録したレスポンス ---
+
+
+def record_search_page(client: "JiraClinet", jql: str, path: str, max_results: int = 100) -> int:
+    """
+    実際の Jira の検索結果を、モックサーバーで再生できるJSONファイルとして保存します。
+
+    Returns:
+        int: 保存した課題の件数。
+    """
+    from jira_api_client.models.base import JiraParseModeEnum
+
+    results = client.get_tickets_by_jql(jql, max_results=max_results, parse_mode=JiraParseModeEnum.RAW)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"issues": results.issues, "isLast": True}, f, ensure_ascii=False)
+    return len(results.issues)
+
+
+def load_search_page(path: str) -> typing.List[typing.Dict[str, typing.Any]]:
+    """record_search_page() で保存したファイルから課題のリストを読み込みます。"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["issues"]
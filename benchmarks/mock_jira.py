@@ -0,0 +1,309 @@
+"""
+ベンチマーク用のローカルで動作する Jira REST API のモックサーバー。
+
+以下のエンドポイントを実装しています (パスは base_url からの相対パス)。
+    GET  search/jql                      nextPageToken によるページング、fields による射影
+    POST issue                           課題の作成
+    POST issue/bulk                      課題の一括作成
+    POST issue/bulkfetch                 課題の一括取得 (移動前のキー 'OLD-{n}' は 'PROJ-{n}' の課題を返す)
+    POST issue/{key}/attachments         添付ファイルのアップロード (multipart/form-data, chunked 転送にも対応)
+    GET  issue/{key}/transitions         課題の遷移の一覧 (WORKFLOW_STATUSES のうち現在のステータス以外への遷移)
+    POST issue/{key}/transitions         課題の遷移 (遷移後のステータスは以降の検索・取得に反映される)
+    PUT  issue/{key}                     課題の編集 (fields の値を以降の検索・取得に反映する)
+    GET  attachment/content/{id}         添付ファイルのダウンロード (Range にも対応)
+
+Example:
+    with MockJiraServer(total_issues=1000, latency=0.02) as server:
+        client = JiraClinet(server.base_url, "bench@example.com", "token")
+"""
+import email.parser
+import json
+import re
+import threading
+import time
+import typing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from fixtures import build_issue, status
+
+_SEARCH_PATH = "/rest/api/3/search/jql"
+_ISSUE_PATH = "/rest/api/3/issue"
+_BULK_PATH = "/rest/api/3/issue/bulk"
+_BULK_FETCH_PATH = "/rest/api/3/issue/bulkfetch"
+_ATTACHMENTS_PATTERN = re.compile(r"^/rest/api/3/issue/([^/]+)/attachments$")
+_CONTENT_PATTERN = re.compile(r"^/rest/api/3/attachment/content/(\d+)$")
+_TRANSITIONS_PATTERN = re.compile(r"^/rest/api/3/issue/([^/]+)/transitions$")
+_EDIT_PATTERN = re.compile(r"^/rest/api/3/issue/([^/]+)$")
+
+# モックのワークフローのステータス (遷移のIDは '1{index}', ステータスのIDは '10{index}')
+WORKFLOW_STATUSES = ("In Progress", "To Be Released", "Done")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "MockJiraServer"
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # ヘッダーと本文の分割送信で遅延確認応答 (約40ms) を待たないようにする
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        pass
+
+    def _send_no_content(self) -> None:
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send_json(self, body: typing.Any, status: int = 200) -> None:
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b"".join(chunks)
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_GET(self) -> None:
+        self.server.wait()
+        url = urlparse(self.path)
+        if url.path == _SEARCH_PATH:
+            self._search(parse_qs(url.query))
+            return
+        match = _CONTENT_PATTERN.match(url.path)
+        if match:
+            self._content(int(match.group(1)))
+            return
+        match = _TRANSITIONS_PATTERN.match(url.path)
+        if match:
+            self._transitions(match.group(1))
+            return
+        self._send_json({"errorMessages": ["Not Found"]}, 404)
+
+    def do_POST(self) -> None:
+        body = self._read_body()
+        self.server.wait()
+        path = urlparse(self.path).path
+        if path == _BULK_PATH:
+            self._bulk_create(json.loads(body))
+        elif path == _BULK_FETCH_PATH:
+            self._bulk_fetch(json.loads(body))
+        elif path == _ISSUE_PATH:
+            json.loads(body)
+            self._send_json(self.server.next_created_issue(), 201)
+        elif _ATTACHMENTS_PATTERN.match(path):
+            self._upload(body)
+        elif _TRANSITIONS_PATTERN.match(path):
+            self._transition(_TRANSITIONS_PATTERN.match(path).group(1), json.loads(body))
+        else:
+            self._send_json({"errorMessages": ["Not Found"]}, 404)
+
+    def do_PUT(self) -> None:
+        body = self._read_body()
+        self.server.wait()
+        match = _EDIT_PATTERN.match(urlparse(self.path).path)
+        if not match:
+            self._send_json({"errorMessages": ["Not Found"]}, 404)
+            return
+        n = self.server.resolve_issue(match.group(1))
+        if n is None:
+            self._send_json({"errorMessages": ["Issue does not exist or you do not have permission to see it."]}, 404)
+            return
+        self.server.issue_payload(n, "*all")["fields"].update(json.loads(body).get("fields") or {})
+        self._send_no_content()
+
+    def _search(self, query: typing.Dict[str, typing.List[str]]) -> None:
+        page_size = min(int(query.get("maxResults", ["50"])[0]), self.server.max_page_size)
+        start = int(query.get("nextPageToken", ["0"])[0])
+        end = min(start + page_size, self.server.total_issues)
+        fields = query.get("fields", ["*all"])[0]
+        issues = [self.server.issue_payload(n, fields) for n in range(start, end)]
+        page: typing.Dict[str, typing.Any] = {"issues": issues, "isLast": end >= self.server.total_issues}
+        if not page["isLast"]:
+            page["nextPageToken"] = str(end)
+        self._send_json(page)
+
+    def _bulk_create(self, payload: typing.Dict[str, typing.Any]) -> None:
+        issues = [self.server.next_created_issue() for _ in payload.get("issueUpdates", [])]
+        self._send_json({"issues": issues, "errors": []}, 201)
+
+    def _bulk_fetch(self, payload: typing.Dict[str, typing.Any]) -> None:
+        fields = ",".join(payload.get("fields") or ["*all"])
+        issues = []
+        errors = []
+        for key in payload.get("issueIdsOrKeys", []):
+            n = self.server.resolve_issue(key)
+            if n is None:
+                errors.append({
+                    "id": key,
+                    "errorMessage": "Issue does not exist or you do not have permission to see it."
+                })
+            else:
+                issues.append(self.server.issue_payload(n, fields))
+        self._send_json({"issues": issues, "issueErrors": errors})
+
+    def _transitions(self, key: str) -> None:
+        n = self.server.resolve_issue(key)
+        if n is None:
+            self._send_json({"errorMessages": ["Issue does not exist or you do not have permission to see it."]}, 404)
+            return
+        current = self.server.issue_payload(n, "*all")["fields"]["status"]["name"]
+        transitions = [{
+            "id": f"1{index}",
+            "name": f"Move to {name}",
+            "to": workflow_status(index),
+            "hasScreen": False,
+        } for index, name in enumerate(WORKFLOW_STATUSES) if name != current]
+        self._send_json({"transitions": transitions})
+
+    def _transition(self, key: str, payload: typing.Dict[str, typing.Any]) -> None:
+        n = self.server.resolve_issue(key)
+        if n is None:
+            self._send_json({"errorMessages": ["Issue does not exist or you do not have permission to see it."]}, 404)
+            return
+        transition_id = str(payload.get("transition", {}).get("id"))
+        indexes = [index for index in range(len(WORKFLOW_STATUSES)) if f"1{index}" == transition_id]
+        if not indexes:
+            self._send_json({"errorMessages": [f"Transition id '{transition_id}' is not valid for this issue."]}, 400)
+            return
+        self.server.issue_payload(n, "*all")["fields"]["status"] = workflow_status(indexes[0])
+        self._send_no_content()
+
+    def _upload(self, body: bytes) -> None:
+        header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+        message = email.parser.BytesParser().parsebytes(header + body)
+        attachments = []
+        for part in message.get_payload():
+            data = part.get_payload(decode=True) or b""
+            attachment_id = self.server.next_id()
+            attachments.append({
+                "id": str(attachment_id),
+                "self": f"{self.server.base_url}/attachment/{attachment_id}",
+                "filename": part.get_filename(),
+                "author": build_issue(0)["fields"]["creator"],
+                "created": "2024-01-01T09:00:00.000+0900",
+                "size": len(data),
+                "mimeType": part.get_content_type(),
+                "content": f"{self.server.base_url}/attachment/content/{attachment_id}",
+            })
+        self._send_json(attachments)
+
+    def _content(self, attachment_id: int) -> None:
+        size = self.server.attachment_size
+        start = 0
+        status = 200
+        range_header = self.headers.get("Range")
+        if range_header:
+            start = int(range_header.split("=", 1)[1].split("-", 1)[0])
+            status = 206
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(size - start))
+        self.end_headers()
+        block = bytes([attachment_id % 256]) * 65536
+        remaining = size - start
+        while remaining > 0:
+            chunk = block[:min(remaining, len(block))]
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
+
+
+def workflow_status(index: int) -> typing.Dict[str, typing.Any]:
+    """WORKFLOW_STATUSES の index 番目のステータスを返します。"""
+    return {**status(index), "id": f"10{index}", "name": WORKFLOW_STATUSES[index]}
+
+
+class MockJiraServer(ThreadingHTTPServer):
+    """
+    ベンチマーク用の Jira REST API のモックサーバー。
+
+    Args:
+        total_issues (int): search/jql が返す課題の総数。
+        latency (float): 各リクエストの応答前に待機する秒数 (ネットワーク遅延の模擬)。
+        max_page_size (int): 1ページの最大件数 (Jira Cloud と同様に maxResults がこれを超える場合は切り詰める)。
+        adf_depth (int): 課題の説明 (ADF) のネストの深さ。
+        attachment_size (int): ダウンロードされる添付ファイルのサイズ (バイト)。
+        issues (List[Dict], optional): 返す課題のリスト (fixtures.load_search_page() で読み込んだ記録など)。
+                                       指定した場合、total_issues 件になるまで繰り返して返します。
+    """
+
+    daemon_threads = True
+
+    def __init__(self,
+                 total_issues: int = 1000,
+                 latency: float = 0.0,
+                 max_page_size: int = 100,
+                 adf_depth: int = 1,
+                 attachment_size: int = 1024 * 1024,
+                 issues: typing.Optional[typing.List[typing.Dict[str, typing.Any]]] = None):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.total_issues = total_issues
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.adf_depth = adf_depth
+        self.attachment_size = attachment_size
+        self.base_url = f"http://127.0.0.1:{self.server_port}/rest/api/3"
+        self.__issues = issues
+        self.__payloads: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+        self.__lock = threading.Lock()
+        self.__counter = 0
+        self.__thread: typing.Optional[threading.Thread] = None
+
+    def __enter__(self) -> "MockJiraServer":
+        self.__thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def next_id(self) -> int:
+        with self.__lock:
+            self.__counter += 1
+            return 20000 + self.__counter
+
+    def next_created_issue(self) -> typing.Dict[str, str]:
+        issue_id = self.next_id()
+        return {"id": str(issue_id), "key": f"BENCH-{issue_id}", "self": f"{self.base_url}/issue/{issue_id}"}
+
+    def resolve_issue(self, key_or_id: str) -> typing.Optional[int]:
+        """課題のキー ('PROJ-{n}'、移動前のキー 'OLD-{n}') またはID (10000 + n) から課題の番号を返します。"""
+        project, _, number = key_or_id.upper().rpartition("-")
+        if project in ("PROJ", "OLD") and number.isdigit():
+            n = int(number)
+        elif key_or_id.isdigit():
+            n = int(key_or_id) - 10000
+        else:
+            return None
+        return n if 0 <= n < self.total_issues else None
+
+    def issue_payload(self, n: int, fields: str) -> typing.Dict[str, typing.Any]:
+        """n 番目の課題を返します。生成した課題はキャッシュし、応答時間に生成コストが含まれないようにします。"""
+        issue = self.__payloads.get(n)
+        if issue is None:
+            if self.__issues:
+                recorded = self.__issues[n % len(self.__issues)]
+                # 遷移・編集で fields を書き換えるため、記録した課題とは別の dict にする
+                issue = {**recorded, "fields": dict(recorded["fields"])}
+            else:
+                issue = build_issue(n, adf_depth=self.adf_depth, base_url=self.base_url)
+            self.__payloads[n] = issue
+        if fields in ("*all", "*navigable"):
+            return issue
+        keep = set(fields.split(","))
+        return {**issue, "fields": {name: value for name, value in issue["fields"].items() if name in keep}}
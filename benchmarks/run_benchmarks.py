@@ -0,0 +1,359 @@
+"""
+JiraClinet とモデルのベンチマークスイート。
+
+ローカルのモックサーバー (mock_jira.py) と合成の課題 (fixtures.py) を使い、実際の Jira なしで以下を計測します。
+    search      get_tickets_by_jql() による全ページの取得
+    validate    検索結果1ページの解析 (解析方法ごとの課題1件あたりの時間)
+    fetch       get_issues() によるキー指定の一括取得 (並列数ごと)
+    update      transition_issues() による一括遷移 (並列数ごと) と edit_issues() による一括編集
+    cache       16スレッドから同じ get_tickets_by_jql() を同時に呼び出した場合の、JiraReadCache の有無と結果の複製 (copy_results) による比較
+    pipeline    get_tickets_by_jql() のページの解析を ProcessPoolExecutor で行う場合 (parse_executor) と行わない場合の比較
+    create      create_ticket()
+    upload      upload_attachment()
+    download    download_attachment()
+    adf         AdfDocument.to_plain_text()
+
+各シナリオについてスループット (件/秒)、レイテンシのパーセンタイル、ピークメモリ (tracemalloc) を表示します。
+
+Usage:
+    cd benchmarks && PYTHONPATH=../src python run_benchmarks.py [--scenarios search,adf] [--latency 0.01]
+        [--issues 1000] [--page-size 100] [--repeat 5] [--adf-depth 1] [--parse-workers 4] [--fixture recorded.json]
+        [--json out.json]
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+import typing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from fixtures import build_document, build_search_page, load_search_page
+from mock_jira import MockJiraServer
+
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.models.attachment import JiraAttachment
+from jira_api_client.models.base import JiraParseModeEnum, JiraStatusNameEnum
+from jira_api_client.models.issue import AdfDocument
+from jira_api_client.parsing import JiraSearchPageParser
+from jira_api_client.read_cache import JiraReadCache
+
+
+class BenchmarkResult(object):
+    """1つのシナリオの計測結果。"""
+
+    def __init__(self, name: str, unit: str, ops: int, seconds: float, latencies: typing.List[float], peak_memory: int):
+        self.name = name
+        self.unit = unit
+        self.ops = ops
+        self.seconds = seconds
+        self.latencies = sorted(latencies)
+        self.peak_memory = peak_memory
+
+    @property
+    def throughput(self) -> float:
+        return self.ops / self.seconds if self.seconds else 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies:
+            return 0.0
+        index = min(len(self.latencies) - 1, max(0, round(p / 100 * len(self.latencies)) - 1))
+        return self.latencies[index]
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "name": self.name,
+            "unit": self.unit,
+            "ops": self.ops,
+            "seconds": self.seconds,
+            "throughput": self.throughput,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "peak_memory": self.peak_memory,
+        }
+
+    def format(self) -> str:
+        return (f"{self.name:<28} {self.throughput:>11.1f} {self.unit + '/s':<10}"
+                f" p50 {self.percentile(50) * 1000:8.2f} ms  p90 {self.percentile(90) * 1000:8.2f} ms"
+                f"  p99 {self.percentile(99) * 1000:8.2f} ms  peak {self.peak_memory / 1024 / 1024:7.1f} MiB")
+
+
+def run(name: str, unit: str, func: typing.Callable[[], int], repeat: int) -> BenchmarkResult:
+    """
+    func を repeat 回実行して計測します。func は処理した件数を返します。
+
+    レイテンシは func 1回の所要時間です。ピークメモリは tracemalloc を有効にした別の1回で計測します
+    (tracemalloc は処理を遅くするため、時間の計測とは分けています)。
+    """
+    func()  # ウォームアップ
+    latencies = []
+    ops = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ops += func()
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name, unit, ops, sum(latencies), latencies, peak)
+
+
+def bench_search(client: JiraClinet, args: argparse.Namespace) -> typing.List[BenchmarkResult]:
+    results = []
+    for mode in args.parse_modes:
+        results.append(
+            run(f"search ({mode.value})",
+                "issues",
+                lambda mode=mode: len(client.get_tickets_by_jql("project = BENCH", parse_mode=mode).issues),
+                args.repeat))
+
+    # 1ページあたりのレイテンシ (リクエスト + 解析)
+    page_latencies = []
+    for _ in range(args.repeat):
+        pages = client.iter_pages("project = BENCH", page_size=args.page_size)
+        while True:
+            start = time.perf_counter()
+            page = next(pages, None)
+            if page is None:
+                break
+            page_latencies.append(time.perf_counter() - start)
+    results.append(
+        BenchmarkResult("search page (full)", "pages", len(page_latencies), sum(page_latencies), page_latencies, 0))
+    return results
+
+
+def bench_validate(args: argparse.Namespace) -> typing.List[BenchmarkResult]:
+    if args.fixture:
+        issues = load_search_page(args.fixture)
+        content = json.dumps({"issues": issues, "isLast": True}).encode()
+    else:
+        content = json.dumps(build_search_page(0, args.page_size, adf_depth=args.adf_depth)).encode()
+
+    results = []
+    for mode in args.parse_modes:
+        parser = JiraSearchPageParser(False, mode)
+        results.append(
+            run(f"validate ({mode.value})",
+                "issues",
+                lambda parser=parser: len(parser.parse_json(content).issues),
+                args.repeat))
+    return results
+
+
+def bench_fetch(client: JiraClinet, args: argparse.Namespace) -> typing.List[BenchmarkResult]:
+    # 並列化の効果 (リクエストの待ち時間の重なり) を見るため、検証コストの小さい RAW モードで計測する
+    keys = [f"PROJ-{n}" for n in range(args.issues)]
+    results = []
+    for workers in (1, 4):
+        results.append(
+            run(f"get_issues (workers={workers})",
+                "issues",
+                lambda workers=workers: len(
+                    client.get_issues(keys, parse_mode=JiraParseModeEnum.RAW, max_workers=workers).issues),
+                args.repeat))
+    return results
+
+
+def bench_update(client: JiraClinet, args: argparse.Namespace) -> typing.List[BenchmarkResult]:
+    keys = [f"PROJ-{n}" for n in range(args.issues)]
+    # 毎回すべての課題が遷移するよう、遷移先のステータスを交互に切り替える
+    targets = itertools.cycle([JiraStatusNameEnum.TO_BE_RELEASED, JiraStatusNameEnum.DONE])
+    results = []
+    for workers in (1, 8):
+        results.append(
+            run(f"transition_issues (workers={workers})",
+                "issues",
+                lambda workers=workers: len(client.transition_issues(keys, next(targets), max_workers=workers).updated),
+                args.repeat))
+    results.append(
+        run("edit_issues (workers=8)", "issues",
+            lambda: len(client.edit_issues(keys, update={
+                "labels": [{
+                    "add": "released"
+                }]
+            }).updated), args.repeat))
+    return results
+
+
+def bench_cache(server: MockJiraServer, args: argparse.Namespace) -> typing.List[BenchmarkResult]:
+    callers = 16
+    results = []
+    # 呼び出しごとに結果を複製する場合 (デフォルト) と、インスタンスを共有する場合 (copy_results=False) の両方を計測する
+    configs = (("no cache", None), ("read cache", JiraReadCache(ttl=60.0)), ("read cache, shared",
+                                                                             JiraReadCache(ttl=60.0,
+                                                                                           copy_results=False)))
+    for label, cache in configs:
+        with JiraClinet(server.base_url, "bench@example.com", "token", pool_maxsize=callers,
+                        read_cache=cache) as client:
+
+            def search(_: int) -> int:
+                return len(client.get_tickets_by_jql("project = BENCH", parse_mode=JiraParseModeEnum.RAW).issues)
+
+            def burst() -> int:
+                # 有効期限内のヒットではなく、同時に呼ばれた検索の合流 (single-flight) の効果を計測する
+                if cache is not None:
+                    cache.clear()
+                with ThreadPoolExecutor(max_workers=callers) as executor:
+                    return sum(executor.map(search, range(callers)))
+
+            results.append(run(f"get_tickets x{callers} ({label})", "issues", burst, args.repeat))
+    return results
+
+
+def bench_pipeline(server: MockJiraServer, args: argparse.Namespace) -> typing.List[BenchmarkResult]:
+    # FULL: 検証済みのモデルを pickle で受け取る (呼び出し元での復元のコストが検証に近い)
+    # RECORD (validate_every=1): 全件の検証はワーカーで行い、呼び出し元は軽量なレコードだけを受け取る
+    configs = [(JiraParseModeEnum.FULL, None), (JiraParseModeEnum.RECORD, 1)]
+    results = []
+    with ProcessPoolExecutor(max_workers=args.parse_workers) as executor:
+        for (mode, validate_every), parse_executor in itertools.product(configs, (None, executor)):
+            with JiraClinet(server.base_url,
+                            "bench@example.com",
+                            "token",
+                            parse_mode=mode,
+                            validate_every=validate_every,
+                            parse_executor=parse_executor,
+                            parse_prefetch=max(args.parse_workers * 2, 1)) as client:
+                label = f"processes={args.parse_workers}" if parse_executor is not None else "in-thread"
+                name = f"pipeline ({mode.value}, {label})"
+                results.append(
+                    run(name,
+                        "issues",
+                        lambda client=client: len(client.get_tickets_by_jql("project = BENCH").issues),
+                        args.repeat))
+    return results
+
+
+def bench_create(client: JiraClinet, args: argparse.Namespace) -> typing.List[BenchmarkResult]:
+
+    def create() -> int:
+        client.create_ticket("BENCH", "benchmark ticket", description="created by run_benchmarks.py")
+        return 1
+
+    return [run("create_ticket", "issues", lambda: sum(create() for _ in range(args.requests)), args.repeat)]
+
+
+def bench_upload(client: JiraClinet, args: argparse.Namespace, workdir: str) -> typing.List[BenchmarkResult]:
+    path = os.path.join(workdir, "upload.bin")
+    with open(path, "wb") as f:
+        f.write(os.urandom(args.attachment_size))
+
+    def upload() -> int:
+        for _ in range(args.requests):
+            client.upload_attachment("BENCH-1", path)
+        return args.requests
+
+    return [run("upload_attachment", "files", upload, args.repeat)]
+
+
+def bench_download(client: JiraClinet, args: argparse.Namespace, base_url: str,
+                   workdir: str) -> typing.List[BenchmarkResult]:
+    attachment = JiraAttachment.model_validate({
+        "id": "1",
+        "self": f"{base_url}/attachment/1",
+        "filename": "download.bin",
+        "author": build_search_page(0, 1)["issues"][0]["fields"]["creator"],
+        "created": "2024-01-01T09:00:00.000+0900",
+        "size": args.attachment_size,
+        "mimeType": "application/octet-stream",
+        "content": f"{base_url}/attachment/content/1",
+    })
+    save_path = os.path.join(workdir, "download.bin")
+
+    def download() -> int:
+        # download_attachment() は完了メッセージを表示するため、計測中の出力は捨てる
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(args.requests):
+                client.download_attachment(attachment, save_path)
+        return args.requests
+
+    return [run("download_attachment", "files", download, args.repeat)]
+
+
+def bench_adf(args: argparse.Namespace) -> typing.List[BenchmarkResult]:
+    document = AdfDocument.model_validate(build_document(args.adf_depth, with_unknown=True))
+    return [run("AdfDocument.to_plain_text", "docs", lambda: len(document.to_plain_text()) and 1, args.repeat * 10)]
+
+
+SCENARIOS = ("search", "validate", "fetch", "update", "cache", "pipeline", "create", "upload", "download", "adf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="実行するシナリオ (カンマ区切り, デフォルト: すべて)")
+    parser.add_argument("--latency", type=float, default=0.0, help="モックサーバーの応答遅延 (秒, デフォルト: 0)")
+    parser.add_argument("--issues", type=int, default=1000, help="検索結果の課題数 (デフォルト: 1000)")
+    parser.add_argument("--page-size", type=int, default=100, help="1ページの課題数 (デフォルト: 100)")
+    parser.add_argument("--repeat", type=int, default=5, help="計測回数 (デフォルト: 5)")
+    parser.add_argument("--requests", type=int, default=20, help="create / upload / download の1回あたりのリクエスト数")
+    parser.add_argument("--adf-depth", type=int, default=1, help="説明 (ADF) のネストの深さ (デフォルト: 1)")
+    parser.add_argument("--attachment-size", type=int, default=1024 * 1024, help="添付ファイルのサイズ (バイト)")
+    parser.add_argument("--parse-workers",
+                        type=int,
+                        default=os.cpu_count() or 1,
+                        help="pipeline で解析に使うプロセス数 (デフォルト: CPUコア数)")
+    parser.add_argument("--parse-modes", default="full,lazy,construct,raw", help="search / validate で計測する解析方法")
+    parser.add_argument("--fixture", help="record_search_page() で記録した検索結果 (JSON) を合成データの代わりに使う")
+    parser.add_argument("--json", help="計測結果をJSONで保存するパス")
+    args = parser.parse_args()
+    args.parse_modes = [JiraParseModeEnum(mode) for mode in args.parse_modes.split(",")]
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"不明なシナリオ: {', '.join(sorted(unknown))}")
+
+    recorded = load_search_page(args.fixture) if args.fixture else None
+    results: typing.List[BenchmarkResult] = []
+    with MockJiraServer(total_issues=args.issues,
+                        latency=args.latency,
+                        max_page_size=args.page_size,
+                        adf_depth=args.adf_depth,
+                        attachment_size=args.attachment_size,
+                        issues=recorded) as server, \
+            JiraClinet(server.base_url, "bench@example.com", "token") as client, \
+            tempfile.TemporaryDirectory() as workdir:
+        print(f"issues: {args.issues}, page size: {args.page_size}, latency: {args.latency * 1000:.0f} ms, "
+              f"adf depth: {args.adf_depth}, repeat: {args.repeat}")
+        for scenario in scenarios:
+            if scenario == "search":
+                scenario_results = bench_search(client, args)
+            elif scenario == "validate":
+                scenario_results = bench_validate(args)
+            elif scenario == "fetch":
+                scenario_results = bench_fetch(client, args)
+            elif scenario == "update":
+                scenario_results = bench_update(client, args)
+            elif scenario == "cache":
+                scenario_results = bench_cache(server, args)
+            elif scenario == "pipeline":
+                scenario_results = bench_pipeline(server, args)
+            elif scenario == "create":
+                scenario_results = bench_create(client, args)
+            elif scenario == "upload":
+                scenario_results = bench_upload(client, args, workdir)
+            elif scenario == "download":
+                scenario_results = bench_download(client, args, server.base_url, workdir)
+            else:
+                scenario_results = bench_adf(args)
+            for result in scenario_results:
+                print(result.format())
+                if result.unit == "issues" and result.name.startswith("validate"):
+                    print(f"{'':<28} {result.seconds / result.ops * 1e6:>11.1f} us/issue")
+            results.extend(scenario_results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([result.to_dict() for result in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
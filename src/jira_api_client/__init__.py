@@ -0,0 +1,103 @@
+import importlib
+import typing
+
+# --- パッケージの公開API ---
+# `import jira_api_client` は軽量に保ち、各クラスは初めて参照された時に定義元のモジュールを読み込みます (PEP 562)。
+# 例えば `from jira_api_client import JiraClinet` は requests と JiraClinet が使うモジュールだけを読み込み、
+# 課題・ADFのモデルは検索などで必要になるまで読み込みません。
+
+# 公開する名前と定義元のモジュール
+_LAZY_ATTRIBUTES = {
+    "JiraClinet": "jira_api_client.jira_client",
+    "AsyncJiraClient": "jira_api_client.async_jira_client",
+    "JiraRequestScheduler": "jira_api_client.request_scheduler",
+    "JiraTokenBucket": "jira_api_client.request_scheduler",
+    "JiraMetricsCollector": "jira_api_client.instrumentation",
+    "JiraInMemoryMetricsCollector": "jira_api_client.instrumentation",
+    "JiraCallbackMetricsCollector": "jira_api_client.instrumentation",
+    "JiraIssueStore": "jira_api_client.issue_store",
+    "JiraReadCache": "jira_api_client.read_cache",
+    "JiraColumnarExporter": "jira_api_client.columnar",
+    "JiraParseModeEnum": "jira_api_client.models.base",
+    "JiraIssueTypeEnum": "jira_api_client.models.base",
+    "JiraStatusNameEnum": "jira_api_client.models.base",
+    "JiraInternCache": "jira_api_client.models.interning",
+    "JiraAttachment": "jira_api_client.models.attachment",
+    "JiraBulkFetchResult": "jira_api_client.models.bulk_fetch",
+    "JiraBulkUpdateResult": "jira_api_client.models.issue_update",
+    "JiraTransition": "jira_api_client.models.issue_update",
+    "JiraTransitionCache": "jira_api_client.transitions",
+    "JiraCreatedIssue": "jira_api_client.models.ticket_create",
+    "JiraTicketSpec": "jira_api_client.models.ticket_create",
+    "JiraIssue": "jira_api_client.models.issue",
+    "JiraPartialIssue": "jira_api_client.models.issue",
+    "AdfDocument": "jira_api_client.models.issue",
+    "JiraIssueRecord": "jira_api_client.models.record",
+    "JiraSearchResults": "jira_api_client.models.search",
+}
+
+__all__ = [
+    "AdfDocument",
+    "AsyncJiraClient",
+    "JiraAttachment",
+    "JiraBulkFetchResult",
+    "JiraBulkUpdateResult",
+    "JiraCallbackMetricsCollector",
+    "JiraClinet",
+    "JiraColumnarExporter",
+    "JiraCreatedIssue",
+    "JiraInMemoryMetricsCollector",
+    "JiraInternCache",
+    "JiraIssue",
+    "JiraIssueRecord",
+    "JiraIssueStore",
+    "JiraIssueTypeEnum",
+    "JiraMetricsCollector",
+    "JiraParseModeEnum",
+    "JiraPartialIssue",
+    "JiraReadCache",
+    "JiraRequestScheduler",
+    "JiraSearchResults",
+    "JiraStatusNameEnum",
+    "JiraTicketSpec",
+    "JiraTokenBucket",
+    "JiraTransition",
+    "JiraTransitionCache",
+]
+
+if typing.TYPE_CHECKING:
+    from jira_api_client.async_jira_client import AsyncJiraClient
+    from jira_api_client.columnar import JiraColumnarExporter
+    from jira_api_client.instrumentation import (
+        JiraCallbackMetricsCollector,
+        JiraInMemoryMetricsCollector,
+        JiraMetricsCollector,
+    )
+    from jira_api_client.issue_store import JiraIssueStore
+    from jira_api_client.jira_client import JiraClinet
+    from jira_api_client.models.attachment import JiraAttachment
+    from jira_api_client.models.base import JiraIssueTypeEnum, JiraParseModeEnum, JiraStatusNameEnum
+    from jira_api_client.models.bulk_fetch import JiraBulkFetchResult
+    from jira_api_client.models.interning import JiraInternCache
+    from jira_api_client.models.issue import AdfDocument, JiraIssue, JiraPartialIssue
+    from jira_api_client.models.issue_update import JiraBulkUpdateResult, JiraTransition
+    from jira_api_client.models.record import JiraIssueRecord
+    from jira_api_client.models.search import JiraSearchResults
+    from jira_api_client.models.ticket_create import JiraCreatedIssue, JiraTicketSpec
+    from jira_api_client.read_cache import JiraReadCache
+    from jira_api_client.request_scheduler import JiraRequestScheduler, JiraTokenBucket
+    from jira_api_client.transitions import JiraTransitionCache
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # 2回目以降は通常のモジュール属性として参照されるようにする
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
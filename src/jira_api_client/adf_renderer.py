@@ -0,0 +1,723 @@
+import html
+import io
+import re
+import typing
+
+# Atlassian Document Format (ADF) をプレーンテキスト / Markdown / HTML に変換するレンダラー
+#
+# ADFのツリーを明示的なスタックで1回だけ走査し、出力を1つのテキストストリームに直接書き込むため、
+# ネストの深さやドキュメントの大きさに対して線形時間で動作し、中間の文字列や行リストを生成しません。
+# 検証済みの AdfDocument (Pydanticモデル) と、APIレスポンスの生の dict のどちらも入力にできます。
+
+# 入力として受け付ける型: AdfDocument などのADFノード (モデルまたは dict)、ノードのリスト、None
+AdfInput = typing.Union[typing.Any, typing.Mapping[str, typing.Any], typing.Sequence[typing.Any], None]
+
+# Markdown で意味を持つ文字のエスケープ表
+_MARKDOWN_ESCAPES = str.maketrans({char: "\\" + char for char in "\\`*_[]<>|"})
+
+# Markdown のリンク先 (<...> で囲む形式) で意味を持つ文字のエスケープ表。改行は <...> の中に書けないためパーセントエンコードする
+_MARKDOWN_DESTINATION_ESCAPES = str.maketrans({"\\": "\\\\", "<": "\\<", ">": "\\>", "\n": "%0A", "\r": "%0D"})
+
+# リンク・画像のURLとして出力を許可するスキーム。スキームの無いURL (相対URL) も許可する
+_SAFE_URL_SCHEMES = frozenset({"http", "https", "mailto"})
+# ブラウザはURLの前後の空白・制御文字とURL中のタブ・改行を無視するため、スキームの判定前に取り除く
+_IGNORED_URL_CHARS = re.compile(r"[\x00-\x20\x7f]+")
+_URL_SCHEME = re.compile(r"([a-zA-Z][a-zA-Z0-9+.\-]*):")
+_BACKTICK_RUN = re.compile(r"`+")
+
+
+def _fields(node: typing.Any) -> typing.Mapping[str, typing.Any]:
+    """ノード (dict またはモデル) の属性の辞書を返します。"""
+    if isinstance(node, dict):
+        return node
+    # Pydanticモデルのフィールドは __dict__ に格納されている (getattr は未定義の属性で遅い経路を通る)
+    return getattr(node, "__dict__", None) or {}
+
+
+def _get(node: typing.Any, name: str, default: typing.Any = None) -> typing.Any:
+    """ノード (dict またはモデル) の属性を取得します。"""
+    return _fields(node).get(name, default)
+
+
+def _attr(node: typing.Any, name: str, default: typing.Any = None) -> typing.Any:
+    """ノードの attrs の属性を取得します。"""
+    attrs = _get(node, "attrs")
+    if attrs is None:
+        return default
+    value = _fields(attrs).get(name)
+    return default if value is None else value
+
+
+def _fallback_text(node: typing.Any) -> str:
+    """未対応のノードを表す代替テキスト (text, attrs.text, attrs.shortName の順)。"""
+    for value in (_get(node, "text"), _attr(node, "text"), _attr(node, "shortName")):
+        if isinstance(value, str):
+            return value
+    return ""
+
+
+def _safe_url(url: typing.Any) -> typing.Optional[str]:
+    """
+    url のスキームが http / https / mailto のいずれか、またはスキームの無い相対URLの場合は url を文字列で返します。
+
+    javascript: や data: などそれ以外のスキームのURLと空のURLは None を返します (リンク・画像として出力しない)。
+    """
+    if url is None:
+        return None
+    url = str(url)
+    match = _URL_SCHEME.match(_IGNORED_URL_CHARS.sub("", url))
+    if match is not None and match.group(1).lower() not in _SAFE_URL_SCHEMES:
+        return None
+    return url or None
+
+
+def _markdown_destination(url: str) -> str:
+    """Markdown のリンク先として、空白や括弧を含んでいても壊れない <...> 形式の文字列を返します。"""
+    return "<" + url.translate(_MARKDOWN_DESTINATION_ESCAPES) + ">"
+
+
+def _backtick_fence(text: str, minimum: int = 1) -> str:
+    """text 中のどのバッククォートの連続よりも長い (かつ minimum 以上の) バッククォートの列を返します。"""
+    longest = max((len(run) for run in _BACKTICK_RUN.findall(text)), default=0)
+    return "`" * max(longest + 1, minimum)
+
+
+def _root_nodes(adf: AdfInput) -> typing.Sequence[typing.Any]:
+    if adf is None:
+        return ()
+    if isinstance(adf, (list, tuple)):
+        return adf
+    if _get(adf, "type") == "doc":
+        return _get(adf, "content") or ()
+    return (adf,)
+
+
+class _TextSink(object):
+    """
+    行頭の接頭辞 (リストのインデントや引用記号) を管理しながらストリームに書き込むライター。
+
+    接頭辞は push_prefix() で積まれ、最初の行だけ first、以降の行は rest が出力されます (例: 箇条書き記号とインデント)。
+    2行目以降の接頭辞は積んだ時点で連結しておくため、1行あたりのコストは入れ子の深さに依存しません。
+
+    begin_inline() から end_inline() までの間は、改行がその区切り文字列に置き換えられます
+    (テーブルのセルなど、1行で出力する箇所で使用)。区切りは次の文字列が書き込まれる時に出力されるため、
+    セルの先頭・末尾に余分な区切りは付きません。
+    """
+
+    def __init__(self, stream: typing.TextIO):
+        self.stream = stream
+        self._firsts: typing.List[str] = []
+        # _rests[i] は下から i 個の接頭辞の rest を連結した文字列
+        self._rests: typing.List[str] = [""]
+        # 最初の行を出力済みの接頭辞の数 (未出力の接頭辞は常に上側にある)
+        self._used = 0
+        self.inline_newline: typing.Optional[str] = None
+        self.at_line_start = True
+        self.empty = True
+        self._inline_written = False
+        self._pending_break = False
+
+    def push_prefix(self, first: str, rest: typing.Optional[str] = None) -> None:
+        self._firsts.append(first)
+        self._rests.append(self._rests[-1] + (first if rest is None else rest))
+
+    def pop_prefix(self) -> None:
+        self._firsts.pop()
+        self._rests.pop()
+        self._used = min(self._used, len(self._firsts))
+
+    @property
+    def at_prefix_start(self) -> bool:
+        """直前に積んだ接頭辞 (リスト項目など) の最初の行がまだ出力されていないかどうか。"""
+        return self._used < len(self._firsts)
+
+    def begin_inline(self, separator: str) -> None:
+        self.inline_newline = separator
+        self._inline_written = False
+        self._pending_break = False
+
+    def end_inline(self) -> None:
+        self.inline_newline = None
+        self._pending_break = False
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        if "\n" not in text:
+            self._write_segment(text)
+            return
+        lines = text.split("\n")
+        for line in lines[:-1]:
+            self._write_segment(line)
+            self.newline()
+        self._write_segment(lines[-1])
+
+    def _write_segment(self, text: str) -> None:
+        if not text:
+            return
+        if self.inline_newline is not None:
+            if self._pending_break:
+                self._pending_break = False
+                self.stream.write(self.inline_newline)
+            self._inline_written = True
+        if self.at_line_start:
+            if self._firsts:
+                self.stream.write(self._prefix())
+            self.at_line_start = False
+        self.stream.write(text)
+        self.empty = False
+
+    def _prefix(self) -> str:
+        depth = len(self._firsts)
+        used = self._used
+        if used == depth:
+            return self._rests[depth]
+        self._used = depth
+        return self._rests[used] + "".join(self._firsts[used:])
+
+    def newline(self) -> None:
+        """改行を出力します。"""
+        if self.inline_newline is not None:
+            self._pending_break = self._inline_written
+            return
+        if self.at_line_start and self._firsts and not self.empty:
+            # 空行にも接頭辞 (引用記号など) を付ける
+            self.stream.write(self._prefix().rstrip())
+        self.stream.write("\n")
+        self.at_line_start = True
+        self.empty = False
+
+    def end_line(self) -> None:
+        """行の途中であれば改行します。"""
+        if self.inline_newline is not None or not self.at_line_start:
+            self.newline()
+
+
+class _AdfRenderer(object):
+    """
+    ADFのツリーを反復的に走査し、ノードの開始・終了ごとに _enter_<type> / _exit_<type> を呼び出すレンダラーの基底クラス。
+    対応するメソッドが無いノードは _enter_unknown で代替テキストを出力し、子要素はそのまま走査します。
+    """
+
+    def __init__(self, stream: typing.TextIO):
+        self.out = _TextSink(stream)
+        # 開始済みで終了していないリストの (種類, 次の番号) のスタック
+        self.lists: typing.List[typing.List[typing.Any]] = []
+        self.in_code = 0
+        # 開始済みで終了していないテーブルの [行番号, 列数] のスタック
+        self.tables: typing.List[typing.List[int]] = []
+        # テーブルのセルの入れ子の深さ
+        self.cell_depth = 0
+        self._handlers: typing.Dict[str, typing.Tuple[typing.Callable, typing.Optional[typing.Callable]]] = {}
+
+    def _handler(self, node_type: str) -> typing.Tuple[typing.Callable, typing.Optional[typing.Callable]]:
+        """ノードの種類に対応する (開始時, 終了時) の処理を返します。終了時の処理が無い場合は None。"""
+        enter = getattr(self, f"_enter_{node_type}", None)
+        if enter is None:
+            return self._enter_unknown, None
+        return enter, getattr(self, f"_exit_{node_type}", None)
+
+    def render(self, adf: AdfInput) -> None:
+        """adf をストリームに書き込みます。"""
+        handlers = self._handlers
+        # 未処理のノードと、(終了時の処理, ノード) のタプルを積むスタック。子要素は逆順に積むことで先頭から処理する
+        stack: typing.List[typing.Any] = list(reversed(_root_nodes(adf)))
+        while stack:
+            item = stack.pop()
+            if item.__class__ is tuple:
+                item[0](item[1])
+                continue
+            fields = item if item.__class__ is dict else _fields(item)
+            node_type = fields.get("type")
+            handler = handlers.get(node_type)
+            if handler is None:
+                handler = handlers[node_type] = self._handler(node_type)
+            enter, exit_ = handler
+            descend = enter(item)
+            if exit_ is not None:
+                stack.append((exit_, item))
+            if descend is not False:
+                children = fields.get("content")
+                if children:
+                    stack.extend(reversed(children))
+        self.finish()
+
+    def finish(self) -> None:
+        pass
+
+    # --- リストの番号管理 ---
+
+    def _push_list(self, node: typing.Any, ordered: bool) -> None:
+        self.lists.append([ordered, int(_attr(node, "order", 1)) if ordered else 0])
+
+    def _next_marker(self, bullet: str) -> str:
+        if not self.lists:
+            return bullet
+        frame = self.lists[-1]
+        if not frame[0]:
+            return bullet
+        number = frame[1]
+        frame[1] += 1
+        return f"{number}. "
+
+
+class _PlainTextRenderer(_AdfRenderer):
+    """AdfDocument.to_plain_text() に近い書式のプレーンテキストを出力します。"""
+
+    bullet = "● "
+    cell_newline = " "
+
+    def _enter_paragraph(self, node: typing.Any) -> None:
+        self.out.end_line()
+
+    def _exit_paragraph(self, node: typing.Any) -> None:
+        self.out.end_line()
+
+    def _enter_text(self, node: typing.Any) -> None:
+        self.out.write(_get(node, "text") or "")
+
+    def _enter_hardBreak(self, node: typing.Any) -> None:
+        self.out.newline()
+
+    def _enter_inlineCard(self, node: typing.Any) -> None:
+        self.out.write(f"<{_attr(node, 'url', '')}>")
+
+    def _enter_mediaInline(self, node: typing.Any) -> None:
+        self.out.write(f"[インラインメディア: {_attr(node, 'url') or 'ID:' + str(_attr(node, 'id', ''))}]")
+
+    def _enter_media(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.write(f"[メディア: {_attr(node, 'url') or _attr(node, 'id', '')} ({_attr(node, 'type', '')})]")
+        self.out.end_line()
+
+    def _enter_heading(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.write("#" * int(_attr(node, "level", 1)) + " ")
+
+    def _exit_heading(self, node: typing.Any) -> None:
+        self.out.end_line()
+
+    def _enter_bulletList(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self._push_list(node, ordered=False)
+
+    def _exit_bulletList(self, node: typing.Any) -> None:
+        self.lists.pop()
+
+    def _enter_orderedList(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self._push_list(node, ordered=True)
+
+    _exit_orderedList = _exit_bulletList
+
+    def _enter_listItem(self, node: typing.Any) -> None:
+        self.out.end_line()
+        marker = self._next_marker(self.bullet)
+        self.out.push_prefix(marker, " " * len(marker))
+
+    def _exit_listItem(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.pop_prefix()
+
+    def _enter_blockquote(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.push_prefix("> ")
+
+    def _exit_blockquote(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.pop_prefix()
+
+    def _enter_rule(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.write("---")
+        self.out.end_line()
+
+    def _enter_expand(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.write(f"--- 展開パネル: {_attr(node, 'title', '')} ---")
+        self.out.end_line()
+
+    def _exit_expand(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.write("--- 展開パネル終了 ---")
+        self.out.end_line()
+
+    def _enter_codeBlock(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.out.write(f"``` {_attr(node, 'language', 'plaintext')}")
+        self.out.end_line()
+        self.in_code += 1
+
+    def _exit_codeBlock(self, node: typing.Any) -> None:
+        self.in_code -= 1
+        self.out.end_line()
+        self.out.write("```")
+        self.out.end_line()
+
+    def _enter_table(self, node: typing.Any) -> None:
+        self.out.end_line()
+        self.tables.append([-1, 0])
+
+    def _exit_table(self, node: typing.Any) -> None:
+        self.tables.pop()
+
+    def _enter_tableRow(self, node: typing.Any) -> None:
+        self.out.end_line()
+        if self.tables:
+            table = self.tables[-1]
+            table[0] += 1
+            if table[0] == 0:
+                table[1] = len(_get(node, "content") or ())
+        self.out.write("|")
+
+    def _exit_tableRow(self, node: typing.Any) -> None:
+        self.out.end_line()
+
+    def _enter_tableCell(self, node: typing.Any) -> None:
+        self.out.write(" ")
+        # セル内の段落・改行は区切り文字列に置き換えて1行で出力する (入れ子のテーブルのセルは外側のセルに含める)
+        self.cell_depth += 1
+        if self.cell_depth == 1:
+            self.out.begin_inline(self.cell_newline)
+
+    def _exit_tableCell(self, node: typing.Any) -> None:
+        self.cell_depth -= 1
+        if self.cell_depth == 0:
+            self.out.end_inline()
+        self.out.write(" |")
+
+    _enter_tableHeader = _enter_tableCell
+    _exit_tableHeader = _exit_tableCell
+
+    def _enter_mediaGroup(self, node: typing.Any) -> None:
+        self.out.end_line()
+
+    _enter_mediaSingle = _enter_mediaGroup
+
+    def _enter_unknown(self, node: typing.Any) -> None:
+        self.out.write(_fallback_text(node))
+
+    def finish(self) -> None:
+        self.out.end_line()
+
+
+class _MarkdownRenderer(_PlainTextRenderer):
+    """CommonMark / GitHub Flavored Markdown を出力します。"""
+
+    bullet = "- "
+    cell_newline = "<br>"
+
+    def __init__(self, stream: typing.TextIO):
+        super().__init__(stream)
+        # 開始済みで終了していないコードブロックの囲み (バッククォートの列) のスタック
+        self.fences: typing.List[str] = []
+
+    def _enter_paragraph(self, node: typing.Any) -> None:
+        self._start_block()
+
+    def _start_block(self) -> None:
+        # ブロック同士の間は空行で区切る (リスト項目の先頭やセル内を除く)
+        out = self.out
+        out.end_line()
+        if out.inline_newline is None and not out.empty and not out.at_prefix_start:
+            out.newline()
+
+    def _enter_text(self, node: typing.Any) -> None:
+        text = _get(node, "text") or ""
+        if self.in_code:
+            self.out.write(text)
+            return
+        marks = _get(node, "marks") or ()
+        if not marks:
+            self.out.write(text.translate(_MARKDOWN_ESCAPES))
+            return
+        opening, closing = [], []
+        is_code = False
+        for mark in marks:
+            mark_type = _get(mark, "type")
+            if mark_type == "strong":
+                opening.append("**")
+                closing.append("**")
+            elif mark_type == "em":
+                opening.append("*")
+                closing.append("*")
+            elif mark_type == "strike":
+                opening.append("~~")
+                closing.append("~~")
+            elif mark_type == "code":
+                is_code = True
+            elif mark_type == "link":
+                # 許可しないスキームのリンクはテキストだけを出力する
+                url = _safe_url(_attr(mark, "href"))
+                if url is not None:
+                    opening.append("[")
+                    closing.append(f"]({_markdown_destination(url)})")
+        if is_code:
+            # テキスト中のバッククォートより長い列で囲み、先頭・末尾のバッククォートは空白で区切る
+            fence = _backtick_fence(text)
+            padding = " " if text.startswith("`") or text.endswith("`") else ""
+            body = f"{fence}{padding}{text}{padding}{fence}"
+        else:
+            body = text.translate(_MARKDOWN_ESCAPES)
+        self.out.write("".join(opening) + body + "".join(reversed(closing)))
+
+    def _enter_hardBreak(self, node: typing.Any) -> None:
+        if self.out.inline_newline is not None:
+            self.out.newline()
+        else:
+            self.out.write("\\")
+            self.out.newline()
+
+    def _enter_inlineCard(self, node: typing.Any) -> None:
+        text = str(_attr(node, "url", "")).translate(_MARKDOWN_ESCAPES)
+        url = _safe_url(_attr(node, "url"))
+        self.out.write(f"[{text}]({_markdown_destination(url)})" if url is not None else text)
+
+    def _enter_mediaInline(self, node: typing.Any) -> None:
+        url = _safe_url(_attr(node, "url"))
+        media_id = str(_attr(node, "id", "")).translate(_MARKDOWN_ESCAPES)
+        self.out.write(f"[{media_id}]({_markdown_destination(url)})" if url else f"[インラインメディア: ID:{media_id}]")
+
+    def _enter_media(self, node: typing.Any) -> None:
+        url = _safe_url(_attr(node, "url"))
+        media_id = str(_attr(node, "id", "")).translate(_MARKDOWN_ESCAPES)
+        self.out.end_line()
+        self.out.write(f"![{media_id}]({_markdown_destination(url)})" if url else f"[メディア: {media_id}]")
+        self.out.end_line()
+
+    def _enter_heading(self, node: typing.Any) -> None:
+        self._start_block()
+        self.out.write("#" * min(max(int(_attr(node, "level", 1)), 1), 6) + " ")
+
+    def _enter_bulletList(self, node: typing.Any) -> None:
+        self._start_list_block()
+        self._push_list(node, ordered=False)
+
+    def _enter_orderedList(self, node: typing.Any) -> None:
+        self._start_list_block()
+        self._push_list(node, ordered=True)
+
+    def _start_list_block(self) -> None:
+        # 入れ子のリストは親の項目の直後に続ける (空行を入れると loose list になる)
+        if self.lists:
+            self.out.end_line()
+        else:
+            self._start_block()
+
+    def _enter_blockquote(self, node: typing.Any) -> None:
+        self._start_block()
+        self.out.push_prefix("> ")
+
+    def _enter_rule(self, node: typing.Any) -> None:
+        self._start_block()
+        self.out.write("---")
+        self.out.end_line()
+
+    def _enter_expand(self, node: typing.Any) -> None:
+        self._start_block()
+        self.out.write(f"<details><summary>{html.escape(str(_attr(node, 'title', '')))}</summary>")
+        self.out.end_line()
+
+    def _exit_expand(self, node: typing.Any) -> None:
+        self._start_block()
+        self.out.write("</details>")
+        self.out.end_line()
+
+    def _enter_codeBlock(self, node: typing.Any) -> None:
+        self._start_block()
+        # コード中の ``` でブロックが閉じないよう、コード中のどのバッククォートの連続よりも長い列で囲む
+        code = "".join(_get(child, "text") or "" for child in _get(node, "content") or ())
+        fence = _backtick_fence(code, minimum=3)
+        self.fences.append(fence)
+        self.out.write(f"{fence}{_attr(node, 'language', '')}")
+        self.out.end_line()
+        self.in_code += 1
+
+    def _exit_codeBlock(self, node: typing.Any) -> None:
+        self.in_code -= 1
+        self.out.end_line()
+        self.out.write(self.fences.pop())
+        self.out.end_line()
+
+    def _enter_table(self, node: typing.Any) -> None:
+        self._start_block()
+        self.tables.append([-1, 0])
+
+    def _exit_tableRow(self, node: typing.Any) -> None:
+        self.out.end_line()
+        if self.tables and self.tables[-1][0] == 0:
+            # Markdown のテーブルは1行目をヘッダーとして扱うため、直後に区切り行が必要
+            self.out.write("|" + " --- |" * self.tables[-1][1])
+            self.out.end_line()
+
+    def _enter_mediaGroup(self, node: typing.Any) -> None:
+        self._start_block()
+
+    _enter_mediaSingle = _enter_mediaGroup
+
+
+class _HtmlRenderer(_AdfRenderer):
+    """
+    HTML の断片 (body の内容) を出力します。テキストと属性値はすべてエスケープされます。
+    リンク・画像のURLは http / https / mailto と相対URLだけを出力し、それ以外のスキームのURLはリンクにしません。
+    """
+
+    # 子要素を持つノードの開始タグ・終了タグ
+    _BLOCK_TAGS = {
+        "paragraph": ("<p>", "</p>"),
+        "bulletList": ("<ul>", "</ul>"),
+        "listItem": ("<li>", "</li>"),
+        "blockquote": ("<blockquote>", "</blockquote>"),
+        "table": ("<table>", "</table>"),
+        "tableRow": ("<tr>", "</tr>"),
+        "tableCell": ("<td>", "</td>"),
+        "tableHeader": ("<th>", "</th>"),
+        "mediaGroup": ('<div class="media-group">', "</div>"),
+        "mediaSingle": ('<div class="media-single">', "</div>"),
+    }
+    _MARK_TAGS = {
+        "strong": ("<strong>", "</strong>"),
+        "em": ("<em>", "</em>"),
+        "strike": ("<s>", "</s>"),
+        "underline": ("<u>", "</u>"),
+        "code": ("<code>", "</code>"),
+    }
+
+    def __init__(self, stream: typing.TextIO):
+        super().__init__(stream)
+        self.stream = stream
+
+    def _handler(self, node_type: str) -> typing.Tuple[typing.Callable, typing.Callable]:
+        tags = self._BLOCK_TAGS.get(node_type)
+        if tags is None:
+            return super()._handler(node_type)
+        start, end = tags
+        return lambda node: self.stream.write(start), lambda node: self.stream.write(end)
+
+    def _enter_orderedList(self, node: typing.Any) -> None:
+        order = int(_attr(node, "order", 1))
+        self.stream.write(f'<ol start="{order}">' if order != 1 else "<ol>")
+
+    def _exit_orderedList(self, node: typing.Any) -> None:
+        self.stream.write("</ol>")
+
+    def _enter_text(self, node: typing.Any) -> None:
+        text = html.escape(_get(node, "text") or "", quote=False)
+        marks = _get(node, "marks") or ()
+        if not marks or self.in_code:
+            self.stream.write(text)
+            return
+        opening, closing = [], []
+        for mark in marks:
+            mark_type = _get(mark, "type")
+            if mark_type == "link":
+                # 許可しないスキーム (javascript: など) のリンクはテキストだけを出力する
+                url = _safe_url(_attr(mark, "href"))
+                if url is not None:
+                    opening.append(f'<a href="{html.escape(url)}">')
+                    closing.append("</a>")
+            elif mark_type == "subsup":
+                tag = "sup" if _attr(mark, "type") == "sup" else "sub"
+                opening.append(f"<{tag}>")
+                closing.append(f"</{tag}>")
+            elif mark_type in self._MARK_TAGS:
+                start, end = self._MARK_TAGS[mark_type]
+                opening.append(start)
+                closing.append(end)
+        self.stream.write("".join(opening) + text + "".join(reversed(closing)))
+
+    def _enter_hardBreak(self, node: typing.Any) -> None:
+        self.stream.write("<br>")
+
+    def _enter_inlineCard(self, node: typing.Any) -> None:
+        url = _safe_url(_attr(node, "url"))
+        if url is not None:
+            self.stream.write(f'<a href="{html.escape(url)}">{html.escape(url)}</a>')
+        else:
+            self.stream.write(html.escape(str(_attr(node, "url", "")), quote=False))
+
+    def _enter_media(self, node: typing.Any) -> None:
+        url = _safe_url(_attr(node, "url"))
+        if url is not None:
+            self.stream.write(f'<img src="{html.escape(url)}" alt="{html.escape(str(_attr(node, "id", "")))}">')
+        else:
+            self.stream.write(f'<span class="media" data-id="{html.escape(str(_attr(node, "id", "")))}"></span>')
+
+    _enter_mediaInline = _enter_media
+
+    def _enter_heading(self, node: typing.Any) -> None:
+        self.stream.write(f"<h{min(max(int(_attr(node, 'level', 1)), 1), 6)}>")
+
+    def _exit_heading(self, node: typing.Any) -> None:
+        self.stream.write(f"</h{min(max(int(_attr(node, 'level', 1)), 1), 6)}>")
+
+    def _enter_rule(self, node: typing.Any) -> None:
+        self.stream.write("<hr>")
+
+    def _enter_expand(self, node: typing.Any) -> None:
+        self.stream.write(f"<details><summary>{html.escape(str(_attr(node, 'title', '')))}</summary>")
+
+    def _exit_expand(self, node: typing.Any) -> None:
+        self.stream.write("</details>")
+
+    def _enter_codeBlock(self, node: typing.Any) -> None:
+        language = _attr(node, "language")
+        if language:
+            self.stream.write(f'<pre><code class="language-{html.escape(str(language))}">')
+        else:
+            self.stream.write("<pre><code>")
+        self.in_code += 1
+
+    def _exit_codeBlock(self, node: typing.Any) -> None:
+        self.in_code -= 1
+        self.stream.write("</code></pre>")
+
+    def _enter_unknown(self, node: typing.Any) -> None:
+        self.stream.write(html.escape(_fallback_text(node), quote=False))
+
+
+def _render(renderer_class: typing.Type[_AdfRenderer], adf: AdfInput,
+            stream: typing.Optional[typing.TextIO]) -> typing.Optional[str]:
+    if stream is not None:
+        renderer_class(stream).render(adf)
+        return None
+    buffer = io.StringIO()
+    renderer_class(buffer).render(adf)
+    return buffer.getvalue()
+
+
+def render_plain_text(adf: AdfInput, stream: typing.Optional[typing.TextIO] = None) -> typing.Optional[str]:
+    """
+    ADFをプレーンテキストに変換します。
+
+    ストリームへ順に書き込むため、AdfDocument.to_plain_text() とは次の点で書式が異なります。
+    テーブルの列幅を揃えない (列幅の計算にテーブル全体を保持する必要があるため)、引用の各行の先頭に "> " を付ける、
+    末尾に改行を付ける。
+
+    Args:
+        adf: AdfDocument、APIレスポンスの生のADF (dict)、ADFノードまたはそのリスト。None の場合は空文字列。
+        stream (TextIO, optional): 出力先のテキストストリーム (ファイルなど)。指定した場合はそこへ直接書き込みます。
+
+    Returns:
+        Optional[str]: stream を省略した場合は変換結果の文字列。指定した場合は None。
+    """
+    return _render(_PlainTextRenderer, adf, stream)
+
+
+def render_markdown(adf: AdfInput, stream: typing.Optional[typing.TextIO] = None) -> typing.Optional[str]:
+    """
+    ADFを Markdown (GitHub Flavored Markdown) に変換します。引数と戻り値は render_plain_text() と同じです。
+    テキストの装飾 (太字・斜体・取り消し線・コード・リンク) も変換されます。
+    リンク・画像のURLの扱いは render_html() と同じです。
+    """
+    return _render(_MarkdownRenderer, adf, stream)
+
+
+def render_html(adf: AdfInput, stream: typing.Optional[typing.TextIO] = None) -> typing.Optional[str]:
+    """
+    ADFを HTML の断片に変換します。引数と戻り値は render_plain_text() と同じです。
+    テキストと属性値はエスケープされ、リンク (link マーク・inlineCard) と画像 (media) のURLは
+    http / https / mailto と相対URLだけを出力します。javascript: などそれ以外のスキームのURLはリンク・画像にせず、
+    リンクのテキストやURLの文字列だけを出力します。
+    """
+    return _render(_HtmlRenderer, adf, stream)
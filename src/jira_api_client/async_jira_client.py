@@ -0,0 +1,660 @@
+import asyncio
+import contextlib
+import json
+import os
+import os.path
+import time
+import typing
+
+from pydantic import ValidationError
+
+from jira_api_client.decoding import validate_json
+from jira_api_client.instrumentation import (
+    JiraMetricsCollector,
+    JiraQueryEvent,
+    JiraRequestEvent,
+    emit_query,
+    emit_request,
+)
+from jira_api_client.models.attachment import JiraAttachment, attachment_list_adapter
+from jira_api_client.models.base import JiraIssueTypeEnum, JiraParseModeEnum, JiraStatusNameEnum
+from jira_api_client.models.bulk_fetch import JiraBulkFetchResult
+from jira_api_client.models.interning import JiraInternCache
+from jira_api_client.models.raw import JiraIssueDict
+from jira_api_client.models.record import JiraIssueRecord
+from jira_api_client.models.ticket_create import JiraCreatedIssue
+from jira_api_client.multipart import (
+    AttachmentFile,
+    AttachmentSource,
+    MultipartUploadBody,
+    ProgressCallback,
+    aiter_upload_body,
+    build_upload_parts,
+)
+from jira_api_client.request_builders import (
+    BULK_FETCH_LIMIT,
+    build_auth_headers,
+    build_bulk_fetch_payload,
+    build_create_ticket_payload,
+    build_tickets_jql,
+    format_fields,
+    normalize_issue_keys,
+)
+from jira_api_client.request_scheduler import JiraRequestScheduler
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError("AsyncJiraClient を利用するには httpx が必要です。"
+                      "`pip install jira_api_client[async]` でインストールしてください。") from e
+
+if typing.TYPE_CHECKING:
+    from jira_api_client.models.issue import JiraIssue, JiraLazyIssue, JiraLazyPartialIssue, JiraPartialIssue
+    from jira_api_client.models.search import (
+        JiraLazyPartialSearchResults,
+        JiraLazySearchResults,
+        JiraPartialSearchResults,
+        JiraRawSearchResults,
+        JiraRecordSearchResults,
+        JiraSearchResults,
+    )
+    from jira_api_client.parsing import JiraBulkFetchPage
+
+# 課題・検索結果のモデルと検索結果のパーサーは、初回の検索時に読み込みます (JiraClinet と同様)
+SearchResults = typing.Union["JiraSearchResults", "JiraPartialSearchResults", "JiraLazySearchResults",
+                             "JiraLazyPartialSearchResults", "JiraRawSearchResults", "JiraRecordSearchResults"]
+SearchIssue = typing.Union["JiraIssue", "JiraPartialIssue", "JiraLazyIssue", "JiraLazyPartialIssue", JiraIssueDict,
+                           JiraIssueRecord]
+
+# 再試行の対象とする接続エラー (JiraClinet の requests の ConnectionError / Timeout に相当)
+_CONNECTION_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class AsyncJiraClient(object):
+    """
+    asyncio で Jira REST API と通信するためのクライアントクラス。
+
+    JiraClinet と同じ操作 (検索・チケット作成・添付ファイルのアップロード/ダウンロード) を
+    コルーチンとして提供し、同じPydanticモデルを返します。
+    同時に実行中のリクエスト数は max_concurrency で制限されるため、
+    数百件のリクエストを asyncio.gather で一度に発行しても Jira への負荷は一定に保たれます。
+
+    Example:
+        async with AsyncJiraClient(base_url, email, token, max_concurrency=20) as client:
+            async for issue in client.iter_tickets("PROJ"):
+                print(issue.key)
+    """
+
+    __base_url: str
+    __headers: typing.Dict[str, typing.Any]
+    __upload_headers: typing.Dict[str, typing.Any]
+    __download_headers: typing.Dict[str, typing.Any]
+    __client: "httpx.AsyncClient"
+    __max_concurrency: int
+    __semaphore: typing.Optional[asyncio.Semaphore]
+    __parse_mode: JiraParseModeEnum
+    __validate_every: typing.Optional[int]
+    __intern_entities: bool
+    __metrics: typing.Optional[JiraMetricsCollector]
+    __scheduler: JiraRequestScheduler
+
+    def __init__(self,
+                 base_url: str,
+                 email: str,
+                 token: str,
+                 max_concurrency: int = 10,
+                 keep_alive: bool = True,
+                 timeout: typing.Union[float, typing.Tuple[float, float], None] = (10.0, 60.0),
+                 parse_mode: JiraParseModeEnum = JiraParseModeEnum.FULL,
+                 validate_every: typing.Optional[int] = None,
+                 intern_entities: bool = False,
+                 metrics: typing.Optional[JiraMetricsCollector] = None,
+                 scheduler: typing.Optional[JiraRequestScheduler] = None,
+                 transport: typing.Optional["httpx.AsyncBaseTransport"] = None):
+        """
+        AsyncJiraClient の新しいインスタンスを初期化します。
+
+        Args:
+            base_url (str): Jira REST APIのベースURL (例: 'https://your-company.atlassian.net/rest/api/3/').
+                            末尾にスラッシュがあってもなくても対応します。
+            email (str): Jiraアカウントのメールアドレス。
+            token (str): Jiraで生成されたAPIトークン。
+            max_concurrency (int): 同時に実行するリクエストの最大数 (デフォルト: 10)。
+                                   コネクションプールの最大接続数も同じ値になります。
+            keep_alive (bool): HTTP keep-alive で接続を再利用するかどうか (デフォルト: True)。
+            timeout (float | Tuple[float, float] | None): リクエストのタイムアウト秒数。
+                                                         (接続, 読み込み) のタプルでも指定可能です。
+                                                         デフォルトは (10.0, 60.0)。None の場合は無制限。
+            parse_mode (JiraParseModeEnum): 検索結果の解析方法のデフォルト (デフォルト: FULL)。
+                                            詳細は JiraClinet を参照。
+            validate_every (int, optional): CONSTRUCT / RAW / RECORD モードのサンプリング検証の間隔。詳細は JiraClinet を参照。
+            intern_entities (bool): 検索結果のユーザー・ステータスなどを共有するかどうか。詳細は JiraClinet を参照。
+            metrics (JiraMetricsCollector, optional): リクエスト・検索ごとの計測結果を受け取るコレクター。
+                                                      詳細は JiraClinet を参照。
+            scheduler (JiraRequestScheduler, optional): 送信ペース制御・レート制限 (429 / Retry-After) への対応・
+                                                        5xx と接続エラーの再試行を行うスケジューラ。JiraClinet と同じ
+                                                        ポリシーで、待機は asyncio.sleep() で行います。省略時はデフォルト設定
+                                                        (最大5回再試行, ペース制御なし) のスケジューラを使用します。
+            transport (httpx.AsyncBaseTransport, optional): httpx の通信に使用するトランスポート。
+                                                            テストで httpx.MockTransport を使う場合などに指定します。
+                                                            None の場合は httpx のデフォルト (HTTP接続) を使用します。
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency には1以上を指定してください。")
+
+        # 末尾のスラッシュを統一
+        if not base_url.endswith('/'):
+            base_url += '/'
+        self.__base_url = base_url
+
+        auth_headers = build_auth_headers(email, token)
+        self.__headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            **auth_headers,
+        }
+        # ファイルダウンロード時はContent-Typeは不要、Authorizationヘッダのみ
+        self.__download_headers = {**auth_headers}
+        self.__upload_headers = {
+            **self.__download_headers,
+            "Accept": "application/json",
+            "X-Atlassian-Token": "no-check",  # 添付ファイルアップロードには必須
+        }
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            httpx_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        else:
+            httpx_timeout = httpx.Timeout(timeout)
+        limits = httpx.Limits(max_connections=max_concurrency,
+                              max_keepalive_connections=max_concurrency if keep_alive else 0)
+        self.__client = httpx.AsyncClient(timeout=httpx_timeout, limits=limits, transport=transport)
+        self.__max_concurrency = max_concurrency
+        # Python 3.9 では Semaphore が生成時のイベントループに紐づくため、初回利用時に生成する
+        self.__semaphore = None
+        self.__parse_mode = parse_mode
+        self.__validate_every = validate_every
+        self.__intern_entities = intern_entities
+        self.__metrics = metrics
+        self.__scheduler = scheduler if scheduler is not None else JiraRequestScheduler()
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """コネクションプールを閉じます。"""
+        await self.__client.aclose()
+
+    @property
+    def closed(self) -> bool:
+        """aclose() 済みかどうか。"""
+        return self.__client.is_closed
+
+    @property
+    def metrics(self) -> typing.Optional[JiraMetricsCollector]:
+        """計測結果を受け取るメトリクスコレクター。"""
+        return self.__metrics
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """同時実行数を制限するセマフォを返します。"""
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+        return self.__semaphore
+
+    async def _request(self,
+                       method: str,
+                       url: str,
+                       retryable: typing.Optional[bool] = None,
+                       replayable: bool = True,
+                       event: typing.Optional[JiraRequestEvent] = None,
+                       content_factory: typing.Optional[typing.Callable[[], typing.Any]] = None,
+                       **kwargs) -> "httpx.Response":
+        """
+        スケジューラを経由し、同時実行数の上限を守ってリクエストを送信します。
+        レート制限や一時的なエラーは JiraClinet と同様に待機・再試行し、最終的なレスポンスがエラーステータスの場合は
+        例外を送出します。引数 retryable / replayable は JiraRequestScheduler.send() を参照してください。
+        同時実行数の枠は1回の送信ごとに確保し、再試行の待機中は他のリクエストに譲ります。
+        content_factory を指定した場合は、送信のたびに呼び出した戻り値をボディ (content) にします (再送できるストリーム用)。
+        event を指定した場合は、ステータス・レイテンシ (空きを待った時間を含む)・送受信バイト数・再試行回数を記録します。
+        """
+        attempts = 0
+
+        async def send() -> "httpx.Response":
+            nonlocal attempts
+            attempts += 1
+            if content_factory is not None:
+                kwargs["content"] = content_factory()
+            async with self._semaphore():
+                return await self.__client.request(method, url, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            response = await self.__scheduler.send_async(method,
+                                                         send,
+                                                         retryable=retryable,
+                                                         replayable=replayable,
+                                                         connection_errors=_CONNECTION_ERRORS)
+        finally:
+            if event is not None:
+                event.latency = time.perf_counter() - started
+                event.retries = max(attempts - 1, 0)
+        if event is not None:
+            event.status = response.status_code
+            event.bytes_sent = int(response.request.headers.get("Content-Length", 0))
+            event.bytes_received = len(response.content)
+        response.raise_for_status()
+        return response
+
+    @contextlib.contextmanager
+    def _instrument(self, endpoint: str, method: str, url: str) -> typing.Iterator[JiraRequestEvent]:
+        """APIリクエスト1回分の計測結果を作成し、with ブロックの終了時にメトリクスコレクターへ通知します。"""
+        event = JiraRequestEvent(endpoint, method, url)
+        try:
+            yield event
+        except Exception as e:
+            event.error = type(e).__name__
+            raise
+        finally:
+            emit_request(self.__metrics, event)
+
+    async def iter_pages(self,
+                         jql: str,
+                         max_results: typing.Optional[int] = None,
+                         page_size: int = 50,
+                         fields: typing.Optional[typing.Sequence[str]] = None,
+                         parse_mode: typing.Optional[JiraParseModeEnum] = None,
+                         intern_cache: typing.Optional[JiraInternCache] = None) -> typing.AsyncIterator[SearchResults]:
+        """
+        JQLの検索結果を1ページずつ取得して返す非同期ジェネレータです。
+        引数と動作は JiraClinet.iter_pages() と同じです。
+
+        Yields:
+            JiraSearchResults | JiraPartialSearchResults: 1ページ分の検索結果。
+
+        Raises:
+            httpx.HTTPError: リクエスト中にネットワークまたはHTTPエラーが発生した場合。
+            json.JSONDecodeError: Jira APIからのレスポンスが有効なJSONでない場合。
+            pydantic.ValidationError: レスポンスJSONが定義されたPydanticモデルの構造と一致しない場合。
+            Exception: その他の予期せぬエラーが発生した場合。
+        """
+        search_endpoint = os.path.join(self.__base_url, "search/jql")
+        params = {
+            "jql": jql,
+            "maxResults": page_size,
+            "fields": format_fields(fields),
+        }
+        from jira_api_client.parsing import JiraSearchPageParser
+
+        if intern_cache is None and self.__intern_entities:
+            intern_cache = JiraInternCache()
+        parser = JiraSearchPageParser(fields is not None, parse_mode or self.__parse_mode, self.__validate_every,
+                                      intern_cache)
+
+        query = JiraQueryEvent(jql, parser.parse_mode.value)
+        started = time.perf_counter()
+        fetched = 0
+        try:
+            while True:
+                with self._instrument("search", "GET", search_endpoint) as event:
+                    try:
+                        response = await self._request("GET",
+                                                       search_endpoint,
+                                                       event=event,
+                                                       headers=self.__headers,
+                                                       params=params)
+                        results = parser.parse_json(response.content, event)
+                    except httpx.HTTPError as err:
+                        print(f"Jira API 'search' リクエストエラー: {err}")
+                        if isinstance(err, httpx.HTTPStatusError):
+                            print(f"レスポンス詳細: {err.response.text}")
+                        raise
+                    except json.JSONDecodeError as e:
+                        print(f"Jira API 'search' レスポンスのJSONデコードに失敗しました: {e}")
+                        print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
+                        raise
+                    except ValidationError as e:
+                        print(f"Jira API 'search' Pydanticバリデーションエラー: {e}")
+                        print(f"エラー詳細: {e.errors()}")
+                        raise
+                    except Exception as e:
+                        print(f"Jira API 'search' 予期せぬエラー: {e}")
+                        raise
+
+                if max_results and fetched + len(results.issues) > max_results:
+                    results.issues = results.issues[:max_results - fetched]
+                fetched += len(results.issues)
+                query.add_page(event, len(results.issues))
+
+                yield results
+
+                if not results.issues or results.isLast or (max_results and fetched >= max_results):
+                    query.completed = True
+                    return
+                token = results.nextPageToken
+                if not token:
+                    query.completed = True
+                    return
+                params["nextPageToken"] = token
+        except Exception as e:
+            query.error = type(e).__name__
+            raise
+        finally:
+            query.elapsed = time.perf_counter() - started
+            emit_query(self.__metrics, query)
+
+    async def iter_tickets_by_jql(
+            self,
+            jql: str,
+            max_results: typing.Optional[int] = None,
+            page_size: int = 50,
+            fields: typing.Optional[typing.Sequence[str]] = None,
+            parse_mode: typing.Optional[JiraParseModeEnum] = None) -> typing.AsyncIterator[SearchIssue]:
+        """
+        JQLの検索結果の課題を1件ずつ返す非同期ジェネレータです。引数は iter_pages() と同じです。
+
+        Yields:
+            JiraIssue | JiraPartialIssue: 検索結果の課題。
+        """
+        async for page in self.iter_pages(jql,
+                                          max_results=max_results,
+                                          page_size=page_size,
+                                          fields=fields,
+                                          parse_mode=parse_mode):
+            for issue in page.issues:
+                yield issue
+
+    async def get_tickets_by_jql(self,
+                                 jql: str,
+                                 max_results: typing.Optional[int] = None,
+                                 fields: typing.Optional[typing.Sequence[str]] = None,
+                                 parse_mode: typing.Optional[JiraParseModeEnum] = None) -> SearchResults:
+        """
+        JQLの検索結果を全ページ分取得し、1つの検索結果にまとめて返します。
+        引数と戻り値は JiraClinet.get_tickets_by_jql() と同じです。
+        """
+        all_issues = []
+        async for results in self.iter_pages(jql, max_results=max_results, fields=fields, parse_mode=parse_mode):
+            all_issues.extend(results.issues)
+
+        results.issues = all_issues
+        return results
+
+    async def get_tickets(self,
+                          project_key: str,
+                          issue_type: typing.Optional[JiraIssueTypeEnum] = None,
+                          assignee_account_id: typing.Optional[str] = None,
+                          status_name: typing.Optional[JiraStatusNameEnum] = None,
+                          max_results: typing.Optional[int] = None,
+                          fields: typing.Optional[typing.Sequence[str]] = None,
+                          parse_mode: typing.Optional[JiraParseModeEnum] = None) -> SearchResults:
+        """
+        Jiraから特定のプロジェクトのチケット一覧を取得します。
+        引数と戻り値は JiraClinet.get_tickets() と同じです。
+        """
+        jql_query = build_tickets_jql(project_key, issue_type, assignee_account_id, status_name)
+        return await self.get_tickets_by_jql(jql_query, max_results, fields=fields, parse_mode=parse_mode)
+
+    def iter_tickets(self,
+                     project_key: str,
+                     issue_type: typing.Optional[JiraIssueTypeEnum] = None,
+                     assignee_account_id: typing.Optional[str] = None,
+                     status_name: typing.Optional[JiraStatusNameEnum] = None,
+                     max_results: typing.Optional[int] = None,
+                     fields: typing.Optional[typing.Sequence[str]] = None,
+                     parse_mode: typing.Optional[JiraParseModeEnum] = None) -> typing.AsyncIterator[SearchIssue]:
+        """
+        get_tickets() のストリーミング版です。条件に一致する課題をページ到着ごとに1件ずつ返します。
+        """
+        jql_query = build_tickets_jql(project_key, issue_type, assignee_account_id, status_name)
+        return self.iter_tickets_by_jql(jql_query, max_results, fields=fields, parse_mode=parse_mode)
+
+    async def get_issues(self,
+                         keys: typing.Iterable[str],
+                         fields: typing.Optional[typing.Sequence[str]] = None,
+                         parse_mode: typing.Optional[JiraParseModeEnum] = None,
+                         chunk_size: int = BULK_FETCH_LIMIT) -> JiraBulkFetchResult:
+        """
+        課題のキー (またはID) のリストから、課題の現在の状態をまとめて取得します。
+        引数と戻り値は JiraClinet.get_issues() と同じです。
+        各リクエストは同時に発行され、同時実行数はクライアントの max_concurrency で制限されます。
+
+        Raises:
+            ValueError: chunk_size が範囲外の場合。
+        """
+        if not 1 <= chunk_size <= BULK_FETCH_LIMIT:
+            raise ValueError(f"chunk_size には1〜{BULK_FETCH_LIMIT}を指定してください。")
+        from jira_api_client.parsing import merge_bulk_fetch_pages
+
+        keys = normalize_issue_keys(keys)
+        parse_mode = parse_mode or self.__parse_mode
+        intern_cache = JiraInternCache() if self.__intern_entities else None
+        chunks = [keys[start:start + chunk_size] for start in range(0, len(keys), chunk_size)]
+        pages = await asyncio.gather(*(self._fetch_issues_chunk(chunk, fields, parse_mode, intern_cache)
+                                       for chunk in chunks))
+        return merge_bulk_fetch_pages(keys, pages)
+
+    async def _fetch_issues_chunk(self, keys: typing.List[str], fields: typing.Optional[typing.Sequence[str]],
+                                  parse_mode: JiraParseModeEnum,
+                                  intern_cache: typing.Optional[JiraInternCache]) -> "JiraBulkFetchPage":
+        """get_issues() の1リクエスト分を送信します。動作は JiraClinet._fetch_issues_chunk() と同じです。"""
+        from jira_api_client.parsing import JiraSearchPageParser, failed_bulk_fetch_page, parse_bulk_fetch
+
+        bulk_fetch_endpoint = os.path.join(self.__base_url, "issue/bulkfetch")
+        parser = JiraSearchPageParser(fields is not None, parse_mode, self.__validate_every, intern_cache)
+
+        with self._instrument("get_issues", "POST", bulk_fetch_endpoint) as event:
+            try:
+                # 取得のみで副作用が無いため、POST でも一時的なエラーは再試行する
+                response = await self._request("POST",
+                                               bulk_fetch_endpoint,
+                                               retryable=True,
+                                               event=event,
+                                               headers=self.__headers,
+                                               content=json.dumps(build_bulk_fetch_payload(keys, fields)))
+                page = parse_bulk_fetch(parser, response.content, keys, event)
+            except httpx.HTTPError as err:
+                event.error = type(err).__name__
+                print(f"Jira API 'get_issues' リクエストエラー: {err}")
+                status = None
+                if isinstance(err, httpx.HTTPStatusError):
+                    print(f"レスポンス詳細: {err.response.text}")
+                    status = err.response.status_code
+                return failed_bulk_fetch_page(keys, status, str(err))
+            except (json.JSONDecodeError, ValidationError) as e:
+                event.error = type(e).__name__
+                print(f"Jira API 'get_issues' レスポンスの解析に失敗しました: {e}")
+                return failed_bulk_fetch_page(keys, response.status_code, str(e))
+
+        for key in page.unresolved:
+            retried = await self._fetch_issues_chunk([key], fields, parse_mode, intern_cache)
+            page.issues.update(retried.issues)
+            page.moved.update(retried.moved)
+            page.missing.extend(retried.missing)
+            page.errors.extend(retried.errors)
+        page.unresolved = []
+        return page
+
+    async def create_ticket(self,
+                            project_key: str,
+                            summary: str,
+                            description: typing.Optional[str] = None,
+                            issue_type: JiraIssueTypeEnum = JiraIssueTypeEnum.TASK,
+                            assignee_account_id: typing.Optional[str] = None,
+                            priority_name: typing.Optional[str] = None,
+                            custom_fields: typing.Optional[typing.Dict[str, typing.Any]] = None) -> JiraCreatedIssue:
+        """
+        Jiraに新しいチケットを作成します。引数と戻り値は JiraClinet.create_ticket() と同じです。
+
+        Raises:
+            httpx.HTTPError: リクエスト中にネットワークまたはHTTPエラーが発生した場合。
+            json.JSONDecodeError: Jira APIからのレスポンスが有効なJSONでない場合。
+            pydantic.ValidationError: レスポンスJSONが定義されたPydanticモデルの構造と一致しない場合。
+            Exception: その他の予期せぬエラーが発生した場合。
+        """
+        create_endpoint = os.path.join(self.__base_url, "issue")
+        payload = build_create_ticket_payload(project_key, summary, description, issue_type, assignee_account_id,
+                                              priority_name, custom_fields)
+
+        with self._instrument("create_ticket", "POST", create_endpoint) as event:
+            try:
+                response = await self._request("POST",
+                                               create_endpoint,
+                                               event=event,
+                                               headers=self.__headers,
+                                               content=json.dumps(payload))
+                return validate_json(JiraCreatedIssue.model_validate_json, response.content, event)
+            except httpx.HTTPError as err:
+                print(f"Jira API 'create_ticket' リクエストエラー: {err}")
+                if isinstance(err, httpx.HTTPStatusError):
+                    print(f"レスポンス詳細: {err.response.text}")
+                raise
+            except json.JSONDecodeError as e:
+                print(f"Jira API 'create_ticket' レスポンスのJSONデコードに失敗しました: {e}")
+                print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
+                raise
+            except ValidationError as e:
+                print(f"Jira API 'create_ticket' Pydanticバリデーションエラー: {e}")
+                print(f"エラー詳細: {e.errors()}")
+                raise
+            except Exception as e:
+                print(f"Jira API 'create_ticket' 予期せぬエラー: {e}")
+                raise
+
+    async def upload_attachment(self,
+                                issue_key_or_id: str,
+                                file_path: AttachmentSource,
+                                filename: typing.Optional[str] = None,
+                                progress_callback: typing.Optional[ProgressCallback] = None,
+                                chunk_size: int = 1024 * 1024) -> typing.List[JiraAttachment]:
+        """
+        指定されたJiraチケットにファイルをアップロードします。
+        引数と戻り値は JiraClinet.upload_attachment() と同じです。
+        """
+        return await self.upload_attachments(issue_key_or_id, [(filename, file_path)],
+                                             progress_callback=progress_callback,
+                                             chunk_size=chunk_size)
+
+    async def upload_attachments(self,
+                                 issue_key_or_id: str,
+                                 files: typing.Sequence[AttachmentFile],
+                                 progress_callback: typing.Optional[ProgressCallback] = None,
+                                 chunk_size: int = 1024 * 1024) -> typing.List[JiraAttachment]:
+        """
+        指定されたJiraチケットに、複数のファイルを1回の multipart リクエストでアップロードします。
+        引数と戻り値は JiraClinet.upload_attachments() と同じです。
+
+        ボディはストリーミング送信され、ファイルの読み込みは別スレッドで行われるため (multipart.aiter_upload_body())、
+        大きなファイルのアップロード中も他のコルーチンの処理は止まりません。
+        """
+        if not files:
+            raise ValueError("files には1つ以上のファイルを指定してください。")
+        parts = await asyncio.to_thread(build_upload_parts, files)
+        upload_endpoint = os.path.join(self.__base_url, f"issue/{issue_key_or_id}/attachments")
+
+        with self._instrument("upload_attachment", "POST", upload_endpoint) as event:
+            try:
+                body = MultipartUploadBody(parts, chunk_size=chunk_size, progress_callback=progress_callback)
+                headers = {**self.__upload_headers, "Content-Type": body.content_type}
+                if body.total_size is not None:
+                    headers["Content-Length"] = str(body.total_size)
+                response = await self._request("POST",
+                                               upload_endpoint,
+                                               replayable=body.replayable,
+                                               event=event,
+                                               content_factory=lambda: aiter_upload_body(body),
+                                               headers=headers)
+                event.bytes_sent = body.bytes_sent
+
+                return validate_json(attachment_list_adapter().validate_json, response.content, event)
+            except httpx.HTTPError as err:
+                print(f"Jira API 'upload_attachment' リクエストエラー: {err}")
+                if isinstance(err, httpx.HTTPStatusError):
+                    print(f"レスポンス詳細: {err.response.text}")
+                raise
+            except json.JSONDecodeError as e:
+                print(f"Jira API 'upload_attachment' レスポンスのJSONデコードに失敗しました: {e}")
+                print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
+                raise
+            except ValidationError as e:
+                print(f"Jira API 'upload_attachment' Pydanticバリデーションエラー: {e}")
+                print(f"エラー詳細: {e.errors()}")
+                raise
+            except Exception as e:
+                print(f"Jira API 'upload_attachment' 予期せぬエラー: {e}")
+                raise
+
+    async def download_attachment(self,
+                                  attachment: JiraAttachment,
+                                  save_path: typing.Optional[str] = None,
+                                  chunk_size: int = 1024 * 1024) -> None:
+        """
+        Jiraに添付されたファイルをダウンロードします。
+        引数は JiraClinet.download_attachment() と同じです。
+
+        ファイルへの書き込みはチャンクごとに別スレッドで行うため、イベントループをブロックしません。
+        スレッドの切り替えの回数を抑えるため、chunk_size のデフォルトは JiraClinet より大きい 1MiB です。
+
+        Raises:
+            httpx.HTTPError: リクエスト中にネットワークまたはHTTPエラーが発生した場合。
+            Exception: その他の予期せぬエラーが発生した場合。
+        """
+        if save_path is None:
+            save_path = f"./{attachment.filename}"
+        try:
+            with self._instrument("download_attachment", "GET", attachment.content) as event, \
+                    event.measure("latency"):
+                request = self.__client.build_request("GET", attachment.content, headers=self.__download_headers)
+                semaphore = self._semaphore()
+
+                async def send() -> "httpx.Response":
+                    # 同時実行数の枠は送信ごとに確保する。エラーの応答は本文を読み込んで枠を返し、
+                    # 再試行の待機中は他のリクエストに譲る。成功した応答の枠は本文を書き込み終えるまで保持する
+                    await semaphore.acquire()
+                    try:
+                        response = await self.__client.send(request, stream=True)
+                    except BaseException:
+                        semaphore.release()
+                        raise
+                    if response.is_error:
+                        try:
+                            # エラー詳細を出力できるよう、本文を読み込んでおく
+                            await response.aread()
+                        finally:
+                            await response.aclose()
+                            semaphore.release()
+                    return response
+
+                response = await self.__scheduler.send_async("GET", send, connection_errors=_CONNECTION_ERRORS)
+                try:
+                    event.status = response.status_code
+                    response.raise_for_status()
+
+                    # 保存先のディレクトリが存在しない場合は作成 (ファイル名のみの場合はカレントディレクトリに保存)
+                    save_dir = os.path.dirname(save_path)
+                    if save_dir:
+                        await asyncio.to_thread(os.makedirs, save_dir, exist_ok=True)
+
+                    f = await asyncio.to_thread(open, save_path, 'wb')
+                    try:
+                        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                            await asyncio.to_thread(f.write, chunk)
+                            event.bytes_received += len(chunk)
+                    finally:
+                        await asyncio.to_thread(f.close)
+                finally:
+                    await response.aclose()
+                    if not response.is_error:
+                        semaphore.release()
+            print(f"ファイルをダウンロードしました: {save_path}")
+
+        except httpx.HTTPError as err:
+            print(f"添付ファイルダウンロードリクエストエラー: {err}")
+            if isinstance(err, httpx.HTTPStatusError):
+                print(f"レスポンス詳細: {err.response.text}")
+            raise
+        except Exception as e:
+            print(f"添付ファイルダウンロード中に予期せぬエラー: {e}")
+            raise
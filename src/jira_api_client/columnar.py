@@ -0,0 +1,441 @@
+import datetime
+import typing
+from enum import Enum
+
+from pydantic import BaseModel
+
+from jira_api_client.jql import parse_jira_datetime
+from jira_api_client.models.base import JiraParseModeEnum
+
+if typing.TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+    from jira_api_client.jira_client import JiraClinet
+
+# --- 検索結果を列 (カラム) 単位で書き出すエクスポーター ---
+# 課題をモデルや行 (dict) に変換せず、RAW モードでデコードしたページから必要な値だけを列ごとのバッファに集め、
+# batch_size 件ごとに Arrow の RecordBatch や NumPy の配列に変換します。
+# pyarrow / numpy は任意の依存関係です (pip install jira_api_client[columnar])。
+
+
+class JiraColumnTypeEnum(str, Enum):
+    """エクスポートする列のデータ型。"""
+    STRING = "string"
+    INT64 = "int64"
+    FLOAT64 = "float64"
+    BOOL = "bool"
+    TIMESTAMP = "timestamp"  # Jiraの日時文字列をUTCのミリ秒精度のタイムスタンプに変換する
+    STRING_LIST = "string_list"  # ラベルなどの文字列の配列
+
+
+class JiraColumn(object):
+    """
+    エクスポートする列の定義。
+
+    path は課題のJSON上の値の位置を表すキーの並びです (例: ("fields", "status", "name"))。
+    途中の値が存在しない (None や欠落) 場合、その行の値は欠損値になります。
+    """
+
+    def __init__(self, name: str, path: typing.Sequence[str], column_type: JiraColumnTypeEnum):
+        """
+        Args:
+            name (str): 列名。
+            path (Sequence[str]): 課題のJSON上の値の位置を表すキーの並び。
+            column_type (JiraColumnTypeEnum): 列のデータ型。
+        """
+        if not path:
+            raise ValueError("path には1つ以上のキーを指定してください。")
+        self.name = name
+        self.path = tuple(path)
+        self.column_type = column_type
+
+    @property
+    def field(self) -> typing.Optional[str]:
+        """検索時に取得する必要があるフィールド名。課題直下の値 (key, id など) の場合は None。"""
+        if self.path[0] == "fields" and len(self.path) > 1:
+            return self.path[1]
+        return None
+
+    def __repr__(self) -> str:
+        return f"JiraColumn({self.name!r}, {self.path!r}, {self.column_type.value})"
+
+
+DEFAULT_COLUMNS: typing.Tuple[JiraColumn, ...] = (
+    JiraColumn("key", ("key",), JiraColumnTypeEnum.STRING),
+    JiraColumn("id", ("id",), JiraColumnTypeEnum.STRING),
+    JiraColumn("project_key", ("fields", "project", "key"), JiraColumnTypeEnum.STRING),
+    JiraColumn("issue_type", ("fields", "issuetype", "name"), JiraColumnTypeEnum.STRING),
+    JiraColumn("summary", ("fields", "summary"), JiraColumnTypeEnum.STRING),
+    JiraColumn("status", ("fields", "status", "name"), JiraColumnTypeEnum.STRING),
+    JiraColumn("status_category", ("fields", "status", "statusCategory", "key"), JiraColumnTypeEnum.STRING),
+    JiraColumn("priority", ("fields", "priority", "name"), JiraColumnTypeEnum.STRING),
+    JiraColumn("assignee_account_id", ("fields", "assignee", "accountId"), JiraColumnTypeEnum.STRING),
+    JiraColumn("reporter_account_id", ("fields", "reporter", "accountId"), JiraColumnTypeEnum.STRING),
+    JiraColumn("labels", ("fields", "labels"), JiraColumnTypeEnum.STRING_LIST),
+    JiraColumn("created", ("fields", "created"), JiraColumnTypeEnum.TIMESTAMP),
+    JiraColumn("updated", ("fields", "updated"), JiraColumnTypeEnum.TIMESTAMP),
+    JiraColumn("resolutiondate", ("fields", "resolutiondate"), JiraColumnTypeEnum.TIMESTAMP),
+    JiraColumn("timespent", ("fields", "timespent"), JiraColumnTypeEnum.INT64),
+    JiraColumn("timeestimate", ("fields", "timeestimate"), JiraColumnTypeEnum.INT64),
+    JiraColumn("timeoriginalestimate", ("fields", "timeoriginalestimate"), JiraColumnTypeEnum.INT64),
+    JiraColumn("workratio", ("fields", "workratio"), JiraColumnTypeEnum.INT64),
+)
+
+# NumPy の datetime64 で欠損値 (NaT) を表す整数値
+_NAT = -(2**63)
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+
+def _require_pyarrow() -> typing.Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Arrow / Parquet 形式で出力するには pyarrow が必要です。"
+                          "`pip install jira_api_client[columnar]` でインストールしてください。") from e
+    return pyarrow
+
+
+def _require_numpy() -> typing.Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NumPy の配列に変換するには numpy が必要です。"
+                          "`pip install jira_api_client[columnar]` でインストールしてください。") from e
+    return numpy
+
+
+def _get(value: typing.Any, key: str) -> typing.Any:
+    """dict (RAW モード) とモデル (FULL / CONSTRUCT モードなど) のどちらからも値を取り出します。"""
+    if isinstance(value, dict):
+        return value.get(key)
+    if isinstance(value, BaseModel):
+        found = value.__dict__.get(key)
+        if found is None and value.__pydantic_extra__:
+            found = value.__pydantic_extra__.get(key)
+        return found
+    return None
+
+
+def _extract(issue: typing.Any, path: typing.Tuple[str, ...]) -> typing.Any:
+    value = issue
+    for key in path:
+        value = _get(value, key)
+        if value is None:
+            return None
+    return value
+
+
+def _epoch_millis(value: typing.Any) -> typing.Optional[int]:
+    if not isinstance(value, str):
+        return None
+    parsed = parse_jira_datetime(value)
+    if parsed is None:
+        return None
+    return (parsed - _EPOCH) // _MILLISECOND
+
+
+def _to_str(value: typing.Any) -> typing.Optional[str]:
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _to_str_list(value: typing.Any) -> typing.Optional[typing.List[str]]:
+    if not isinstance(value, list):
+        return None
+    return [item if isinstance(item, str) else str(item) for item in value]
+
+
+def _numeric(cast: typing.Callable[[typing.Any], typing.Any]) -> typing.Callable[[typing.Any], typing.Any]:
+
+    def convert(value: typing.Any) -> typing.Any:
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            return None
+
+    return convert
+
+
+_CONVERTERS: typing.Dict[JiraColumnTypeEnum, typing.Callable[[typing.Any], typing.Any]] = {
+    JiraColumnTypeEnum.STRING: _to_str,
+    JiraColumnTypeEnum.INT64: _numeric(int),
+    JiraColumnTypeEnum.FLOAT64: _numeric(float),
+    JiraColumnTypeEnum.BOOL: lambda value: value if isinstance(value, bool) else None,
+    JiraColumnTypeEnum.TIMESTAMP: _epoch_millis,
+    JiraColumnTypeEnum.STRING_LIST: _to_str_list,
+}
+
+
+def arrow_schema(columns: typing.Sequence[JiraColumn] = DEFAULT_COLUMNS) -> "pyarrow.Schema":
+    """
+    columns に対応する Arrow のスキーマを返します。
+
+    Raises:
+        ImportError: pyarrow がインストールされていない場合。
+    """
+    pa = _require_pyarrow()
+    types = {
+        JiraColumnTypeEnum.STRING: pa.string(),
+        JiraColumnTypeEnum.INT64: pa.int64(),
+        JiraColumnTypeEnum.FLOAT64: pa.float64(),
+        JiraColumnTypeEnum.BOOL: pa.bool_(),
+        JiraColumnTypeEnum.TIMESTAMP: pa.timestamp("ms", tz="UTC"),
+        JiraColumnTypeEnum.STRING_LIST: pa.list_(pa.string()),
+    }
+    return pa.schema([pa.field(column.name, types[column.column_type]) for column in columns])
+
+
+class JiraColumnBuffer(object):
+    """
+    課題の値を列ごとに蓄積するバッファ。
+
+    値は列の型に合わせて変換した状態 (日時はUTCのエポックミリ秒、欠損値は None) で保持され、
+    to_record_batch() / to_numpy() でまとめて Arrow / NumPy の配列に変換されます。
+    """
+
+    def __init__(self, columns: typing.Sequence[JiraColumn] = DEFAULT_COLUMNS):
+        """
+        Args:
+            columns (Sequence[JiraColumn]): 蓄積する列の定義 (デフォルト: DEFAULT_COLUMNS)。
+        """
+        names = [column.name for column in columns]
+        if len(set(names)) != len(names):
+            raise ValueError("列名が重複しています。")
+        self.columns = tuple(columns)
+        self.values: typing.Dict[str, typing.List[typing.Any]] = {name: [] for name in names}
+        self.__plan = [(self.values[column.name], column.path, _CONVERTERS[column.column_type])
+                       for column in self.columns]
+        self.__rows = 0
+
+    def __len__(self) -> int:
+        return self.__rows
+
+    def append(self, issues: typing.Iterable[typing.Any]) -> None:
+        """
+        課題を列ごとのバッファに追加します。
+
+        Args:
+            issues (Iterable): 課題の dict (RAW モード) またはモデル (JiraIssue など)。
+        """
+        issues = list(issues)
+        for values, path, convert in self.__plan:
+            values.extend(convert(_extract(issue, path)) for issue in issues)
+        self.__rows += len(issues)
+
+    def clear(self) -> None:
+        """蓄積した値を破棄します。"""
+        for values in self.values.values():
+            values.clear()
+        self.__rows = 0
+
+    def to_record_batch(self) -> "pyarrow.RecordBatch":
+        """
+        蓄積した値を Arrow の RecordBatch に変換します。
+
+        Raises:
+            ImportError: pyarrow がインストールされていない場合。
+        """
+        pa = _require_pyarrow()
+        schema = arrow_schema(self.columns)
+        arrays = [pa.array(self.values[field.name], type=field.type) for field in schema]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_numpy(self) -> typing.Dict[str, "numpy.ndarray"]:
+        """
+        蓄積した値を列名と NumPy の配列の辞書に変換します。
+
+        日時の列は datetime64[ms] (UTC, 欠損値は NaT)、文字列・文字列の配列の列は object 型の配列になります。
+        欠損値を含む整数の列は float64 (欠損値は NaN)、欠損値を含む真偽値の列は object 型の配列になります。
+
+        Raises:
+            ImportError: numpy がインストールされていない場合。
+        """
+        np = _require_numpy()
+        arrays = {}
+        for column in self.columns:
+            values = self.values[column.name]
+            column_type = column.column_type
+            if column_type == JiraColumnTypeEnum.TIMESTAMP:
+                array = np.array([_NAT if value is None else value for value in values],
+                                 dtype=np.int64).view("datetime64[ms]")
+            elif column_type in (JiraColumnTypeEnum.STRING, JiraColumnTypeEnum.STRING_LIST):
+                array = np.empty(len(values), dtype=object)
+                array[:] = values
+            elif column_type == JiraColumnTypeEnum.INT64 and None not in values:
+                array = np.array(values, dtype=np.int64)
+            elif column_type == JiraColumnTypeEnum.BOOL and None not in values:
+                array = np.array(values, dtype=np.bool_)
+            elif column_type == JiraColumnTypeEnum.BOOL:
+                array = np.array(values, dtype=object)
+            else:
+                array = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+            arrays[column.name] = array
+        return arrays
+
+
+class JiraColumnarExporter(object):
+    """
+    JQLの検索結果を列単位で Parquet / Arrow IPC ファイルや NumPy の配列に書き出すエクスポーター。
+
+    検索結果は RAW モード (検証なしの dict) で1ページずつ取得され、batch_size 件ごとに RecordBatch として
+    ファイルに追記されるため、結果件数に関わらずメモリ使用量は batch_size 件分に収まります。
+
+    Example:
+        exporter = JiraColumnarExporter(client)
+        exporter.write_parquet("project = PROJ", "issues.parquet")
+    """
+
+    __client: "JiraClinet"
+
+    def __init__(self,
+                 client: "JiraClinet",
+                 columns: typing.Sequence[JiraColumn] = DEFAULT_COLUMNS,
+                 batch_size: int = 10000,
+                 page_size: int = 100):
+        """
+        Args:
+            client (JiraClinet): 検索に使用するクライアント。
+            columns (Sequence[JiraColumn]): 出力する列の定義 (デフォルト: DEFAULT_COLUMNS)。
+            batch_size (int): 1つの RecordBatch にまとめる課題の件数 (デフォルト: 10000)。
+            page_size (int): 1回のリクエストで取得する件数 (デフォルト: 100)。
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size には1以上を指定してください。")
+        self.__client = client
+        self.columns = tuple(columns)
+        self.batch_size = batch_size
+        self.page_size = page_size
+
+    @property
+    def fields(self) -> typing.List[str]:
+        """検索時に取得するフィールドのリスト (列の定義から求めたもの)。"""
+        fields = []
+        for column in self.columns:
+            if column.field is not None and column.field not in fields:
+                fields.append(column.field)
+        return fields
+
+    def iter_buffers(self, jql: str, max_results: typing.Optional[int] = None) -> typing.Iterator[JiraColumnBuffer]:
+        """
+        検索結果を batch_size 件ずつ列のバッファに詰めて返すジェネレータです。
+
+        返されるバッファは次の要素を取得する際に再利用 (clear) されるため、必要な値は呼び出し側で変換・コピーしてください。
+
+        Args:
+            jql (str): 検索に使用するJQLクエリ。
+            max_results (int, optional): 取得する最大件数。None の場合はすべて取得します。
+
+        Yields:
+            JiraColumnBuffer: 最大 batch_size 件の課題を蓄積したバッファ。
+        """
+        buffer = JiraColumnBuffer(self.columns)
+        pages = self.__client.iter_pages(jql,
+                                         max_results=max_results,
+                                         page_size=self.page_size,
+                                         fields=self.fields,
+                                         parse_mode=JiraParseModeEnum.RAW)
+        for page in pages:
+            issues = page.issues
+            while issues:
+                room = self.batch_size - len(buffer)
+                buffer.append(issues[:room])
+                issues = issues[room:]
+                if len(buffer) >= self.batch_size:
+                    yield buffer
+                    buffer.clear()
+        if len(buffer):
+            yield buffer
+
+    def iter_record_batches(self,
+                            jql: str,
+                            max_results: typing.Optional[int] = None) -> typing.Iterator["pyarrow.RecordBatch"]:
+        """
+        検索結果を batch_size 件ずつ Arrow の RecordBatch に変換して返すジェネレータです。
+
+        Raises:
+            ImportError: pyarrow がインストールされていない場合。
+        """
+        for buffer in self.iter_buffers(jql, max_results):
+            yield buffer.to_record_batch()
+
+    def write_parquet(self,
+                      jql: str,
+                      path: str,
+                      max_results: typing.Optional[int] = None,
+                      compression: str = "snappy") -> int:
+        """
+        検索結果を Parquet ファイルに書き出します。RecordBatch ごとに追記されます。
+
+        Args:
+            jql (str): 検索に使用するJQLクエリ。
+            path (str): 出力先のファイルパス。
+            max_results (int, optional): 取得する最大件数。None の場合はすべて取得します。
+            compression (str): Parquet の圧縮方式 (デフォルト: 'snappy')。
+
+        Returns:
+            int: 書き出した課題の件数。
+
+        Raises:
+            ImportError: pyarrow がインストールされていない場合。
+        """
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        rows = 0
+        with pq.ParquetWriter(path, arrow_schema(self.columns), compression=compression) as writer:
+            for batch in self.iter_record_batches(jql, max_results):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        return rows
+
+    def write_arrow(self, jql: str, path: str, max_results: typing.Optional[int] = None) -> int:
+        """
+        検索結果を Arrow IPC (Feather V2) ファイルに書き出します。RecordBatch ごとに追記されます。
+
+        Args:
+            jql (str): 検索に使用するJQLクエリ。
+            path (str): 出力先のファイルパス。
+            max_results (int, optional): 取得する最大件数。None の場合はすべて取得します。
+
+        Returns:
+            int: 書き出した課題の件数。
+
+        Raises:
+            ImportError: pyarrow がインストールされていない場合。
+        """
+        pa = _require_pyarrow()
+        rows = 0
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, arrow_schema(self.columns)) as writer:
+            for batch in self.iter_record_batches(jql, max_results):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        return rows
+
+    def to_numpy(self, jql: str, max_results: typing.Optional[int] = None) -> typing.Dict[str, "numpy.ndarray"]:
+        """
+        検索結果を列名と NumPy の配列の辞書に変換します。
+
+        batch_size 件ごとに配列へ変換してから連結するため、Pythonオブジェクトとして保持されるのは
+        batch_size 件分だけです (文字列の列は object 型の配列になります)。
+
+        Raises:
+            ImportError: numpy がインストールされていない場合。
+        """
+        np = _require_numpy()
+        chunks: typing.Dict[str, typing.List["numpy.ndarray"]] = {column.name: [] for column in self.columns}
+        for buffer in self.iter_buffers(jql, max_results):
+            for name, array in buffer.to_numpy().items():
+                chunks[name].append(array)
+        if not any(chunks.values()):
+            return JiraColumnBuffer(self.columns).to_numpy()
+        return {name: _concatenate(np, arrays) for name, arrays in chunks.items()}
+
+
+def _concatenate(np: typing.Any, arrays: typing.List["numpy.ndarray"]) -> "numpy.ndarray":
+    """バッチごとに dtype が異なる場合 (欠損値の有無による int64 と float64 など) も連結できるようにします。"""
+    dtypes = {array.dtype for array in arrays}
+    if len(dtypes) > 1 and np.dtype(object) not in dtypes:
+        dtype = np.result_type(*dtypes)
+        arrays = [array.astype(dtype) for array in arrays]
+    return np.concatenate(arrays)
@@ -0,0 +1,75 @@
+import json
+import time
+import typing
+
+from pydantic import ValidationError
+
+from jira_api_client.instrumentation import JiraRequestEvent
+
+try:
+    import orjson
+except ImportError:  # orjson は任意の依存関係 (pip install jira_api_client[orjson])
+    orjson = None
+
+# レスポンスボディ (bytes) のJSONデコードと検証。
+# 課題のモデルを読み込まずに利用できるよう parsing から分けています (チケット作成などの軽い処理で使用します)。
+
+T = typing.TypeVar("T")
+
+
+def decode_json(content: bytes) -> typing.Any:
+    """
+    レスポンスボディ (bytes) をデコードします。orjson がインストールされている場合は orjson を使用します。
+
+    Raises:
+        json.JSONDecodeError: content が不正なJSONの場合 (orjson.JSONDecodeError も json.JSONDecodeError のサブクラスです)。
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def validate_json(validator: typing.Callable[[bytes], T],
+                  content: bytes,
+                  event: typing.Optional[JiraRequestEvent] = None) -> T:
+    """
+    レスポンスボディ (bytes) を、中間の dict を作らずに validator (model_validate_json など) で直接検証します。
+
+    Pydantic は不正なJSONも ValidationError (json_invalid) として送出するため、その場合は標準の json モジュールで
+    デコードし直し、位置情報 (行・列) を含む json.JSONDecodeError に置き換えて送出します。
+
+    Args:
+        validator (Callable[[bytes], T]): BaseModel.model_validate_json や TypeAdapter.validate_json。
+        content (bytes): レスポンスボディ。
+        event (JiraRequestEvent, optional): 所要時間を validation_time に記録するリクエストの計測結果。
+
+    Returns:
+        T: 検証済みの値。
+
+    Raises:
+        json.JSONDecodeError: content が不正なJSONの場合。
+        pydantic.ValidationError: JSONの構造がモデルと一致しない場合。
+    """
+    started = time.perf_counter()
+    try:
+        return validator(content)
+    except ValidationError as e:
+        errors = e.errors()
+        if not errors or any(error["type"] != "json_invalid" for error in errors):
+            raise
+        _raise_json_decode_error(content, e)
+        raise
+    finally:
+        if event is not None:
+            event.validation_time += time.perf_counter() - started
+
+
+def _raise_json_decode_error(content: bytes, cause: Exception) -> None:
+    """content を json.loads() でデコードし直し、得られた json.JSONDecodeError を cause に連結して送出します。"""
+    try:
+        json.loads(content)
+    except json.JSONDecodeError as decode_error:
+        raise decode_error from cause
+    except UnicodeDecodeError as decode_error:
+        text = content.decode("utf-8", errors="replace")
+        raise json.JSONDecodeError(f"Invalid UTF-8: {decode_error.reason}", text, decode_error.start) from cause
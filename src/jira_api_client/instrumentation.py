@@ -0,0 +1,315 @@
+import collections
+import contextlib
+import threading
+import time
+import typing
+
+# --- リクエスト・検索ごとの計測 (インストルメンテーション) ---
+# JiraClinet / AsyncJiraClient に metrics (JiraMetricsCollector) を指定すると、
+# APIリクエスト1回ごとに JiraRequestEvent が、JQL検索 (iter_pages() のページング) 1回ごとに JiraQueryEvent が通知されます。
+# JiraInMemoryMetricsCollector はエンドポイントごとに集計してメモリ上に保持し、
+# Prometheus / OpenTelemetry などへの出力は JiraMetricsCollector を継承して on_request() / on_query() を実装します。
+
+
+class JiraRequestEvent(object):
+    """
+    APIリクエスト1回分の計測結果。
+
+    latency はリクエストの送信開始から最終的なレスポンスの受信までの秒数で、
+    スケジューラによるレート制限の待機や再試行の待機も含みます。
+    decode_time / validation_time はレスポンスボディのJSONデコードとモデルの検証に要した秒数です。
+    model_validate_json() のようにデコードと検証を同時に行う場合は、全体が validation_time に計上されます。
+    """
+
+    __slots__ = ("endpoint", "method", "url", "status", "started_at", "latency", "bytes_sent", "bytes_received",
+                 "retries", "decode_time", "validation_time", "error")
+
+    def __init__(self, endpoint: str, method: str, url: str):
+        """
+        Args:
+            endpoint (str): APIの種類を表す名前 (例: 'search', 'create_ticket')。
+            method (str): HTTPメソッド。
+            url (str): リクエストURL (クエリパラメータを除く)。
+        """
+        self.endpoint = endpoint
+        self.method = method
+        self.url = url
+        self.status: typing.Optional[int] = None
+        self.started_at = time.time()
+        self.latency = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.decode_time = 0.0
+        self.validation_time = 0.0
+        self.error: typing.Optional[str] = None
+
+    @contextlib.contextmanager
+    def measure(self, attribute: str) -> typing.Iterator[None]:
+        """with ブロックの所要時間を attribute ('decode_time' / 'validation_time' など) に加算します。"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, attribute, getattr(self, attribute) + time.perf_counter() - started)
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"JiraRequestEvent(endpoint={self.endpoint!r}, status={self.status!r}, "
+                f"latency={self.latency:.3f}, retries={self.retries})")
+
+
+class JiraQueryEvent(object):
+    """
+    JQL検索 (iter_pages() による1回のページング) 全体の集計結果。
+
+    elapsed は最初のリクエストの送信から検索の終了までの秒数で、呼び出し元がページを処理していた時間も含みます。
+    request_time / decode_time / validation_time は各ページのリクエストの計測結果の合計です。
+    全ページを取得する前に中断された場合 (ジェネレータの close() や例外) は completed が False になります。
+    """
+
+    __slots__ = ("jql", "parse_mode", "pages", "issues", "started_at", "elapsed", "request_time", "decode_time",
+                 "validation_time", "bytes_received", "retries", "completed", "error")
+
+    def __init__(self, jql: str, parse_mode: str):
+        self.jql = jql
+        self.parse_mode = parse_mode
+        self.pages = 0
+        self.issues = 0
+        self.started_at = time.time()
+        self.elapsed = 0.0
+        self.request_time = 0.0
+        self.decode_time = 0.0
+        self.validation_time = 0.0
+        self.bytes_received = 0
+        self.retries = 0
+        self.completed = False
+        self.error: typing.Optional[str] = None
+
+    def add_page(self, request: JiraRequestEvent, issues: int) -> None:
+        """1ページ分のリクエストの計測結果を加算します。"""
+        self.pages += 1
+        self.issues += issues
+        self.request_time += request.latency
+        self.decode_time += request.decode_time
+        self.validation_time += request.validation_time
+        self.bytes_received += request.bytes_received
+        self.retries += request.retries
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"JiraQueryEvent(pages={self.pages}, issues={self.issues}, elapsed={self.elapsed:.3f}, "
+                f"completed={self.completed})")
+
+
+class JiraMetricsCollector(object):
+    """
+    計測結果を受け取るコレクターのインターフェース。
+
+    on_request() / on_query() はリクエストを送信したスレッド (AsyncJiraClient ではイベントループ) から
+    同期的に呼び出されるため、時間のかかる処理 (外部への送信など) はバッファリングして別スレッドで行ってください。
+    コレクター内で発生した例外は表示されたうえで無視され、APIの呼び出しには影響しません。
+
+    Example:
+        class PrometheusCollector(JiraMetricsCollector):
+            def on_request(self, event):
+                REQUEST_LATENCY.labels(event.endpoint, str(event.status)).observe(event.latency)
+    """
+
+    def on_request(self, event: JiraRequestEvent) -> None:
+        """APIリクエストが完了 (または失敗) した時に呼び出されます。"""
+
+    def on_query(self, event: JiraQueryEvent) -> None:
+        """JQL検索のページングが終了 (または中断) した時に呼び出されます。"""
+
+
+class JiraCallbackMetricsCollector(JiraMetricsCollector):
+    """計測結果を関数 (イベントフック) に渡すコレクター。"""
+
+    def __init__(self,
+                 on_request: typing.Optional[typing.Callable[[JiraRequestEvent], None]] = None,
+                 on_query: typing.Optional[typing.Callable[[JiraQueryEvent], None]] = None):
+        """
+        Args:
+            on_request (Callable[[JiraRequestEvent], None], optional): APIリクエストごとに呼び出す関数。
+            on_query (Callable[[JiraQueryEvent], None], optional): JQL検索ごとに呼び出す関数。
+        """
+        self.__on_request = on_request
+        self.__on_query = on_query
+
+    def on_request(self, event: JiraRequestEvent) -> None:
+        if self.__on_request is not None:
+            self.__on_request(event)
+
+    def on_query(self, event: JiraQueryEvent) -> None:
+        if self.__on_query is not None:
+            self.__on_query(event)
+
+
+class JiraEndpointStats(object):
+    """JiraInMemoryMetricsCollector が保持する、1つのエンドポイントの集計値。"""
+
+    __slots__ = ("requests", "errors", "retries", "latency_total", "latency_max", "bytes_sent", "bytes_received",
+                 "decode_time", "validation_time", "statuses", "latencies")
+
+    def __init__(self, max_samples: int):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.decode_time = 0.0
+        self.validation_time = 0.0
+        self.statuses: typing.Counter[int] = collections.Counter()
+        # パーセンタイルの計算に使う直近のレイテンシ
+        self.latencies: typing.Deque[float] = collections.deque(maxlen=max_samples)
+
+    def add(self, event: JiraRequestEvent) -> None:
+        self.requests += 1
+        if event.error is not None or event.status is None or event.status >= 400:
+            self.errors += 1
+        self.retries += event.retries
+        self.latency_total += event.latency
+        self.latency_max = max(self.latency_max, event.latency)
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.decode_time += event.decode_time
+        self.validation_time += event.validation_time
+        if event.status is not None:
+            self.statuses[event.status] += 1
+        self.latencies.append(event.latency)
+
+    def percentile(self, p: float) -> float:
+        """直近のリクエストのレイテンシの p パーセンタイル (0〜100) を返します。"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "latency_total": self.latency_total,
+            "latency_mean": self.latency_total / self.requests if self.requests else 0.0,
+            "latency_max": self.latency_max,
+            "latency_p50": self.percentile(50),
+            "latency_p90": self.percentile(90),
+            "latency_p99": self.percentile(99),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "decode_time": self.decode_time,
+            "validation_time": self.validation_time,
+            "statuses": {
+                str(status): count
+                for status, count in sorted(self.statuses.items())
+            },
+        }
+
+
+class JiraInMemoryMetricsCollector(JiraMetricsCollector):
+    """
+    計測結果をエンドポイントごとに集計してメモリ上に保持するコレクター。スレッドセーフです。
+
+    snapshot() は集計値をJSONに変換できる dict で返すため、定期的に取得して外部の監視システムへ送ったり、
+    ログに出力したりできます。直近のイベントは max_events 件まで requests / queries に保持されます。
+
+    Example:
+        metrics = JiraInMemoryMetricsCollector()
+        with JiraClinet(base_url, email, token, metrics=metrics) as client:
+            client.get_tickets("PROJ")
+        print(metrics.snapshot()["endpoints"]["search"]["latency_p90"])
+    """
+
+    def __init__(self, max_events: int = 1000, max_samples: int = 10000):
+        """
+        Args:
+            max_events (int): 保持する直近のイベント数 (リクエスト・検索それぞれ, デフォルト: 1000)。
+            max_samples (int): パーセンタイルの計算に使う、エンドポイントごとの直近のレイテンシの数 (デフォルト: 10000)。
+        """
+        self.max_samples = max_samples
+        self.requests: typing.Deque[JiraRequestEvent] = collections.deque(maxlen=max_events)
+        self.queries: typing.Deque[JiraQueryEvent] = collections.deque(maxlen=max_events)
+        self.__endpoints: typing.Dict[str, JiraEndpointStats] = {}
+        self.__query_totals: typing.Dict[str, typing.Any] = self._empty_query_totals()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def _empty_query_totals() -> typing.Dict[str, typing.Any]:
+        return {"queries": 0, "incomplete": 0, "pages": 0, "issues": 0, "elapsed": 0.0, "request_time": 0.0}
+
+    def on_request(self, event: JiraRequestEvent) -> None:
+        with self.__lock:
+            stats = self.__endpoints.get(event.endpoint)
+            if stats is None:
+                stats = self.__endpoints[event.endpoint] = JiraEndpointStats(self.max_samples)
+            stats.add(event)
+            self.requests.append(event)
+
+    def on_query(self, event: JiraQueryEvent) -> None:
+        with self.__lock:
+            totals = self.__query_totals
+            totals["queries"] += 1
+            totals["incomplete"] += 0 if event.completed else 1
+            totals["pages"] += event.pages
+            totals["issues"] += event.issues
+            totals["elapsed"] += event.elapsed
+            totals["request_time"] += event.request_time
+            self.queries.append(event)
+
+    def endpoint_stats(self, endpoint: str) -> typing.Optional[JiraEndpointStats]:
+        """エンドポイントの集計値を返します。まだリクエストが無い場合は None。"""
+        with self.__lock:
+            return self.__endpoints.get(endpoint)
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        """
+        現在の集計値を返します。
+
+        Returns:
+            Dict[str, Any]: {"endpoints": {エンドポイント名: 集計値}, "queries": 検索の合計} の形式の dict。
+        """
+        with self.__lock:
+            return {
+                "endpoints": {
+                    name: stats.to_dict()
+                    for name, stats in self.__endpoints.items()
+                },
+                "queries": dict(self.__query_totals),
+            }
+
+    def reset(self) -> None:
+        """集計値と保持しているイベントを消去します。"""
+        with self.__lock:
+            self.__endpoints.clear()
+            self.__query_totals = self._empty_query_totals()
+            self.requests.clear()
+            self.queries.clear()
+
+
+def emit_request(collector: typing.Optional[JiraMetricsCollector], event: JiraRequestEvent) -> None:
+    """collector に event を通知します。コレクターの例外はAPIの呼び出しに影響させません。"""
+    if collector is None:
+        return
+    try:
+        collector.on_request(event)
+    except Exception as e:
+        print(f"メトリクスコレクターでエラーが発生しました (on_request): {e}")
+
+
+def emit_query(collector: typing.Optional[JiraMetricsCollector], event: JiraQueryEvent) -> None:
+    """collector に event を通知します。コレクターの例外はAPIの呼び出しに影響させません。"""
+    if collector is None:
+        return
+    try:
+        collector.on_query(event)
+    except Exception as e:
+        print(f"メトリクスコレクターでエラーが発生しました (on_query): {e}")
@@ -0,0 +1,196 @@
+import datetime
+import math
+import sqlite3
+import threading
+import typing
+
+from jira_api_client.jql import parse_jira_datetime
+from jira_api_client.models.base import JiraParseModeEnum
+from jira_api_client.models.issue import JiraIssue
+from jira_api_client.models.search import JiraSearchResults
+
+if typing.TYPE_CHECKING:
+    from jira_api_client.jira_client import JiraClinet
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    id TEXT NOT NULL,
+    project_key TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    updated_epoch REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project_key ON issues (project_key, updated_epoch);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_key TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+
+class JiraIssueStore(object):
+    """
+    Jira課題をローカルのSQLiteデータベースに保存し、差分同期するストア。
+
+    sync() は前回同期した課題の最終更新日時 (ウォーターマーク) 以降に更新された課題だけを
+    'updated >= ...' のJQLで取得してupsertします。保存済みの課題の読み出しはJiraへ通信せずにローカルで行われます。
+    Jira上で削除された課題は差分検索では検出できないため、必要に応じて sync(full=True) で再同期してください。
+
+    Example:
+        with JiraIssueStore("issues.db", client) as store:
+            store.sync("PROJ")
+            for issue in store.iter_issues("PROJ"):
+                ...
+    """
+
+    __connection: sqlite3.Connection
+    __lock: threading.Lock
+    __client: typing.Optional["JiraClinet"]
+
+    def __init__(self, path: str, client: typing.Optional["JiraClinet"] = None):
+        """
+        JiraIssueStore の新しいインスタンスを初期化します。
+
+        Args:
+            path (str): SQLiteデータベースファイルのパス。':memory:' を指定するとメモリ上に作成します。
+            client (JiraClinet, optional): sync() で使用するクライアント。sync() の引数でも指定できます。
+        """
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.executescript(_SCHEMA)
+        self.__lock = threading.Lock()
+        self.__client = client
+
+    def __enter__(self) -> "JiraIssueStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """データベース接続を閉じます。"""
+        self.__connection.close()
+
+    def sync(self,
+             project_key: str,
+             client: typing.Optional["JiraClinet"] = None,
+             full: bool = False,
+             overlap: datetime.timedelta = datetime.timedelta(minutes=1),
+             page_size: int = 100) -> int:
+        """
+        プロジェクトの課題をJiraから差分取得し、ローカルに保存します。
+
+        ウォーターマークはページごとにコミットされるため、同期が途中で失敗しても次回はその続きから再開されます。
+
+        Args:
+            project_key (str): 同期するプロジェクトのキー (例: 'PROJ')。
+            client (JiraClinet, optional): 使用するクライアント。省略時はコンストラクタで指定したクライアント。
+            full (bool): True の場合、ウォーターマークを無視して全件を取得し直します (デフォルト: False)。
+            overlap (datetime.timedelta): JQLの日時が分単位であることや、この端末とJiraの時計のずれを考慮して、
+                                          ウォーターマークから遡って取得する時間 (デフォルト: 1分)。
+                                          時計のずれがこれより大きい場合は、その分だけ長く指定してください。
+            page_size (int): 1回のリクエストで取得する件数 (デフォルト: 100)。
+
+        Returns:
+            int: 保存 (新規追加または更新) した課題の数。
+
+        Raises:
+            ValueError: クライアントが指定されていない場合、または課題の更新日時を解析できない場合
+                        (そのページは保存されず、ウォーターマークも進みません)。
+            requests.exceptions.RequestException: Jiraへのリクエストでエラーが発生した場合。
+        """
+        client = client or self.__client
+        if client is None:
+            raise ValueError("sync() には JiraClinet を指定してください。")
+
+        watermark = None if full else self.watermark(project_key)
+        jql = f'project = "{project_key}"'
+        if watermark is not None:
+            # JQLの日時リテラルは検索するユーザーのタイムゾーンで解釈され、レスポンスの日時のオフセットと一致するとは限らない
+            # (夏時間の切り替えなど) ため、タイムゾーンに依存しない現在からの相対指定 (例: "-90m") に変換する
+            elapsed = datetime.datetime.now(datetime.timezone.utc) - (watermark - overlap)
+            jql += f' AND updated >= "-{max(math.ceil(elapsed.total_seconds() / 60), 1)}m"'
+        jql += ' ORDER BY updated ASC'
+
+        upserted = 0
+        latest = watermark
+        # クライアントのデフォルトの解析方法に関わらず、保存する課題は検証済みのモデルとして取得する
+        for page in client.iter_pages(jql, page_size=page_size, parse_mode=JiraParseModeEnum.FULL):
+            if not page.issues:
+                continue
+            rows = []
+            for issue in page.issues:
+                updated = parse_jira_datetime(issue.fields.updated)
+                if updated is None:
+                    raise ValueError(f"課題 {issue.key} の更新日時を解析できません: {issue.fields.updated!r}")
+                if latest is None or updated > latest:
+                    latest = updated
+                rows.append((issue.key, issue.id, issue.fields.project.key, issue.fields.updated, updated.timestamp(),
+                             issue.model_dump_json()))
+            with self.__lock, self.__connection:
+                self.__connection.executemany(
+                    "INSERT INTO issues (key, id, project_key, updated, updated_epoch, data) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET id = excluded.id, project_key = excluded.project_key, "
+                    "updated = excluded.updated, updated_epoch = excluded.updated_epoch, data = excluded.data", rows)
+                self.__connection.execute(
+                    "INSERT INTO sync_state (project_key, watermark, synced_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(project_key) DO UPDATE SET watermark = excluded.watermark, "
+                    "synced_at = excluded.synced_at",
+                    (project_key, latest.isoformat(), datetime.datetime.now(datetime.timezone.utc).isoformat()))
+            upserted += len(rows)
+        return upserted
+
+    def watermark(self, project_key: str) -> typing.Optional[datetime.datetime]:
+        """プロジェクトの同期済みの最終更新日時を返します。未同期の場合は None。"""
+        with self.__lock:
+            row = self.__connection.execute("SELECT watermark FROM sync_state WHERE project_key = ?",
+                                            (project_key,)).fetchone()
+        return datetime.datetime.fromisoformat(row[0]) if row else None
+
+    def get(self, key: str) -> typing.Optional[JiraIssue]:
+        """保存済みの課題をキーで取得します。存在しない場合は None。"""
+        with self.__lock:
+            row = self.__connection.execute("SELECT data FROM issues WHERE key = ?", (key,)).fetchone()
+        return JiraIssue.model_validate_json(row[0]) if row else None
+
+    def iter_issues(self, project_key: typing.Optional[str] = None) -> typing.Iterator[JiraIssue]:
+        """
+        保存済みの課題を更新日時の新しい順に1件ずつ返します。
+
+        Args:
+            project_key (str, optional): 対象のプロジェクトのキー。省略時は全プロジェクト。
+        """
+        query = "SELECT data FROM issues"
+        params: typing.Tuple[str, ...] = ()
+        if project_key is not None:
+            query += " WHERE project_key = ?"
+            params = (project_key,)
+        query += " ORDER BY updated_epoch DESC"
+        with self.__lock:
+            cursor = self.__connection.execute(query, params)
+        try:
+            while True:
+                # 全件をメモリに載せないよう、一定件数ずつ読み出す
+                with self.__lock:
+                    rows = cursor.fetchmany(500)
+                if not rows:
+                    return
+                for (data,) in rows:
+                    yield JiraIssue.model_validate_json(data)
+        finally:
+            cursor.close()
+
+    def get_tickets(self, project_key: str) -> JiraSearchResults:
+        """保存済みのプロジェクトの課題を、JiraClinet.get_tickets() と同じ JiraSearchResults として返します。"""
+        return JiraSearchResults(issues=list(self.iter_issues(project_key)), isLast=True, nextPageToken=None)
+
+    def count(self, project_key: typing.Optional[str] = None) -> int:
+        """保存済みの課題の数を返します。"""
+        with self.__lock:
+            if project_key is None:
+                row = self.__connection.execute("SELECT COUNT(*) FROM issues").fetchone()
+            else:
+                row = self.__connection.execute("SELECT COUNT(*) FROM issues WHERE project_key = ?",
+                                                (project_key,)).fetchone()
+        return row[0]
@@ -1,16 +1,130 @@
-import base64
+import contextlib
+import heapq
+import itertools
 import json
 import os
 import os.path
+import queue
+import threading
+import time
 import typing
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 
 import requests
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
 
-from jira_api_client.models.attachment import JiraAttachment
-from jira_api_client.models.base import JiraIssueTypeEnum, JiraStatusNameEnum
-from jira_api_client.models.search import JiraSearchResults
-from jira_api_client.models.ticket_create import JiraCreatedIssue
+from jira_api_client.decoding import validate_json
+from jira_api_client.instrumentation import (
+    JiraMetricsCollector,
+    JiraQueryEvent,
+    JiraRequestEvent,
+    emit_query,
+    emit_request,
+)
+from jira_api_client.jql import issue_sort_key, join_jql, order_by_fields, split_order_by
+from jira_api_client.models.attachment import (
+    JiraAttachment,
+    JiraAttachmentDownloadReport,
+    JiraAttachmentDownloadResult,
+    JiraDownloadStatusEnum,
+    attachment_list_adapter,
+)
+from jira_api_client.models.base import JiraIssueTypeEnum, JiraParseModeEnum, JiraStatusNameEnum
+from jira_api_client.models.bulk_fetch import JiraBulkFetchResult
+from jira_api_client.models.interning import JiraInternCache
+from jira_api_client.models.issue_update import (
+    JiraBulkUpdateResult,
+    JiraIssueUpdateResult,
+    JiraIssueUpdateStatusEnum,
+    JiraTransition,
+    JiraTransitionList,
+)
+from jira_api_client.models.raw import JiraIssueDict
+from jira_api_client.models.record import JiraIssueRecord
+from jira_api_client.models.ticket_create import (
+    JiraBulkCreateError,
+    JiraBulkCreateResult,
+    JiraCreatedIssue,
+    JiraTicketSpec,
+    bulk_create_response_adapter,
+)
+from jira_api_client.multipart import (
+    AttachmentFile,
+    AttachmentSource,
+    MultipartUploadBody,
+    ProgressCallback,
+    build_upload_parts,
+)
+from jira_api_client.read_cache import JiraReadCache, search_cache_key
+from jira_api_client.request_builders import (
+    BULK_FETCH_LIMIT,
+    build_auth_headers,
+    build_bulk_fetch_payload,
+    build_create_ticket_payload,
+    build_edit_payload,
+    build_tickets_jql,
+    build_transition_payload,
+    format_fields,
+    normalize_issue_keys,
+)
+from jira_api_client.request_scheduler import JiraRequestScheduler
+from jira_api_client.transitions import JiraTransitionCache, WorkflowKey, find_transition, status_name, workflow_key
+
+if typing.TYPE_CHECKING:
+    from jira_api_client.models.issue import JiraIssue, JiraLazyIssue, JiraLazyPartialIssue, JiraPartialIssue
+    from jira_api_client.models.search import (
+        JiraLazyPartialSearchResults,
+        JiraLazySearchResults,
+        JiraPartialSearchResults,
+        JiraRawSearchResults,
+        JiraRecordSearchResults,
+        JiraSearchResults,
+    )
+    from jira_api_client.parsing import JiraBulkFetchPage, JiraSearchPageParser
+
+# 課題・検索結果のモデル (models.issue / models.search) と検索結果のパーサーは、ADFを含む多数のモデルを定義しているため
+# 読み込みに時間がかかります。チケットの作成だけを行う場合などに読み込まずに済むよう、初回の検索時に読み込みます。
+# fields を指定した検索では、指定フィールドのみを持つ Partial モデルが返されます。
+# parse_mode に JiraParseModeEnum.LAZY を指定した検索では、重いフィールドを遅延パースする Lazy モデルが、
+# JiraParseModeEnum.RAW を指定した検索では、課題がデコードしたJSONの dict のまま返されます。
+SearchResults = typing.Union["JiraSearchResults", "JiraPartialSearchResults", "JiraLazySearchResults",
+                             "JiraLazyPartialSearchResults", "JiraRawSearchResults", "JiraRecordSearchResults"]
+SearchIssue = typing.Union["JiraIssue", "JiraPartialIssue", "JiraLazyIssue", "JiraLazyPartialIssue", JiraIssueDict,
+                           JiraIssueRecord]
+
+# 並列検索でパーティションの終端を示す番兵
+_PARTITION_DONE = object()
+
+# /issue/bulk で1回のリクエストに含められるチケット数の上限
+BULK_CREATE_LIMIT = 50
+
+# 課題を作成・変更するAPI (計測結果の endpoint 名)。リクエストの後に検索結果のキャッシュ (read_cache) を破棄する
+_WRITE_ENDPOINTS = frozenset(
+    {"create_ticket", "create_tickets_bulk", "transition_issue", "edit_issue", "upload_attachment"})
+
+# 課題の遷移・編集のリクエスト (キー, メソッド, URL, ペイロード, 遷移ID)
+_IssueUpdateTask = typing.Tuple[str, str, str, typing.Dict[str, typing.Any], typing.Optional[str]]
+# ワークフローごとの遷移の一覧と、遷移の一覧の取得に失敗したワークフローの結果
+_ResolvedTransitions = typing.Tuple[typing.Dict[WorkflowKey, typing.List[JiraTransition]],
+                                    typing.Dict[WorkflowKey, JiraIssueUpdateResult]]
+
+
+def _request_body_size(request: requests.PreparedRequest, data: typing.Any) -> int:
+    """送信したボディのバイト数を返します。chunked 転送のボディは送信済みバイト数 (bytes_sent 属性) を使用します。"""
+    content_length = request.headers.get("Content-Length")
+    if content_length is not None:
+        return int(content_length)
+    return getattr(data, "bytes_sent", 0)
+
+
+class _BulkChunkResult(object):
+    """create_tickets_bulk() の1リクエスト分の結果 (入力インデックスと作成結果の組、エラー)。"""
+    __slots__ = ("issues", "errors")
+
+    def __init__(self):
+        self.issues: typing.List[typing.Tuple[int, JiraCreatedIssue]] = []
+        self.errors: typing.List[JiraBulkCreateError] = []
 
 
 class JiraClinet(object):
@@ -19,14 +133,53 @@ class JiraClinet(object):
 
     環境変数から認証情報を取得するのではなく、
     インスタンス化時に直接ベースURL、メールアドレス、APIトークンを受け取ります。
+
+    HTTP通信はインスタンスごとに1つのコネクションプールを共有し、keep-alive で接続を再利用します。
+    セッションとプールは全スレッドで共有され (urllib3 のコネクションプールはスレッドセーフ)、
+    1つのインスタンスをマルチスレッドのワーカーから安全に利用できます。
+    使用後は close() を呼ぶか、with 文で利用してください。
+
+    Example:
+        with JiraClinet(base_url, email, token, pool_maxsize=20) as client:
+            results = client.get_tickets("PROJ")
     """
 
     __headers: typing.Dict[str, typing.Any]
     __base_url: str
     __upload_headers: typing.Dict[str, typing.Any]
     __download_headers: typing.Dict[str, typing.Any]
+    __adapter: HTTPAdapter
+    __timeout: typing.Union[float, typing.Tuple[float, float], None]
+    __session: requests.Session
+    __close_lock: threading.Lock
+    __closed: bool
+    __scheduler: JiraRequestScheduler
+    __parse_mode: JiraParseModeEnum
+    __validate_every: typing.Optional[int]
+    __intern_entities: bool
+    __metrics: typing.Optional[JiraMetricsCollector]
+    __transition_cache: JiraTransitionCache
+    __read_cache: typing.Optional[JiraReadCache]
+    __parse_executor: typing.Optional[Executor]
+    __parse_prefetch: int
 
-    def __init__(self, base_url: str, email: str, token: str):
+    def __init__(self,
+                 base_url: str,
+                 email: str,
+                 token: str,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = True,
+                 keep_alive: bool = True,
+                 timeout: typing.Union[float, typing.Tuple[float, float], None] = (10.0, 60.0),
+                 scheduler: typing.Optional[JiraRequestScheduler] = None,
+                 parse_mode: JiraParseModeEnum = JiraParseModeEnum.FULL,
+                 validate_every: typing.Optional[int] = None,
+                 intern_entities: bool = False,
+                 metrics: typing.Optional[JiraMetricsCollector] = None,
+                 read_cache: typing.Optional[JiraReadCache] = None,
+                 parse_executor: typing.Optional[Executor] = None,
+                 parse_prefetch: int = 4):
         """
         JiraClinet の新しいインスタンスを初期化します。
 
@@ -35,88 +188,687 @@ class JiraClinet(object):
                             末尾にスラッシュがあってもなくても対応します。
             email (str): Jiraアカウントのメールアドレス。
             token (str): Jiraで生成されたAPIトークン。
+            pool_connections (int): キャッシュするホストごとのコネクションプール数 (デフォルト: 10)。
+            pool_maxsize (int): 1ホストあたりに保持する最大接続数 (デフォルト: 10)。
+                                同時に利用するスレッド数以上を指定してください。
+            pool_block (bool): プールの接続が枯渇した場合に、空きが出るまで待つかどうか (デフォルト: True)。
+                               False の場合は一時的な接続を作成し、使用後に破棄します。
+            keep_alive (bool): HTTP keep-alive で接続を再利用するかどうか (デフォルト: True)。
+            timeout (float | Tuple[float, float] | None): リクエストのタイムアウト秒数。
+                                                         (接続, 読み込み) のタプルでも指定可能です。
+                                                         デフォルトは (10.0, 60.0)。None の場合は無制限。
+            scheduler (JiraRequestScheduler, optional): 全てのリクエストの送信ペース制御・レート制限対応・再試行を行う
+                                                        スケジューラ。省略時はデフォルト設定 (最大5回再試行,
+                                                        ペース制御なし) のスケジューラを使用します。
+            parse_mode (JiraParseModeEnum): 検索結果の解析方法のデフォルト (デフォルト: FULL)。
+                                            LAZY の場合、説明 (ADF)・添付ファイル・ユーザーなどの重いフィールドは
+                                            生のJSONのまま保持され、属性に初めてアクセスした時に検証されます。
+                                            CONSTRUCT / RAW の場合は検証を行わずにモデル / dict を返します。
+                                            RECORD の場合は主要なスカラー値だけを持つ軽量な JiraIssueRecord を返します。
+                                            検索メソッドの parse_mode 引数で呼び出しごとに上書きできます。
+            validate_every (int, optional): CONSTRUCT / RAW / RECORD モードで、何件ごとに1件の課題を完全に検証するか
+                                            (例: 100 の場合は100件に1件)。スキーマの変化を検出するためのサンプリング検証で、
+                                            不一致があれば pydantic.ValidationError が送出されます。None の場合は検証しません。
+            intern_entities (bool): FULL / LAZY モードの検索で、同じ内容のユーザー・ステータス・課題タイプ・
+                                    プロジェクト・優先度を1つのインスタンスで共有するかどうか (デフォルト: False)。
+                                    1回の検索の全ページで共有され、大量の課題を取得する際のメモリ使用量を大きく削減します。
+                                    共有されたインスタンスは変更できません (models.interning を参照)。
+            metrics (JiraMetricsCollector, optional): リクエストごとのレイテンシ・転送バイト数・再試行回数・
+                                                      デコード/検証時間と、JQL検索ごとのページ数・課題数を受け取る
+                                                      コレクター (instrumentation を参照)。None の場合は通知しません。
+            read_cache (JiraReadCache, optional): get_tickets_by_jql() / get_tickets() の結果を短時間キャッシュし、
+                                                  同時に呼ばれた同じ検索を1回の取得にまとめるキャッシュ (read_cache を参照)。
+                                                  このクライアントで課題を作成・遷移・編集したり添付ファイルを
+                                                  アップロードした場合は、キャッシュ全体が破棄されます。
+                                                  他のクライアントや Jira 上での変更は、キャッシュの有効期限 (ttl)
+                                                  が切れるまで反映されません。None の場合はキャッシュしません。
+            parse_executor (Executor, optional): 検索結果のページの解析 (JSONのデコードとモデルの検証) を実行する Executor。
+                                                 ProcessPoolExecutor を指定すると、取得用のスレッドが次のページを要求し続ける間に
+                                                 取得済みのページを複数のプロセスで並列に解析します (iter_pages() を参照)。
+                                                 解析結果は pickle で呼び出し元のプロセスに戻され、FULL / LAZY モードの
+                                                 モデルの復元には検証に近いコストがかかるため、効果が大きいのは
+                                                 RECORD モード (validate_every による検証をワーカーで行い、軽量な
+                                                 レコードだけを受け取る) など結果の小さい解析方法です。
+                                                 Executor の作成と終了 (shutdown) は呼び出し元で行ってください。
+                                                 None の場合は呼び出し元のスレッドで解析します。
+            parse_prefetch (int): parse_executor を指定した場合に、解析中・解析済みで消費を待つページの最大数 (デフォルト: 4)。
+                                  Executor のワーカー数以上を指定してください。
         """
         # 末尾のスラッシュを統一
         if not base_url.endswith('/'):
             base_url += '/'
         self.__base_url = base_url
 
-        auth_string = f"{email}:{token}"
-        encoded_auth_string = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
+        auth_headers = build_auth_headers(email, token)
 
         self.__headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
-            "Authorization": f"Basic {encoded_auth_string}"
-        }
-        self.__download_headers = {
-            # ファイルダウンロード時はContent-Typeは不要、Authorizationヘッダのみ
-            "Authorization": f"Basic {encoded_auth_string}"
+            **auth_headers,
         }
+        # ファイルダウンロード時はContent-Typeは不要、Authorizationヘッダのみ
+        self.__download_headers = {**auth_headers}
         self.__upload_headers = {
             **self.__download_headers,
             "Accept": "application/json",
             "X-Atlassian-Token": "no-check",  # 添付ファイルアップロードには必須
         }
+        if not keep_alive:
+            for headers in (self.__headers, self.__download_headers, self.__upload_headers):
+                headers["Connection"] = "close"
+
+        self.__timeout = timeout
+        self.__scheduler = scheduler if scheduler is not None else JiraRequestScheduler()
+        self.__parse_mode = parse_mode
+        self.__validate_every = validate_every
+        self.__intern_entities = intern_entities
+        self.__metrics = metrics
+        self.__transition_cache = JiraTransitionCache()
+        self.__read_cache = read_cache
+        if parse_prefetch < 1:
+            raise ValueError("parse_prefetch には1以上を指定してください。")
+        self.__parse_executor = parse_executor
+        self.__parse_prefetch = parse_prefetch
+        # 全スレッドで共有するコネクションプール (urllib3のPoolManagerはスレッドセーフ)
+        self.__adapter = HTTPAdapter(pool_connections=pool_connections,
+                                     pool_maxsize=pool_maxsize,
+                                     pool_block=pool_block)
+        # セッションも全スレッドで1つを共有する。スレッドごとに作成すると、呼び出しごとに作られる
+        # スレッドプールのスレッドの数だけセッションが増え続けるため
+        self.__session = requests.Session()
+        self.__session.mount("https://", self.__adapter)
+        self.__session.mount("http://", self.__adapter)
+        self.__close_lock = threading.Lock()
+        self.__closed = False
+
+    def __enter__(self) -> "JiraClinet":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        保持しているセッションとコネクションプールを閉じます。
+        close() 後にリクエストを送信しようとすると RuntimeError が発生します。
+        """
+        with self.__close_lock:
+            if self.__closed:
+                return
+            self.__closed = True
+        # マウントしたアダプター (コネクションプール) もセッションと一緒に閉じられる
+        self.__session.close()
+
+    @property
+    def closed(self) -> bool:
+        """close() 済みかどうか。"""
+        return self.__closed
+
+    @property
+    def metrics(self) -> typing.Optional[JiraMetricsCollector]:
+        """計測結果を受け取るメトリクスコレクター。"""
+        return self.__metrics
+
+    @property
+    def read_cache(self) -> typing.Optional[JiraReadCache]:
+        """検索結果のキャッシュ。"""
+        return self.__read_cache
+
+    @property
+    def parse_executor(self) -> typing.Optional[Executor]:
+        """検索結果のページの解析を実行する Executor。"""
+        return self.__parse_executor
+
+    @property
+    def transition_cache(self) -> JiraTransitionCache:
+        """transition_issues() が解決したワークフローの遷移のキャッシュ。"""
+        return self.__transition_cache
+
+    def _session(self) -> requests.Session:
+        """
+        全スレッドで共有する requests.Session を返します。
+        セッションはクライアントごとに1つだけ作成され、共有のコネクションプールを利用します。
+        """
+        if self.__closed:
+            raise RuntimeError("JiraClinet は既に close() されています。")
+        return self.__session
+
+    def _request(self,
+                 method: str,
+                 url: str,
+                 retryable: typing.Optional[bool] = None,
+                 replayable: bool = True,
+                 event: typing.Optional[JiraRequestEvent] = None,
+                 **kwargs) -> requests.Response:
+        """
+        スケジューラを経由してリクエストを送信します。全てのAPI呼び出しはこのメソッドを通ります。
+        レート制限や一時的なエラーはスケジューラが待機・再試行し、最終的なレスポンスを返します。
+        引数 retryable / replayable は JiraRequestScheduler.send() を参照してください。
+        event を指定した場合は、ステータス・レイテンシ・送受信バイト数・再試行回数を記録します
+        (stream=True の場合、受信バイト数はボディを読み込む呼び出し側で記録してください)。
+        """
+        session = self._session()
+        kwargs.setdefault("timeout", self.__timeout)
+        if event is None:
+            return self.__scheduler.send(method,
+                                         lambda: session.request(method, url, **kwargs),
+                                         retryable=retryable,
+                                         replayable=replayable)
+
+        attempts = 0
+
+        def send() -> requests.Response:
+            nonlocal attempts
+            attempts += 1
+            return session.request(method, url, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            response = self.__scheduler.send(method, send, retryable=retryable, replayable=replayable)
+        finally:
+            event.latency = time.perf_counter() - started
+            event.retries = max(attempts - 1, 0)
+        event.status = response.status_code
+        event.bytes_sent = _request_body_size(response.request, kwargs.get("data"))
+        if not kwargs.get("stream"):
+            event.bytes_received = len(response.content)
+        return response
+
+    @contextlib.contextmanager
+    def _instrument(self, endpoint: str, method: str, url: str) -> typing.Iterator[JiraRequestEvent]:
+        """
+        APIリクエスト1回分の計測結果を作成し、with ブロックの終了時にメトリクスコレクターへ通知します。
+        課題を作成・変更するAPI (_WRITE_ENDPOINTS) の場合は、終了時に検索結果のキャッシュも破棄します。
+        """
+        event = JiraRequestEvent(endpoint, method, url)
+        try:
+            yield event
+        except Exception as e:
+            event.error = type(e).__name__
+            raise
+        finally:
+            emit_request(self.__metrics, event)
+            if endpoint in _WRITE_ENDPOINTS:
+                self._invalidate_read_cache()
+
+    def _invalidate_read_cache(self) -> None:
+        """
+        検索結果のキャッシュを破棄します。書き込みのリクエストが失敗した場合 (タイムアウトなど) も Jira 側では
+        反映されている可能性があるため、成否に関わらず呼び出します。実行中の検索の結果もキャッシュされなくなります。
+        """
+        if self.__read_cache is not None:
+            self.__read_cache.clear()
+
+    def iter_pages(self,
+                   jql: str,
+                   max_results: typing.Optional[int] = None,
+                   page_size: int = 50,
+                   fields: typing.Optional[typing.Sequence[str]] = None,
+                   parse_mode: typing.Optional[JiraParseModeEnum] = None,
+                   intern_cache: typing.Optional[JiraInternCache] = None) -> typing.Iterator[SearchResults]:
+        """
+        JQLの検索結果を1ページずつ取得して返すジェネレータです。
+
+        次のページは、呼び出し元が前のページを消費してから nextPageToken を使って取得されます。
+        レート制限などでページの取得が再試行される場合も、最後に取得できたページの nextPageToken から再開されます。
+        取得済みのページは保持しないため、結果件数に関わらずメモリ使用量は1ページ分に収まります。
 
-    def get_tickets_by_jql(self, jql: str, max_results: typing.Optional[int] = None) -> JiraSearchResults:
+        クライアントに parse_executor を指定した場合は、取得用のスレッドが nextPageToken だけを読み取って次のページを
+        要求し続け、ページの解析は parse_executor で並列に行われます (ページは要求順に返されます)。
+        この場合、先読みしたページ (最大 parse_prefetch 件) の分だけメモリ使用量が増え、max_results に達した後も
+        先読み済みのページのリクエストが送信されることがあります。エンティティの共有は intern_cache ではなく
+        ページごとに行われます。
+
+        Args:
+            jql (str): 検索に使用するJQL。
+            max_results (int, optional): 取得する課題の最大数。Noneの場合は全件取得。
+                                         最後のページは max_results 件になるよう切り詰められます。
+            page_size (int): 1回のリクエストで取得する件数 (デフォルト: 50)。
+            fields (Sequence[str], optional): 取得するフィールドのリスト (例: ['status', 'assignee', 'updated'])。
+                                              指定した場合はリクエストとレスポンスがそのフィールドのみに絞られ、
+                                              結果は JiraPartialSearchResults として返されます。
+                                              Noneの場合は全フィールド ('*all') を取得します。
+            parse_mode (JiraParseModeEnum, optional): 検索結果の解析方法。省略時はクライアントのデフォルト。
+                                                      LAZY の場合は JiraLazySearchResults
+                                                      (fields 指定時は JiraLazyPartialSearchResults) が、
+                                                      CONSTRUCT の場合は検証せずに組み立てたモデルが、
+                                                      RAW の場合は課題が dict の JiraRawSearchResults が、
+                                                      RECORD の場合は課題が JiraIssueRecord の JiraRecordSearchResults が
+                                                      返されます。
+            intern_cache (JiraInternCache, optional): エンティティの共有に使用するキャッシュ。複数の検索で共有する場合に指定します。
+                                                      省略時は、クライアントの intern_entities が True の場合に
+                                                      この検索専用のキャッシュが作成されます。
+                                                      parse_executor を指定したクライアントでは、指定した場合も
+                                                      ページごとの共有になります。
+
+        Yields:
+            JiraSearchResults | JiraPartialSearchResults: 1ページ分の検索結果。
+
+        Raises:
+            requests.exceptions.RequestException: リクエスト中にネットワークまたはHTTPエラーが発生した場合。
+            json.JSONDecodeError: Jira APIからのレスポンスが有効なJSONでない場合。
+            pydantic.ValidationError: レスポンスJSONが定義されたPydanticモデルの構造と一致しない場合。
+            Exception: その他の予期せぬエラーが発生した場合。
+        """
         search_endpoint = os.path.join(self.__base_url, "search/jql")
-        # 1回のリクエスト件数
-        fetch_size = 50
         # 初回リクエスト用のパラメータ
         # 新しいAPIでは startAt ではなく nextPageToken を使用
         params = {
             "jql": jql,
-            "maxResults": fetch_size,
-            "fields": "*all",
+            "maxResults": page_size,
+            "fields": format_fields(fields),
         }
+        parse_mode = parse_mode or self.__parse_mode
+        if self.__parse_executor is not None:
+            pages = self._iter_pages_in_executor(search_endpoint, params, fields is not None, parse_mode,
+                                                 intern_cache is not None or self.__intern_entities)
+        else:
+            from jira_api_client.parsing import JiraSearchPageParser
 
-        all_issues = []
+            if intern_cache is None and self.__intern_entities:
+                intern_cache = JiraInternCache()
+            parser = JiraSearchPageParser(fields is not None, parse_mode, self.__validate_every, intern_cache)
+            pages = self._iter_parsed_pages(search_endpoint, params, parser)
 
+        query = JiraQueryEvent(jql, parse_mode.value)
+        started = time.perf_counter()
+        fetched = 0
         try:
-            while True:
-                response = requests.get(search_endpoint, headers=self.__headers, params=params)
-                response.raise_for_status()
-                results = JiraSearchResults(**response.json())
+            for event, results in pages:
+                if max_results and fetched + len(results.issues) > max_results:
+                    results.issues = results.issues[:max_results - fetched]
+                fetched += len(results.issues)
+                query.add_page(event, len(results.issues))
 
-                new_issues = results.issues
-                if not new_issues:
-                    break
+                yield results
 
-                all_issues.extend(new_issues)
-                if results.isLast or (max_results and len(all_issues) >= max_results):
+                if not results.issues or (max_results and fetched >= max_results):
                     break
-                token = results.nextPageToken
-                if not token:
-                    break
-                params["nextPageToken"] = token
+            query.completed = True
+        except Exception as e:
+            query.error = type(e).__name__
+            raise
+        finally:
+            pages.close()
+            query.elapsed = time.perf_counter() - started
+            emit_query(self.__metrics, query)
+
+    def _iter_parsed_pages(
+            self, search_endpoint: str, params: typing.Dict[str, typing.Any],
+            parser: "JiraSearchPageParser") -> typing.Iterator[typing.Tuple[JiraRequestEvent, typing.Any]]:
+        """
+        ページを1つずつ取得・解析し、(リクエストの計測結果, 1ページ分の検索結果) を返すジェネレータです。
 
-            results.issues = all_issues
-            return results
+        次のページは、呼び出し元が前のページを消費してから nextPageToken を使って取得されます。
+        """
+        while True:
+            with self._instrument("search", "GET", search_endpoint) as event:
+                try:
+                    response = self._request("GET", search_endpoint, event=event, headers=self.__headers, params=params)
+                    response.raise_for_status()
+                    results = parser.parse_json(response.content, event)
+                except requests.exceptions.RequestException as err:
+                    print(f"Jira API 'search' リクエストエラー: {err}")
+                    if hasattr(err, 'response') and err.response is not None:
+                        print(f"レスポンス詳細: {err.response.text}")
+                    raise
+                except json.JSONDecodeError as e:
+                    print(f"Jira API 'search' レスポンスのJSONデコードに失敗しました: {e}")
+                    print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
+                    raise
+                except ValidationError as e:
+                    print(f"Jira API 'search' Pydanticバリデーションエラー: {e}")
+                    print(f"エラー詳細: {e.errors()}")
+                    raise
+                except Exception as e:
+                    print(f"Jira API 'search' 予期せぬエラー: {e}")
+                    raise
 
-        except requests.exceptions.RequestException as err:
-            print(f"Jira API 'search' リクエストエラー: {err}")
-            if hasattr(err, 'response') and err.response is not None:
-                print(f"レスポンス詳細: {err.response.text}")
-            raise
-        except json.JSONDecodeError as e:
-            print(f"Jira API 'search' レスポンスのJSONデコードに失敗しました: {e}")
-            print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
-            raise
-        except ValidationError as e:
-            print(f"Jira API 'search' Pydanticバリデーションエラー: {e}")
-            print(f"エラー詳細: {e.errors()}")
-            raise
+            # 呼び出し元が issues を切り詰めることがあるため、次のページの判定に使う値は先に読んでおく
+            token = None if results.isLast else results.nextPageToken
+            yield event, results
+
+            if not token:
+                return
+            params["nextPageToken"] = token
+
+    def _iter_pages_in_executor(self, search_endpoint: str, params: typing.Dict[str, typing.Any], partial: bool,
+                                parse_mode: JiraParseModeEnum,
+                                intern_entities: bool) -> typing.Iterator[typing.Tuple[JiraRequestEvent, typing.Any]]:
+        """
+        ページの取得と解析をパイプライン化し、(リクエストの計測結果, 1ページ分の検索結果) を要求順に返すジェネレータです。
+
+        取得用のスレッドはレスポンスから nextPageToken だけを読み取って次のページを要求し続け、レスポンスボディ (bytes) は
+        parse_executor で解析されます (parsing.parse_search_page())。解析中・解析済みで消費を待つページは parse_prefetch 件までで、
+        それを超えると取得用のスレッドは呼び出し元がページを消費するまで待機します。
+        ジェネレータを閉じると取得用のスレッドは停止し、未着手の解析はキャンセルされます。
+        """
+        from jira_api_client.models.search import JiraSearchCursor
+        from jira_api_client.parsing import parse_search_page
+
+        executor = self.__parse_executor
+        page_queue: "queue.Queue[typing.Any]" = queue.Queue(maxsize=self.__parse_prefetch)
+        stop_event = threading.Event()
+
+        def fetch_pages() -> None:
+            # サンプリング検証の対象をページをまたいで揃えるための、ページより前の課題数 (満杯のページを仮定した概算)
+            offset = 0
+            try:
+                while not stop_event.is_set():
+                    # 計測結果は解析の完了後に、解析の所要時間を含めて呼び出し元のスレッドで通知する
+                    event = JiraRequestEvent("search", "GET", search_endpoint)
+                    try:
+                        response = self._request("GET",
+                                                 search_endpoint,
+                                                 event=event,
+                                                 headers=self.__headers,
+                                                 params=params)
+                        response.raise_for_status()
+                        cursor = validate_json(JiraSearchCursor.model_validate_json, response.content)
+                    except Exception as e:
+                        event.error = type(e).__name__
+                        emit_request(self.__metrics, event)
+                        self._print_search_error(e)
+                        raise
+                    future = executor.submit(parse_search_page, response.content, partial, parse_mode,
+                                             self.__validate_every, offset, intern_entities)
+                    offset += params["maxResults"]
+                    self._put_until_stopped(page_queue, (event, future), stop_event)
+                    if cursor.isLast or not cursor.nextPageToken:
+                        break
+                    params["nextPageToken"] = cursor.nextPageToken
+            except Exception as e:
+                self._put_until_stopped(page_queue, e, stop_event)
+                return
+            self._put_until_stopped(page_queue, _PARTITION_DONE, stop_event)
+
+        fetcher = threading.Thread(target=fetch_pages, daemon=True)
+        fetcher.start()
+        try:
+            while True:
+                item = page_queue.get()
+                if item is _PARTITION_DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                event, future = item
+                yield event, self._parse_page_result(future, event)
+        finally:
+            stop_event.set()
+            # 消費されなかったページの解析をキャンセルする (実行中の解析は完了を待たずに破棄する)
+            while True:
+                try:
+                    item = page_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, tuple):
+                    item[1].cancel()
+
+    def _parse_page_result(self, future: "Future[typing.Tuple[typing.Any, float, float]]",
+                           event: JiraRequestEvent) -> typing.Any:
+        """
+        parse_executor での1ページ分の解析の完了を待って検索結果を返します。
+        解析の所要時間を event に記録し、メトリクスコレクターへ通知します。
+        """
+        try:
+            results, event.decode_time, event.validation_time = future.result()
         except Exception as e:
-            print(f"Jira API 'search' 予期せぬエラー: {e}")
+            event.error = type(e).__name__
+            self._print_search_error(e)
             raise
+        finally:
+            emit_request(self.__metrics, event)
+        return results
+
+    @staticmethod
+    def _print_search_error(error: Exception) -> None:
+        """検索のページの取得・解析で発生したエラーの内容を出力します。"""
+        if isinstance(error, requests.exceptions.RequestException):
+            print(f"Jira API 'search' リクエストエラー: {error}")
+            if error.response is not None:
+                print(f"レスポンス詳細: {error.response.text}")
+        elif isinstance(error, json.JSONDecodeError):
+            print(f"Jira API 'search' レスポンスのJSONデコードに失敗しました: {error}")
+        elif isinstance(error, ValidationError):
+            print(f"Jira API 'search' Pydanticバリデーションエラー: {error}")
+            print(f"エラー詳細: {error.errors()}")
+        else:
+            print(f"Jira API 'search' 予期せぬエラー: {error}")
+
+    def iter_tickets_by_jql(self,
+                            jql: str,
+                            max_results: typing.Optional[int] = None,
+                            page_size: int = 50,
+                            fields: typing.Optional[typing.Sequence[str]] = None,
+                            parse_mode: typing.Optional[JiraParseModeEnum] = None) -> typing.Iterator[SearchIssue]:
+        """
+        JQLの検索結果の課題を1件ずつ返すジェネレータです。
+
+        各ページの到着ごとに課題を返すため、全件の取得完了を待たずに処理を開始でき、
+        メモリ使用量も結果件数に比例して増えません。引数は iter_pages() と同じです。
+
+        Yields:
+            JiraIssue | JiraPartialIssue: 検索結果の課題。
+        """
+        for page in self.iter_pages(jql,
+                                    max_results=max_results,
+                                    page_size=page_size,
+                                    fields=fields,
+                                    parse_mode=parse_mode):
+            yield from page.issues
+
+    def get_tickets_by_jql(self,
+                           jql: str,
+                           max_results: typing.Optional[int] = None,
+                           fields: typing.Optional[typing.Sequence[str]] = None,
+                           parse_mode: typing.Optional[JiraParseModeEnum] = None) -> SearchResults:
+        """
+        JQLの検索結果を全ページ分取得し、1つの JiraSearchResults にまとめて返します。
+
+        全件をメモリ上に保持するため、大量の課題を扱う場合は iter_tickets_by_jql() を使用してください。
+        クライアントに read_cache を指定した場合、有効期限内の同じ検索 (JQL・fields・max_results・parse_mode) には
+        キャッシュした結果を返し、実行中の同じ検索があればその完了を待って結果を共有します。
+        キャッシュの copy_results=False の場合、キャッシュした結果 (課題のリストを含む) は呼び出し元の間で共有されるため、変更しないでください。
+
+        Args:
+            jql (str): 検索に使用するJQL。
+            max_results (int, optional): 取得するチケットの最大数。Noneの場合は全件取得。
+            fields (Sequence[str], optional): 取得するフィールドのリスト。詳細は iter_pages() を参照。
+            parse_mode (JiraParseModeEnum, optional): 検索結果の解析方法。詳細は iter_pages() を参照。
+
+        Returns:
+            JiraSearchResults | JiraPartialSearchResults: 最後のページの検索結果。
+                                                          issues には全ページの課題が格納されます。
+        """
+        if self.__read_cache is None:
+            return self._fetch_tickets_by_jql(jql, max_results, fields, parse_mode)
+
+        key = search_cache_key(jql, fields, max_results, parse_mode or self.__parse_mode)
+        return self.__read_cache.get_or_load(key,
+                                             lambda: self._fetch_tickets_by_jql(jql, max_results, fields, parse_mode),
+                                             size=lambda cached: len(cached.issues))
+
+    def _fetch_tickets_by_jql(self, jql: str, max_results: typing.Optional[int],
+                              fields: typing.Optional[typing.Sequence[str]],
+                              parse_mode: typing.Optional[JiraParseModeEnum]) -> SearchResults:
+        """全ページを取得して1つの検索結果にまとめます (get_tickets_by_jql() のキャッシュを経由しない部分)。"""
+        all_issues = []
+        for results in self.iter_pages(jql, max_results=max_results, fields=fields, parse_mode=parse_mode):
+            all_issues.extend(results.issues)
+
+        results.issues = all_issues
+        return results
+
+    def iter_tickets_by_jql_parallel(
+            self,
+            jql: str,
+            partitions: typing.Sequence[str],
+            max_workers: int = 4,
+            max_results: typing.Optional[int] = None,
+            page_size: int = 50,
+            fields: typing.Optional[typing.Sequence[str]] = None,
+            prefetch_pages: int = 2,
+            parse_mode: typing.Optional[JiraParseModeEnum] = None) -> typing.Iterator[SearchIssue]:
+        """
+        JQLを互いに素なパーティションに分割し、各パーティションを並列にページングして課題を返すジェネレータです。
+
+        nextPageToken によるページングは1本の検索では直列にしか進められないため、
+        パーティションごとに独立した検索を並列に実行することで、スループットをワーカー数に比例させます。
+        各パーティションの結果は元のJQLの ORDER BY 句の順序でマージされ (ORDER BY が無い場合はパーティション順)、
+        スキャン中の更新でパーティション間を移動した課題は、最初に現れた1件のみが返されます。
+
+        Example:
+            partitions = jql.created_partitions(datetime(2020, 1, 1), datetime.now(), 8)
+            for issue in client.iter_tickets_by_jql_parallel('project = "PROJ" ORDER BY created DESC', partitions):
+                ...
+
+        Args:
+            jql (str): 検索に使用するJQL。
+            partitions (Sequence[str]): 各パーティションの条件となるJQL句のリスト。
+                                        jira_api_client.jql の created_partitions() / key_range_partitions() で生成できます。
+                                        各条件は元のJQLの条件部分と AND で結合されます。
+            max_workers (int): 同時に実行する検索リクエストの最大数 (デフォルト: 4)。
+            max_results (int, optional): 取得する課題の最大数。Noneの場合は全件取得。
+            page_size (int): 1回のリクエストで取得する件数 (デフォルト: 50)。
+            fields (Sequence[str], optional): 取得するフィールドのリスト。詳細は iter_pages() を参照。
+                                              並び替えに必要な ORDER BY のフィールドは自動的に追加されます。
+            prefetch_pages (int): パーティションごとに先読みしておくページ数 (デフォルト: 2)。
+            parse_mode (JiraParseModeEnum, optional): 検索結果の解析方法。詳細は iter_pages() を参照。
+
+        Yields:
+            JiraIssue | JiraPartialIssue: 検索結果の課題。
+
+        Raises:
+            ValueError: partitions が空の場合、または ORDER BY のフィールドがクライアント側で並び替えできない場合
+                        (jql.SORTABLE_FIELDS 以外のフィールド。検索を始める前に送出されます)。
+            requests.exceptions.RequestException: いずれかのパーティションの検索でエラーが発生した場合。
+        """
+        if not partitions:
+            raise ValueError("partitions には1つ以上の条件を指定してください。")
+        if max_workers < 1:
+            raise ValueError("max_workers には1以上を指定してください。")
+
+        where, order_by = split_order_by(jql)
+        # 対応していない ORDER BY のフィールドは、パーティションの検索を始める前に ValueError になる
+        sort_key = issue_sort_key(order_by)
+        if fields is not None and order_by:
+            fields = [*fields, *order_by_fields(order_by)]
+
+        stop_event = threading.Event()
+        # パーティション数に関わらず、同時に実行中の検索リクエストは max_workers 件まで
+        request_slots = threading.BoundedSemaphore(max_workers)
+        # エンティティの共有は全パーティションで1つのキャッシュを使う
+        intern_cache = JiraInternCache() if self.__intern_entities else None
+        page_queues = []
+        for clause in partitions:
+            page_queue: "queue.Queue[typing.Any]" = queue.Queue(maxsize=max(prefetch_pages, 1))
+            worker = threading.Thread(target=self._fetch_partition,
+                                      args=(join_jql(where, clause, order_by), page_size, fields, parse_mode,
+                                            intern_cache, page_queue, request_slots, stop_event),
+                                      daemon=True)
+            worker.start()
+            page_queues.append(page_queue)
+
+        try:
+            streams = [self._drain_partition(page_queue) for page_queue in page_queues]
+            if sort_key is not None:
+                merged = heapq.merge(*streams, key=sort_key)
+            else:
+                merged = itertools.chain.from_iterable(streams)
+
+            seen_ids = set()
+            for issue in merged:
+                issue_id = issue["id"] if isinstance(issue, dict) else issue.id
+                if issue_id in seen_ids:
+                    continue
+                seen_ids.add(issue_id)
+                yield issue
+                if max_results and len(seen_ids) >= max_results:
+                    return
+        finally:
+            stop_event.set()
+
+    def get_tickets_by_jql_parallel(self,
+                                    jql: str,
+                                    partitions: typing.Sequence[str],
+                                    max_workers: int = 4,
+                                    max_results: typing.Optional[int] = None,
+                                    fields: typing.Optional[typing.Sequence[str]] = None,
+                                    parse_mode: typing.Optional[JiraParseModeEnum] = None) -> SearchResults:
+        """
+        iter_tickets_by_jql_parallel() の結果を1つの検索結果にまとめて返します。
+        引数は iter_tickets_by_jql_parallel() と同じです。
+
+        Returns:
+            JiraSearchResults | JiraPartialSearchResults: 全パーティションの課題を含む検索結果。
+        """
+        from jira_api_client.models.search import search_results_model
+
+        results_model = search_results_model(fields is not None, parse_mode or self.__parse_mode)
+        issues = list(
+            self.iter_tickets_by_jql_parallel(jql,
+                                              partitions,
+                                              max_workers=max_workers,
+                                              max_results=max_results,
+                                              fields=fields,
+                                              parse_mode=parse_mode))
+        # 課題は iter_pages() で解析済みのため、検索結果の組み立てでは再検証しない
+        return results_model.model_construct(issues=issues, isLast=True, nextPageToken=None)
+
+    def _fetch_partition(self, jql: str, page_size: int, fields: typing.Optional[typing.Sequence[str]],
+                         parse_mode: typing.Optional[JiraParseModeEnum], intern_cache: typing.Optional[JiraInternCache],
+                         page_queue: "queue.Queue[typing.Any]", request_slots: threading.BoundedSemaphore,
+                         stop_event: threading.Event) -> None:
+        """1つのパーティションをページングし、取得した課題のリストを page_queue に送ります。"""
+        pages = self.iter_pages(jql,
+                                page_size=page_size,
+                                fields=fields,
+                                parse_mode=parse_mode,
+                                intern_cache=intern_cache)
+        try:
+            while not stop_event.is_set():
+                with request_slots:
+                    page = next(pages, None)
+                if page is None:
+                    break
+                self._put_until_stopped(page_queue, page.issues, stop_event)
+        except Exception as e:
+            self._put_until_stopped(page_queue, e, stop_event)
+            return
+        finally:
+            pages.close()
+        self._put_until_stopped(page_queue, _PARTITION_DONE, stop_event)
+
+    @staticmethod
+    def _put_until_stopped(page_queue: "queue.Queue[typing.Any]", item: typing.Any,
+                           stop_event: threading.Event) -> None:
+        """消費側が停止した場合に備え、stop_event を確認しながら page_queue に item を送ります。"""
+        while not stop_event.is_set():
+            try:
+                page_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    @staticmethod
+    def _drain_partition(page_queue: "queue.Queue[typing.Any]") -> typing.Iterator[SearchIssue]:
+        """_fetch_partition() が送った課題を順に返します。ワーカーで発生した例外はここで再送出されます。"""
+        while True:
+            item = page_queue.get()
+            if item is _PARTITION_DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
 
     def get_tickets(self,
                     project_key: str,
                     issue_type: typing.Optional[JiraIssueTypeEnum] = None,
                     assignee_account_id: typing.Optional[str] = None,
                     status_name: typing.Optional[JiraStatusNameEnum] = None,
-                    max_results: typing.Optional[int] = None) -> JiraSearchResults:
+                    max_results: typing.Optional[int] = None,
+                    fields: typing.Optional[typing.Sequence[str]] = None,
+                    parse_mode: typing.Optional[JiraParseModeEnum] = None) -> SearchResults:
         """
         Jiraから特定のプロジェクトのチケット一覧を取得します。
         オプションで課題タイプおよび担当者によるフィルタリングも可能です。
@@ -131,6 +883,10 @@ class JiraClinet(object):
                                          指定しない場合、ステータスでフィルタしません。
             max_results (int): 取得するチケットの最大数 (デフォルト: None)。
                                Noneの場合は全件取得
+            fields (Sequence[str], optional): 取得するフィールドのリスト (例: ['status', 'assignee', 'updated'])。
+                                              指定した場合は JiraPartialSearchResults が返されます。
+                                              Noneの場合は全フィールドを取得します。
+            parse_mode (JiraParseModeEnum, optional): 検索結果の解析方法。詳細は iter_pages() を参照。
 
         Returns:
             JiraSearchResults: Jira APIからの検索結果を表すPydanticオブジェクト。
@@ -142,21 +898,410 @@ class JiraClinet(object):
             pydantic.ValidationError: レスポンスJSONが定義されたPydanticモデルの構造と一致しない場合。
             Exception: その他の予期せぬエラーが発生した場合。
         """
-        jql_parts = [f'project = "{project_key}"']
+        jql_query = build_tickets_jql(project_key, issue_type, assignee_account_id, status_name)
+        return self.get_tickets_by_jql(jql_query, max_results, fields=fields, parse_mode=parse_mode)
+
+    def iter_tickets(self,
+                     project_key: str,
+                     issue_type: typing.Optional[JiraIssueTypeEnum] = None,
+                     assignee_account_id: typing.Optional[str] = None,
+                     status_name: typing.Optional[JiraStatusNameEnum] = None,
+                     max_results: typing.Optional[int] = None,
+                     fields: typing.Optional[typing.Sequence[str]] = None,
+                     parse_mode: typing.Optional[JiraParseModeEnum] = None) -> typing.Iterator[SearchIssue]:
+        """
+        get_tickets() のストリーミング版です。条件に一致する課題をページ到着ごとに1件ずつ返します。
+        引数は get_tickets() と同じです。
+
+        Yields:
+            JiraIssue | JiraPartialIssue: 検索結果の課題。
+        """
+        jql_query = build_tickets_jql(project_key, issue_type, assignee_account_id, status_name)
+        return self.iter_tickets_by_jql(jql_query, max_results, fields=fields, parse_mode=parse_mode)
+
+    def get_issues(self,
+                   keys: typing.Iterable[str],
+                   fields: typing.Optional[typing.Sequence[str]] = None,
+                   parse_mode: typing.Optional[JiraParseModeEnum] = None,
+                   chunk_size: int = BULK_FETCH_LIMIT,
+                   max_workers: int = 4) -> JiraBulkFetchResult:
+        """
+        課題のキー (またはID) のリストから、課題の現在の状態をまとめて取得します。
+
+        Webhook やコミットメッセージから集めた数千件のキーでも、巨大なJQLを組み立てずに取得できます。
+        キーは大文字に正規化して重複を除いた後、一括取得API (/issue/bulkfetch) の chunk_size 件ずつのリクエストに分割され、
+        max_workers 件まで並列に送信されます。URLの長さの制限を受けないよう、キーはリクエストボディで送信します。
+        一部のリクエストが失敗しても残りの取得は継続され、失敗したキーは errors に記録されます。
+
+        Example:
+            result = client.get_issues(["PROJ-1", "proj-2", "PROJ-1"], fields=["status", "updated"])
+            for key, issue in result.issues.items():
+                print(key, issue.fields.status.name)
+            print(result.moved, result.missing)
+
+        Args:
+            keys (Iterable[str]): 取得する課題のキーまたはIDのリスト。
+            fields (Sequence[str], optional): 取得するフィールドのリスト。詳細は iter_pages() を参照。
+            parse_mode (JiraParseModeEnum, optional): 課題の解析方法。詳細は iter_pages() を参照。
+            chunk_size (int): 1回のリクエストで取得する課題数 (1〜100, デフォルト: 100)。
+            max_workers (int): 同時に送信するリクエスト数 (デフォルト: 4)。
+
+        Returns:
+            JiraBulkFetchResult: 要求したキー (大文字に正規化済み) をキーとする課題の辞書 (issues)、
+                                 キーが変わった課題の新しいキー (moved)、存在しない・閲覧権限が無い課題のキー (missing)、
+                                 リクエストの失敗により取得できなかった課題のエラー情報 (errors)。
+
+        Raises:
+            ValueError: chunk_size または max_workers が範囲外の場合。
+        """
+        if not 1 <= chunk_size <= BULK_FETCH_LIMIT:
+            raise ValueError(f"chunk_size には1〜{BULK_FETCH_LIMIT}を指定してください。")
+        if max_workers < 1:
+            raise ValueError("max_workers には1以上を指定してください。")
+
+        keys = normalize_issue_keys(keys)
+        chunks = [keys[start:start + chunk_size] for start in range(0, len(keys), chunk_size)]
+        parse_mode = parse_mode or self.__parse_mode
+        # エンティティの共有は全チャンクで1つのキャッシュを使う
+        intern_cache = JiraInternCache() if self.__intern_entities else None
+
+        def fetch(chunk: typing.List[str]) -> "JiraBulkFetchPage":
+            return self._fetch_issues_chunk(chunk, fields, parse_mode, intern_cache)
+
+        if max_workers == 1 or len(chunks) <= 1:
+            pages = [fetch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                pages = list(executor.map(fetch, chunks))
+        from jira_api_client.parsing import merge_bulk_fetch_pages
+
+        return merge_bulk_fetch_pages(keys, pages)
+
+    def _fetch_issues_chunk(self, keys: typing.List[str], fields: typing.Optional[typing.Sequence[str]],
+                            parse_mode: JiraParseModeEnum,
+                            intern_cache: typing.Optional[JiraInternCache]) -> "JiraBulkFetchPage":
+        """
+        get_issues() の1リクエスト分を送信し、結果を要求したキーに対応付けて返します。
+        キーが変わった課題を対応付けられなかった場合は、そのキーを1件ずつ取得し直します。
+        """
+        from jira_api_client.parsing import JiraSearchPageParser, failed_bulk_fetch_page, parse_bulk_fetch
+
+        bulk_fetch_endpoint = os.path.join(self.__base_url, "issue/bulkfetch")
+        parser = JiraSearchPageParser(fields is not None, parse_mode, self.__validate_every, intern_cache)
+
+        with self._instrument("get_issues", "POST", bulk_fetch_endpoint) as event:
+            try:
+                # 取得のみで副作用が無いため、POST でも一時的なエラーは再試行する
+                response = self._request("POST",
+                                         bulk_fetch_endpoint,
+                                         retryable=True,
+                                         event=event,
+                                         headers=self.__headers,
+                                         data=json.dumps(build_bulk_fetch_payload(keys, fields)))
+                response.raise_for_status()
+                page = parse_bulk_fetch(parser, response.content, keys, event)
+            except requests.exceptions.RequestException as err:
+                event.error = type(err).__name__
+                print(f"Jira API 'get_issues' リクエストエラー: {err}")
+                if hasattr(err, 'response') and err.response is not None:
+                    print(f"レスポンス詳細: {err.response.text}")
+                status = err.response.status_code if getattr(err, 'response', None) is not None else None
+                return failed_bulk_fetch_page(keys, status, str(err))
+            except (json.JSONDecodeError, ValidationError) as e:
+                event.error = type(e).__name__
+                print(f"Jira API 'get_issues' レスポンスの解析に失敗しました: {e}")
+                return failed_bulk_fetch_page(keys, response.status_code, str(e))
+
+        for key in page.unresolved:
+            retried = self._fetch_issues_chunk([key], fields, parse_mode, intern_cache)
+            page.issues.update(retried.issues)
+            page.moved.update(retried.moved)
+            page.missing.extend(retried.missing)
+            page.errors.extend(retried.errors)
+        page.unresolved = []
+        return page
+
+    def get_transitions(self, issue_key_or_id: str) -> typing.List[JiraTransition]:
+        """
+        課題に対して現在実行できるワークフローの遷移の一覧を取得します。
+
+        Args:
+            issue_key_or_id (str): 課題のキーまたはID。
+
+        Returns:
+            List[JiraTransition]: 実行できる遷移のリスト。
+
+        Raises:
+            requests.exceptions.RequestException: リクエスト中にネットワークまたはHTTPエラーが発生した場合。
+            json.JSONDecodeError: Jira APIからのレスポンスが有効なJSONでない場合。
+            pydantic.ValidationError: レスポンスJSONが定義されたPydanticモデルの構造と一致しない場合。
+        """
+        transitions_endpoint = os.path.join(self.__base_url, f"issue/{issue_key_or_id}/transitions")
+        with self._instrument("get_transitions", "GET", transitions_endpoint) as event:
+            try:
+                response = self._request("GET", transitions_endpoint, event=event, headers=self.__headers)
+                response.raise_for_status()
+                return validate_json(JiraTransitionList.model_validate_json, response.content, event).transitions
+            except requests.exceptions.RequestException as err:
+                print(f"Jira API 'get_transitions' リクエストエラー: {err}")
+                if hasattr(err, 'response') and err.response is not None:
+                    print(f"レスポンス詳細: {err.response.text}")
+                raise
+            except json.JSONDecodeError as e:
+                print(f"Jira API 'get_transitions' レスポンスのJSONデコードに失敗しました: {e}")
+                print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
+                raise
+            except ValidationError as e:
+                print(f"Jira API 'get_transitions' Pydanticバリデーションエラー: {e}")
+                print(f"エラー詳細: {e.errors()}")
+                raise
+
+    def transition_issues(self,
+                          keys: typing.Iterable[str],
+                          target_status: typing.Union[JiraStatusNameEnum, str],
+                          fields: typing.Optional[typing.Dict[str, typing.Any]] = None,
+                          update: typing.Optional[typing.Dict[str, typing.Any]] = None,
+                          max_workers: int = 8,
+                          skip_current: bool = True) -> JiraBulkUpdateResult:
+        """
+        複数の課題を、指定したステータスへまとめて遷移させます。
+
+        課題の現在のステータス・プロジェクト・課題タイプを get_issues() でまとめて取得した後、
+        (プロジェクト, 課題タイプ, 現在のステータス) の組み合わせごとに1件だけ遷移の一覧を取得して遷移IDを解決します。
+        解決した遷移はクライアントの transition_cache に保持され、以降の呼び出しでも再利用されます。
+        遷移のリクエストは max_workers 件まで並列に送信され、一部の課題の失敗は他の課題の遷移を中断しません。
+
+        Example:
+            result = client.transition_issues(keys, JiraStatusNameEnum.TO_BE_RELEASED)
+            for failed in result.failed:
+                print(failed.key, failed.errorMessages)
+
+        Args:
+            keys (Iterable[str]): 遷移させる課題のキーまたはIDのリスト。
+            target_status (JiraStatusNameEnum | str): 遷移先のステータス名 (大文字小文字は区別しません)。
+                                                    遷移先のステータス名が一致する遷移が無い場合は、遷移の表示名で探します。
+            fields (Dict[str, Any], optional): 遷移画面で設定するフィールドの値 (例: {"resolution": {"name": "Done"}})。
+            update (Dict[str, Any], optional): 遷移時に行うフィールドへの操作 (例: コメントの追加)。
+            max_workers (int): 同時に送信するリクエスト数 (デフォルト: 8)。
+                               クライアントの pool_maxsize 以下を指定してください。
+            skip_current (bool): 既に target_status の課題を遷移させずに skipped とするかどうか (デフォルト: True)。
+
+        Returns:
+            JiraBulkUpdateResult: 要求した順序 (キーは大文字に正規化・重複除去済み) の課題ごとの結果と所要時間。
+
+        Raises:
+            ValueError: max_workers が範囲外の場合。
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers には1以上を指定してください。")
 
-        if issue_type:
-            jql_parts.append(f'issuetype = "{issue_type.value}"')
+        started = time.perf_counter()
+        keys = normalize_issue_keys(keys)
+        target = status_name(target_status)
+        target_label = target_status.value if isinstance(target_status, JiraStatusNameEnum) else target_status
+        # 遷移IDの解決に必要なフィールドだけを、検証せずに取得する
+        current = self.get_issues(keys,
+                                  fields=["project", "issuetype", "status"],
+                                  parse_mode=JiraParseModeEnum.RAW,
+                                  max_workers=max_workers)
+        results = self._fetch_failure_results(current)
 
-        if assignee_account_id:
-            jql_parts.append(f'assignee = "{assignee_account_id}"')
+        pending = []
+        for key, issue in current.issues.items():
+            current_status = ((issue.get("fields") or {}).get("status") or {}).get("name") or ""
+            if skip_current and current_status.casefold() == target:
+                results[key] = JiraIssueUpdateResult(key=key, status=JiraIssueUpdateStatusEnum.SKIPPED)
+            else:
+                pending.append((key, issue))
 
-        if status_name:
-            jql_parts.append(f'status = "{status_name.value}"')
+        transitions, failures = self._resolve_transitions(pending, max_workers)
+        tasks = []
+        for key, issue in pending:
+            workflow = workflow_key(issue)
+            if workflow in failures:
+                results[key] = failures[workflow].model_copy(update={"key": key})
+                continue
+            transition = find_transition(transitions[workflow], target_status)
+            if transition is None:
+                current_status = issue["fields"]["status"].get("name")
+                results[key] = JiraIssueUpdateResult(
+                    key=key,
+                    status=JiraIssueUpdateStatusEnum.FAILED,
+                    errorMessages=[f"現在のステータス '{current_status}' から '{target_label}' への遷移がありません。"])
+                continue
+            url = os.path.join(self.__base_url, f"issue/{issue['key']}/transitions")
+            tasks.append((key, "POST", url, build_transition_payload(transition.id, fields, update), transition.id))
 
-        jql_query = ' AND '.join(jql_parts)
-        jql_query += ' ORDER BY created DESC'
+        results.update(self._run_issue_updates("transition_issue", tasks, max_workers))
+        return JiraBulkUpdateResult(results=[results[key] for key in keys],
+                                    elapsed_seconds=time.perf_counter() - started)
 
-        return self.get_tickets_by_jql(jql_query, max_results)
+    def edit_issues(self,
+                    keys: typing.Union[typing.Iterable[str], typing.Mapping[str, typing.Dict[str, typing.Any]]],
+                    fields: typing.Optional[typing.Dict[str, typing.Any]] = None,
+                    update: typing.Optional[typing.Dict[str, typing.Any]] = None,
+                    notify_users: bool = True,
+                    max_workers: int = 8) -> JiraBulkUpdateResult:
+        """
+        複数の課題のフィールドをまとめて編集します。
+
+        編集のリクエストは max_workers 件まで並列に送信され、一部の課題の失敗は他の課題の編集を中断しません。
+
+        Example:
+            # 全ての課題の修正バージョンに 1.2.0 を追加する
+            client.edit_issues(keys, update={"fixVersions": [{"add": {"name": "1.2.0"}}]})
+            # 課題ごとに異なる値を設定する
+            client.edit_issues({"PROJ-1": {"summary": "A"}, "PROJ-2": {"summary": "B"}})
+
+        Args:
+            keys (Iterable[str] | Mapping[str, Dict[str, Any]]): 編集する課題のキーまたはIDのリスト。
+                                                                辞書の場合、値はその課題だけに設定するフィールドの値で、
+                                                                fields と同じフィールドは辞書の値が優先されます。
+            fields (Dict[str, Any], optional): 全ての課題に設定するフィールドの値。
+            update (Dict[str, Any], optional): 全ての課題に行うフィールドへの操作
+                                              (例: {"labels": [{"add": "released"}]})。
+            notify_users (bool): 編集をウォッチャーにメールで通知するかどうか (デフォルト: True)。
+                                 False を指定するにはJiraの管理者権限が必要です。
+            max_workers (int): 同時に送信するリクエスト数 (デフォルト: 8)。
+                               クライアントの pool_maxsize 以下を指定してください。
+
+        Returns:
+            JiraBulkUpdateResult: 要求した順序 (キーは大文字に正規化・重複除去済み) の課題ごとの結果と所要時間。
+
+        Raises:
+            ValueError: 編集内容が指定されていない場合、または max_workers が範囲外の場合。
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers には1以上を指定してください。")
+
+        started = time.perf_counter()
+        issue_fields: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        if isinstance(keys, typing.Mapping):
+            issue_fields = {key.strip().upper(): value for key, value in keys.items()}
+        keys = normalize_issue_keys(keys)
+
+        tasks = []
+        for key in keys:
+            payload = build_edit_payload({**(fields or {}), **issue_fields.get(key, {})}, update)
+            if not payload:
+                raise ValueError(f"課題 {key} の編集内容 (fields または update) を指定してください。")
+            url = os.path.join(self.__base_url, f"issue/{key}")
+            if not notify_users:
+                url += "?notifyUsers=false"
+            tasks.append((key, "PUT", url, payload, None))
+
+        results = self._run_issue_updates("edit_issue", tasks, max_workers)
+        return JiraBulkUpdateResult(results=[results[key] for key in keys],
+                                    elapsed_seconds=time.perf_counter() - started)
+
+    def _resolve_transitions(self, issues: typing.Sequence[typing.Tuple[str, typing.Dict[str, typing.Any]]],
+                             max_workers: int) -> _ResolvedTransitions:
+        """
+        課題の (プロジェクト, 課題タイプ, 現在のステータス) ごとの遷移の一覧を返します。
+        キャッシュに無い組み合わせは、その組み合わせの課題1件の遷移の一覧を並列に取得してキャッシュします。
+        取得に失敗した組み合わせは、失敗の結果 (キーは空) として2つ目の辞書に返します。
+        """
+        transitions: typing.Dict[WorkflowKey, typing.List[JiraTransition]] = {}
+        representatives: typing.Dict[WorkflowKey, str] = {}
+        for _, issue in issues:
+            workflow = workflow_key(issue)
+            if workflow in transitions or workflow in representatives:
+                continue
+            cached = self.__transition_cache.get(workflow)
+            if cached is not None:
+                transitions[workflow] = cached
+            else:
+                representatives[workflow] = issue["key"]
+
+        def fetch(workflow: WorkflowKey) -> typing.Union[typing.List[JiraTransition], JiraIssueUpdateResult]:
+            try:
+                return self.get_transitions(representatives[workflow])
+            except requests.exceptions.RequestException as err:
+                return self._failed_update_result("", err)
+            except (json.JSONDecodeError, ValidationError) as e:
+                return JiraIssueUpdateResult(key="", status=JiraIssueUpdateStatusEnum.FAILED, errorMessages=[str(e)])
+
+        failures: typing.Dict[WorkflowKey, JiraIssueUpdateResult] = {}
+        if representatives:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(representatives))) as executor:
+                fetched = list(executor.map(fetch, representatives))
+            for workflow, result in zip(representatives, fetched):
+                if isinstance(result, JiraIssueUpdateResult):
+                    failures[workflow] = result
+                else:
+                    self.__transition_cache.put(workflow, result)
+                    transitions[workflow] = result
+        return transitions, failures
+
+    def _run_issue_updates(self, endpoint: str, tasks: typing.Sequence[_IssueUpdateTask],
+                           max_workers: int) -> typing.Dict[str, JiraIssueUpdateResult]:
+        """(キー, メソッド, URL, ペイロード, 遷移ID) の更新リクエストを並列に送信し、キーごとの結果を返します。"""
+        if not tasks:
+            return {}
+        if max_workers == 1 or len(tasks) == 1:
+            results = [self._update_issue(endpoint, *task) for task in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+                results = list(executor.map(lambda task: self._update_issue(endpoint, *task), tasks))
+        return {result.key: result for result in results}
+
+    def _update_issue(self, endpoint: str, key: str, method: str, url: str, payload: typing.Dict[str, typing.Any],
+                      transition_id: typing.Optional[str]) -> JiraIssueUpdateResult:
+        """課題1件の遷移・編集のリクエストを送信し、結果を返します。エラーは例外にせず失敗の結果として返します。"""
+        with self._instrument(endpoint, method, url) as event:
+            try:
+                response = self._request(method, url, event=event, headers=self.__headers, data=json.dumps(payload))
+                response.raise_for_status()
+                return JiraIssueUpdateResult(key=key,
+                                             status=JiraIssueUpdateStatusEnum.UPDATED,
+                                             transition_id=transition_id)
+            except requests.exceptions.RequestException as err:
+                event.error = type(err).__name__
+                print(f"Jira API '{endpoint}' リクエストエラー ({key}): {err}")
+                if hasattr(err, 'response') and err.response is not None:
+                    print(f"レスポンス詳細: {err.response.text}")
+                return self._failed_update_result(key, err, transition_id)
+
+    @staticmethod
+    def _failed_update_result(key: str,
+                              err: requests.exceptions.RequestException,
+                              transition_id: typing.Optional[str] = None) -> JiraIssueUpdateResult:
+        """リクエストエラーを失敗の結果に変換します。レスポンスにJiraのエラー情報があればそれを使います。"""
+        response = getattr(err, 'response', None)
+        error_messages = [str(err)]
+        errors = {}
+        if response is not None:
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                error_messages = data.get("errorMessages") or ([] if data.get("errors") else error_messages)
+                errors = {name: str(message) for name, message in (data.get("errors") or {}).items()}
+        return JiraIssueUpdateResult(key=key,
+                                     status=JiraIssueUpdateStatusEnum.FAILED,
+                                     transition_id=transition_id,
+                                     http_status=response.status_code if response is not None else None,
+                                     errorMessages=error_messages,
+                                     errors=errors)
+
+    @staticmethod
+    def _fetch_failure_results(fetched: JiraBulkFetchResult) -> typing.Dict[str, JiraIssueUpdateResult]:
+        """get_issues() で取得できなかった課題を失敗の結果に変換します。"""
+        results = {
+            key:
+                JiraIssueUpdateResult(key=key,
+                                      status=JiraIssueUpdateStatusEnum.FAILED,
+                                      http_status=404,
+                                      errorMessages=["課題が存在しないか、閲覧する権限がありません。"])
+            for key in fetched.missing
+        }
+        for error in fetched.errors:
+            results[error.key] = JiraIssueUpdateResult(key=error.key,
+                                                       status=JiraIssueUpdateStatusEnum.FAILED,
+                                                       http_status=error.status,
+                                                       errorMessages=error.errorMessages)
+        return results
 
     def create_ticket(self,
                       project_key: str,
@@ -197,107 +1342,268 @@ class JiraClinet(object):
         """
         create_endpoint = os.path.join(self.__base_url, "issue")
 
-        payload = {
-            "fields": {
-                "project": {
-                    "key": project_key
-                },
-                "summary": summary,
-                "issuetype": {
-                    "name": issue_type.value
-                }
-            }
-        }
-        if description:
-            payload["fields"]["description"] = {
-                "type": "doc",
-                "version": 1,
-                "content": [{
-                    "type": "paragraph",
-                    "content": [{
-                        "type": "text",
-                        "text": description
-                    }]
-                }]
-            }
-        if assignee_account_id:
-            payload["fields"]["assignee"] = {"accountId": assignee_account_id}
-        if priority_name:
-            payload["fields"]["priority"] = {"name": priority_name}
-
-        if custom_fields:
-            payload["fields"].update(custom_fields)
+        payload = build_create_ticket_payload(project_key, summary, description, issue_type, assignee_account_id,
+                                              priority_name, custom_fields)
 
-        try:
-            response = requests.post(create_endpoint, headers=self.__headers, data=json.dumps(payload))
-            response.raise_for_status()
+        with self._instrument("create_ticket", "POST", create_endpoint) as event:
+            try:
+                response = self._request("POST",
+                                         create_endpoint,
+                                         event=event,
+                                         headers=self.__headers,
+                                         data=json.dumps(payload))
+                response.raise_for_status()
 
-            data = response.json()
-            return JiraCreatedIssue(**data)
-        except requests.exceptions.RequestException as err:
-            print(f"Jira API 'create_ticket' リクエストエラー: {err}")
-            if hasattr(err, 'response') and err.response is not None:
-                print(f"レスポンス詳細: {err.response.text}")
-            raise
-        except json.JSONDecodeError as e:
-            print(f"Jira API 'create_ticket' レスポンスのJSONデコードに失敗しました: {e}")
-            print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
-            raise
-        except ValidationError as e:
-            print(f"Jira API 'create_ticket' Pydanticバリデーションエラー: {e}")
-            print(f"エラー詳細: {e.errors()}")
-            raise
-        except Exception as e:
-            print(f"Jira API 'create_ticket' 予期せぬエラー: {e}")
-            raise
+                return validate_json(JiraCreatedIssue.model_validate_json, response.content, event)
+            except requests.exceptions.RequestException as err:
+                print(f"Jira API 'create_ticket' リクエストエラー: {err}")
+                if hasattr(err, 'response') and err.response is not None:
+                    print(f"レスポンス詳細: {err.response.text}")
+                raise
+            except json.JSONDecodeError as e:
+                print(f"Jira API 'create_ticket' レスポンスのJSONデコードに失敗しました: {e}")
+                print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
+                raise
+            except ValidationError as e:
+                print(f"Jira API 'create_ticket' Pydanticバリデーションエラー: {e}")
+                print(f"エラー詳細: {e.errors()}")
+                raise
+            except Exception as e:
+                print(f"Jira API 'create_ticket' 予期せぬエラー: {e}")
+                raise
+
+    def create_tickets_bulk(self,
+                            tickets: typing.Sequence[typing.Union[JiraTicketSpec, typing.Dict[str, typing.Any]]],
+                            chunk_size: int = BULK_CREATE_LIMIT,
+                            max_workers: int = 1) -> JiraBulkCreateResult:
+        """
+        Jiraの一括作成API (/issue/bulk) を使って複数のチケットを作成します。
+
+        チケットは chunk_size 件ずつのリクエストに分割して送信されます。
+        一部のチケットの作成に失敗しても残りのチケットの作成は継続され、
+        失敗したチケットは入力シーケンス内のインデックスとともに errors に記録されます。
+
+        Args:
+            tickets (Sequence[JiraTicketSpec | Dict[str, Any]]): 作成するチケットのリスト。
+                                                               辞書の場合のキーは create_ticket() の引数と同じです。
+                                                               例: {"project_key": "PROJ", "summary": "タイトル"}
+            chunk_size (int): 1回のリクエストで作成するチケット数 (1〜50, デフォルト: 50)。
+            max_workers (int): 同時に送信するリクエスト数 (デフォルト: 1)。
+
+        Returns:
+            JiraBulkCreateResult: 入力と同じ順序の作成結果 (issues) と、失敗したチケットのエラー情報 (errors)。
+
+        Raises:
+            ValueError: chunk_size が範囲外の場合。
+            pydantic.ValidationError: tickets の辞書が JiraTicketSpec の構造と一致しない場合。
+        """
+        if not 1 <= chunk_size <= BULK_CREATE_LIMIT:
+            raise ValueError(f"chunk_size には1〜{BULK_CREATE_LIMIT}を指定してください。")
+        if max_workers < 1:
+            raise ValueError("max_workers には1以上を指定してください。")
+
+        specs = [ticket if isinstance(ticket, JiraTicketSpec) else JiraTicketSpec(**ticket) for ticket in tickets]
+        chunks = [(start, specs[start:start + chunk_size]) for start in range(0, len(specs), chunk_size)]
+
+        result = JiraBulkCreateResult(issues=[None] * len(specs))
+        if max_workers == 1 or len(chunks) <= 1:
+            chunk_results = [self._create_tickets_chunk(start, chunk) for start, chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                chunk_results = list(executor.map(lambda args: self._create_tickets_chunk(*args), chunks))
+
+        for chunk_result in chunk_results:
+            for index, issue in chunk_result.issues:
+                result.issues[index] = issue
+            result.errors.extend(chunk_result.errors)
+        result.errors.sort(key=lambda error: error.index)
+        return result
+
+    def _create_tickets_chunk(self, start: int, specs: typing.Sequence[JiraTicketSpec]) -> "_BulkChunkResult":
+        """create_tickets_bulk() の1リクエスト分を送信し、結果を入力インデックスに対応付けて返します。"""
+        bulk_endpoint = os.path.join(self.__base_url, "issue/bulk")
+        payload = {"issueUpdates": [build_create_ticket_payload(**spec.model_dump()) for spec in specs]}
+
+        with self._instrument("create_tickets_bulk", "POST", bulk_endpoint) as event:
+            try:
+                response = self._request("POST",
+                                         bulk_endpoint,
+                                         event=event,
+                                         headers=self.__headers,
+                                         data=json.dumps(payload))
+                if response.status_code >= 400:
+                    try:
+                        data = validate_json(bulk_create_response_adapter().validate_json, response.content, event)
+                    except (json.JSONDecodeError, ValidationError):
+                        data = None
+                    # 全件失敗時も 400 で要素ごとのエラーが返されるため、その場合は通常のレスポンスとして扱う
+                    if data is None or "errors" not in data:
+                        response.raise_for_status()
+                else:
+                    data = validate_json(bulk_create_response_adapter().validate_json, response.content, event)
+                with event.measure("validation_time"):
+                    return self._map_bulk_create_response(start, len(specs), data)
+            except requests.exceptions.RequestException as err:
+                event.error = type(err).__name__
+                print(f"Jira API 'create_tickets_bulk' リクエストエラー: {err}")
+                if hasattr(err, 'response') and err.response is not None:
+                    print(f"レスポンス詳細: {err.response.text}")
+                status = err.response.status_code if getattr(err, 'response', None) is not None else None
+                return self._failed_bulk_chunk(start, len(specs), status, str(err))
+            except (json.JSONDecodeError, ValidationError) as e:
+                event.error = type(e).__name__
+                print(f"Jira API 'create_tickets_bulk' レスポンスの解析に失敗しました: {e}")
+                return self._failed_bulk_chunk(start, len(specs), response.status_code, str(e))
+
+    @staticmethod
+    def _map_bulk_create_response(start: int, count: int, data: typing.Dict[str, typing.Any]) -> "_BulkChunkResult":
+        """
+        /issue/bulk のレスポンスを入力インデックスに対応付けます。
+        issues には成功した要素だけが入力順に並び、失敗した要素は errors の failedElementNumber で示されます。
+
+        Raises:
+            pydantic.ValidationError: issues の要素が JiraCreatedIssue の構造と一致しない場合。
+        """
+        chunk_result = _BulkChunkResult()
+        failed_numbers = set()
+        for error in data.get("errors", []):
+            number = error.get("failedElementNumber")
+            element_errors = error.get("elementErrors", {})
+            if number is None:
+                continue
+            failed_numbers.add(number)
+            chunk_result.errors.append(
+                JiraBulkCreateError(index=start + number,
+                                    status=error.get("status"),
+                                    errorMessages=element_errors.get("errorMessages", []),
+                                    errors=element_errors.get("errors", {})))
+
+        succeeded_numbers = [number for number in range(count) if number not in failed_numbers]
+        for number, item in zip(succeeded_numbers, data.get("issues", [])):
+            chunk_result.issues.append((start + number, JiraCreatedIssue.model_validate(item)))
+        return chunk_result
+
+    @staticmethod
+    def _failed_bulk_chunk(start: int, count: int, status: typing.Optional[int], message: str) -> "_BulkChunkResult":
+        """リクエスト自体が失敗した場合に、チャンク内の全チケットを失敗として記録します。"""
+        chunk_result = _BulkChunkResult()
+        chunk_result.errors.extend(
+            JiraBulkCreateError(index=start + number, status=status, errorMessages=[message])
+            for number in range(count))
+        return chunk_result
 
     def upload_attachment(self,
                           issue_key_or_id: str,
-                          file_path: str,
-                          filename: typing.Optional[str] = None) -> typing.List[JiraAttachment]:
+                          file_path: AttachmentSource,
+                          filename: typing.Optional[str] = None,
+                          progress_callback: typing.Optional[ProgressCallback] = None,
+                          chunk_size: int = 1024 * 1024) -> typing.List[JiraAttachment]:
         """
         指定されたJiraチケットにファイルをアップロードします。
+
+        Args:
+            issue_key_or_id (str): アップロード先のチケットのキーまたはID。
+            file_path (AttachmentSource): アップロードするデータ。ファイルパスの他、bytes / bytearray / memoryview、
+                                          バイナリモードのファイルオブジェクト、bytes のイテラブルを受け付けます。
+                                          データはコピーせず、chunk_size 単位でストリーミング送信されます。
+            filename (str, optional): Jira上のファイル名。パス (またはname属性を持つファイルオブジェクト) の場合は
+                                      省略するとそのファイル名になります。それ以外のデータでは必須です。
+            progress_callback (Callable[[int, Optional[int]], None], optional):
+                送信済みバイト数と合計バイト数 (不明な場合は None) を受け取る進捗コールバック。
+            chunk_size (int): 送信単位となるバッファサイズ（バイト単位, デフォルト: 1MiB）。
+
+        Returns:
+            List[JiraAttachment]: 作成された添付ファイルのリスト。
+
+        Raises:
+            FileNotFoundError: ファイルパスが存在しない場合。
+            ValueError: ファイル名を決定できない場合。
+            requests.exceptions.RequestException: リクエスト中にネットワークまたはHTTPエラーが発生した場合。
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
+        return self.upload_attachments(issue_key_or_id, [(filename, file_path)],
+                                       progress_callback=progress_callback,
+                                       chunk_size=chunk_size)
 
-        upload_endpoint = os.path.join(self.__base_url, f"issue/{issue_key_or_id}/attachments")
+    def upload_attachments(self,
+                           issue_key_or_id: str,
+                           files: typing.Sequence[AttachmentFile],
+                           progress_callback: typing.Optional[ProgressCallback] = None,
+                           chunk_size: int = 1024 * 1024) -> typing.List[JiraAttachment]:
+        """
+        指定されたJiraチケットに、複数のファイルを1回の multipart リクエストでアップロードします。
 
-        if filename is None:
-            filename = os.path.basename(file_path)
+        ボディはメモリ上に組み立てずにストリーミング送信されるため、数GBのファイルでもメモリ使用量は
+        chunk_size 程度に収まります。全ファイルのサイズが分かる場合は Content-Length 付きで、
+        bytes のイテラブルなどサイズが分からないデータを含む場合は chunked 転送で送信されます。
 
-        try:
-            with open(file_path, 'rb') as f:
-                files = {'file': (filename, f, 'application/octet-stream')}
-                response = requests.post(upload_endpoint, headers=self.__upload_headers, files=files)
+        Args:
+            issue_key_or_id (str): アップロード先のチケットのキーまたはID。
+            files (Sequence[AttachmentFile]): アップロードするファイルのリスト。各要素はデータ単体
+                                              (形式は upload_attachment() の file_path と同じ)、
+                                              (ファイル名, データ)、(ファイル名, データ, Content-Type) のいずれか。
+            progress_callback (Callable[[int, Optional[int]], None], optional): 進捗コールバック。
+            chunk_size (int): 送信単位となるバッファサイズ（バイト単位, デフォルト: 1MiB）。
+
+        Returns:
+            List[JiraAttachment]: 作成された添付ファイルのリスト。
+
+        Raises:
+            FileNotFoundError: ファイルパスが存在しない場合。
+            ValueError: files が空の場合、またはファイル名を決定できない場合。
+            requests.exceptions.RequestException: リクエスト中にネットワークまたはHTTPエラーが発生した場合。
+            json.JSONDecodeError: Jira APIからのレスポンスが有効なJSONでない場合。
+            pydantic.ValidationError: レスポンスJSONが定義されたPydanticモデルの構造と一致しない場合。
+        """
+        if not files:
+            raise ValueError("files には1つ以上のファイルを指定してください。")
+        parts = build_upload_parts(files)
+        upload_endpoint = os.path.join(self.__base_url, f"issue/{issue_key_or_id}/attachments")
+
+        with self._instrument("upload_attachment", "POST", upload_endpoint) as event:
+            try:
+                body = MultipartUploadBody(parts, chunk_size=chunk_size, progress_callback=progress_callback)
+                response = self._request("POST",
+                                         upload_endpoint,
+                                         replayable=body.replayable,
+                                         event=event,
+                                         headers={
+                                             **self.__upload_headers, "Content-Type": body.content_type
+                                         },
+                                         data=body)
                 response.raise_for_status()
 
-            data = response.json()
-            return [JiraAttachment(**item) for item in data]
-        except requests.exceptions.RequestException as err:
-            print(f"Jira API 'upload_attachment' リクエストエラー: {err}")
-            if hasattr(err, 'response') and err.response is not None:
-                print(f"レスポンス詳細: {err.response.text}")
-            raise
-        except json.JSONDecodeError as e:
-            print(f"Jira API 'upload_attachment' レスポンスのJSONデコードに失敗しました: {e}")
-            print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
-            raise
-        except ValidationError as e:
-            print(f"Jira API 'upload_attachment' Pydanticバリデーションエラー: {e}")
-            print(f"エラー詳細: {e.errors()}")
-            raise
-        except Exception as e:
-            print(f"Jira API 'upload_attachment' 予期せぬエラー: {e}")
-            raise
+                return validate_json(attachment_list_adapter().validate_json, response.content, event)
+            except requests.exceptions.RequestException as err:
+                print(f"Jira API 'upload_attachment' リクエストエラー: {err}")
+                if hasattr(err, 'response') and err.response is not None:
+                    print(f"レスポンス詳細: {err.response.text}")
+                raise
+            except json.JSONDecodeError as e:
+                print(f"Jira API 'upload_attachment' レスポンスのJSONデコードに失敗しました: {e}")
+                print(f"レスポンステキスト: {response.text if 'response' in locals() else 'レスポンスなし'}")
+                raise
+            except ValidationError as e:
+                print(f"Jira API 'upload_attachment' Pydanticバリデーションエラー: {e}")
+                print(f"エラー詳細: {e.errors()}")
+                raise
+            except Exception as e:
+                print(f"Jira API 'upload_attachment' 予期せぬエラー: {e}")
+                raise
 
-    def download_attachment(self, attachment: JiraAttachment, save_path: typing.Optional[str] = None) -> None:
+    def download_attachment(self,
+                            attachment: JiraAttachment,
+                            save_path: typing.Optional[str] = None,
+                            chunk_size: int = 8192,
+                            resume: bool = False) -> None:
         """
         Jiraに添付されたファイルをダウンロードします。
 
         Args:
             attachment (JiraAttachment): ダウンロードするファイルのJiraAttachment instance。
             save_path (str): ダウンロードしたファイルを保存するローカルパス（ファイル名を含む）。
+            chunk_size (int): ファイルへの書き込み単位となるバッファサイズ（バイト単位, デフォルト: 8192）。
+            resume (bool): True の場合、保存先に途中までのファイルがあれば HTTP Range で続きからダウンロードし、
+                           サイズが一致するファイルが既にあればダウンロードをスキップします (デフォルト: False)。
 
         Returns:
             None
@@ -309,15 +1615,7 @@ class JiraClinet(object):
         if save_path is None:
             save_path = f"./{attachment.filename}"
         try:
-            response = requests.get(attachment.content, headers=self.__download_headers, stream=True)
-            response.raise_for_status()
-
-            # 保存先のディレクトリが存在しない場合は作成
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            self._download_to_file(attachment, save_path, chunk_size, resume)
             print(f"ファイルをダウンロードしました: {save_path}")
 
         except requests.exceptions.RequestException as err:
@@ -328,3 +1626,105 @@ class JiraClinet(object):
         except Exception as e:
             print(f"添付ファイルダウンロード中に予期せぬエラー: {e}")
             raise
+
+    def download_attachments(
+            self,
+            attachments: typing.Iterable[JiraAttachment],
+            save_dir: str = ".",
+            max_workers: int = 4,
+            chunk_size: int = 1024 * 1024,
+            resume: bool = True,
+            path_factory: typing.Optional[typing.Callable[[JiraAttachment],
+                                                          str]] = None) -> JiraAttachmentDownloadReport:
+        """
+        複数の添付ファイルを並列にダウンロードします。
+
+        例えば検索結果の全課題の fields.attachment をまとめて渡すことで、プロジェクトの添付ファイルを一括でミラーできます。
+        サイズが一致するファイルが既に存在する場合はスキップし、途中までのファイルは HTTP Range で続きから再開します。
+        一部のファイルの失敗は他のファイルのダウンロードを中断せず、そのファイルの結果に failed として記録されます。
+
+        Args:
+            attachments (Iterable[JiraAttachment]): ダウンロードする添付ファイルのリスト。
+            save_dir (str): 保存先のディレクトリ (デフォルト: カレントディレクトリ)。
+            max_workers (int): 同時にダウンロードするファイル数 (デフォルト: 4)。
+                               クライアントの pool_maxsize 以下を指定してください。
+            chunk_size (int): ファイルへの書き込み単位となるバッファサイズ（バイト単位, デフォルト: 1MiB）。
+            resume (bool): 既存ファイルのスキップと途中からの再開を行うかどうか (デフォルト: True)。
+            path_factory (Callable[[JiraAttachment], str], optional): 添付ファイルごとの保存先パスを返す関数。
+                                                                      指定しない場合は '{save_dir}/{id}_{filename}'。
+
+        Returns:
+            JiraAttachmentDownloadReport: ファイルごとの結果と、転送バイト数・所要時間・スループット。
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers には1以上を指定してください。")
+        if path_factory is None:
+
+            def path_factory(attachment: JiraAttachment) -> str:
+                return os.path.join(save_dir, f"{attachment.id}_{attachment.filename}")
+
+        def download(attachment: JiraAttachment) -> JiraAttachmentDownloadResult:
+            save_path = path_factory(attachment)
+            try:
+                status, transferred = self._download_to_file(attachment, save_path, chunk_size, resume)
+                return JiraAttachmentDownloadResult(attachment_id=attachment.id,
+                                                    save_path=save_path,
+                                                    status=status,
+                                                    bytes_transferred=transferred)
+            except Exception as e:
+                print(f"添付ファイルダウンロードエラー ({attachment.filename}): {e}")
+                return JiraAttachmentDownloadResult(attachment_id=attachment.id,
+                                                    save_path=save_path,
+                                                    status=JiraDownloadStatusEnum.FAILED,
+                                                    error=str(e))
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(download, attachments))
+        elapsed = time.perf_counter() - started
+
+        return JiraAttachmentDownloadReport(results=results,
+                                            bytes_transferred=sum(result.bytes_transferred for result in results),
+                                            elapsed_seconds=elapsed)
+
+    def _download_to_file(self, attachment: JiraAttachment, save_path: str, chunk_size: int,
+                          resume: bool) -> typing.Tuple[JiraDownloadStatusEnum, int]:
+        """
+        添付ファイルを save_path に保存し、(結果, 転送バイト数) を返します。
+        resume が True の場合は、既存ファイルのサイズを attachment.size と比較してスキップ・再開を判断します。
+        """
+        if not attachment.content:
+            raise ValueError(f"添付ファイルのダウンロードURLがありません: {attachment.filename}")
+
+        existing_size = os.path.getsize(save_path) if resume and os.path.exists(save_path) else 0
+        if resume and existing_size == attachment.size:
+            return JiraDownloadStatusEnum.SKIPPED, 0
+
+        headers = self.__download_headers
+        if 0 < existing_size < attachment.size:
+            headers = {**headers, "Range": f"bytes={existing_size}-"}
+
+        with self._instrument("download_attachment", "GET", attachment.content) as event:
+            with self._request("GET", attachment.content, event=event, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                # 206 の場合のみ追記する (Rangeが無視されて 200 が返った場合は先頭から書き直す)
+                resumed = response.status_code == 206
+                status = JiraDownloadStatusEnum.RESUMED if resumed else JiraDownloadStatusEnum.DOWNLOADED
+
+                # 保存先のディレクトリが存在しない場合は作成
+                save_dir = os.path.dirname(save_path)
+                if save_dir:
+                    os.makedirs(save_dir, exist_ok=True)
+
+                transferred = 0
+                # ボディの受信はレスポンスヘッダの受信後に行われるため、その時間もレイテンシに含める
+                with open(save_path, 'ab' if resumed else 'wb') as f, event.measure("latency"):
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        transferred += len(chunk)
+                event.bytes_received = transferred
+
+        if resume and os.path.getsize(save_path) != attachment.size:
+            raise IOError(f"ダウンロードしたファイルのサイズが一致しません: {save_path} "
+                          f"({os.path.getsize(save_path)} != {attachment.size})")
+        return status, transferred
@@ -0,0 +1,229 @@
+import datetime
+import re
+import typing
+
+from jira_api_client.models.record import JiraIssueRecord
+
+# JQLの分割 (パーティション) と、ORDER BY 句に従った課題の並び替えのためのユーティリティ
+
+_ORDER_BY_PATTERN = re.compile(r"\s+ORDER\s+BY\s+", re.IGNORECASE)
+_ISSUE_KEY_PATTERN = re.compile(r"^([A-Z][A-Z0-9_]*)-(\d+)$", re.IGNORECASE)
+_JQL_DATETIME_FORMAT = "%Y/%m/%d %H:%M"
+# JQLの引用符で囲まれた文字列 (エスケープされた引用符を含む)
+_QUOTED_PATTERN = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')')
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# クライアント側で ORDER BY と同じ順序に並び替えられるフィールド (key / id と、値が日時・数値・文字列のフィールド)。
+# ステータスやユーザーなど値がオブジェクトのフィールドと、型の分からないカスタムフィールドは含まない
+SORTABLE_FIELDS = frozenset({
+    "key", "issuekey", "id", "created", "updated", "resolutiondate", "duedate", "lastViewed",
+    "statuscategorychangedate", "summary", "timespent", "timeestimate", "timeoriginalestimate", "aggregatetimespent",
+    "aggregatetimeoriginalestimate", "workratio"
+})
+
+
+def split_order_by(jql: str) -> typing.Tuple[str, str]:
+    """
+    JQLを条件部分と ORDER BY 句に分割します。
+
+    Returns:
+        Tuple[str, str]: (条件部分, ORDER BY 以降の並び替え指定)。ORDER BY が無い場合は空文字列。
+    """
+    # ORDER BY はJQLの末尾にしか置けないため、引用符の外で最後に現れたものを採用する
+    # (summary ~ "sort order by date" のような引用符の中の文字列は検索条件の一部)
+    last = None
+    offset = 0
+    for index, part in enumerate(_QUOTED_PATTERN.split(" " + jql)):
+        if index % 2 == 0:
+            for match in _ORDER_BY_PATTERN.finditer(part):
+                last = (offset + match.start(), offset + match.end())
+        offset += len(part)
+    if last is None:
+        return jql.strip(), ""
+    start, end = last[0] - 1, last[1] - 1
+    return jql[:max(start, 0)].strip(), jql[end:].strip()
+
+
+def normalize_jql(jql: str) -> str:
+    """
+    JQLの前後の空白を除き、引用符の外の連続する空白 (改行を含む) を1つの空白にまとめます。
+
+    同じ検索条件のJQLを、書式の違いに関わらず同じ文字列として扱うために使用します (キャッシュのキーなど)。
+    引用符の中の文字列は検索条件の一部のため変更しません。
+    """
+    parts = _QUOTED_PATTERN.split(jql)
+    # split() の結果は、奇数番目が引用符で囲まれた文字列
+    return "".join(part if index % 2 else _WHITESPACE_PATTERN.sub(" ", part)
+                   for index, part in enumerate(parts)).strip()
+
+
+def parse_order_by(order_by: str) -> typing.List[typing.Tuple[str, bool]]:
+    """
+    ORDER BY 句 (例: 'created DESC, key ASC') を (フィールド名, 降順かどうか) のリストに変換します。
+    """
+    terms = []
+    for term in order_by.split(","):
+        parts = term.split()
+        if not parts:
+            continue
+        field = parts[0].strip('"')
+        descending = len(parts) > 1 and parts[1].upper() == "DESC"
+        terms.append((field, descending))
+    return terms
+
+
+def join_jql(where: str, clause: str, order_by: str = "") -> str:
+    """条件部分にパーティション条件を AND で結合し、ORDER BY 句を付け直したJQLを返します。"""
+    conditions = " AND ".join(f"({part})" for part in (where, clause) if part)
+    if order_by:
+        return f"{conditions} ORDER BY {order_by}"
+    return conditions
+
+
+def created_partitions(start: datetime.datetime, end: datetime.datetime, count: int) -> typing.List[str]:
+    """
+    created を start から end まで count 個の期間に分割したJQL条件のリストを返します。
+
+    最初の期間は下限なし、最後の期間は上限なしとなるため、
+    期間外に作成された課題も含めて全ての課題がちょうど1つのパーティションに属します。
+    日時は分単位に丸められます (JQLの日時リテラルの精度)。
+
+    Example:
+        created_partitions(datetime(2024, 1, 1), datetime(2025, 1, 1), 4)
+        # ['created < "2024/04/01 12:00"', 'created >= "2024/04/01 12:00" AND created < "2024/07/01 18:00"', ...]
+    """
+    return _range_partitions("created", _datetime_boundaries(start, end, count))
+
+
+def updated_partitions(start: datetime.datetime, end: datetime.datetime, count: int) -> typing.List[str]:
+    """
+    updated を start から end まで count 個の期間に分割したJQL条件のリストを返します。
+    スキャン中に更新された課題はパーティション間を移動する可能性があります。
+    """
+    return _range_partitions("updated", _datetime_boundaries(start, end, count))
+
+
+def key_range_partitions(project_key: str, first_number: int, last_number: int, count: int) -> typing.List[str]:
+    """
+    プロジェクト内の課題キーの番号範囲 (例: PROJ-1 〜 PROJ-20000) を count 個に分割したJQL条件のリストを返します。
+    created_partitions() と同様に、両端のパーティションは範囲外の課題も含みます。
+    """
+    if count < 1:
+        raise ValueError("count には1以上を指定してください。")
+    if last_number < first_number:
+        raise ValueError("last_number には first_number 以上を指定してください。")
+    step = (last_number - first_number + 1) / count
+    numbers = sorted({first_number + int(step * i) for i in range(1, count)})
+    boundaries = [f"{project_key}-{number}" for number in numbers]
+    return _range_partitions("key", boundaries)
+
+
+def _datetime_boundaries(start: datetime.datetime, end: datetime.datetime, count: int) -> typing.List[str]:
+    if count < 1:
+        raise ValueError("count には1以上を指定してください。")
+    if end <= start:
+        raise ValueError("end には start より後の日時を指定してください。")
+    step = (end - start) / count
+    # 分単位に丸めた結果、同じ境界が重複した場合は1つにまとめる
+    return list(dict.fromkeys((start + step * i).strftime(_JQL_DATETIME_FORMAT) for i in range(1, count)))
+
+
+def _range_partitions(field: str, boundaries: typing.Sequence[str]) -> typing.List[str]:
+    if not boundaries:
+        return [""]
+    partitions = [f'{field} < "{boundaries[0]}"']
+    for lower, upper in zip(boundaries, boundaries[1:]):
+        partitions.append(f'{field} >= "{lower}" AND {field} < "{upper}"')
+    partitions.append(f'{field} >= "{boundaries[-1]}"')
+    return partitions
+
+
+class _Reversed(object):
+    """降順ソート用に比較結果を反転させるラッパー。"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.value == other.value
+
+
+def parse_jira_datetime(value: str) -> typing.Optional[datetime.datetime]:
+    """Jira APIの日時文字列 (例: '2024-01-01T09:00:00.000+0900') をタイムゾーン付きの datetime に変換します。"""
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _sortable_value(field: str, value: typing.Any) -> typing.Any:
+    if field in ("key", "issuekey"):
+        match = _ISSUE_KEY_PATTERN.match(value)
+        return (match.group(1).upper(), int(match.group(2))) if match else (value, 0)
+    if field == "id":
+        return int(value)
+    if isinstance(value, str):
+        parsed = parse_jira_datetime(value)
+        if parsed is not None:
+            return parsed.timestamp()
+        return value
+    if isinstance(value, (int, float)):
+        return value
+    raise ValueError(f"フィールド '{field}' の値はクライアント側で並び替えできません: {type(value).__name__}")
+
+
+def _issue_value(issue: typing.Any, field: str) -> typing.Any:
+    # RAWモードの課題は dict、RECORDモードの課題は JiraIssueRecord
+    if isinstance(issue, JiraIssueRecord):
+        return issue.field_value(field)
+    if isinstance(issue, dict):
+        if field in ("key", "issuekey", "id"):
+            return issue.get("id" if field == "id" else "key")
+        return (issue.get("fields") or {}).get(field)
+    if field in ("key", "issuekey", "id"):
+        return getattr(issue, "id" if field == "id" else "key")
+    return getattr(issue.fields, field, None)
+
+
+def issue_sort_key(order_by: str) -> typing.Optional[typing.Callable[[typing.Any], typing.Tuple]]:
+    """
+    ORDER BY 句と同じ順序で課題を並べるための sort key 関数を返します。ORDER BY が空の場合は None。
+
+    対応しているフィールドは SORTABLE_FIELDS です (key / id / 日時フィールド / 数値・文字列フィールド)。
+    値が空 (None) の課題は、昇順・降順どちらでも最後に並びます。
+
+    Raises:
+        ValueError: ORDER BY 句に SORTABLE_FIELDS 以外のフィールドが含まれる場合。
+    """
+    terms = parse_order_by(order_by)
+    if not terms:
+        return None
+    # 並び替えは課題の取得を始めた後に行われるため、対応していないフィールドは取得を始める前にここで検出する
+    unsupported = [field for field, _ in terms if field not in SORTABLE_FIELDS]
+    if unsupported:
+        raise ValueError(f"ORDER BY のフィールド {', '.join(unsupported)} はクライアント側で並び替えできません。"
+                         f"対応しているフィールド: {', '.join(sorted(SORTABLE_FIELDS))}")
+
+    def sort_key(issue: typing.Any) -> typing.Tuple:
+        key = []
+        for field, descending in terms:
+            value = _issue_value(issue, field)
+            if value is None:
+                key.append((1, None))
+                continue
+            sortable = _sortable_value(field, value)
+            key.append((0, _Reversed(sortable) if descending else sortable))
+        return tuple(key)
+
+    return sort_key
+
+
+def order_by_fields(order_by: str) -> typing.List[str]:
+    """ORDER BY 句で使われている課題フィールド名 (key / id を除く) のリストを返します。"""
+    return [field for field, _ in parse_order_by(order_by) if field not in ("key", "issuekey", "id")]
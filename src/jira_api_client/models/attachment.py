@@ -1,11 +1,14 @@
+import functools
 import typing
+from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import Field, TypeAdapter
 
 from jira_api_client.models.base import JiraUser
+from jira_api_client.models.deferred import JiraDeferredModel
 
 
-class JiraAttachment(BaseModel):
+class JiraAttachment(JiraDeferredModel):
     """Jiraにアップロードされた添付ファイルの情報を表すPydanticモデル。"""
     id: str = Field(..., description="添付ファイルのユニークなID")
     self: str = Field(..., description="添付ファイルリソースへのURL")
@@ -16,3 +19,51 @@ class JiraAttachment(BaseModel):
     mimeType: str = Field(..., description="添付ファイルのMIMEタイプ")
     content: typing.Optional[str] = Field(None, description="添付ファイルのダウンロードURL")
     thumbnail: typing.Optional[str] = Field(None, description="添付ファイルのサムネイルURL（画像の場合）")
+
+
+@functools.lru_cache(maxsize=None)
+def attachment_list_adapter() -> "TypeAdapter[typing.List[JiraAttachment]]":
+    """
+    添付ファイルのアップロードAPIが返す JiraAttachment の配列を、bytes から直接検証するためのアダプターを返します。
+
+    TypeAdapter は生成時にスキーマを構築するため、初回の呼び出しまで生成を遅延します。
+    """
+    return TypeAdapter(typing.List[JiraAttachment])
+
+
+class JiraDownloadStatusEnum(str, Enum):
+    """
+    添付ファイルの一括ダウンロードにおける、ファイルごとの結果の列挙型。
+    """
+    DOWNLOADED = "downloaded"  # 新規にダウンロードした
+    RESUMED = "resumed"  # 途中まで保存済みのファイルの続きからダウンロードした
+    SKIPPED = "skipped"  # サイズが一致するファイルが既に存在したためスキップした
+    FAILED = "failed"  # ダウンロードに失敗した
+
+
+class JiraAttachmentDownloadResult(JiraDeferredModel):
+    """添付ファイル1件分のダウンロード結果を表すPydanticモデル。"""
+    attachment_id: str = Field(..., description="添付ファイルのID")
+    save_path: str = Field(..., description="保存先のローカルパス")
+    status: JiraDownloadStatusEnum = Field(..., description="ダウンロード結果")
+    bytes_transferred: int = Field(0, description="今回のダウンロードで転送したバイト数")
+    error: typing.Optional[str] = Field(None, description="失敗した場合のエラーメッセージ")
+
+
+class JiraAttachmentDownloadReport(JiraDeferredModel):
+    """添付ファイルの一括ダウンロード全体の結果を表すPydanticモデル。"""
+    results: typing.List[JiraAttachmentDownloadResult] = Field(default_factory=list, description="入力と同じ順序のファイルごとの結果")
+    bytes_transferred: int = Field(0, description="転送した合計バイト数")
+    elapsed_seconds: float = Field(0.0, description="一括ダウンロード全体の所要時間（秒）")
+
+    @property
+    def throughput(self) -> float:
+        """全体のスループット（バイト/秒）。"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_transferred / self.elapsed_seconds
+
+    @property
+    def failed(self) -> typing.List[JiraAttachmentDownloadResult]:
+        """ダウンロードに失敗したファイルの結果のリスト。"""
+        return [result for result in self.results if result.status == JiraDownloadStatusEnum.FAILED]
@@ -1,12 +1,15 @@
 import typing
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from jira_api_client.models.deferred import JiraDeferredModel
+from jira_api_client.models.interning import JiraInternableModel
 
 # --- 既存のEnumと基本モデル ---
 
 
-class JiraStatusCategory(BaseModel):
+class JiraStatusCategory(JiraInternableModel):
     """Jiraのステータスカテゴリを表すPydanticモデル。"""
     self: str = Field(..., description="このステータスカテゴリリソースへのURL")  # selfフィールドも追加
     id: int = Field(..., description="ステータスカテゴリのユニークなID")
@@ -15,7 +18,7 @@ class JiraStatusCategory(BaseModel):
     name: str = Field(..., description="ステータスカテゴリの表示名 (例: '進行中')")
 
 
-class JiraStatus(BaseModel):
+class JiraStatus(JiraInternableModel):
     """Jiraの課題ステータスを表すPydanticモデル。"""
     self: str = Field(..., description="このステータスリソースへのURL")
     description: typing.Optional[str] = Field(None, description="ステータスの説明")
@@ -25,7 +28,7 @@ class JiraStatus(BaseModel):
     statusCategory: JiraStatusCategory = Field(..., description="ステータスが属するカテゴリ")
 
 
-class JiraIssueType(BaseModel):
+class JiraIssueType(JiraInternableModel):
     """Jiraの課題タイプを表すPydanticモデル。"""
     self: str = Field(..., description="この課題タイプリソースへのURL")
     id: str = Field(..., description="課題タイプのユニークなID")
@@ -37,7 +40,7 @@ class JiraIssueType(BaseModel):
     hierarchyLevel: typing.Optional[int] = Field(None, description="課題タイプの階層レベル")
 
 
-class JiraProjectCategory(BaseModel):  # <-- 新規追加: projectCategoryのモデル
+class JiraProjectCategory(JiraDeferredModel):  # <-- 新規追加: projectCategoryのモデル
     """Jiraプロジェクトのカテゴリを表すPydanticモデル。"""
     self: str = Field(..., description="このプロジェクトカテゴリリソースへのURL")
     id: str = Field(..., description="プロジェクトカテゴリのユニークなID")
@@ -45,7 +48,7 @@ class JiraProjectCategory(BaseModel):  # <-- 新規追加: projectCategoryのモ
     name: str = Field(..., description="プロジェクトカテゴリの表示名")
 
 
-class JiraProjectMeta(BaseModel):
+class JiraProjectMeta(JiraInternableModel):
     """Jira課題の 'fields' 内にあるプロジェクト情報を表すPydanticモデル。"""
     self: str = Field(..., description="このプロジェクトリソースへのURL")
     id: str = Field(..., description="プロジェクトのユニークなID")
@@ -57,8 +60,10 @@ class JiraProjectMeta(BaseModel):
     projectCategory: typing.Optional[JiraProjectCategory] = Field(None, description="プロジェクトが属するカテゴリ")  # <-- 追加
 
 
-class JiraUser(BaseModel):
+class JiraUser(JiraInternableModel):
     """Jiraのユーザー情報を表すPydanticモデル。"""
+    _intern_key: typing.ClassVar[str] = "accountId"
+
     self: str = Field(..., description="このユーザーリソースへのURL")
     accountId: str = Field(..., description="ユーザーのAtlassianアカウントID")
     emailAddress: typing.Optional[str] = Field(None, description="ユーザーのメールアドレス")
@@ -69,7 +74,7 @@ class JiraUser(BaseModel):
     accountType: typing.Optional[str] = Field(None, description="ユーザーアカウントのタイプ (例: 'atlassian')")  # <-- 追加
 
 
-class JiraPriority(BaseModel):
+class JiraPriority(JiraInternableModel):
     """Jiraの優先度情報を表すPydanticモデル。"""
     self: str = Field(..., description="この優先度リソースへのURL")
     iconUrl: str = Field(..., description="優先度アイコンのURL")
@@ -104,3 +109,15 @@ class JiraStatusNameEnum(str, Enum):
     CANCELLED = "Cancelled"
     BLOCKED = "Blocked"
     DONE = "Done"
+
+
+# 検索結果の解析方法をEnumで定義
+class JiraParseModeEnum(str, Enum):
+    """
+    検索結果のレスポンスをモデルに変換する方法の列挙型。
+    """
+    FULL = "full"  # 全フィールドを検証してPydanticモデルに変換する
+    LAZY = "lazy"  # 重いフィールド (説明・添付ファイル・ユーザーなど) は生のJSONのまま保持し、初回アクセス時に検証する
+    CONSTRUCT = "construct"  # 検証を行わず model_construct() でPydanticモデルを組み立てる (スキーマを信頼できる場合)
+    RAW = "raw"  # 検証もモデルへの変換も行わず、デコードしたJSONを dict (models.raw の TypedDict) のまま返す
+    RECORD = "record"  # 主要なスカラー値だけを保持する軽量な JiraIssueRecord (models.record) に変換する
@@ -0,0 +1,26 @@
+import typing
+
+from pydantic import Field
+
+from jira_api_client.models.deferred import JiraDeferredModel
+
+
+class JiraIssueFetchError(JiraDeferredModel):
+    """課題の一括取得で、リクエスト自体が失敗した課題1件分のエラー情報を表すPydanticモデル。"""
+    key: str = Field(..., description="取得に失敗した課題のキー (またはID)")
+    status: typing.Optional[int] = Field(None, description="HTTPステータスコード")
+    errorMessages: typing.List[str] = Field(default_factory=list, description="エラーメッセージのリスト")
+
+
+class JiraBulkFetchResult(JiraDeferredModel):
+    """
+    課題の一括取得 (get_issues) の結果を表すモデル。
+
+    課題は検索と同じ解析方法 (JiraParseModeEnum) で変換されるため、issues の値は JiraIssue・JiraPartialIssue・
+    dict・JiraIssueRecord などになります。キーは大文字に正規化された、要求した課題のキー (またはID) です。
+    """
+    issues: typing.Dict[str, typing.Any] = Field(default_factory=dict, description="要求したキーをキーとする、取得できた課題の辞書 (要求順)")
+    moved: typing.Dict[str, str] = Field(default_factory=dict,
+                                         description="別のプロジェクトへの移動などでキーが変わった課題の、要求したキーから現在のキーへの辞書")
+    missing: typing.List[str] = Field(default_factory=list, description="存在しない、または閲覧権限が無い課題のキー")
+    errors: typing.List[JiraIssueFetchError] = Field(default_factory=list, description="リクエストの失敗により取得できなかった課題のエラー情報")
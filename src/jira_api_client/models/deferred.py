@@ -0,0 +1,17 @@
+from pydantic import BaseModel, ConfigDict
+
+# --- スキーマ構築の遅延 ---
+# Pydantic はモデルの定義時に検証用のスキーマ (コア スキーマと検証器) を構築するため、
+# ADFのノードを含む多数のモデルを定義するとインポートだけで数百ミリ秒かかります。
+# このパッケージのモデルは JiraDeferredModel を継承し、スキーマの構築を各モデルの初回の検証 (または model_rebuild()) まで遅延します。
+# チケットの作成だけを行うCLIやサーバーレス関数では、課題・ADFのスキーマは構築されません。
+
+
+class JiraDeferredModel(BaseModel):
+    """
+    検証用のスキーマの構築を初回の検証まで遅延するモデルの基底クラス。
+
+    前方参照 (後から定義されるモデルの名前) も初回の検証時に解決されるため、model_rebuild() を呼ぶ必要はありません。
+    起動時にまとめて構築しておきたい場合は、対象のモデルの model_rebuild() を呼び出してください。
+    """
+    model_config = ConfigDict(defer_build=True)
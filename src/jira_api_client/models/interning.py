@@ -0,0 +1,93 @@
+import typing
+import weakref
+
+from pydantic import BaseModel, ValidationInfo, model_validator
+
+from jira_api_client.models.deferred import JiraDeferredModel
+
+# --- 検索結果に繰り返し現れるエンティティ (ユーザー・ステータス・プロジェクトなど) の共有 (フライウェイト) ---
+# 検証時のコンテキスト (model_validate(..., context={INTERN_CONTEXT_KEY: cache})) に JiraInternCache を渡すと、
+# 同じID・同じ内容のエンティティは検証を省略して1つのインスタンスを共有します。
+
+INTERN_CONTEXT_KEY = "jira_intern_cache"
+
+# 共有されているインスタンス (id -> インスタンス)。
+# 比較 (==) やシリアライズに影響しないよう、インスタンス自身には印を付けずにここで管理する
+_interned_instances: "weakref.WeakValueDictionary[int, BaseModel]" = weakref.WeakValueDictionary()
+
+
+class JiraInternCache(object):
+    """
+    検証済みのエンティティを (モデル, ID) ごとに保持するキャッシュ。
+
+    同じIDでも内容 (フィールドの有無や値) が異なる場合は共有せず、通常どおり検証した別のインスタンスを返します。
+    複数ページ・複数の検索で同じインスタンスを使い回すことで、キャッシュはページをまたいで有効になります。
+    スレッド間で共有できますが、競合した場合は同じエンティティのインスタンスが重複することがあります。
+    """
+
+    def __init__(self):
+        self.__entries: typing.Dict[typing.Tuple[type, typing.Any], typing.Tuple[typing.Any, BaseModel]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def lookup(self, model: type, key: typing.Any, data: typing.Any) -> typing.Optional[BaseModel]:
+        """(model, key) のインスタンスが data と同じ内容から作られていれば、そのインスタンスを返します。"""
+        entry = self.__entries.get((model, key))
+        if entry is not None and entry[0] == data:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def store(self, model: type, key: typing.Any, data: typing.Any, instance: BaseModel) -> None:
+        """data から検証した instance を登録します。同じ (model, key) が登録済みの場合は先に登録したものを残します。"""
+        self.__entries.setdefault((model, key), (data, instance))
+
+    def clear(self) -> None:
+        """保持しているインスタンスを破棄します。"""
+        self.__entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class JiraInternableModel(JiraDeferredModel):
+    """
+    JiraInternCache による共有の対象になるモデルの基底クラス。
+
+    サブクラスは _intern_key に、エンティティを識別するフィールド名 (accountId, id など) を指定します。
+    共有されたインスタンスは複数の課題から参照されるため、フィールドへの代入は TypeError になります
+    (avatarUrls などの dict の中身も変更しないでください)。変更が必要な場合は model_copy() で複製してください。
+    """
+
+    _intern_key: typing.ClassVar[str] = "id"
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _intern(cls, data: typing.Any, handler: typing.Callable[[typing.Any], typing.Any],
+                info: ValidationInfo) -> typing.Any:
+        cache = info.context.get(INTERN_CONTEXT_KEY) if isinstance(info.context, dict) else None
+        if cache is None or not isinstance(data, dict):
+            return handler(data)
+        key = data.get(cls._intern_key)
+        if key is None:
+            return handler(data)
+        instance = cache.lookup(cls, key, data)
+        if instance is None:
+            instance = handler(data)
+            _interned_instances[id(instance)] = instance
+            cache.store(cls, key, data, instance)
+        return instance
+
+    @property
+    def interned(self) -> bool:
+        """JiraInternCache で共有されているインスタンスかどうか。"""
+        return _interned_instances.get(id(self)) is self
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if not name.startswith("_") and self.interned:
+            raise TypeError(f"共有されている {type(self).__name__} のインスタンスは変更できません。"
+                            "model_copy() で複製してから変更してください。")
+        super().__setattr__(name, value)
@@ -1,7 +1,18 @@
+import copy
 import typing
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    PrivateAttr,
+    Tag,
+    TypeAdapter,
+    create_model,
+)
 
+from jira_api_client.adf_renderer import render_html, render_markdown
 from jira_api_client.models.attachment import JiraAttachment
 from jira_api_client.models.base import (
     JiraIssueType,
@@ -11,203 +22,239 @@ from jira_api_client.models.base import (
     JiraStatusCategory,
     JiraUser,
 )
+from jira_api_client.models.deferred import JiraDeferredModel
 
 # --- ADF構造のためのPydanticモデル定義 ---
+# 各ノードの content は type の値で1回だけ振り分ける判別共用体 (_adf_union) で検証されます。
+# このライブラリがモデルを持たないノード (panel, mention, emoji, status, date など) は AdfUnknownNode として受け入れます。
 
 
 # AdfParagraphの子要素として使用されるノードを個別に定義
-class AdfTextContent(BaseModel):
+class AdfMark(JiraDeferredModel):
+    """テキストの装飾 (strong, em, code, link など)。link の場合は attrs に href を持つ。"""
+    type: str
+    attrs: typing.Dict[str, typing.Any] = Field(default_factory=dict)
+
+
+class AdfTextContent(JiraDeferredModel):
     type: typing.Literal["text"]
     text: str
+    marks: typing.List[AdfMark] = Field(default_factory=list)
 
 
-class AdfHardBreakContent(BaseModel):
+class AdfHardBreakContent(JiraDeferredModel):
     type: typing.Literal["hardBreak"]
 
 
-class AdfInlineCardAttrs(BaseModel):
+class AdfInlineCardAttrs(JiraDeferredModel):
     url: str
 
 
-class AdfInlineCardContent(BaseModel):
+class AdfInlineCardContent(JiraDeferredModel):
     type: typing.Literal["inlineCard"]
     attrs: AdfInlineCardAttrs
 
 
 # AdfMediaInline モデル (media とは異なるインラインメディア)
-class AdfMediaInlineAttrs(BaseModel):
+class AdfMediaInlineAttrs(JiraDeferredModel):
     id: str
     type: typing.Literal["file", "link"]  # media と同様に file または link
     collection: str
     url: typing.Optional[str] = None  # media と同様
 
 
-class AdfMediaInline(BaseModel):
+class AdfMediaInline(JiraDeferredModel):
     type: typing.Literal["mediaInline"]
     attrs: AdfMediaInlineAttrs
 
 
-# AdfParagraphのcontentは、上記のノードのUnionのリスト
-# インラインメディアも段落の子になりうるため追加
-AdfParagraphChildContent = typing.Union[AdfTextContent, AdfHardBreakContent, AdfInlineCardContent, AdfMediaInline]
-
-
-class AdfParagraph(BaseModel):
+class AdfParagraph(JiraDeferredModel):
     type: typing.Literal["paragraph"]
-    content: typing.List[AdfParagraphChildContent] = Field(default_factory=list)
+    content: typing.List['AdfParagraphChildContent'] = Field(default_factory=list)
 
 
-class AdfHeadingAttrs(BaseModel):
+class AdfHeadingAttrs(JiraDeferredModel):
     level: int
 
 
-class AdfHeading(BaseModel):
+class AdfHeading(JiraDeferredModel):
     type: typing.Literal["heading"]
-    content: typing.List[AdfTextContent]
+    content: typing.List['AdfParagraphChildContent'] = Field(default_factory=list)  # 見出しにも絵文字などが入りうる
     attrs: AdfHeadingAttrs
 
 
-class AdfMediaAttrs(BaseModel):
+class AdfMediaAttrs(JiraDeferredModel):
     id: str
     type: typing.Literal["file", "link"]
     collection: str
     url: typing.Optional[str] = None
 
 
-class AdfMedia(BaseModel):
+class AdfMedia(JiraDeferredModel):
     type: typing.Literal["media"]
     attrs: AdfMediaAttrs
 
 
-class AdfMediaSingleAttrs(BaseModel):
+class AdfMediaSingleAttrs(JiraDeferredModel):
     layout: typing.Literal["center", "wrap-right", "wrap-left", "align-start", "align-end", "wide", "full-width"]
 
 
-class AdfMediaSingle(BaseModel):
+class AdfMediaSingle(JiraDeferredModel):
     type: typing.Literal["mediaSingle"]
     content: typing.List[AdfMedia]
     attrs: AdfMediaSingleAttrs
 
 
-class AdfBlockQuote(BaseModel):
+class AdfBlockQuote(JiraDeferredModel):
     type: typing.Literal["blockquote"]
     # 循環参照を避けるため、文字列リファレンスを使用
     content: typing.List['AdfDocumentContent']
 
 
-class AdfRule(BaseModel):
+class AdfRule(JiraDeferredModel):
     type: typing.Literal["rule"]
 
 
 # AdfExpand モデル
-class AdfExpandAttrs(BaseModel):
+class AdfExpandAttrs(JiraDeferredModel):
     title: str
 
 
-class AdfExpand(BaseModel):
+class AdfExpand(JiraDeferredModel):
     type: typing.Literal["expand"]
     content: typing.List['AdfDocumentContent']  # expand の中もドキュメントコンテンツ
     attrs: AdfExpandAttrs
 
 
 # AdfCodeBlock モデル
-class AdfCodeBlockAttrs(BaseModel):
+class AdfCodeBlockAttrs(JiraDeferredModel):
     language: typing.Optional[str] = None
     syntax: typing.Optional[str] = None  # 'language' と同じ意味合いで使われることもある
 
 
-class AdfCodeBlock(BaseModel):
+class AdfCodeBlock(JiraDeferredModel):
     type: typing.Literal["codeBlock"]
     content: typing.List[AdfTextContent]  # コードブロックのコンテンツは通常テキスト
     attrs: typing.Optional[AdfCodeBlockAttrs] = None  # language などの属性
 
 
 # Table 関連モデル
-class AdfTableCell(BaseModel):
+class AdfTableCell(JiraDeferredModel):
     type: typing.Literal["tableCell"]
     content: typing.List['AdfDocumentContent']  # セル内は任意のADFコンテンツが可能
     attrs: typing.Dict[str, typing.Any] = Field(default_factory=dict)  # colspan, rowspan など
 
 
-class AdfTableHeader(BaseModel):
+class AdfTableHeader(JiraDeferredModel):
     type: typing.Literal["tableHeader"]
     content: typing.List['AdfDocumentContent']  # ヘッダーセル内は任意のADFコンテンツが可能
     attrs: typing.Dict[str, typing.Any] = Field(default_factory=dict)  # colspan, rowspan など
 
 
-class AdfTableRow(BaseModel):
+class AdfTableRow(JiraDeferredModel):
     type: typing.Literal["tableRow"]
-    content: typing.List[typing.Union[AdfTableCell, AdfTableHeader]]
+    content: typing.List['AdfTableRowChildContent']
 
 
-class AdfTableAttrs(BaseModel):
+class AdfTableAttrs(JiraDeferredModel):
     layout: str  # 'center' が来たため、より柔軟に str に変更
     localId: typing.Optional[str] = None  # テーブルのローカルID (Confluenceで使われる)
 
 
-class AdfTable(BaseModel):
+class AdfTable(JiraDeferredModel):
     type: typing.Literal["table"]
     content: typing.List[AdfTableRow]
     attrs: typing.Optional[AdfTableAttrs] = None
 
 
 # AdfMediaGroup モデル
-class AdfMediaGroup(BaseModel):
+class AdfMediaGroup(JiraDeferredModel):
     type: typing.Literal["mediaGroup"]
     # mediaGroup の content は AdfMedia だけでなく、
     # paragraph や text, hardBreak, mediaInline なども含む可能性があるため、
-    # AdfMedia と AdfParagraphChildContent の Union をリストとして受け入れる
-    content: typing.List[typing.Union[AdfMedia, AdfParagraphChildContent]]
+    # AdfMedia と段落の子要素の共用体をリストとして受け入れる
+    content: typing.List['AdfMediaGroupChildContent']
 
 
-# AdfListItem の content にくる可能性のある要素
-AdfListItemChildContent = typing.Union[
-    AdfParagraph,
-    'AdfBulletList',  # 循環参照を避けるため
-    'AdfOrderedList',
-    AdfHeading,
-    AdfMediaSingle,
-    AdfBlockQuote,
-    AdfRule,
-    AdfExpand,
-    AdfCodeBlock,
-    AdfTable,
-    AdfMediaGroup,
-]
-
-
-class AdfListItem(BaseModel):
+class AdfListItem(JiraDeferredModel):
     type: typing.Literal["listItem"]
-    content: typing.List[AdfListItemChildContent]
+    content: typing.List['AdfListItemChildContent']
 
 
-class AdfBulletList(BaseModel):
+class AdfBulletList(JiraDeferredModel):
     type: typing.Literal["bulletList"]
     content: typing.List[AdfListItem]
 
 
-class AdfOrderedList(BaseModel):
+class AdfOrderedList(JiraDeferredModel):
     type: typing.Literal["orderedList"]
     content: typing.List[AdfListItem]
 
 
-# ドキュメントのトップレベルコンテンツと、
-# TableCell や TableHeader の content にも使われるため、
-# より複雑な構造（メディアグループ、テーブル、コードブロック、展開パネル）を先に評価するよう順序を調整
-# その後、一般的なブロックレベル要素（見出し、段落、リスト、引用、罫線）を配置
-AdfDocumentContent = typing.Union[
-    AdfMediaGroup,  # 最優先
-    AdfTable,  # 次にテーブル
-    AdfCodeBlock,  # コードブロック
-    AdfExpand,  # 展開パネル
-    AdfHeading,
-    AdfBulletList,
-    AdfOrderedList,
-    AdfMediaSingle,
-    AdfBlockQuote,
-    AdfRule,
-    AdfParagraph,  # 最も汎用的な要素を最後に
-]
+class AdfUnknownNode(JiraDeferredModel):
+    """
+    このライブラリがモデルを持たないADFノード (panel, mention, emoji, status, date など)。
+
+    type 以外の属性はそのまま保持され、子要素 (content) は既知のノードと同様に検証されます。
+    """
+    model_config = ConfigDict(extra='allow')
+
+    type: str
+    attrs: typing.Dict[str, typing.Any] = Field(default_factory=dict)
+    content: typing.List['AdfNode'] = Field(default_factory=list)
+    text: typing.Optional[str] = None
+
+    def fallback_text(self) -> str:
+        """ノードを文字列で表す場合の代替テキスト (text, attrs.text, attrs.shortName の順)。無い場合は空文字列。"""
+        if self.text is not None:
+            return self.text
+        for name in ("text", "shortName"):
+            value = self.attrs.get(name)
+            if isinstance(value, str):
+                return value
+        return ""
+
+
+# 判別共用体で未知の type に割り当てるタグ (ADFのノード名と衝突しない値)
+_ADF_UNKNOWN_TAG = "__unknown__"
+
+
+def _adf_union(*models: typing.Type[BaseModel]) -> typing.Any:
+    """
+    type の値で models のいずれか1つに振り分け、どれにも該当しない場合は AdfUnknownNode として検証する判別共用体を返します。
+
+    通常の Union は全メンバーを順に試すためネストが深いほど検証コストが増大しますが、
+    判別共用体はノードごとに1回の振り分けで済み、未知のノードで検証全体が失敗することもありません。
+    """
+    tags = {typing.get_args(model.model_fields["type"].annotation)[0]: model for model in models}
+
+    def discriminate(value: typing.Any) -> str:
+        node_type = value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+        return node_type if node_type in tags else _ADF_UNKNOWN_TAG
+
+    members = [typing.Annotated[model, Tag(tag)] for tag, model in tags.items()]
+    members.append(typing.Annotated[AdfUnknownNode, Tag(_ADF_UNKNOWN_TAG)])
+    return typing.Annotated[typing.Union[tuple(members)], Discriminator(discriminate)]
+
+
+# 段落・見出しの子要素 (インラインノード)
+AdfParagraphChildContent = _adf_union(AdfTextContent, AdfHardBreakContent, AdfInlineCardContent, AdfMediaInline)
+# テーブル行の子要素
+AdfTableRowChildContent = _adf_union(AdfTableCell, AdfTableHeader)
+# メディアグループの子要素
+AdfMediaGroupChildContent = _adf_union(AdfMedia, AdfTextContent, AdfHardBreakContent, AdfInlineCardContent,
+                                       AdfMediaInline)
+# AdfListItem の content にくる可能性のある要素
+AdfListItemChildContent = _adf_union(AdfParagraph, AdfBulletList, AdfOrderedList, AdfHeading, AdfMediaSingle,
+                                     AdfBlockQuote, AdfRule, AdfExpand, AdfCodeBlock, AdfTable, AdfMediaGroup)
+# ドキュメントのトップレベルコンテンツ (TableCell や TableHeader, blockquote, expand の content にも使われる)
+AdfDocumentContent = _adf_union(AdfParagraph, AdfHeading, AdfBulletList, AdfOrderedList, AdfMediaSingle, AdfBlockQuote,
+                                AdfRule, AdfExpand, AdfCodeBlock, AdfTable, AdfMediaGroup)
+# 未知のノードの子要素 (ブロック・インラインのどちらも含みうるため、全ての既知のノードを対象とする)
+AdfNode = _adf_union(AdfParagraph, AdfHeading, AdfBulletList, AdfOrderedList, AdfListItem, AdfMediaSingle,
+                     AdfBlockQuote, AdfRule, AdfExpand, AdfCodeBlock, AdfTable, AdfTableRow, AdfTableCell,
+                     AdfTableHeader, AdfMediaGroup, AdfMedia, AdfTextContent, AdfHardBreakContent, AdfInlineCardContent,
+                     AdfMediaInline)
 
 
 def _parse_content_recursive(node_list: typing.List[typing.Any], indent_level: int = 0) -> typing.List[str]:
@@ -229,6 +276,8 @@ def _parse_content_recursive(node_list: typing.List[typing.Any], indent_level: i
                 elif isinstance(sub_node, AdfMediaInline):
                     media_url = sub_node.attrs.url or f"ID:{sub_node.attrs.id}"
                     paragraph_text += f"[インラインメディア: {media_url} ({sub_node.attrs.type})]"
+                elif isinstance(sub_node, AdfUnknownNode):
+                    paragraph_text += sub_node.fallback_text()
 
             lines = paragraph_text.strip().splitlines()
             if not lines:
@@ -355,48 +404,69 @@ def _parse_content_recursive(node_list: typing.List[typing.Any], indent_level: i
             output_lines.extend(media_group_info_lines)
             output_lines.append(f"{indent_str}--- メディアグループ終了 ---")
 
+        # 未対応のノード (panel, mention など) は代替テキストと子要素を出力する
+        elif isinstance(node, AdfUnknownNode):
+            fallback_text = node.fallback_text()
+            if fallback_text:
+                output_lines.append(f"{indent_str}{fallback_text}")
+            output_lines.extend(_parse_content_recursive(node.content, indent_level))
+
         else:
             output_lines.append(f"{indent_str}[未知のノード: {node_type}]")
 
     return output_lines
 
 
-class AdfDocument(BaseModel):
+class AdfDocument(JiraDeferredModel):
     """Atlassian Document Format (ADF) のルートモデル"""
     type: typing.Literal["doc"] = Field(..., description="ドキュメントのタイプ: 'doc'")
     version: int = Field(..., description="ADFのバージョン")
     content: typing.List[AdfDocumentContent] = Field(..., description="ドキュメントのコンテンツのリスト")
 
     def to_plain_text(self) -> str:
-        """このADFドキュメントを整形されたプレーンテキストに変換します。"""
+        """
+        このADFドキュメントを整形されたプレーンテキストに変換します。
+
+        既存の出力との互換性のため、テーブルの列幅を揃えるなど adf_renderer.render_plain_text() とは書式が異なり、
+        ドキュメント全体を行のリストとして組み立てます。大きなドキュメントや大量の課題を変換する場合、
+        書式の違いが問題にならなければ render_plain_text() を使用してください。
+        """
         parsed_lines = _parse_content_recursive(self.content, 0)
         return "\n".join(parsed_lines)
 
+    def to_markdown(self) -> str:
+        """このADFドキュメントを Markdown に変換します。ストリームへ直接書き込む場合は adf_renderer.render_markdown() を使用します。"""
+        return render_markdown(self)
+
+    def to_html(self) -> str:
+        """このADFドキュメントを HTML の断片に変換します。ストリームへ直接書き込む場合は adf_renderer.render_html() を使用します。"""
+        return render_html(self)
+
 
 # --- 既存のJiraモデルにADFを組み込む ---
 
 
-class JiraProgress(BaseModel):
+class JiraProgress(JiraDeferredModel):
     """Jira課題の進捗状況を表すPydanticモデル。"""
     progress: int = Field(..., description="現在の進捗値")
     total: int = Field(..., description="進捗の合計値")
 
 
-class JiraWatches(BaseModel):
+class JiraWatches(JiraDeferredModel):
     """Jira課題のウォッチャー情報を表すPydanticモデル。"""
     self: str = Field(..., description="このウォッチャーリソースへのURL")
     watchCount: int = Field(..., description="ウォッチャーの数")
     isWatching: bool = Field(..., description="現在のユーザーがウォッチしているか")
 
 
-class JiraVotes(BaseModel):
+class JiraVotes(JiraDeferredModel):
     """Jira課題の投票情報を表すPydanticモデル。"""
     self: str = Field(..., description="この投票リソースへのURL")
     votes: int = Field(..., description="投票の総数")
     hasVoted: bool = Field(..., description="現在のユーザーが投票しているか")
 
 
-class JiraSubtask(BaseModel):
+class JiraSubtask(JiraDeferredModel):
     """サブタスクを表す簡易Pydanticモデル (JiraIssueと同様の構造)。"""
     id: str = Field(..., description="サブタスクのユニークなID")
     key: str = Field(..., description="サブタスクのキー")
@@ -404,7 +474,7 @@ class JiraSubtask(BaseModel):
     fields: typing.Optional[dict] = Field(None, description="サブタスクのフィールド。詳細なパースは別途必要に応じて。")
 
 
-class JiraIssueFields(BaseModel):
+class JiraIssueFields(JiraDeferredModel):
     """Jira課題の 'fields' 部分（主要な課題属性）を表すPydanticモデル。
     動的なカスタムフィールドに対応するため、extra='allow' を使用します。
     """
@@ -448,7 +518,7 @@ class JiraIssueFields(BaseModel):
     duedate: typing.Optional[str] = Field(None, description="課題の期限日時")
 
 
-class JiraIssue(BaseModel):
+class JiraIssue(JiraDeferredModel):
     """個々のJira課題を表すPydanticモデル。"""
     expand: str = Field(..., description="この課題に対して展開されたフィールドのリスト")
     id: str = Field(..., description="課題のユニークなID")
@@ -457,18 +527,108 @@ class JiraIssue(BaseModel):
     fields: JiraIssueFields = Field(..., description="課題の主要な属性を含むフィールド")
 
 
-# 循環参照のモデルを再構築
-# これらのモデルは、他のモデルの定義を参照しているため、すべてのモデルがロードされた後に再構築が必要です。
-AdfBlockQuote.model_rebuild()
-AdfListItem.model_rebuild()
-AdfBulletList.model_rebuild()
-AdfOrderedList.model_rebuild()
-AdfExpand.model_rebuild()
-AdfCodeBlock.model_rebuild()
-AdfTableCell.model_rebuild()
-AdfTableHeader.model_rebuild()
-AdfTableRow.model_rebuild()
-AdfTable.model_rebuild()
-AdfMediaInline.model_rebuild()
-AdfMediaGroup.model_rebuild()
-AdfDocument.model_rebuild()
+# 循環参照 (ADFのノードの content など) の前方参照は、各モデルの初回の検証時にこのモジュールの名前空間から解決されます
+# (JiraDeferredModel を参照)。インポート時には model_rebuild() を呼ばず、ADFのスキーマの構築を初回の検証まで遅延します。
+
+
+def _make_partial_model(model: typing.Type[BaseModel], name: str, doc: str) -> typing.Type[BaseModel]:
+    """model の全フィールドを Optional (デフォルト None) にしたモデルを生成します。"""
+    partial_fields = {
+        field_name: (typing.Optional[field_info.annotation], Field(None, description=field_info.description))
+        for field_name, field_info in model.model_fields.items()
+    }
+    partial_model = create_model(name, __config__=model.model_config, __module__=__name__, **partial_fields)
+    partial_model.__doc__ = doc
+    return partial_model
+
+
+# fields を指定した検索 (フィールド射影) では、リクエストしたフィールドだけが値を持ちます。
+JiraPartialIssueFields = _make_partial_model(JiraIssueFields, "JiraPartialIssueFields",
+                                             "JiraIssueFields の全フィールドを任意項目にしたPydanticモデル。リクエストしなかったフィールドは None になります。")
+
+
+class JiraPartialIssue(JiraDeferredModel):
+    """取得するフィールドを指定した検索で返される、個々のJira課題を表すPydanticモデル。"""
+    expand: typing.Optional[str] = Field(None, description="この課題に対して展開されたフィールドのリスト")
+    id: str = Field(..., description="課題のユニークなID")
+    self: str = Field(..., description="この課題リソースへのURL")
+    key: str = Field(..., description="課題のキー")
+    fields: JiraPartialIssueFields = Field(default_factory=JiraPartialIssueFields, description="リクエストしたフィールドのみを含む課題の属性")
+
+
+# 遅延パースモードで、生のJSONのまま保持して初回アクセス時に検証するフィールド
+LAZY_ISSUE_FIELDS = ("description", "attachment", "subtasks", "creator", "reporter", "assignee")
+
+
+class _LazyIssueFieldsBase(JiraDeferredModel):
+    """
+    遅延パースモードの課題フィールドの基底クラス。
+
+    LAZY_ISSUE_FIELDS のフィールドは検証せずに生のJSONのまま保持され、
+    属性として初めてアクセスされた時に検証・変換されてキャッシュされます。
+    """
+    model_config = ConfigDict(extra='allow')
+
+    _lazy_cache: typing.Dict[str, typing.Any] = PrivateAttr(default_factory=dict)
+
+    def raw(self, name: str) -> typing.Any:
+        """フィールドの生のJSON値を返します。検証は行いません。"""
+        return (self.__pydantic_extra__ or {}).get(name)
+
+    def is_loaded(self, name: str) -> bool:
+        """遅延フィールドが既に検証済みかどうかを返します。"""
+        return name in self._lazy_cache
+
+
+def _lazy_field_property(name: str, annotation: typing.Any, description: typing.Optional[str]) -> property:
+    """初回アクセス時に生のJSONを annotation の型に検証し、結果をキャッシュするプロパティを生成します。"""
+    adapters: typing.List[TypeAdapter] = []
+
+    def getter(self: _LazyIssueFieldsBase) -> typing.Any:
+        cache = self._lazy_cache
+        if name not in cache:
+            if not adapters:
+                adapters.append(TypeAdapter(annotation))
+            cache[name] = adapters[0].validate_python(self.raw(name))
+        return cache[name]
+
+    return property(getter, doc=description)
+
+
+def _make_lazy_model(model: typing.Type[BaseModel], name: str, doc: str) -> typing.Type[_LazyIssueFieldsBase]:
+    """model のうち LAZY_ISSUE_FIELDS を遅延パースのプロパティに置き換えたモデルを生成します。"""
+    eager_fields = {
+        field_name: (field_info.annotation, copy.copy(field_info))
+        for field_name, field_info in model.model_fields.items() if field_name not in LAZY_ISSUE_FIELDS
+    }
+    lazy_model = create_model(name, __base__=_LazyIssueFieldsBase, __module__=__name__, **eager_fields)
+    lazy_model.__doc__ = doc
+    for field_name in LAZY_ISSUE_FIELDS:
+        field_info = model.model_fields[field_name]
+        setattr(lazy_model, field_name, _lazy_field_property(field_name, field_info.annotation, field_info.description))
+    return lazy_model
+
+
+JiraLazyIssueFields = _make_lazy_model(JiraIssueFields, "JiraLazyIssueFields",
+                                       "JiraIssueFields の重いフィールドを初回アクセス時に検証するPydanticモデル。")
+JiraLazyPartialIssueFields = _make_lazy_model(JiraPartialIssueFields, "JiraLazyPartialIssueFields",
+                                              "JiraPartialIssueFields の重いフィールドを初回アクセス時に検証するPydanticモデル。")
+
+
+class JiraLazyIssue(JiraDeferredModel):
+    """遅延パースモードの検索で返される、個々のJira課題を表すPydanticモデル。"""
+    expand: str = Field(..., description="この課題に対して展開されたフィールドのリスト")
+    id: str = Field(..., description="課題のユニークなID")
+    self: str = Field(..., description="この課題リソースへのURL")
+    key: str = Field(..., description="課題のキー")
+    fields: JiraLazyIssueFields = Field(..., description="課題の主要な属性を含むフィールド (重いフィールドは遅延パース)")
+
+
+class JiraLazyPartialIssue(JiraDeferredModel):
+    """取得するフィールドを指定した遅延パースモードの検索で返される、個々のJira課題を表すPydanticモデル。"""
+    expand: typing.Optional[str] = Field(None, description="この課題に対して展開されたフィールドのリスト")
+    id: str = Field(..., description="課題のユニークなID")
+    self: str = Field(..., description="この課題リソースへのURL")
+    key: str = Field(..., description="課題のキー")
+    fields: JiraLazyPartialIssueFields = Field(default_factory=JiraLazyPartialIssueFields,
+                                               description="リクエストしたフィールドのみを含む課題の属性 (重いフィールドは遅延パース)")
@@ -0,0 +1,72 @@
+import typing
+from enum import Enum
+
+from pydantic import Field
+
+from jira_api_client.models.deferred import JiraDeferredModel
+
+
+class JiraTransitionTarget(JiraDeferredModel):
+    """ワークフローの遷移先のステータスを表すPydanticモデル。"""
+    id: str = Field(..., description="遷移先のステータスのID")
+    name: str = Field(..., description="遷移先のステータスの表示名 (例: 'Done')")
+
+
+class JiraTransition(JiraDeferredModel):
+    """課題に対して実行できるワークフローの遷移を表すPydanticモデル。"""
+    id: str = Field(..., description="遷移のID (課題の遷移の実行時に指定する)")
+    name: str = Field(..., description="遷移の表示名 (例: 'リリース待ちにする')")
+    to: JiraTransitionTarget = Field(..., description="遷移先のステータス")
+    hasScreen: typing.Optional[bool] = Field(None, description="遷移時に画面 (入力項目) が表示されるかどうか")
+
+
+class JiraTransitionList(JiraDeferredModel):
+    """/issue/{issueIdOrKey}/transitions のレスポンスを表すPydanticモデル。"""
+    transitions: typing.List[JiraTransition] = Field(default_factory=list, description="課題に対して実行できる遷移のリスト")
+
+
+class JiraIssueUpdateStatusEnum(str, Enum):
+    """
+    課題の一括遷移・一括編集における、課題ごとの結果の列挙型。
+    """
+    UPDATED = "updated"  # 遷移または編集した
+    SKIPPED = "skipped"  # 既に目的のステータスだったため遷移しなかった
+    FAILED = "failed"  # 失敗した (課題が存在しない、遷移できない、リクエストエラーなど)
+
+
+class JiraIssueUpdateResult(JiraDeferredModel):
+    """課題1件分の遷移・編集の結果を表すPydanticモデル。"""
+    key: str = Field(..., description="課題のキー (大文字に正規化済み)")
+    status: JiraIssueUpdateStatusEnum = Field(..., description="遷移・編集の結果")
+    transition_id: typing.Optional[str] = Field(None, description="実行した遷移のID (遷移の場合)")
+    http_status: typing.Optional[int] = Field(None, description="失敗した場合のHTTPステータスコード")
+    errorMessages: typing.List[str] = Field(default_factory=list, description="失敗した場合のエラーメッセージのリスト")
+    errors: typing.Dict[str, str] = Field(default_factory=dict, description="失敗した場合のフィールドごとのエラーメッセージ")
+
+
+class JiraBulkUpdateResult(JiraDeferredModel):
+    """課題の一括遷移・一括編集全体の結果を表すPydanticモデル。"""
+    results: typing.List[JiraIssueUpdateResult] = Field(default_factory=list, description="要求した順序の課題ごとの結果")
+    elapsed_seconds: float = Field(0.0, description="一括処理全体の所要時間（秒）")
+
+    @property
+    def updated(self) -> typing.List[JiraIssueUpdateResult]:
+        """遷移・編集に成功した課題の結果のリスト。"""
+        return [result for result in self.results if result.status == JiraIssueUpdateStatusEnum.UPDATED]
+
+    @property
+    def skipped(self) -> typing.List[JiraIssueUpdateResult]:
+        """既に目的のステータスだったため遷移しなかった課題の結果のリスト。"""
+        return [result for result in self.results if result.status == JiraIssueUpdateStatusEnum.SKIPPED]
+
+    @property
+    def failed(self) -> typing.List[JiraIssueUpdateResult]:
+        """遷移・編集に失敗した課題の結果のリスト。"""
+        return [result for result in self.results if result.status == JiraIssueUpdateStatusEnum.FAILED]
+
+    @property
+    def throughput(self) -> float:
+        """全体のスループット（課題/秒）。"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return len(self.results) / self.elapsed_seconds
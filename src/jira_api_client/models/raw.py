@@ -0,0 +1,124 @@
+import typing
+
+from typing_extensions import TypedDict
+
+# --- 検証を行わない RAW モード (JiraParseModeEnum.RAW) で返される、デコード済みJSONの型定義 ---
+# Pydanticモデルと同じ構造を TypedDict で表したもので、実行時には通常の dict です。
+# Jiraのレスポンスや fields の指定によってはキーが省略されるため、すべて total=False としています。
+# (Python 3.12 未満でもPydanticで検証できるよう typing_extensions の TypedDict を使用)
+
+
+class JiraStatusCategoryDict(TypedDict, total=False):
+    """JiraStatusCategory に対応する dict。"""
+    self: str
+    id: int
+    key: str
+    colorName: str
+    name: str
+
+
+class JiraStatusDict(TypedDict, total=False):
+    """JiraStatus に対応する dict。"""
+    self: str
+    description: typing.Optional[str]
+    iconUrl: typing.Optional[str]
+    name: str
+    id: str
+    statusCategory: JiraStatusCategoryDict
+
+
+class JiraIssueTypeDict(TypedDict, total=False):
+    """JiraIssueType に対応する dict。"""
+    self: str
+    id: str
+    description: typing.Optional[str]
+    iconUrl: typing.Optional[str]
+    name: str
+    subtask: bool
+    avatarId: typing.Optional[int]
+    hierarchyLevel: typing.Optional[int]
+
+
+class JiraProjectMetaDict(TypedDict, total=False):
+    """JiraProjectMeta に対応する dict。"""
+    self: str
+    id: str
+    key: str
+    name: str
+    projectTypeKey: str
+    simplified: typing.Optional[bool]
+    avatarUrls: typing.Dict[str, str]
+    projectCategory: typing.Optional[typing.Dict[str, typing.Any]]
+
+
+class JiraUserDict(TypedDict, total=False):
+    """JiraUser に対応する dict。"""
+    self: str
+    accountId: str
+    emailAddress: typing.Optional[str]
+    displayName: str
+    active: bool
+    timeZone: typing.Optional[str]
+    avatarUrls: typing.Dict[str, str]
+    accountType: typing.Optional[str]
+
+
+class JiraPriorityDict(TypedDict, total=False):
+    """JiraPriority に対応する dict。"""
+    self: str
+    iconUrl: str
+    name: str
+    id: str
+
+
+class JiraAttachmentDict(TypedDict, total=False):
+    """JiraAttachment に対応する dict。"""
+    id: str
+    self: str
+    filename: str
+    author: JiraUserDict
+    created: str
+    size: int
+    mimeType: str
+    content: typing.Optional[str]
+    thumbnail: typing.Optional[str]
+
+
+class JiraIssueFieldsDict(TypedDict, total=False):
+    """
+    JiraIssueFields に対応する dict。主要なフィールドのみを定義しています。
+    カスタムフィールド (customfield_XXXXX) などのキーもそのまま含まれます。
+    """
+    summary: str
+    statuscategorychangedate: str
+    statusCategory: JiraStatusCategoryDict
+    resolution: typing.Any
+    labels: typing.List[str]
+    lastViewed: typing.Optional[str]
+    priority: JiraPriorityDict
+    assignee: typing.Optional[JiraUserDict]
+    status: JiraStatusDict
+    timeestimate: typing.Optional[int]
+    creator: JiraUserDict
+    subtasks: typing.List[typing.Dict[str, typing.Any]]
+    reporter: JiraUserDict
+    issuetype: JiraIssueTypeDict
+    timespent: typing.Optional[int]
+    project: JiraProjectMetaDict
+    resolutiondate: typing.Optional[str]
+    workratio: int
+    created: str
+    updated: str
+    attachment: typing.List[JiraAttachmentDict]
+    timeoriginalestimate: typing.Optional[int]
+    description: typing.Optional[typing.Dict[str, typing.Any]]  # ADF (Atlassian Document Format) のJSON
+    duedate: typing.Optional[str]
+
+
+class JiraIssueDict(TypedDict, total=False):
+    """JiraIssue に対応する dict。"""
+    expand: str
+    id: str
+    self: str
+    key: str
+    fields: JiraIssueFieldsDict
@@ -0,0 +1,206 @@
+import datetime
+import typing
+
+from jira_api_client.models.base import JiraParseModeEnum
+
+if typing.TYPE_CHECKING:
+    from jira_api_client.jira_client import JiraClinet
+    from jira_api_client.models.issue import JiraIssue
+
+# --- 大量の課題の集計向けの軽量な課題レコード (JiraParseModeEnum.RECORD) ---
+# JiraIssue (Pydanticモデル) は入れ子のモデルや dict を多数保持するため、数十万件を走査・集計する用途には重すぎます。
+# JiraIssueRecord は よく使われるスカラー値だけを __slots__ に保持する変更不可のレコードです。
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+
+def _epoch_millis(value: typing.Any) -> typing.Optional[int]:
+    """Jiraの日時文字列 (例: '2024-01-01T09:00:00.000+0900') をUTCのエポックミリ秒に変換します。"""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        # Python 3.11 未満の fromisoformat は '+0900' 形式のオフセットに対応していない
+        try:
+            parsed = datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        return None
+    return (parsed - _EPOCH) // _MILLISECOND
+
+
+def _int_or_none(value: typing.Any) -> typing.Optional[int]:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _nested(fields: typing.Dict[str, typing.Any], name: str, key: str) -> typing.Any:
+    value = fields.get(name)
+    return value.get(key) if isinstance(value, dict) else None
+
+
+class JiraIssueRecord(object):
+    """
+    検索結果の課題の主要なスカラー値だけを保持する、変更不可の軽量なレコード。
+
+    日時はUTCのエポックミリ秒 (int)、ユーザーはアカウントID、ステータス・優先度・課題タイプはIDで保持します。
+    取得しなかったフィールドや値が空のフィールドは None (labels は空のタプル) になります。
+    全フィールドが必要な場合は to_issue() で JiraIssue に変換してください。
+    """
+
+    __slots__ = ("key", "id", "project_key", "issue_type_id", "summary", "status_id", "status_category_key",
+                 "priority_id", "assignee_id", "reporter_id", "created", "updated", "resolutiondate", "timespent",
+                 "timeestimate", "timeoriginalestimate", "labels", "source")
+
+    key: str
+    id: str
+    project_key: typing.Optional[str]
+    issue_type_id: typing.Optional[str]
+    summary: typing.Optional[str]
+    status_id: typing.Optional[str]
+    status_category_key: typing.Optional[str]
+    priority_id: typing.Optional[str]
+    assignee_id: typing.Optional[str]
+    reporter_id: typing.Optional[str]
+    created: typing.Optional[int]
+    updated: typing.Optional[int]
+    resolutiondate: typing.Optional[int]
+    timespent: typing.Optional[int]
+    timeestimate: typing.Optional[int]
+    timeoriginalestimate: typing.Optional[int]
+    labels: typing.Tuple[str, ...]
+    source: typing.Optional[typing.Dict[str, typing.Any]]
+
+    # ORDER BY などで使われるJiraのフィールド名とレコードの属性名の対応
+    _JIRA_FIELDS: typing.ClassVar[typing.Dict[str, str]] = {
+        "key": "key",
+        "issuekey": "key",
+        "id": "id",
+        "project": "project_key",
+        "issuetype": "issue_type_id",
+        "summary": "summary",
+        "status": "status_id",
+        "priority": "priority_id",
+        "assignee": "assignee_id",
+        "reporter": "reporter_id",
+        "created": "created",
+        "updated": "updated",
+        "resolutiondate": "resolutiondate",
+        "resolved": "resolutiondate",
+        "timespent": "timespent",
+        "timeestimate": "timeestimate",
+        "timeoriginalestimate": "timeoriginalestimate",
+    }
+
+    def __init__(self,
+                 key: str,
+                 id: str,
+                 project_key: typing.Optional[str] = None,
+                 issue_type_id: typing.Optional[str] = None,
+                 summary: typing.Optional[str] = None,
+                 status_id: typing.Optional[str] = None,
+                 status_category_key: typing.Optional[str] = None,
+                 priority_id: typing.Optional[str] = None,
+                 assignee_id: typing.Optional[str] = None,
+                 reporter_id: typing.Optional[str] = None,
+                 created: typing.Optional[int] = None,
+                 updated: typing.Optional[int] = None,
+                 resolutiondate: typing.Optional[int] = None,
+                 timespent: typing.Optional[int] = None,
+                 timeestimate: typing.Optional[int] = None,
+                 timeoriginalestimate: typing.Optional[int] = None,
+                 labels: typing.Iterable[str] = (),
+                 source: typing.Optional[typing.Dict[str, typing.Any]] = None):
+        values = locals()
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+        object.__setattr__(self, "labels", tuple(labels))
+
+    @classmethod
+    def from_dict(cls, data: typing.Dict[str, typing.Any], keep_source: bool = False) -> "JiraIssueRecord":
+        """
+        検索結果のJSONの課題1件 (デコード済みの dict) からレコードを作成します。
+
+        Args:
+            data (Dict[str, Any]): /search/jql のレスポンスの issues の要素。
+            keep_source (bool): data をレコードに保持し、to_issue() で通信せずに変換できるようにするかどうか
+                                (デフォルト: False)。保持する場合はレコードの軽量さは失われます。
+        """
+        fields = data.get("fields") or {}
+        labels = fields.get("labels")
+        return cls(key=data["key"],
+                   id=data["id"],
+                   project_key=_nested(fields, "project", "key"),
+                   issue_type_id=_nested(fields, "issuetype", "id"),
+                   summary=fields.get("summary"),
+                   status_id=_nested(fields, "status", "id"),
+                   status_category_key=_nested(fields.get("status") or {}, "statusCategory", "key"),
+                   priority_id=_nested(fields, "priority", "id"),
+                   assignee_id=_nested(fields, "assignee", "accountId"),
+                   reporter_id=_nested(fields, "reporter", "accountId"),
+                   created=_epoch_millis(fields.get("created")),
+                   updated=_epoch_millis(fields.get("updated")),
+                   resolutiondate=_epoch_millis(fields.get("resolutiondate")),
+                   timespent=_int_or_none(fields.get("timespent")),
+                   timeestimate=_int_or_none(fields.get("timeestimate")),
+                   timeoriginalestimate=_int_or_none(fields.get("timeoriginalestimate")),
+                   labels=labels if isinstance(labels, list) else (),
+                   source=data if keep_source else None)
+
+    def field_value(self, field: str) -> typing.Any:
+        """Jiraのフィールド名 (例: 'created', 'assignee') に対応する値を返します。レコードに無いフィールドは None。"""
+        name = self._JIRA_FIELDS.get(field)
+        return getattr(self, name) if name is not None else None
+
+    def to_issue(self, client: typing.Optional["JiraClinet"] = None) -> "JiraIssue":
+        """
+        完全な JiraIssue に変換します。
+
+        from_dict(keep_source=True) で作成したレコードは保持しているJSONを検証して変換します。
+        それ以外のレコードは client で課題を再取得します (1件ごとに1リクエストが発生します)。
+
+        Args:
+            client (JiraClinet, optional): 課題の再取得に使用するクライアント。
+
+        Returns:
+            JiraIssue: 検証済みの課題。
+
+        Raises:
+            ValueError: JSONを保持しておらず client も指定されていない場合、または課題が見つからない場合。
+            pydantic.ValidationError: 課題のJSONが JiraIssue の構造と一致しない場合。
+        """
+        if self.source is not None:
+            # レコードは JiraIssue のモデルを読み込まずに利用できるよう、変換時に読み込む
+            from jira_api_client.models.issue import JiraIssue
+
+            return JiraIssue.model_validate(self.source)
+        if client is None:
+            raise ValueError(f"課題 {self.key} のJSONを保持していないため、to_issue() には client を指定してください。")
+
+        results = client.get_tickets_by_jql(f"id = {self.id}", max_results=1, parse_mode=JiraParseModeEnum.FULL)
+        if not results.issues:
+            raise ValueError(f"課題 {self.key} が見つかりません。")
+        return results.issues[0]
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} は変更できません。")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} は変更できません。")
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        # __setattr__ を使う既定の復元方法は使えないため、コンストラクタの引数として渡す
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, JiraIssueRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__ if name != "source")
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in self.__slots__ if name != "source"))
+
+    def __repr__(self) -> str:
+        return f"JiraIssueRecord(key={self.key!r}, id={self.id!r}, status_id={self.status_id!r})"
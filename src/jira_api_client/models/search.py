@@ -1,12 +1,100 @@
 import typing
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
 
-from jira_api_client.models.issue import JiraIssue
+from jira_api_client.models.base import JiraParseModeEnum
+from jira_api_client.models.deferred import JiraDeferredModel
+from jira_api_client.models.issue import (
+    JiraIssue,
+    JiraLazyIssue,
+    JiraLazyPartialIssue,
+    JiraPartialIssue,
+)
+from jira_api_client.models.raw import JiraIssueDict
+from jira_api_client.models.record import JiraIssueRecord
 
 
-class JiraSearchResults(BaseModel):
+class JiraSearchResults(JiraDeferredModel):
     """Jira APIの /search エンドポイントからの検索結果全体を表すPydanticモデル。"""
     issues: typing.List[JiraIssue] = Field(default_factory=list, description="検索結果として返されたJira課題のリスト")
     isLast: bool = Field(description="結果が最後のページであるかどうか")
     nextPageToken: typing.Optional[str] = Field(None, description="結果が最後のページで無い時はTokenが代入される")
+
+
+class JiraPartialSearchResults(JiraDeferredModel):
+    """取得するフィールドを指定した /search の検索結果全体を表すPydanticモデル。"""
+    issues: typing.List[JiraPartialIssue] = Field(default_factory=list,
+                                                  description="検索結果として返されたJira課題 (指定フィールドのみ) のリスト")
+    isLast: bool = Field(description="結果が最後のページであるかどうか")
+    nextPageToken: typing.Optional[str] = Field(None, description="結果が最後のページで無い時はTokenが代入される")
+
+
+class JiraLazySearchResults(JiraDeferredModel):
+    """遅延パースモードの /search の検索結果全体を表すPydanticモデル。"""
+    issues: typing.List[JiraLazyIssue] = Field(default_factory=list, description="検索結果として返されたJira課題のリスト")
+    isLast: bool = Field(description="結果が最後のページであるかどうか")
+    nextPageToken: typing.Optional[str] = Field(None, description="結果が最後のページで無い時はTokenが代入される")
+
+
+class JiraLazyPartialSearchResults(JiraDeferredModel):
+    """取得するフィールドを指定した遅延パースモードの /search の検索結果全体を表すPydanticモデル。"""
+    issues: typing.List[JiraLazyPartialIssue] = Field(default_factory=list,
+                                                      description="検索結果として返されたJira課題 (指定フィールドのみ) のリスト")
+    isLast: bool = Field(description="結果が最後のページであるかどうか")
+    nextPageToken: typing.Optional[str] = Field(None, description="結果が最後のページで無い時はTokenが代入される")
+
+
+class JiraRawSearchResults(JiraDeferredModel):
+    """
+    RAWモードの /search の検索結果全体を表すモデル。
+
+    検証を行わずに model_construct() で生成され、issues にはデコードしたJSONの dict がそのまま格納されます。
+    """
+    issues: typing.List[JiraIssueDict] = Field(default_factory=list, description="検索結果として返されたJira課題 (dict) のリスト")
+    isLast: bool = Field(description="結果が最後のページであるかどうか")
+    nextPageToken: typing.Optional[str] = Field(None, description="結果が最後のページで無い時はTokenが代入される")
+
+
+class JiraRecordSearchResults(JiraDeferredModel):
+    """
+    RECORDモードの /search の検索結果全体を表すモデル。
+
+    検証を行わずに model_construct() で生成され、issues には軽量な JiraIssueRecord が格納されます。
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    issues: typing.List[JiraIssueRecord] = Field(default_factory=list, description="検索結果として返されたJira課題のレコードのリスト")
+    isLast: bool = Field(description="結果が最後のページであるかどうか")
+    nextPageToken: typing.Optional[str] = Field(None, description="結果が最後のページで無い時はTokenが代入される")
+
+
+class JiraSearchCursor(JiraDeferredModel):
+    """
+    /search の検索結果から、次のページの取得に必要な値だけを読み取るモデル。
+
+    課題は読み飛ばして検証しないため、ページの解析を別プロセスで行う場合に、解析の完了を待たずに次のページを要求できます。
+    """
+    isLast: bool = Field(True, description="結果が最後のページであるかどうか")
+    nextPageToken: typing.Optional[str] = Field(None, description="結果が最後のページで無い時はTokenが代入される")
+
+
+SearchResultsModel = typing.Union[typing.Type[JiraSearchResults], typing.Type[JiraPartialSearchResults],
+                                  typing.Type[JiraLazySearchResults], typing.Type[JiraLazyPartialSearchResults],
+                                  typing.Type[JiraRawSearchResults], typing.Type[JiraRecordSearchResults]]
+
+
+def search_results_model(partial: bool, parse_mode: JiraParseModeEnum = JiraParseModeEnum.FULL) -> SearchResultsModel:
+    """
+    検索結果のレスポンスを検証するモデルを返します。
+
+    Args:
+        partial (bool): 取得するフィールドを指定した検索 (フィールド射影) かどうか。
+        parse_mode (JiraParseModeEnum): 検索結果の解析方法。
+    """
+    if parse_mode == JiraParseModeEnum.LAZY:
+        return JiraLazyPartialSearchResults if partial else JiraLazySearchResults
+    if parse_mode == JiraParseModeEnum.RAW:
+        return JiraRawSearchResults
+    if parse_mode == JiraParseModeEnum.RECORD:
+        return JiraRecordSearchResults
+    return JiraPartialSearchResults if partial else JiraSearchResults
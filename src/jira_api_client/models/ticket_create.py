@@ -1,8 +1,56 @@
-from pydantic import BaseModel, Field
+import functools
+import typing
 
+from pydantic import Field, TypeAdapter
 
-class JiraCreatedIssue(BaseModel):
+from jira_api_client.models.base import JiraIssueTypeEnum
+from jira_api_client.models.deferred import JiraDeferredModel
+
+
+class JiraCreatedIssue(JiraDeferredModel):
     """Jiraに新しく作成された課題の簡易情報を示すPydanticモデル。"""
     id: str = Field(..., description="作成された課題のユニークなID")
     key: str = Field(..., description="作成された課題のキー (例: 'PROJ-456')")
     self: str = Field(..., description="作成された課題リソースへのURL")
+
+
+class JiraTicketSpec(JiraDeferredModel):
+    """一括作成するチケット1件分の内容を表すPydanticモデル。各項目は create_ticket() の引数と同じです。"""
+    project_key: str = Field(..., description="チケットを作成するプロジェクトのキー (例: 'PROJ')")
+    summary: str = Field(..., description="チケットの要約（タイトル）")
+    description: typing.Optional[str] = Field(None, description="チケットの説明")
+    issue_type: JiraIssueTypeEnum = Field(JiraIssueTypeEnum.TASK, description="作成するチケットの課題タイプ")
+    assignee_account_id: typing.Optional[str] = Field(None, description="チケットをアサインするユーザーのaccountId")
+    priority_name: typing.Optional[str] = Field(None, description="チケットの優先度名 (例: 'High', 'Low')")
+    custom_fields: typing.Optional[typing.Dict[str, typing.Any]] = Field(None, description="設定したいカスタムフィールドの辞書")
+
+
+class JiraBulkCreateError(JiraDeferredModel):
+    """一括作成で失敗したチケット1件分のエラー情報を表すPydanticモデル。"""
+    index: int = Field(..., description="失敗したチケットの、入力シーケンス内でのインデックス")
+    status: typing.Optional[int] = Field(None, description="HTTPステータスコード")
+    errorMessages: typing.List[str] = Field(default_factory=list, description="エラーメッセージのリスト")
+    errors: typing.Dict[str, str] = Field(default_factory=dict, description="フィールドごとのエラーメッセージ")
+
+
+class JiraBulkCreateResult(JiraDeferredModel):
+    """チケットの一括作成結果を表すPydanticモデル。"""
+    issues: typing.List[typing.Optional[JiraCreatedIssue]] = Field(default_factory=list,
+                                                                   description="入力と同じ順序の作成結果。作成に失敗したチケットは None")
+    errors: typing.List[JiraBulkCreateError] = Field(default_factory=list, description="作成に失敗したチケットのエラー情報")
+
+    @property
+    def created(self) -> typing.List[JiraCreatedIssue]:
+        """作成に成功したチケットのリスト。"""
+        return [issue for issue in self.issues if issue is not None]
+
+
+@functools.lru_cache(maxsize=None)
+def bulk_create_response_adapter() -> "TypeAdapter[typing.Dict[str, typing.Any]]":
+    """
+    一括作成API (/issue/bulk) のレスポンス (JSONオブジェクト) を bytes からデコードするためのアダプターを返します。
+
+    要素ごとの検証は入力インデックスとの対応付けの際に行うため、ここではJSONオブジェクトであることだけを検証します。
+    TypeAdapter は生成時にスキーマを構築するため、初回の呼び出しまで生成を遅延します。
+    """
+    return TypeAdapter(typing.Dict[str, typing.Any])
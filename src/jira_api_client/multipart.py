@@ -0,0 +1,210 @@
+import asyncio
+import io
+import os
+import os.path
+import stat
+import typing
+import uuid
+
+# 添付ファイルアップロード用の multipart/form-data ボディを、メモリに全体を載せずにストリーミング生成する
+
+# アップロード元として受け付ける型: ファイルパス / bytes・memoryview などのバッファ / バイナリのファイルオブジェクト / bytes のイテラブル
+AttachmentSource = typing.Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, typing.BinaryIO,
+                                typing.Iterable[bytes]]
+# upload_attachments() に渡す1ファイル分の指定: ソース単体、(ファイル名, ソース)、(ファイル名, ソース, Content-Type)
+AttachmentFile = typing.Union[
+    AttachmentSource,
+    typing.Tuple[str, AttachmentSource],
+    typing.Tuple[str, AttachmentSource, str],
+]
+# 送信済みバイト数と合計バイト数 (不明な場合は None) を受け取る進捗コールバック
+ProgressCallback = typing.Callable[[int, typing.Optional[int]], None]
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+class UploadPart(object):
+    """multipart ボディの1ファイル分。データは iter_chunks() で読み出した時点で初めて読み込まれます。"""
+    __slots__ = ("filename", "source", "content_type", "size")
+
+    def __init__(self, filename: str, source: AttachmentSource, content_type: str = DEFAULT_CONTENT_TYPE):
+        self.filename = filename
+        self.source = source
+        self.content_type = content_type
+        self.size = _source_size(source)
+
+    def iter_chunks(self, chunk_size: int) -> typing.Iterator[typing.Union[bytes, memoryview]]:
+        """データを chunk_size 単位で返します。バッファはコピーせずに memoryview のスライスとして返します。"""
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:
+                yield from _iter_file(f, chunk_size)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source).cast("B")
+            for offset in range(0, len(view), chunk_size):
+                yield view[offset:offset + chunk_size]
+        elif hasattr(source, "read"):
+            yield from _iter_file(source, chunk_size)
+        else:
+            for chunk in source:
+                if chunk:
+                    yield chunk
+
+
+def _iter_file(f: typing.BinaryIO, chunk_size: int) -> typing.Iterator[bytes]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _source_size(source: AttachmentSource) -> typing.Optional[int]:
+    """ソースのバイト数を返します。イテラブルなど事前にサイズが分からない場合は None。"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if hasattr(source, "read"):
+        try:
+            if hasattr(source, "fileno"):
+                st = os.fstat(source.fileno())
+                # パイプ・ソケット・標準入力などの st_size は内容のサイズではないため、通常のファイル以外はサイズ不明とする
+                if not stat.S_ISREG(st.st_mode):
+                    return None
+                return st.st_size - source.tell()
+        except (OSError, io.UnsupportedOperation):
+            pass
+        try:
+            if source.seekable():
+                position = source.tell()
+                end = source.seek(0, io.SEEK_END)
+                source.seek(position)
+                return end - position
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            pass
+    return None
+
+
+def build_upload_parts(files: typing.Sequence[AttachmentFile]) -> typing.List[UploadPart]:
+    """
+    upload_attachments() に渡されたファイル指定を UploadPart のリストに変換します。
+
+    Raises:
+        FileNotFoundError: ファイルパスが存在しない場合。
+        ValueError: ファイル名を決定できない場合 (パス・name属性を持つファイルオブジェクト以外でファイル名が未指定)。
+    """
+    parts = []
+    for item in files:
+        filename = None
+        content_type = DEFAULT_CONTENT_TYPE
+        if isinstance(item, tuple):
+            if len(item) == 3:
+                filename, source, content_type = item
+            else:
+                filename, source = item
+        else:
+            source = item
+
+        if isinstance(source, (str, os.PathLike)):
+            if not os.path.exists(source):
+                raise FileNotFoundError(f"ファイルが見つかりません: {source}")
+            filename = filename or os.path.basename(source)
+        elif filename is None and isinstance(getattr(source, "name", None), str):
+            filename = os.path.basename(source.name)
+        if not filename:
+            raise ValueError("パス以外のデータをアップロードする場合はファイル名を指定してください。")
+        parts.append(UploadPart(filename, source, content_type))
+    return parts
+
+
+def _quote_header_value(value: str) -> str:
+    # ブラウザ (HTML5) と同じく、UTF-8 のままダブルクォートと改行のみエスケープする
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartUploadBody(object):
+    """
+    複数ファイルを含む multipart/form-data ボディを、チャンク単位で生成するイテラブル。
+
+    requests の data 引数にそのまま渡すと、全ファイルのサイズが分かる場合は Content-Length 付きで、
+    分からない場合は chunked 転送でストリーミング送信されます。メモリ使用量は chunk_size 程度に収まります。
+    """
+
+    def __init__(self,
+                 parts: typing.Sequence[UploadPart],
+                 field_name: str = "file",
+                 chunk_size: int = 1024 * 1024,
+                 progress_callback: typing.Optional[ProgressCallback] = None):
+        self.parts = parts
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.bytes_sent = 0  # 直近の送信で送信済みのバイト数
+        self.boundary = uuid.uuid4().hex
+        self._headers = [(f'--{self.boundary}\r\n'
+                          f'Content-Disposition: form-data; name="{field_name}"; '
+                          f'filename="{_quote_header_value(part.filename)}"\r\n'
+                          f'Content-Type: {part.content_type}\r\n\r\n').encode('utf-8') for part in parts]
+        self._closing = f'--{self.boundary}--\r\n'.encode('utf-8')
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type ヘッダの値。"""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def replayable(self) -> bool:
+        """ボディを再送 (再度イテレート) できるかどうか。ファイルオブジェクトやイテラブルを含む場合は False。"""
+        return all(isinstance(part.source, (str, os.PathLike, bytes, bytearray, memoryview)) for part in self.parts)
+
+    @property
+    def total_size(self) -> typing.Optional[int]:
+        """ボディ全体のバイト数。サイズ不明のソースを含む場合は None。"""
+        if any(part.size is None for part in self.parts):
+            return None
+        return sum(len(header) + part.size + 2 for header, part in zip(self._headers, self.parts)) + len(self._closing)
+
+    def __len__(self) -> int:
+        # requests は len() が 0 の場合に chunked 転送を使用する
+        return self.total_size or 0
+
+    def __bool__(self) -> bool:
+        # len() が 0 でも空のボディとして扱われないようにする (requests は `data or {}` で判定する)
+        return True
+
+    def __iter__(self) -> typing.Iterator[typing.Union[bytes, memoryview]]:
+        total = self.total_size
+        self.bytes_sent = 0
+        for header, part in zip(self._headers, self.parts):
+            for chunk in _chain_one(header, part.iter_chunks(self.chunk_size), b"\r\n"):
+                yield chunk
+                self.bytes_sent += len(chunk)
+                if self.progress_callback is not None:
+                    self.progress_callback(self.bytes_sent, total)
+        yield self._closing
+        self.bytes_sent += len(self._closing)
+        if self.progress_callback is not None:
+            self.progress_callback(self.bytes_sent, total)
+
+
+def _chain_one(head: bytes, body: typing.Iterable[typing.Union[bytes, memoryview]],
+               tail: bytes) -> typing.Iterator[typing.Union[bytes, memoryview]]:
+    yield head
+    yield from body
+    yield tail
+
+
+async def aiter_upload_body(body: MultipartUploadBody) -> typing.AsyncIterator[bytes]:
+    """
+    MultipartUploadBody を httpx.AsyncClient の content に渡せる非同期イテラブルとして返します。
+
+    ファイルの読み込みはチャンクごとに asyncio.to_thread() で別スレッドで行うため、イベントループをブロックしません。
+    """
+    chunks = iter(body)
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            return
+        yield bytes(chunk)
@@ -0,0 +1,331 @@
+import functools
+import typing
+
+from pydantic import BaseModel
+
+from jira_api_client.decoding import decode_json, validate_json
+from jira_api_client.instrumentation import JiraRequestEvent
+from jira_api_client.models.base import JiraParseModeEnum
+from jira_api_client.models.bulk_fetch import JiraBulkFetchResult, JiraIssueFetchError
+from jira_api_client.models.interning import INTERN_CONTEXT_KEY, JiraInternCache
+from jira_api_client.models.issue import JiraIssue, JiraPartialIssue
+from jira_api_client.models.record import JiraIssueRecord
+from jira_api_client.models.search import search_results_model
+
+# /search/jql のレスポンス1ページ分を、解析方法 (JiraParseModeEnum) に従って検索結果のモデルに変換する
+
+ModelT = typing.TypeVar("ModelT", bound=BaseModel)
+
+# 課題を検証せずに変換するモード (サンプリング検証の対象)
+_UNVALIDATED_MODES = (JiraParseModeEnum.RAW, JiraParseModeEnum.CONSTRUCT, JiraParseModeEnum.RECORD)
+
+# モデルごとの「検証なしで組み立てる必要があるフィールド (名前, 変換関数)」のキャッシュ
+_CONSTRUCT_PLANS: typing.Dict[type, typing.List[typing.Tuple[str, typing.Callable[[typing.Any], typing.Any]]]] = {}
+
+
+def _value_converter(annotation: typing.Any) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+    """
+    型注釈に対応する、検証なしで値をモデルに組み立てる関数を返します。変換が不要な場合は None。
+
+    BaseModel、その Optional / List / Dict を対象とし、判別共用体 (ADFのノードなど) や Any の値は dict のまま残します。
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        model = annotation
+        return lambda value: construct_model(model, value) if isinstance(value, dict) else value
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) != 1:
+            return None
+        return _value_converter(members[0])  # None は各変換関数でそのまま返される
+    if origin is list and args:
+        item_converter = _value_converter(args[0])
+        if item_converter is None:
+            return None
+        return lambda value: [item_converter(item) for item in value] if isinstance(value, list) else value
+    if origin is dict and len(args) == 2:
+        value_converter = _value_converter(args[1])
+        if value_converter is None:
+            return None
+        return lambda value: {k: value_converter(v) for k, v in value.items()} if isinstance(value, dict) else value
+    return None
+
+
+def _construct_plan(model: type) -> typing.List[typing.Tuple[str, typing.Callable[[typing.Any], typing.Any]]]:
+    plan = _CONSTRUCT_PLANS.get(model)
+    if plan is None:
+        plan = []
+        for name, field_info in model.model_fields.items():
+            converter = _value_converter(field_info.annotation)
+            if converter is not None:
+                plan.append((name, converter))
+        _CONSTRUCT_PLANS[model] = plan
+    return plan
+
+
+def construct_model(model: typing.Type[ModelT], data: typing.Dict[str, typing.Any]) -> ModelT:
+    """
+    data を検証せずに、入れ子のモデルも含めて model_construct() で組み立てます。
+
+    model_construct() は入れ子のフィールドを dict のまま格納するため、型注釈が BaseModel (とその Optional / List / Dict)
+    のフィールドは再帰的に組み立てます。ADFのノードのような判別共用体は dict のまま残るため、
+    説明文のテキスト変換には adf_renderer (dict とモデルの混在に対応) を使用してください。
+    型や必須フィールドの確認は一切行われないため、スキーマを信頼できるレスポンスにのみ使用してください。
+    """
+    values = dict(data)
+    for name, converter in _construct_plan(model):
+        value = values.get(name)
+        if value is not None:
+            values[name] = converter(value)
+    return model.model_construct(**values)
+
+
+class JiraSampledValidator(object):
+    """
+    検証を省略するモード (RAW / CONSTRUCT / RECORD) で、every 件ごとに1件だけ課題を完全に検証するバリデーター。
+
+    スキーマの変化 (Jira側のフィールドの型の変更など) を、全件検証のコストを払わずに検出するために使用します。
+    最初の1件は必ず検証されます。
+    """
+
+    def __init__(self, every: int, model: typing.Type[BaseModel]):
+        """
+        Args:
+            every (int): 何件ごとに検証するか (1 の場合は全件)。
+            model (Type[BaseModel]): 検証に使用するモデル (JiraIssue または JiraPartialIssue)。
+        """
+        if every < 1:
+            raise ValueError("every には1以上を指定してください。")
+        self.every = every
+        self.model = model
+        self.seen = 0
+        self.validated = 0
+
+    def check(self, issues: typing.Sequence[typing.Dict[str, typing.Any]]) -> None:
+        """
+        issues のうち検証対象の課題を検証します。
+
+        Raises:
+            pydantic.ValidationError: 検証対象の課題がモデルの構造と一致しない場合。
+        """
+        # 次に検証する課題の、このページ内でのインデックス
+        start = (-self.seen) % self.every
+        for index in range(start, len(issues), self.every):
+            self.model.model_validate(issues[index])
+            self.validated += 1
+        self.seen += len(issues)
+
+
+class JiraSearchPageParser(object):
+    """
+    /search/jql のレスポンス1ページ分を、解析方法に従って検索結果のモデルに変換するパーサー。
+
+    サンプリング検証の件数はページをまたいで数えるため、1回の検索 (ページング) ごとに1つのインスタンスを使用します。
+    """
+
+    def __init__(self,
+                 partial: bool,
+                 parse_mode: JiraParseModeEnum = JiraParseModeEnum.FULL,
+                 validate_every: typing.Optional[int] = None,
+                 intern_cache: typing.Optional[JiraInternCache] = None):
+        """
+        Args:
+            partial (bool): 取得するフィールドを指定した検索 (フィールド射影) かどうか。
+            parse_mode (JiraParseModeEnum): 検索結果の解析方法。
+            validate_every (int, optional): RAW / CONSTRUCT / RECORD モードで、何件ごとに1件を完全に検証するか。
+                                            None の場合は検証しません。FULL / LAZY モードでは無視されます。
+            intern_cache (JiraInternCache, optional): FULL / LAZY モードで、同じユーザー・ステータス・プロジェクトなどを
+                                                      1つのインスタンスで共有するためのキャッシュ。
+                                                      None の場合は共有しません。RAW / CONSTRUCT / RECORD モードでは無視されます。
+        """
+        self.parse_mode = parse_mode
+        self.intern_cache = intern_cache
+        self.__context = {INTERN_CONTEXT_KEY: intern_cache} if intern_cache is not None else None
+        self.results_model = search_results_model(partial, parse_mode)
+        self.issue_model = JiraPartialIssue if partial else JiraIssue
+        self.validator = None
+        if validate_every and parse_mode in _UNVALIDATED_MODES:
+            self.validator = JiraSampledValidator(validate_every, self.issue_model)
+
+    def parse_json(self, content: bytes, event: typing.Optional[JiraRequestEvent] = None) -> typing.Any:
+        """
+        レスポンスボディ (bytes) を検索結果のモデルに変換します。
+
+        FULL / LAZY モードでは model_validate_json() で bytes から直接検証し、中間の dict を作りません。
+        RAW / CONSTRUCT / RECORD モードでは decode_json() でデコードした dict を parse() で変換します。
+        event を指定した場合は、デコードと変換の所要時間を event の decode_time / validation_time に記録します
+        (FULL / LAZY モードではデコードと検証を同時に行うため、全体が validation_time に計上されます)。
+
+        Raises:
+            json.JSONDecodeError: レスポンスが不正なJSONの場合。
+            pydantic.ValidationError: レスポンスがモデルの構造と一致しない場合 (RAW / CONSTRUCT / RECORD ではサンプリング対象の課題のみ)。
+        """
+        if self.parse_mode not in _UNVALIDATED_MODES:
+            return validate_json(functools.partial(self.results_model.model_validate_json, context=self.__context),
+                                 content, event)
+        if event is None:
+            return self.parse(decode_json(content))
+        with event.measure("decode_time"):
+            data = decode_json(content)
+        with event.measure("validation_time"):
+            return self.parse(data)
+
+    def parse(self, data: typing.Dict[str, typing.Any]) -> typing.Any:
+        """
+        デコード済みのレスポンスJSONを検索結果のモデルに変換します。
+
+        Raises:
+            pydantic.ValidationError: レスポンスがモデルの構造と一致しない場合 (RAW / CONSTRUCT / RECORD ではサンプリング対象の課題のみ)。
+        """
+        if self.parse_mode not in _UNVALIDATED_MODES:
+            return self.results_model.model_validate(data, context=self.__context)
+
+        issues = data.get("issues") or []
+        if self.validator is not None:
+            self.validator.check(issues)
+        if self.parse_mode == JiraParseModeEnum.CONSTRUCT:
+            issues = [construct_model(self.issue_model, issue) for issue in issues]
+        elif self.parse_mode == JiraParseModeEnum.RECORD:
+            issues = [JiraIssueRecord.from_dict(issue) for issue in issues]
+        return self.results_model.model_construct(issues=issues,
+                                                  isLast=bool(data.get("isLast", True)),
+                                                  nextPageToken=data.get("nextPageToken"))
+
+
+def parse_search_page(content: bytes,
+                      partial: bool,
+                      parse_mode: JiraParseModeEnum,
+                      validate_every: typing.Optional[int] = None,
+                      offset: int = 0,
+                      intern_entities: bool = False) -> typing.Tuple[typing.Any, float, float]:
+    """
+    /search/jql のレスポンス1ページ分を検索結果のモデルに変換します。ProcessPoolExecutor のワーカーで実行する関数です。
+
+    引数と戻り値は pickle で受け渡されるため、パーサーやキャッシュではなく解析方法の設定だけを受け取ります。
+    エンティティの共有 (intern_entities) はページ内でのみ有効で、共有されたインスタンスは pickle を経由しても
+    ページ内では1つのインスタンスのまま呼び出し元に返されます。
+
+    Args:
+        content (bytes): レスポンスボディ。
+        partial (bool): 取得するフィールドを指定した検索 (フィールド射影) かどうか。
+        parse_mode (JiraParseModeEnum): 検索結果の解析方法。
+        validate_every (int, optional): RAW / CONSTRUCT / RECORD モードで、何件ごとに1件を完全に検証するか。
+        offset (int): このページより前の課題数。サンプリング検証の対象をページをまたいで揃えるために使用します。
+        intern_entities (bool): FULL / LAZY モードで、ページ内の同じエンティティを1つのインスタンスで共有するかどうか。
+
+    Returns:
+        Tuple[Any, float, float]: 検索結果のモデルと、デコード・変換の所要時間 (秒)。
+
+    Raises:
+        json.JSONDecodeError: レスポンスが不正なJSONの場合。
+        pydantic.ValidationError: レスポンスがモデルの構造と一致しない場合。
+    """
+    parser = JiraSearchPageParser(partial, parse_mode, validate_every, JiraInternCache() if intern_entities else None)
+    if parser.validator is not None:
+        parser.validator.seen = offset
+    event = JiraRequestEvent("search", "GET", "")
+    results = parser.parse_json(content, event)
+    return results, event.decode_time, event.validation_time
+
+
+def _issue_identity(issue: typing.Any) -> typing.Tuple[str, str]:
+    """解析方法に関わらず、課題の (大文字のキー, ID) を返します。"""
+    if isinstance(issue, dict):
+        return str(issue.get("key") or "").upper(), str(issue.get("id") or "")
+    return issue.key.upper(), str(issue.id)
+
+
+class JiraBulkFetchPage(object):
+    """
+    /issue/bulkfetch のレスポンス1件分を、要求したキーに対応付けた結果。
+
+    キーが変わった課題は、要求したキーと返された課題がそれぞれ1件だけ余った場合にのみ対応付けられます。
+    複数の候補があり対応付けられないキーは unresolved に残るため、1件ずつ取得し直してください。
+    errors にはリクエスト自体が失敗した場合に、その全てのキーのエラー情報が格納されます。
+    """
+    __slots__ = ("issues", "moved", "missing", "unresolved", "errors")
+
+    def __init__(self):
+        self.issues: typing.Dict[str, typing.Any] = {}
+        self.moved: typing.Dict[str, str] = {}
+        self.missing: typing.List[str] = []
+        self.unresolved: typing.List[str] = []
+        self.errors: typing.List[JiraIssueFetchError] = []
+
+
+def parse_bulk_fetch(parser: JiraSearchPageParser,
+                     content: bytes,
+                     keys: typing.Sequence[str],
+                     event: typing.Optional[JiraRequestEvent] = None) -> JiraBulkFetchPage:
+    """
+    /issue/bulkfetch のレスポンスボディを parser の解析方法で変換し、要求したキー (正規化済み) に対応付けます。
+
+    課題は要求したキーまたはIDで対応付けます。issueErrors に含まれるキー (存在しない・閲覧権限が無い課題) と、
+    対応する課題が返されなかったキーは missing に、キーが変わった課題は moved に記録されます。
+
+    Raises:
+        json.JSONDecodeError: レスポンスが不正なJSONの場合。
+        pydantic.ValidationError: 課題がモデルの構造と一致しない場合。
+    """
+    if event is None:
+        data = decode_json(content)
+        issues = parser.parse({"issues": data.get("issues") or [], "isLast": True}).issues
+    else:
+        with event.measure("decode_time"):
+            data = decode_json(content)
+        with event.measure("validation_time"):
+            issues = parser.parse({"issues": data.get("issues") or [], "isLast": True}).issues
+
+    requested = set(keys)
+    page = JiraBulkFetchPage()
+    unexpected = []
+    for issue in issues:
+        issue_key, issue_id = _issue_identity(issue)
+        if issue_key in requested:
+            page.issues[issue_key] = issue
+        elif issue_id in requested:
+            page.issues[issue_id] = issue
+        else:
+            unexpected.append((issue_key, issue))
+
+    failed = {str(error.get("id") or "").upper() for error in data.get("issueErrors") or []}
+    unmatched = [key for key in keys if key not in page.issues and key not in failed]
+    page.missing.extend(key for key in keys if key in failed)
+    if len(unmatched) == 1 and len(unexpected) == 1:
+        issue_key, issue = unexpected[0]
+        page.issues[unmatched[0]] = issue
+        page.moved[unmatched[0]] = issue_key
+    elif unmatched and unexpected and len(keys) > 1:
+        page.unresolved.extend(unmatched)
+    else:
+        page.missing.extend(unmatched)
+    return page
+
+
+def failed_bulk_fetch_page(keys: typing.Sequence[str], status: typing.Optional[int], message: str) -> JiraBulkFetchPage:
+    """/issue/bulkfetch のリクエスト自体が失敗した場合に、要求した全てのキーを失敗として記録します。"""
+    page = JiraBulkFetchPage()
+    page.errors.extend(JiraIssueFetchError(key=key, status=status, errorMessages=[message]) for key in keys)
+    return page
+
+
+def merge_bulk_fetch_pages(keys: typing.Sequence[str],
+                           pages: typing.Iterable[JiraBulkFetchPage]) -> JiraBulkFetchResult:
+    """各リクエストの結果を、要求したキーの順序で1つの JiraBulkFetchResult にまとめます。"""
+    issues: typing.Dict[str, typing.Any] = {}
+    moved: typing.Dict[str, str] = {}
+    missing = set()
+    errors: typing.Dict[str, JiraIssueFetchError] = {}
+    for page in pages:
+        issues.update(page.issues)
+        moved.update(page.moved)
+        missing.update(page.missing)
+        errors.update((error.key, error) for error in page.errors)
+    return JiraBulkFetchResult(issues={key: issues[key]
+                                       for key in keys if key in issues},
+                               moved={key: moved[key]
+                                      for key in keys if key in moved},
+                               missing=[key for key in keys if key in missing],
+                               errors=[errors[key] for key in keys if key in errors])
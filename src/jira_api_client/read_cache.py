@@ -0,0 +1,251 @@
+import collections
+import copy
+import threading
+import time
+import typing
+
+from jira_api_client.jql import normalize_jql
+from jira_api_client.models.base import JiraParseModeEnum
+from jira_api_client.request_builders import format_fields
+
+# --- 読み取り系の呼び出し (JQL検索) の結果の短期キャッシュ ---
+# 多数のスレッドから同じ条件の検索が同時に呼ばれる場合に、全ページの取得を1回にまとめて Jira への負荷を抑えます。
+# 有効期限 (TTL) 内の同じ検索にはキャッシュした結果を返し、実行中の同じ検索があればその完了を待って結果を共有します
+# (single-flight)。
+# 既定では呼び出しごとに結果を複製 (deepcopy) して返すため、呼び出し元が課題を変更してもキャッシュや他の呼び出し元に影響しません。
+# 複製のコストは同じページの解析と比べて FULL で約1.2倍、RAW で約3.5倍、RECORD で約0.05倍です。
+# 応答の遅延が無いローカルのサーバーでは取得より高くつく場合もあります (benchmarks/run_benchmarks.py の cache シナリオ) が、
+# Jira へのリクエストの合流は変わりません。結果を変更しない場合は copy_results=False で複製を省略できます。
+
+T = typing.TypeVar("T")
+CacheKey = typing.Tuple[typing.Hashable, ...]
+
+
+def search_cache_key(jql: str, fields: typing.Optional[typing.Sequence[str]], max_results: typing.Optional[int],
+                     parse_mode: JiraParseModeEnum) -> CacheKey:
+    """
+    JQL検索の結果のキャッシュキーを返します。
+
+    JQLは空白を正規化し、フィールドは順序と重複を無視して比較します (結果の内容はフィールドの順序に依存しないため)。
+    """
+    fields_key = None if fields is None else tuple(sorted(format_fields(fields).split(",")))
+    return "search", normalize_jql(jql), fields_key, max_results or None, parse_mode.value
+
+
+class JiraReadCacheStats(object):
+    """JiraReadCache の統計値のスナップショット。"""
+
+    __slots__ = ("hits", "misses", "coalesced", "evictions", "expirations", "entries", "issues")
+
+    def __init__(self, hits: int, misses: int, coalesced: int, evictions: int, expirations: int, entries: int,
+                 issues: int):
+        self.hits = hits  # 有効期限内のキャッシュから返した回数
+        self.misses = misses  # Jira から取得した回数
+        self.coalesced = coalesced  # 実行中の同じ検索の完了を待って結果を共有した回数
+        self.evictions = evictions  # 件数・サイズの上限により破棄したエントリ数
+        self.expirations = expirations  # 有効期限切れで破棄したエントリ数
+        self.entries = entries  # 現在のエントリ数
+        self.issues = issues  # 現在キャッシュしている課題の合計数
+
+    @property
+    def hit_ratio(self) -> float:
+        """Jira へのリクエストを省略できた呼び出しの割合 (キャッシュのヒットと合流を含む)。"""
+        lookups = self.hits + self.misses + self.coalesced
+        if not lookups:
+            return 0.0
+        return (self.hits + self.coalesced) / lookups
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """JSONに変換できる dict を返します。"""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values["hit_ratio"] = self.hit_ratio
+        return values
+
+
+class _CacheEntry(object):
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: typing.Any, size: int, expires_at: float):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class _Flight(object):
+    """実行中の取得1回分。同じキーの後続の呼び出しは done を待ち、value または error を共有します。"""
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: typing.Any = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class JiraReadCache(object):
+    """
+    JQL検索の結果を、有効期限 (TTL) と件数・サイズの上限付きで保持するキャッシュ。スレッドセーフです。
+
+    上限を超えた場合は最も長く使われていないエントリから破棄します (LRU)。
+    同じキーの取得が実行中の場合、後続の呼び出しは新たに取得せずにその完了を待って結果を共有します。
+    取得が例外で失敗した場合は、待っていた全ての呼び出しに同じ例外が送出され、結果はキャッシュされません。
+
+    copy_results=True (デフォルト) の場合、呼び出しごとに結果の複製を返します。
+    copy_results=False の場合はキャッシュした結果のインスタンスを呼び出し元の間で共有するため、課題を変更しないでください。
+    キャッシュのキーには認証情報が含まれないため、1つのキャッシュを異なるユーザーのクライアントで共有しないでください。
+
+    Example:
+        cache = JiraReadCache(ttl=30.0, max_entries=256)
+        client = JiraClinet(base_url, email, token, read_cache=cache)
+        client.get_tickets("PROJ", status_name=JiraStatusNameEnum.IN_PROGRESS)
+        print(cache.stats().to_dict())
+    """
+
+    def __init__(self,
+                 ttl: float = 30.0,
+                 max_entries: int = 128,
+                 max_issues: typing.Optional[int] = None,
+                 copy_results: bool = True):
+        """
+        Args:
+            ttl (float): キャッシュの有効期限 (秒, デフォルト: 30.0)。
+            max_entries (int): 保持するエントリ (検索結果) の最大数 (デフォルト: 128)。
+            max_issues (int, optional): 保持する課題の合計数の上限。メモリ使用量の上限の目安として使用します。
+                                        1つの検索結果だけで上限を超える場合、その結果はキャッシュしません。
+                                        None の場合は制限しません。
+            copy_results (bool): 呼び出しごとに結果を複製 (deepcopy) して返すかどうか (デフォルト: True)。
+                                 False の場合は複製のコストを省略し、全ての呼び出し元に同じインスタンスを返します。
+        """
+        if ttl <= 0:
+            raise ValueError("ttl には0より大きい値を指定してください。")
+        if max_entries < 1:
+            raise ValueError("max_entries には1以上を指定してください。")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_issues = max_issues
+        self.copy_results = copy_results
+        self.__entries: "collections.OrderedDict[CacheKey, _CacheEntry]" = collections.OrderedDict()
+        self.__flights: typing.Dict[CacheKey, _Flight] = {}
+        self.__lock = threading.Lock()
+        # clear() / invalidate() の前に始まった取得の結果をキャッシュしないための世代番号
+        self.__generation = 0
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__coalesced = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    def get_or_load(self,
+                    key: CacheKey,
+                    loader: typing.Callable[[], T],
+                    size: typing.Optional[typing.Callable[[T], int]] = None) -> T:
+        """
+        key の有効なキャッシュがあればその値を返し、無ければ loader() で取得してキャッシュします。
+
+        同じ key の loader() が別のスレッドで実行中の場合は、その完了を待って同じ値を返します。
+        copy_results=True の場合、返す値は呼び出しごとの複製です (loader() を呼び出したスレッドを含みます)。
+
+        Args:
+            key (CacheKey): キャッシュキー (search_cache_key() で生成します)。
+            loader (Callable[[], T]): 値を取得する関数。
+            size (Callable[[T], int], optional): 値のサイズ (課題数) を返す関数。max_issues の判定に使用します。
+
+        Raises:
+            Exception: loader() が送出した例外。
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if entry.expires_at > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return self._result(entry.value)
+                self._remove(key)
+                self.__expirations += 1
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[key] = _Flight()
+                self.__misses += 1
+            else:
+                self.__coalesced += 1
+            generation = self.__generation
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return self._result(flight.value)
+
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+                if flight.error is None and generation == self.__generation:
+                    self._store(key, flight.value, size(flight.value) if size is not None else 0)
+            # キャッシュへの保存後に完了を通知し、以降の呼び出しがキャッシュから値を得られるようにする
+            flight.done.set()
+        return self._result(flight.value)
+
+    def _result(self, value: T) -> T:
+        """キャッシュした値 (または共有した取得結果) を呼び出し元に返す形にします。"""
+        if self.copy_results:
+            return copy.deepcopy(value)
+        return value
+
+    def _store(self, key: CacheKey, value: typing.Any, size: int) -> None:
+        """ロックを保持した状態で value を保存し、上限を超えた分を古い順に破棄します。"""
+        if self.max_issues is not None and size > self.max_issues:
+            return
+        if key in self.__entries:
+            self._remove(key)
+        self.__entries[key] = _CacheEntry(value, size, time.monotonic() + self.ttl)
+        self.__size += size
+        while len(self.__entries) > self.max_entries or (self.max_issues is not None and self.__size > self.max_issues):
+            oldest = next(iter(self.__entries))
+            self._remove(oldest)
+            self.__evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self.__entries.pop(key)
+        self.__size -= entry.size
+
+    def invalidate(self, key: CacheKey) -> bool:
+        """
+        key のキャッシュを破棄します。その時点で実行中の取得 (key 以外を含む) の結果もキャッシュされなくなります。
+
+        Returns:
+            bool: 破棄したエントリがあったかどうか。
+        """
+        with self.__lock:
+            self.__generation += 1
+            if key not in self.__entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """全てのキャッシュを破棄します。実行中の取得の結果もキャッシュされなくなります。統計値はリセットしません。"""
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+            self.__size = 0
+
+    def stats(self) -> JiraReadCacheStats:
+        """現在の統計値を返します。"""
+        with self.__lock:
+            return JiraReadCacheStats(self.__hits, self.__misses, self.__coalesced, self.__evictions,
+                                      self.__expirations, len(self.__entries), self.__size)
+
+    def reset_stats(self) -> None:
+        """統計値 (ヒット数など) を0に戻します。キャッシュの内容は破棄しません。"""
+        with self.__lock:
+            self.__hits = self.__misses = self.__coalesced = self.__evictions = self.__expirations = 0
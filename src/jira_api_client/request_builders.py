@@ -0,0 +1,123 @@
+import base64
+import typing
+
+from jira_api_client.models.base import JiraIssueTypeEnum, JiraStatusNameEnum
+
+# JiraClinet と AsyncJiraClient で共通利用する、リクエストパラメータ・ペイロードの組み立て処理
+
+# /issue/bulkfetch で1回のリクエストで取得できる課題数の上限
+BULK_FETCH_LIMIT = 100
+
+
+def build_auth_headers(email: str, token: str) -> typing.Dict[str, str]:
+    """Basic認証用の Authorization ヘッダを組み立てます。"""
+    auth_string = f"{email}:{token}"
+    encoded_auth_string = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
+    return {"Authorization": f"Basic {encoded_auth_string}"}
+
+
+def format_fields(fields: typing.Optional[typing.Sequence[str]]) -> str:
+    """検索APIの fields パラメータを組み立てます。重複は順序を保ったまま除去します。"""
+    if fields is None:
+        return "*all"
+    if isinstance(fields, str):
+        fields = [fields]
+    unique_fields = list(dict.fromkeys(field.strip() for field in fields if field.strip()))
+    if not unique_fields:
+        raise ValueError("fields には1つ以上のフィールド名を指定してください。")
+    return ",".join(unique_fields)
+
+
+def build_tickets_jql(project_key: str,
+                      issue_type: typing.Optional[JiraIssueTypeEnum] = None,
+                      assignee_account_id: typing.Optional[str] = None,
+                      status_name: typing.Optional[JiraStatusNameEnum] = None) -> str:
+    """get_tickets() / iter_tickets() 用のJQLを組み立てます。"""
+    jql_parts = [f'project = "{project_key}"']
+
+    if issue_type:
+        jql_parts.append(f'issuetype = "{issue_type.value}"')
+
+    if assignee_account_id:
+        jql_parts.append(f'assignee = "{assignee_account_id}"')
+
+    if status_name:
+        jql_parts.append(f'status = "{status_name.value}"')
+
+    jql_query = ' AND '.join(jql_parts)
+    jql_query += ' ORDER BY created DESC'
+    return jql_query
+
+
+def build_create_ticket_payload(
+        project_key: str,
+        summary: str,
+        description: typing.Optional[str] = None,
+        issue_type: JiraIssueTypeEnum = JiraIssueTypeEnum.TASK,
+        assignee_account_id: typing.Optional[str] = None,
+        priority_name: typing.Optional[str] = None,
+        custom_fields: typing.Optional[typing.Dict[str, typing.Any]] = None) -> typing.Dict[str, typing.Any]:
+    """create_ticket() 用のリクエストペイロードを組み立てます。引数は create_ticket() と同じです。"""
+    payload = {"fields": {"project": {"key": project_key}, "summary": summary, "issuetype": {"name": issue_type.value}}}
+    if description:
+        payload["fields"]["description"] = {
+            "type": "doc",
+            "version": 1,
+            "content": [{
+                "type": "paragraph",
+                "content": [{
+                    "type": "text",
+                    "text": description
+                }]
+            }]
+        }
+    if assignee_account_id:
+        payload["fields"]["assignee"] = {"accountId": assignee_account_id}
+    if priority_name:
+        payload["fields"]["priority"] = {"name": priority_name}
+
+    if custom_fields:
+        payload["fields"].update(custom_fields)
+
+    return payload
+
+
+def normalize_issue_keys(keys: typing.Iterable[str]) -> typing.List[str]:
+    """
+    get_issues() 用に課題のキー (またはID) を正規化します。
+
+    前後の空白を除いて大文字に揃え (Jiraの課題キーは大文字小文字を区別しません)、空のキーと重複を順序を保ったまま除去します。
+    """
+    if isinstance(keys, str):
+        keys = [keys]
+    return list(dict.fromkeys(key.strip().upper() for key in keys if key and key.strip()))
+
+
+def build_bulk_fetch_payload(keys: typing.Sequence[str],
+                             fields: typing.Optional[typing.Sequence[str]] = None) -> typing.Dict[str, typing.Any]:
+    """課題の一括取得API (/issue/bulkfetch) のリクエストペイロードを組み立てます。"""
+    return {"issueIdsOrKeys": list(keys), "fields": format_fields(fields).split(","), "fieldsByKeys": False}
+
+
+def build_edit_payload(fields: typing.Optional[typing.Dict[str, typing.Any]] = None,
+                       update: typing.Optional[typing.Dict[str, typing.Any]] = None) -> typing.Dict[str, typing.Any]:
+    """
+    課題の編集 (PUT /issue/{key}) のリクエストペイロードを組み立てます。
+
+    fields はフィールドの値を置き換え、update はフィールドへの操作 (例: {"fixVersions": [{"add": {"name": "1.2.0"}}]})
+    を指定します。
+    """
+    payload: typing.Dict[str, typing.Any] = {}
+    if fields:
+        payload["fields"] = fields
+    if update:
+        payload["update"] = update
+    return payload
+
+
+def build_transition_payload(
+        transition_id: str,
+        fields: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        update: typing.Optional[typing.Dict[str, typing.Any]] = None) -> typing.Dict[str, typing.Any]:
+    """課題の遷移 (POST /issue/{key}/transitions) のリクエストペイロードを組み立てます。fields / update は遷移画面の入力項目です。"""
+    return {"transition": {"id": transition_id}, **build_edit_payload(fields, update)}
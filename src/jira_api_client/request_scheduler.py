@@ -0,0 +1,300 @@
+import asyncio
+import datetime
+import email.utils
+import random
+import threading
+import time
+import typing
+
+import requests
+
+# 冪等 (何度送っても結果が変わらない) とみなすHTTPメソッド
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# requests / httpx のどちらのレスポンスも受け付ける (status_code と headers のみ使用)
+ResponseT = typing.TypeVar("ResponseT")
+
+
+class JiraTokenBucket(object):
+    """
+    リクエストの送信ペースを制御するトークンバケット。
+
+    1秒あたり rate 個のトークンが補充され、最大 capacity 個まで蓄積されます。
+    acquire() はトークンを1つ消費し、トークンが無い場合は補充されるまで待機します。スレッドセーフです。
+    """
+
+    def __init__(self, rate: float, capacity: typing.Optional[float] = None):
+        """
+        Args:
+            rate (float): 1秒あたりに補充されるトークン数 (= 平均リクエスト数/秒)。
+            capacity (float, optional): 蓄積できるトークンの最大数 (= 瞬間的に許容するバースト数)。
+                                        省略時は rate と同じ (最低1)。
+        """
+        if rate <= 0:
+            raise ValueError("rate には正の値を指定してください。")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.__tokens = self.capacity
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        トークンを1つ予約し、そのトークンが補充されるまでの待機秒数を返します (待機はしません)。
+
+        トークンが無い場合は残数を負にして予約するため、同時に予約した呼び出し元は補充の順に1つずつ待機時間が延びます。
+        asyncio のコルーチンから、スレッドを止めずに送信ペースを制御するために使用します。
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.capacity, self.__tokens + (now - self.__updated) * self.rate)
+            self.__updated = now
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.rate
+
+    def acquire(self) -> float:
+        """トークンを1つ消費します。トークンが無い場合は補充されるまで待機し、待機した秒数を返します。"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class JiraRequestScheduler(object):
+    """
+    Jira APIへのリクエストを一元的にスケジューリングするクラス。
+
+    * トークンバケットで送信ペースを制限します (rate_per_second を指定した場合)。
+    * 429 / 503 などのレスポンスに対して Retry-After ヘッダ、または X-RateLimit-Reset ヘッダに従って待機し、
+      ジッター付きの指数バックオフで再試行します。
+    * 429 はJiraがリクエストを処理していないことを示すため全メソッドで再試行し、
+      それ以外の一時的なエラー (5xx・接続エラー) は冪等なリクエストのみ再試行します。
+    * レート制限を受けた場合は、他のスレッドからのリクエストも制限の解除まで待機させます。
+
+    1つのスケジューラを複数の JiraClinet / AsyncJiraClient で共有すると、それらの合計のリクエストレートを制御できます。
+    """
+
+    def __init__(self,
+                 max_retries: int = 5,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 60.0,
+                 rate_per_second: typing.Optional[float] = None,
+                 burst: typing.Optional[float] = None,
+                 retry_statuses: typing.Iterable[int] = (429, 502, 503, 504)):
+        """
+        Args:
+            max_retries (int): 1リクエストあたりの最大再試行回数 (デフォルト: 5)。0 の場合は再試行しません。
+            backoff_base (float): 指数バックオフの基準秒数 (デフォルト: 0.5)。n回目の再試行は最大 base * 2^n 秒待機します。
+            backoff_max (float): 1回の待機の最大秒数 (デフォルト: 60)。
+            rate_per_second (float, optional): 1秒あたりの最大リクエスト数。省略時はペース制御を行いません。
+            burst (float, optional): トークンバケットの容量 (瞬間的に許容するリクエスト数)。
+            retry_statuses (Iterable[int]): 再試行の対象とするHTTPステータスコード。
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.bucket = JiraTokenBucket(rate_per_second, burst) if rate_per_second else None
+        self.__blocked_until = 0.0
+        self.__lock = threading.Lock()
+
+    def send(self,
+             method: str,
+             send: typing.Callable[[], requests.Response],
+             retryable: typing.Optional[bool] = None,
+             replayable: bool = True) -> requests.Response:
+        """
+        send を呼び出してリクエストを送信し、必要に応じて待機・再試行したうえでレスポンスを返します。
+
+        再試行回数を使い切った場合は最後のレスポンスをそのまま返すため、
+        ステータスの確認 (raise_for_status) は呼び出し側で行ってください。
+
+        Args:
+            method (str): HTTPメソッド。冪等性の判定に使用します。
+            send (Callable[[], requests.Response]): 1回分のリクエストを送信する関数。
+            retryable (bool, optional): 5xx・接続エラーで再試行してよいかどうか。
+                                        省略時はメソッドが冪等かどうかで判定します。429 はこの値に関わらず再試行されます。
+            replayable (bool): リクエストを再送できるかどうか (デフォルト: True)。
+                               ストリームのボディなど再送できない場合は False を指定すると、一切再試行しません。
+
+        Raises:
+            requests.exceptions.RequestException: 再試行回数を使い切っても接続エラーが解消しない場合。
+        """
+        retryable, max_retries = self._retry_policy(method, retryable, replayable)
+        attempt = 0
+        while True:
+            delay = self._slot_delay()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                response = send()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+                delay = self._error_retry_delay(err, attempt, max_retries, retryable)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            delay = self._response_retry_delay(response, attempt, max_retries, retryable)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def send_async(self,
+                         method: str,
+                         send: typing.Callable[[], typing.Awaitable[ResponseT]],
+                         retryable: typing.Optional[bool] = None,
+                         replayable: bool = True,
+                         connection_errors: typing.Tuple[type, ...] = ()) -> ResponseT:
+        """
+        send() の asyncio 版です。待機は asyncio.sleep() で行うため、待機中もイベントループは止まりません。
+
+        再試行の条件・待機時間・レート制限による他のリクエストの待機は send() と同じで、
+        1つのスケジューラを JiraClinet と AsyncJiraClient で共有することもできます。
+
+        Args:
+            method (str): HTTPメソッド。
+            send (Callable[[], Awaitable]): 1回分のリクエストを送信するコルーチン関数。
+                                            レスポンス (httpx.Response など) は status_code と headers を持つ必要があります。
+            retryable (bool, optional): send() と同じ。
+            replayable (bool): send() と同じ。
+            connection_errors (Tuple[type, ...]): 接続エラーとして再試行の対象とする例外の型。
+
+        Raises:
+            Exception: 再試行回数を使い切っても接続エラーが解消しない場合、その例外。
+        """
+        retryable, max_retries = self._retry_policy(method, retryable, replayable)
+        attempt = 0
+        while True:
+            delay = self._slot_delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                response = await send()
+            except connection_errors as err:
+                delay = self._error_retry_delay(err, attempt, max_retries, retryable)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            delay = self._response_retry_delay(response, attempt, max_retries, retryable)
+            if delay is None:
+                return response
+            # stream=True で受信したレスポンスは接続を解放してから再試行する
+            close = getattr(response, "aclose", None)
+            if close is not None:
+                await close()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_policy(self, method: str, retryable: typing.Optional[bool], replayable: bool) -> typing.Tuple[bool, int]:
+        """(5xx・接続エラーで再試行するかどうか, 最大再試行回数) を返します。"""
+        if retryable is None:
+            retryable = method.upper() in IDEMPOTENT_METHODS
+        return retryable, self.max_retries if replayable else 0
+
+    def _slot_delay(self) -> float:
+        """レート制限の解除と、トークンバケットのトークンの補充を待つ秒数を返します。"""
+        with self.__lock:
+            delay = max(self.__blocked_until - time.monotonic(), 0.0)
+        if self.bucket is not None:
+            delay += self.bucket.reserve()
+        return delay
+
+    def _error_retry_delay(self, err: BaseException, attempt: int, max_retries: int,
+                           retryable: bool) -> typing.Optional[float]:
+        """接続エラーを再試行する場合は待機秒数を、しない場合は None を返します。"""
+        if not retryable or attempt >= max_retries:
+            return None
+        delay = self._backoff(attempt)
+        print(f"Jira API 接続エラーのため {delay:.1f} 秒後に再試行します ({attempt + 1}/{max_retries}): {err}")
+        return delay
+
+    def _response_retry_delay(self, response: typing.Any, attempt: int, max_retries: int,
+                              retryable: bool) -> typing.Optional[float]:
+        """
+        レスポンスを再試行する場合は待機秒数を、しない場合は None を返します。
+        429 の場合は、他のリクエストもその間待機するよう送信を止めます。
+        """
+        self._observe_rate_limit(response)
+        if response.status_code not in self.retry_statuses or attempt >= max_retries:
+            return None
+        if response.status_code != 429 and not retryable:
+            return None
+
+        delay = self._retry_delay(response, attempt)
+        print(f"Jira API ステータス {response.status_code} のため {delay:.1f} 秒後に再試行します "
+              f"({attempt + 1}/{max_retries})")
+        if response.status_code == 429:
+            # 他のスレッド・コルーチンからのリクエストも同じだけ待機させる
+            self._block_for(delay)
+        return delay
+
+    def _block_for(self, seconds: float) -> None:
+        with self.__lock:
+            self.__blocked_until = max(self.__blocked_until, time.monotonic() + seconds)
+
+    def _observe_rate_limit(self, response: typing.Any) -> None:
+        """成功したレスポンスでも残りリクエスト数が0の場合は、リセット時刻まで以降の送信を止めます。"""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None or response.status_code == 429:
+            return
+        try:
+            if int(remaining) > 0:
+                return
+        except ValueError:
+            return
+        reset_delay = _parse_rate_limit_reset(response.headers.get("X-RateLimit-Reset"))
+        if reset_delay:
+            self._block_for(min(reset_delay, self.backoff_max))
+
+    def _retry_delay(self, response: typing.Any, attempt: int) -> float:
+        """Retry-After / X-RateLimit-Reset ヘッダがあればそれに従い、無ければ指数バックオフで待機時間を決めます。"""
+        delay = _parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = _parse_rate_limit_reset(response.headers.get("X-RateLimit-Reset"))
+        if delay is None:
+            return self._backoff(attempt)
+        # 同時に制限を受けた複数のクライアントが一斉に再送しないよう、わずかなジッターを加える
+        return min(delay, self.backoff_max) + random.uniform(0, self.backoff_base)
+
+    def _backoff(self, attempt: int) -> float:
+        """ジッター付き指数バックオフ (Full Jitter) の待機秒数を返します。"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+
+def _parse_retry_after(value: typing.Optional[str]) -> typing.Optional[float]:
+    """Retry-After ヘッダ (秒数またはHTTP日付) を待機秒数に変換します。"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max((retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
+
+
+def _parse_rate_limit_reset(value: typing.Optional[str]) -> typing.Optional[float]:
+    """X-RateLimit-Reset ヘッダ (ISO 8601 の日時, 例: '2024-01-01T12:00Z') を待機秒数に変換します。"""
+    if not value:
+        return None
+    try:
+        reset_at = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=datetime.timezone.utc)
+    return max((reset_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
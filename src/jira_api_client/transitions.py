@@ -0,0 +1,77 @@
+import threading
+import typing
+
+from jira_api_client.models.base import JiraStatusNameEnum
+from jira_api_client.models.issue_update import JiraTransition
+
+# --- ワークフローの遷移IDの解決とキャッシュ ---
+# 課題に対して実行できる遷移は、ワークフロー (プロジェクトと課題タイプで決まる) と課題の現在のステータスで決まります。
+# 一括遷移では (プロジェクト, 課題タイプ, 現在のステータス) ごとに1件の課題の遷移を取得してキャッシュし、
+# 同じ組み合わせの課題では遷移の一覧を取得し直さずに遷移IDを解決します。
+
+# (プロジェクトID, 課題タイプID, 現在のステータスID)
+WorkflowKey = typing.Tuple[str, str, str]
+
+
+def workflow_key(issue: typing.Dict[str, typing.Any]) -> WorkflowKey:
+    """課題 (デコードしたJSON) から、遷移の一覧を共有する (プロジェクトID, 課題タイプID, 現在のステータスID) を返します。"""
+    fields = issue.get("fields") or {}
+    project = fields.get("project") or {}
+    issue_type = fields.get("issuetype") or {}
+    status = fields.get("status") or {}
+    return str(project.get("id")), str(issue_type.get("id")), str(status.get("id"))
+
+
+def status_name(target: typing.Union[JiraStatusNameEnum, str]) -> str:
+    """遷移先のステータス名を、比較用に大文字小文字を区別しない形に正規化します。"""
+    return (target.value if isinstance(target, JiraStatusNameEnum) else target).strip().casefold()
+
+
+def find_transition(transitions: typing.Iterable[JiraTransition],
+                    target: typing.Union[JiraStatusNameEnum, str]) -> typing.Optional[JiraTransition]:
+    """
+    遷移の一覧から、target のステータスへの遷移を返します。
+
+    遷移先のステータス名が一致する遷移を優先し、無い場合は遷移の表示名が一致する遷移を返します。
+    どちらも無い場合は None。
+    """
+    name = status_name(target)
+    transitions = list(transitions)
+    for transition in transitions:
+        if transition.to.name.casefold() == name:
+            return transition
+    for transition in transitions:
+        if transition.name.casefold() == name:
+            return transition
+    return None
+
+
+class JiraTransitionCache(object):
+    """
+    ワークフロー (プロジェクト・課題タイプ・現在のステータス) ごとの遷移の一覧のキャッシュ。
+
+    クライアントごとに1つ保持され、複数の一括遷移の呼び出しで共有されます。スレッドセーフです。
+    Jira側でワークフローを変更した場合は clear() で破棄してください。
+    """
+
+    def __init__(self):
+        self.__transitions: typing.Dict[WorkflowKey, typing.List[JiraTransition]] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__transitions)
+
+    def get(self, key: WorkflowKey) -> typing.Optional[typing.List[JiraTransition]]:
+        """key の遷移の一覧を返します。キャッシュされていない場合は None。"""
+        with self.__lock:
+            return self.__transitions.get(key)
+
+    def put(self, key: WorkflowKey, transitions: typing.List[JiraTransition]) -> None:
+        """key の遷移の一覧を保存します。"""
+        with self.__lock:
+            self.__transitions[key] = transitions
+
+    def clear(self) -> None:
+        """キャッシュした全ての遷移の一覧を破棄します。"""
+        with self.__lock:
+            self.__transitions.clear()
@@ -0,0 +1,84 @@
+"""
+テスト共通のフィクスチャ。
+
+課題・添付ファイルのJSONはベンチマークと同じ合成データ (benchmarks/fixtures.py) を使用します。
+JiraClinet のテストには、テストごとに応答を差し替えられるローカルのHTTPサーバー (ScriptedJiraServer) を使用します。
+"""
+import threading
+import typing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from mock_jira import MockJiraServer
+
+# (ステータス, ヘッダ, ボディ)
+Reply = typing.Tuple[int, typing.Dict[str, str], bytes]
+Handler = typing.Callable[["RecordedRequest"], Reply]
+
+
+class RecordedRequest(object):
+    """ScriptedJiraServer が受信したリクエスト。"""
+    __slots__ = ("method", "path", "headers", "body")
+
+    def __init__(self, method: str, path: str, headers: typing.Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "ScriptedJiraServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        pass
+
+    def _handle(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        request = RecordedRequest(self.command, self.path, dict(self.headers), body)
+        with self.server.lock:
+            self.server.requests.append(request)
+        status, headers, data = self.server.handler(request)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class ScriptedJiraServer(ThreadingHTTPServer):
+    """handler に設定した関数でリクエストに応答するHTTPサーバー。受信したリクエストは requests に記録されます。"""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.handler: Handler = lambda request: (404, {}, b'{"errorMessages": ["Not Found"]}')
+        self.requests: typing.List[RecordedRequest] = []
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/rest/api/3/"
+
+
+@pytest.fixture
+def jira_server() -> typing.Iterator[ScriptedJiraServer]:
+    server = ScriptedJiraServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def mock_jira() -> typing.Iterator[MockJiraServer]:
+    """検索・一括取得・遷移・編集・添付ファイルを実装したモックサーバー (benchmarks/mock_jira.py)。課題は20件。"""
+    with MockJiraServer(total_issues=20, max_page_size=10) as server:
+        yield server
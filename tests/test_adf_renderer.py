@@ -0,0 +1,78 @@
+import pytest
+
+from jira_api_client.adf_renderer import render_html, render_markdown, render_plain_text
+from jira_api_client.models.issue import AdfDocument
+
+
+def _text(text, *marks):
+    return {"type": "text", "text": text, "marks": list(marks)}
+
+
+def _link(href):
+    return {"type": "link", "attrs": {"href": href}}
+
+
+def _doc(*content):
+    return {"type": "doc", "version": 1, "content": list(content)}
+
+
+def _paragraph(*content):
+    return {"type": "paragraph", "content": list(content)}
+
+
+def _inline_card(url):
+    return {"type": "inlineCard", "attrs": {"url": url}}
+
+
+def _media_single(media_id, url):
+    return {"type": "mediaSingle", "content": [{"type": "media", "attrs": {"id": media_id, "url": url}}]}
+
+
+@pytest.mark.parametrize("href",
+                         ["javascript:alert(1)", " JaVaScRiPt:alert(1)", "java\tscript:alert(1)", "data:text/html,x"])
+def test_html_drops_links_with_unsafe_schemes(href):
+    rendered = render_html(_doc(_paragraph(_text("click", _link(href)))))
+    assert rendered == "<p>click</p>"
+
+
+@pytest.mark.parametrize("href", ["https://example.com/a?b=1&c=2", "mailto:user@example.com", "/browse/PROJ-1"])
+def test_html_keeps_allowed_links(href):
+    rendered = render_html(_doc(_paragraph(_text("click", _link(href)))))
+    assert rendered.startswith('<p><a href="') and rendered.endswith('">click</a></p>')
+
+
+def test_html_inline_card_and_media_use_the_same_rule():
+    doc = _doc(_paragraph(_inline_card("javascript:alert(1)")), _media_single("m1", "javascript:alert(1)"),
+               _media_single("m2", "https://example.com/a.png"))
+    rendered = render_html(doc)
+    assert "href" not in rendered
+    assert '<span class="media" data-id="m1"></span>' in rendered
+    assert '<img src="https://example.com/a.png" alt="m2">' in rendered
+
+
+def test_markdown_link_destination_is_bracketed():
+    rendered = render_markdown(_doc(_paragraph(_text("doc", _link("https://example.com/a b)<c>")))))
+    assert rendered == "[doc](<https://example.com/a b)\\<c\\>>)\n"
+
+
+def test_markdown_unsafe_inline_card_is_not_an_autolink():
+    rendered = render_markdown(_doc(_paragraph(_inline_card("javascript:alert(1)"))))
+    assert rendered == "javascript:alert(1)\n"
+
+
+@pytest.mark.parametrize("text, expected", [("plain", "`plain`"), ("a`b``c", "```a`b``c```"), ("`x", "`` `x ``")])
+def test_markdown_code_mark_fence_is_longer_than_backtick_runs(text, expected):
+    assert render_markdown(_doc(_paragraph(_text(text, {"type": "code"})))) == expected + "\n"
+
+
+def test_markdown_code_block_fence_is_longer_than_backtick_runs():
+    doc = _doc({"type": "codeBlock", "content": [{"type": "text", "text": "a\n```\nb"}]})
+    assert render_markdown(doc) == "````\na\n```\nb\n````\n"
+
+
+def test_model_and_dict_input_render_identically():
+    bullet_list = {"type": "bulletList", "content": [{"type": "listItem", "content": [_paragraph(_text("item"))]}]}
+    raw = _doc(_paragraph(_text("bold", {"type": "strong"}), _text(" and "), _text("link", _link("/x"))), bullet_list)
+    document = AdfDocument.model_validate(raw)
+    for render in (render_plain_text, render_markdown, render_html):
+        assert render(document) == render(raw)
@@ -0,0 +1,201 @@
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+from fixtures import attachment
+
+from jira_api_client import request_scheduler
+from jira_api_client.async_jira_client import AsyncJiraClient
+from jira_api_client.instrumentation import JiraInMemoryMetricsCollector
+from jira_api_client.models.attachment import JiraAttachment
+from jira_api_client.models.base import JiraParseModeEnum
+from jira_api_client.request_scheduler import JiraRequestScheduler
+
+BASE_URL = "https://jira.example.com/rest/api/3/"
+
+
+def test_download_attachment_to_bare_filename(tmp_path, monkeypatch):
+    content = b"x" * 20000
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=content))
+    target = JiraAttachment.model_validate(attachment(1, 0, size=len(content)))
+    monkeypatch.chdir(tmp_path)
+
+    async def main() -> None:
+        async with AsyncJiraClient(BASE_URL, "user@example.com", "token", transport=transport) as client:
+            await client.download_attachment(target, "a.txt")
+
+    asyncio.run(main())
+    with open(os.path.join(tmp_path, "a.txt"), "rb") as f:
+        assert f.read() == content
+
+
+def test_upload_attachments_streams_multiple_parts(tmp_path):
+    path = tmp_path / "report.txt"
+    path.write_bytes(b"from a path")
+    received = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received["body"] = request.read()
+        received["headers"] = request.headers
+        return httpx.Response(200, json=[attachment(1, 0), attachment(1, 1)])
+
+    async def main():
+        async with AsyncJiraClient(BASE_URL, "user@example.com", "token",
+                                   transport=httpx.MockTransport(handler)) as client:
+            with open(path, "rb") as f:
+                return await client.upload_attachments("PROJ-1", [f, ("data.bin", b"from bytes")])
+
+    uploaded = asyncio.run(main())
+    assert [item.id for item in uploaded] == ["10", "11"]
+    body = received["body"]
+    assert b'filename="report.txt"' in body and b"from a path" in body
+    assert b'filename="data.bin"' in body and b"from bytes" in body
+    assert int(received["headers"]["Content-Length"]) == len(body)
+    assert received["headers"]["X-Atlassian-Token"] == "no-check"
+
+
+def _scripted_transport(replies):
+    """replies を順に返す (例外の場合は送出する) MockTransport と、受信したリクエストのリストを返します。"""
+    replies = list(replies)
+    received = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    return httpx.MockTransport(handler), received
+
+
+def _client(transport: httpx.MockTransport, **kwargs) -> AsyncJiraClient:
+    scheduler = JiraRequestScheduler(max_retries=3, backoff_base=0.001)
+    return AsyncJiraClient(BASE_URL,
+                           "user@example.com",
+                           "token",
+                           parse_mode=JiraParseModeEnum.RAW,
+                           scheduler=scheduler,
+                           transport=transport,
+                           **kwargs)
+
+
+def test_request_retries_429_after_retry_after():
+    page = {"issues": [{"id": "1", "key": "PROJ-1", "fields": {}}], "isLast": True}
+    transport, received = _scripted_transport([
+        httpx.Response(429, headers={"Retry-After": "0.05"}),
+        httpx.Response(200, json=page),
+    ])
+    metrics = JiraInMemoryMetricsCollector()
+
+    async def main():
+        async with _client(transport, metrics=metrics) as client:
+            return await client.get_tickets_by_jql("project = PROJ")
+
+    started = time.monotonic()
+    results = asyncio.run(main())
+    assert [issue["key"] for issue in results.issues] == ["PROJ-1"]
+    assert len(received) == 2
+    assert time.monotonic() - started >= 0.05
+    assert metrics.requests[-1].retries == 1
+
+
+def test_request_retries_connection_errors_for_idempotent_requests():
+    page = {"issues": [], "isLast": True}
+    transport, received = _scripted_transport([httpx.ConnectError("refused"), httpx.Response(200, json=page)])
+
+    async def main():
+        async with _client(transport) as client:
+            return await client.get_tickets_by_jql("project = PROJ")
+
+    assert asyncio.run(main()).issues == []
+    assert len(received) == 2
+
+
+def test_create_ticket_is_not_retried_on_5xx_but_is_on_429():
+    created = {"id": "10001", "key": "PROJ-1", "self": BASE_URL + "issue/10001"}
+    transport, received = _scripted_transport([
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(503),
+    ])
+
+    async def main():
+        async with _client(transport) as client:
+            return await client.create_ticket("PROJ", "summary")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+    # 429 は再送し、POST の 503 は (重複作成を避けるため) 再送しない
+    assert len(received) == 2
+
+    transport, received = _scripted_transport([httpx.Response(201, json=created)])
+
+    async def create():
+        async with _client(transport) as client:
+            return await client.create_ticket("PROJ", "summary")
+
+    assert asyncio.run(create()).key == "PROJ-1"
+
+
+def test_retries_give_up_after_max_retries():
+    transport, received = _scripted_transport([httpx.Response(503)] * 4)
+
+    async def main():
+        async with _client(transport) as client:
+            return await client.get_tickets_by_jql("project = PROJ")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+    assert len(received) == 4
+
+
+def test_download_retry_backoff_does_not_hold_the_concurrency_slot(tmp_path, monkeypatch):
+    monkeypatch.setattr(request_scheduler.random, "uniform", lambda low, high: high)  # バックオフのジッターを固定する
+    target = JiraAttachment.model_validate(attachment(1, 0, size=3))
+    replies = [httpx.Response(503), httpx.Response(200, content=b"abc")]
+    received = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "search" in request.url.path:
+            received.append("search")
+            return httpx.Response(200, json={"issues": [], "isLast": True})
+        received.append("download")
+        return replies.pop(0)
+
+    async def main():
+        scheduler = JiraRequestScheduler(max_retries=3, backoff_base=0.3)
+        async with AsyncJiraClient(BASE_URL,
+                                   "user@example.com",
+                                   "token",
+                                   max_concurrency=1,
+                                   scheduler=scheduler,
+                                   transport=httpx.MockTransport(handler)) as client:
+
+            async def search():
+                await asyncio.sleep(0.05)
+                return await client.get_tickets_by_jql("project = PROJ")
+
+            await asyncio.gather(client.download_attachment(target, str(tmp_path / "a.bin")), search())
+            # 枠が返されていれば、続けて送信できる
+            await asyncio.wait_for(client.get_tickets_by_jql("project = PROJ"), timeout=1)
+
+    asyncio.run(main())
+    # ダウンロードの再試行の待機中に、検索が唯一の枠を使って送信される
+    assert received == ["download", "search", "download", "search"]
+    assert (tmp_path / "a.bin").read_bytes() == b"abc"
+
+
+def test_download_errors_return_the_concurrency_slot_once(tmp_path):
+    target = JiraAttachment.model_validate(attachment(1, 0, size=3))
+    transport, _ = _scripted_transport([httpx.Response(404, json={"errorMessages": ["Not Found"]})])
+
+    async def main():
+        async with AsyncJiraClient(BASE_URL, "user@example.com", "token", max_concurrency=1,
+                                   transport=transport) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.download_attachment(target, str(tmp_path / "a.bin"))
+            return client._semaphore()._value
+
+    assert asyncio.run(main()) == 1
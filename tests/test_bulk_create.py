@@ -0,0 +1,50 @@
+import json
+
+from jira_api_client.jira_client import JiraClinet
+
+
+def _created(n):
+    return {"id": str(10000 + n), "key": f"PROJ-{n}", "self": f"https://example.atlassian.net/rest/api/3/issue/{n}"}
+
+
+def _tickets(count):
+    return [{"project_key": "PROJ", "summary": f"ticket {n}"} for n in range(count)]
+
+
+def _reply(status, body):
+    data = body if isinstance(body, bytes) else json.dumps(body).encode()
+    return status, {"Content-Type": "application/json"}, data
+
+
+def test_bulk_create_maps_partial_failures_to_input_indexes(jira_server):
+    error = {"status": 400, "failedElementNumber": 1, "elementErrors": {"errors": {"summary": "too long"}}}
+    jira_server.handler = lambda request: _reply(201, {"issues": [_created(0), _created(2)], "errors": [error]})
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        result = client.create_tickets_bulk(_tickets(3))
+    assert [issue.key if issue else None for issue in result.issues] == ["PROJ-0", None, "PROJ-2"]
+    assert [(e.index, e.errors) for e in result.errors] == [(1, {"summary": "too long"})]
+
+
+def test_malformed_items_fail_only_their_chunk(jira_server):
+    malformed = {"issues": [_created(0), {"id": "10001"}], "errors": []}
+    replies = iter([_reply(201, malformed), _reply(201, {"issues": [_created(2), _created(3)], "errors": []})])
+    jira_server.handler = lambda request: next(replies)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        result = client.create_tickets_bulk(_tickets(4), chunk_size=2)
+    assert [issue.key if issue else None for issue in result.issues] == [None, None, "PROJ-2", "PROJ-3"]
+    assert [(e.index, e.status) for e in result.errors] == [(0, 201), (1, 201)]
+
+
+def test_undecodable_response_is_reported_per_chunk(jira_server):
+    jira_server.handler = lambda request: _reply(201, b"[not json")
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        result = client.create_tickets_bulk(_tickets(2))
+    assert result.created == []
+    assert [e.index for e in result.errors] == [0, 1]
+
+
+def test_non_object_error_response_raises_http_error_per_chunk(jira_server):
+    jira_server.handler = lambda request: _reply(400, ["unexpected"])
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        result = client.create_tickets_bulk(_tickets(2))
+    assert [(e.index, e.status) for e in result.errors] == [(0, 400), (1, 400)]
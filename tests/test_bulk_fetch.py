@@ -0,0 +1,51 @@
+import pytest
+from mock_jira import MockJiraServer
+
+from jira_api_client.instrumentation import JiraInMemoryMetricsCollector
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.models.base import JiraParseModeEnum
+from jira_api_client.request_builders import BULK_FETCH_LIMIT
+
+
+def _fetch_requests(metrics):
+    return [event for event in metrics.requests if event.endpoint == "get_issues"]
+
+
+def test_keys_beyond_the_limit_are_split_into_chunks():
+    total = BULK_FETCH_LIMIT * 2 + 50
+    keys = [f"PROJ-{n}" for n in range(total)]
+    metrics = JiraInMemoryMetricsCollector()
+    with MockJiraServer(total_issues=total) as server, \
+            JiraClinet(server.base_url, "user@example.com", "token", metrics=metrics) as client:
+        result = client.get_issues(keys + ["proj-0"], fields=["status"], parse_mode=JiraParseModeEnum.RAW)
+    # 大文字に正規化して重複を除いたキーが、要求順に BULK_FETCH_LIMIT 件ずつ取得される
+    assert list(result.issues) == keys
+    assert result.moved == {} and result.missing == [] and result.errors == []
+    assert len(_fetch_requests(metrics)) == 3
+
+
+def test_moved_keys_map_back_to_the_requested_key(mock_jira):
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        result = client.get_issues(["PROJ-1", "old-2", "10003"], parse_mode=JiraParseModeEnum.RAW, chunk_size=2)
+    assert list(result.issues) == ["PROJ-1", "OLD-2", "10003"]
+    assert result.issues["OLD-2"]["key"] == "PROJ-2"
+    assert result.issues["10003"]["key"] == "PROJ-3"
+    assert result.moved == {"OLD-2": "PROJ-2"}
+
+
+def test_missing_keys_are_reported_without_failing_the_chunk(mock_jira):
+    metrics = JiraInMemoryMetricsCollector()
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token", metrics=metrics) as client:
+        result = client.get_issues(["PROJ-1", "PROJ-999", "OTHER-1", "PROJ-2"], parse_mode=JiraParseModeEnum.FULL)
+    assert list(result.issues) == ["PROJ-1", "PROJ-2"]
+    assert result.issues["PROJ-2"].key == "PROJ-2"
+    assert sorted(result.missing) == ["OTHER-1", "PROJ-999"]
+    assert result.errors == []
+    assert len(_fetch_requests(metrics)) == 1
+
+
+@pytest.mark.parametrize("chunk_size", [0, BULK_FETCH_LIMIT + 1])
+def test_chunk_size_must_be_within_the_limit(mock_jira, chunk_size):
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        with pytest.raises(ValueError):
+            client.get_issues(["PROJ-1"], chunk_size=chunk_size)
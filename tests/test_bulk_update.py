@@ -0,0 +1,73 @@
+import mock_jira as mock_jira_module
+
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.models.base import JiraParseModeEnum
+from jira_api_client.models.issue_update import JiraIssueUpdateStatusEnum
+
+UPDATED = JiraIssueUpdateStatusEnum.UPDATED
+SKIPPED = JiraIssueUpdateStatusEnum.SKIPPED
+FAILED = JiraIssueUpdateStatusEnum.FAILED
+
+
+def _statuses(result):
+    return [(item.key, item.status) for item in result.results]
+
+
+def _current(client, keys, field):
+    issues = client.get_issues(keys, fields=[field], parse_mode=JiraParseModeEnum.RAW).issues
+    return {key: issue["fields"][field] for key, issue in issues.items()}
+
+
+def _reject_transition_of(monkeypatch, rejected):
+    """rejected の課題の遷移だけを 400 で拒否するようモックサーバーを変更します。"""
+    original = mock_jira_module._Handler._transition
+
+    def transition(handler, key, payload):
+        if key == rejected:
+            handler._send_json({"errorMessages": ["rejected"], "errors": {"resolution": "required"}}, 400)
+        else:
+            original(handler, key, payload)
+
+    monkeypatch.setattr(mock_jira_module._Handler, "_transition", transition)
+
+
+def test_transitions_are_resolved_by_status_or_transition_name(mock_jira):
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        result = client.transition_issues(["PROJ-1", "proj-2", "PROJ-1"], "done")
+        assert _statuses(result) == [("PROJ-1", UPDATED), ("PROJ-2", UPDATED)]
+        assert {item.transition_id for item in result.results} == {"12"}
+        assert {status["name"] for status in _current(client, ["PROJ-1", "PROJ-2"], "status").values()} == {"Done"}
+
+        # 既に目的のステータスの課題は遷移しない
+        assert _statuses(client.transition_issues(["PROJ-1"], "Done")) == [("PROJ-1", SKIPPED)]
+
+        # 遷移先のステータス名が一致しない場合は、遷移の表示名で探す
+        result = client.transition_issues(["PROJ-1"], "Move to In Progress")
+        assert (result.results[0].status, result.results[0].transition_id) == (UPDATED, "10")
+
+
+def test_transition_failures_are_reported_per_issue(mock_jira, monkeypatch):
+    _reject_transition_of(monkeypatch, "PROJ-2")
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        result = client.transition_issues(["PROJ-1", "PROJ-2", "PROJ-999", "PROJ-3"], "To Be Released", max_workers=2)
+        unknown = client.transition_issues(["PROJ-4"], "No Such Status")
+    assert _statuses(result) == [("PROJ-1", UPDATED), ("PROJ-2", FAILED), ("PROJ-999", FAILED), ("PROJ-3", UPDATED)]
+    rejected = result.results[1]
+    assert (rejected.http_status, rejected.errorMessages, rejected.errors) == (400, ["rejected"], {
+        "resolution": "required"
+    })
+    assert [item.key for item in result.failed] == ["PROJ-2", "PROJ-999"]
+    assert unknown.results[0].status == FAILED
+    assert "No Such Status" in unknown.results[0].errorMessages[0]
+
+
+def test_edit_failures_do_not_stop_other_issues(mock_jira):
+    edits = {"PROJ-1": {"summary": "first"}, "PROJ-999": {"summary": "missing"}, "PROJ-2": {"summary": "second"}}
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        result = client.edit_issues(edits, fields={"labels": ["bulk"]}, max_workers=3)
+        summaries = _current(client, ["PROJ-1", "PROJ-2"], "summary")
+        labels = _current(client, ["PROJ-1", "PROJ-2"], "labels")
+    assert _statuses(result) == [("PROJ-1", UPDATED), ("PROJ-999", FAILED), ("PROJ-2", UPDATED)]
+    assert result.results[1].http_status == 404
+    assert summaries == {"PROJ-1": "first", "PROJ-2": "second"}
+    assert labels == {"PROJ-1": ["bulk"], "PROJ-2": ["bulk"]}
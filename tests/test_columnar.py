@@ -0,0 +1,137 @@
+import datetime
+
+import pytest
+
+from jira_api_client.columnar import (
+    DEFAULT_COLUMNS,
+    JiraColumn,
+    JiraColumnarExporter,
+    JiraColumnBuffer,
+    JiraColumnTypeEnum,
+    arrow_schema,
+)
+from jira_api_client.jira_client import JiraClinet
+
+pa = pytest.importorskip("pyarrow")
+np = pytest.importorskip("numpy")
+
+COLUMNS = (
+    JiraColumn("key", ("key",), JiraColumnTypeEnum.STRING),
+    JiraColumn("status", ("fields", "status", "name"), JiraColumnTypeEnum.STRING),
+    JiraColumn("points", ("fields", "points"), JiraColumnTypeEnum.FLOAT64),
+    JiraColumn("timespent", ("fields", "timespent"), JiraColumnTypeEnum.INT64),
+    JiraColumn("flagged", ("fields", "flagged"), JiraColumnTypeEnum.BOOL),
+    JiraColumn("updated", ("fields", "updated"), JiraColumnTypeEnum.TIMESTAMP),
+    JiraColumn("labels", ("fields", "labels"), JiraColumnTypeEnum.STRING_LIST),
+)
+UPDATED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _issues():
+    complete = {
+        "status": {
+            "name": "Done"
+        },
+        "points": 3.5,
+        "timespent": 60,
+        "flagged": True,
+        "updated": "2024-01-01T09:00:00.000+0900",
+        "labels": ["a", "b"],
+    }
+    # 途中の値が None・欠落・型の不一致の場合は欠損値になる
+    broken = {"status": None, "points": "n/a", "timespent": "?", "flagged": "yes", "updated": "not a date"}
+    return [{"key": "PROJ-1", "fields": complete}, {"key": "PROJ-2", "fields": broken}, {"key": "PROJ-3"}]
+
+
+def test_record_batch_has_the_schema_types_and_nulls():
+    buffer = JiraColumnBuffer(COLUMNS)
+    buffer.append(_issues())
+    batch = buffer.to_record_batch()
+    assert batch.schema == arrow_schema(COLUMNS)
+    assert batch.schema.field("updated").type == pa.timestamp("ms", tz="UTC")
+    assert batch.schema.field("labels").type == pa.list_(pa.string())
+    assert batch.to_pydict() == {
+        "key": ["PROJ-1", "PROJ-2", "PROJ-3"],
+        "status": ["Done", None, None],
+        "points": [3.5, None, None],
+        "timespent": [60, None, None],
+        "flagged": [True, None, None],
+        "updated": [UPDATED, None, None],
+        "labels": [["a", "b"], None, None],
+    }
+    assert [batch.column(name).null_count for name in ("key", "status", "labels")] == [0, 2, 2]
+
+
+def test_numpy_arrays_use_nan_nat_and_object_for_missing_values():
+    buffer = JiraColumnBuffer(COLUMNS)
+    buffer.append(_issues())
+    arrays = buffer.to_numpy()
+    assert arrays["key"].dtype == object and list(arrays["key"]) == ["PROJ-1", "PROJ-2", "PROJ-3"]
+    # 欠損値を含む整数の列は float64 (NaN)、真偽値の列は object 型になる
+    assert arrays["timespent"].dtype == np.float64 and np.isnan(arrays["timespent"][1:]).all()
+    assert arrays["flagged"].dtype == object and list(arrays["flagged"]) == [True, None, None]
+    assert arrays["updated"].dtype == np.dtype("datetime64[ms]")
+    assert arrays["updated"][0] == np.datetime64("2024-01-01T00:00:00", "ms")
+    assert np.isnat(arrays["updated"][1:]).all()
+
+    complete = JiraColumnBuffer(COLUMNS)
+    complete.append(_issues()[:1])
+    arrays = complete.to_numpy()
+    assert arrays["timespent"].dtype == np.int64 and arrays["flagged"].dtype == np.bool_
+
+
+def test_buffer_rejects_duplicate_names_and_clears():
+    with pytest.raises(ValueError):
+        JiraColumnBuffer(COLUMNS[:1] * 2)
+    buffer = JiraColumnBuffer(COLUMNS)
+    buffer.append(_issues())
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.to_record_batch().num_rows == 0
+
+
+def test_parquet_and_arrow_files_round_trip_in_batches(mock_jira, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        exporter = JiraColumnarExporter(client, batch_size=7, page_size=5)
+        assert exporter.write_parquet("project = PROJ", str(tmp_path / "issues.parquet")) == 20
+        assert exporter.write_arrow("project = PROJ", str(tmp_path / "issues.arrow"), max_results=12) == 12
+        arrays = exporter.to_numpy("project = PROJ")
+
+    parquet = pq.ParquetFile(tmp_path / "issues.parquet")
+    assert parquet.schema_arrow == arrow_schema(DEFAULT_COLUMNS)
+    assert parquet.metadata.num_row_groups == 3  # 7件ずつの RecordBatch ごとに追記される
+    table = parquet.read()
+    assert table.column("key").to_pylist() == [f"PROJ-{n}" for n in range(20)]
+    assert table.column("created").null_count == 0
+
+    with pa.OSFile(str(tmp_path / "issues.arrow"), "rb") as source:
+        arrow = pa.ipc.open_file(source)
+        assert arrow.num_record_batches == 2
+        assert arrow.read_all().column("key").to_pylist() == [f"PROJ-{n}" for n in range(12)]
+
+    assert list(arrays["key"]) == [f"PROJ-{n}" for n in range(20)]
+    assert arrays["created"].dtype == np.dtype("datetime64[ms]")
+    assert np.array_equal(arrays["created"], table.column("created").to_numpy())
+
+
+class _Pages(object):
+    """iter_pages() で固定のページを返すクライアントの代わり。"""
+
+    def __init__(self, *pages):
+        self.pages = pages
+
+    def iter_pages(self, jql, **kwargs):
+        for issues in self.pages:
+            yield type("Page", (), {"issues": issues})()
+
+
+def test_to_numpy_concatenates_batches_with_and_without_missing_values():
+    first = [{"key": "PROJ-1", "fields": {"timespent": 60}}]
+    second = [{"key": "PROJ-2", "fields": {}}]
+    exporter = JiraColumnarExporter(_Pages(first, second), columns=COLUMNS, batch_size=1)
+    arrays = exporter.to_numpy("project = PROJ")
+    assert arrays["timespent"].dtype == np.float64
+    assert arrays["timespent"][0] == 60 and np.isnan(arrays["timespent"][1])
+
+    empty = JiraColumnarExporter(_Pages(), columns=COLUMNS).to_numpy("project = PROJ")
+    assert {name: len(array) for name, array in empty.items()} == {column.name: 0 for column in COLUMNS}
@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+import requests
+
+from jira_api_client.jira_client import JiraClinet
+
+
+def test_repeated_calls_reuse_one_session(mock_jira, monkeypatch):
+    created = []
+    original = requests.Session
+
+    def counting_session():
+        session = original()
+        created.append(session)
+        return session
+
+    monkeypatch.setattr(requests, "Session", counting_session)
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        for _ in range(30):
+            result = client.get_issues(["PROJ-1", "PROJ-2", "PROJ-3"], chunk_size=1, max_workers=3)
+            assert sorted(result.issues) == ["PROJ-1", "PROJ-2", "PROJ-3"]
+    # 呼び出しごとに作られるスレッドプールのスレッドの数だけセッションが増えない
+    assert len(created) == 1
+
+
+def test_session_is_shared_between_threads_and_closed_with_the_client(mock_jira):
+    client = JiraClinet(mock_jira.base_url, "user@example.com", "token")
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(client._session())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(session) for session in sessions}) == 1
+
+    client.close()
+    assert client.closed
+    with pytest.raises(RuntimeError):
+        client._session()
@@ -0,0 +1,83 @@
+import os
+
+from fixtures import attachment
+
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.models.attachment import JiraAttachment, JiraDownloadStatusEnum
+
+DATA = bytes(range(256)) * 40
+
+
+def _attachment(jira_server, attachment_id, size=len(DATA)):
+    data = attachment(1, attachment_id, size=size)
+    data["content"] = f"{jira_server.base_url}attachment/content/{attachment_id}"
+    return JiraAttachment.model_validate(data)
+
+
+def _serve(jira_server, honor_range=True, body=DATA):
+
+    def handler(request):
+        range_header = request.headers.get("Range")
+        if range_header and honor_range:
+            start = int(range_header[len("bytes="):-1])
+            return 206, {"Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}"}, body[start:]
+        return 200, {}, body
+
+    jira_server.handler = handler
+
+
+def _ranges(jira_server):
+    return [request.headers.get("Range") for request in jira_server.requests]
+
+
+def test_partial_file_is_resumed_with_range(jira_server, tmp_path):
+    _serve(jira_server)
+    item = _attachment(jira_server, 1)
+    save_path = tmp_path / f"{item.id}_{item.filename}"
+    save_path.write_bytes(DATA[:1000])
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        report = client.download_attachments([item], save_dir=str(tmp_path))
+    result = report.results[0]
+    assert (result.status, result.bytes_transferred) == (JiraDownloadStatusEnum.RESUMED, len(DATA) - 1000)
+    assert _ranges(jira_server) == ["bytes=1000-"]
+    assert save_path.read_bytes() == DATA
+
+
+def test_ignored_range_rewrites_the_file(jira_server, tmp_path):
+    _serve(jira_server, honor_range=False)
+    item = _attachment(jira_server, 1)
+    save_path = tmp_path / f"{item.id}_{item.filename}"
+    save_path.write_bytes(b"x" * 1000)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        result = client.download_attachments([item], save_dir=str(tmp_path)).results[0]
+    assert result.status == JiraDownloadStatusEnum.DOWNLOADED
+    assert save_path.read_bytes() == DATA
+
+
+def test_complete_files_are_skipped_without_a_request(jira_server, tmp_path):
+    _serve(jira_server)
+    item = _attachment(jira_server, 1)
+    (tmp_path / f"{item.id}_{item.filename}").write_bytes(DATA)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        report = client.download_attachments([item], save_dir=str(tmp_path))
+    assert report.results[0].status == JiraDownloadStatusEnum.SKIPPED
+    assert jira_server.requests == []
+
+
+def test_size_mismatch_and_http_errors_fail_only_that_file(jira_server, tmp_path):
+    _serve(jira_server)
+    good = _attachment(jira_server, 1)
+    truncated = _attachment(jira_server, 2, size=len(DATA) + 10)  # サーバーのファイルが記録より小さい
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        report = client.download_attachments([good, truncated], save_dir=str(tmp_path), max_workers=2)
+    statuses = [result.status for result in report.results]
+    assert statuses == [JiraDownloadStatusEnum.DOWNLOADED, JiraDownloadStatusEnum.FAILED]
+    assert "サイズが一致しません" in report.results[1].error
+    assert report.bytes_transferred == len(DATA)
+
+    jira_server.handler = lambda request: (404, {}, b'{"errorMessages": ["Not Found"]}')
+    missing = _attachment(jira_server, 3)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        result = client.download_attachments([missing], save_dir=str(tmp_path)).results[0]
+    assert result.status == JiraDownloadStatusEnum.FAILED
+    assert not os.path.exists(result.save_path)
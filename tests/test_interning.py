@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from fixtures import build_search_page
+
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.models.base import JiraParseModeEnum, JiraUser
+from jira_api_client.models.interning import INTERN_CONTEXT_KEY, JiraInternCache
+from jira_api_client.parsing import JiraSearchPageParser
+
+
+def _parse(page, cache):
+    return JiraSearchPageParser(False, JiraParseModeEnum.FULL, intern_cache=cache).parse_json(json.dumps(page).encode())
+
+
+def test_repeated_entities_share_one_instance():
+    cache = JiraInternCache()
+    issues = _parse(build_search_page(0, 10, users=2), cache).issues
+    by_account = {}
+    for issue in issues:
+        by_account.setdefault(issue.fields.reporter.accountId, set()).add(id(issue.fields.reporter))
+    assert len(by_account) == 2
+    assert all(len(ids) == 1 for ids in by_account.values())
+    assert len({id(issue.fields.project) for issue in issues}) == 1
+    assert cache.hits > 0
+
+
+def test_sharing_spans_pages_and_matches_unshared_results():
+    cache = JiraInternCache()
+    first = _parse(build_search_page(0, 5, users=1), cache).issues
+    second = _parse(build_search_page(5, 5, users=1), cache).issues
+    assert first[0].fields.reporter is second[0].fields.reporter
+    unshared = _parse(build_search_page(0, 5, users=1), None).issues
+    assert first == unshared
+    assert first[0].fields.reporter is not unshared[0].fields.reporter
+
+
+def test_same_id_with_different_content_is_not_shared():
+    cache = JiraInternCache()
+    context = {INTERN_CONTEXT_KEY: cache}
+    data = build_search_page(0, 1)["issues"][0]["fields"]["reporter"]
+    renamed = {**data, "displayName": "Renamed"}
+    first = JiraUser.model_validate(data, context=context)
+    assert JiraUser.model_validate(dict(data), context=context) is first
+    other = JiraUser.model_validate(renamed, context=context)
+    assert other is not first
+    assert other.displayName == "Renamed"
+
+
+def test_shared_instances_reject_mutation_but_copies_do_not():
+    cache = JiraInternCache()
+    reporter = _parse(build_search_page(0, 2, users=1), cache).issues[0].fields.reporter
+    assert reporter.interned
+    with pytest.raises(TypeError, match="model_copy"):
+        reporter.displayName = "changed"
+
+    copy = reporter.model_copy()
+    assert not copy.interned
+    copy.displayName = "changed"
+    assert reporter.displayName != "changed"
+
+    unshared = _parse(build_search_page(0, 1), None).issues[0].fields.reporter
+    assert not unshared.interned
+    unshared.displayName = "changed"
+
+
+def test_client_interns_entities_across_pages(mock_jira):
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token", intern_entities=True) as client:
+        issues = client.get_tickets_by_jql("project = PROJ", parse_mode=JiraParseModeEnum.FULL).issues
+    assert len(issues) == 20
+    assert len({id(issue.fields.project) for issue in issues}) == 1
+    assert all(issue.fields.project.interned for issue in issues)
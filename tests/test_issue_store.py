@@ -0,0 +1,69 @@
+import datetime
+import json
+import urllib.parse
+
+import pytest
+from fixtures import build_issue
+
+from jira_api_client.issue_store import JiraIssueStore
+from jira_api_client.jira_client import JiraClinet
+
+
+def _issue(n, updated, summary=None):
+    issue = build_issue(n)
+    issue["fields"]["updated"] = updated
+    if summary is not None:
+        issue["fields"]["summary"] = summary
+    return issue
+
+
+def _serve(jira_server, issues):
+    """search/jql に issues を1ページで返し、受け取ったJQLを記録します。"""
+    received = []
+
+    def handler(request):
+        received.append(urllib.parse.parse_qs(urllib.parse.urlsplit(request.path).query)["jql"][0])
+        return 200, {"Content-Type": "application/json"}, json.dumps({"issues": issues, "isLast": True}).encode()
+
+    jira_server.handler = handler
+    return received
+
+
+def test_sync_upserts_and_advances_the_watermark(jira_server):
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client, \
+            JiraIssueStore(":memory:", client) as store:
+        _serve(jira_server, [_issue(1, "2024-01-01T09:00:00.000+0900"), _issue(2, "2024-01-02T09:00:00.000+0900")])
+        assert store.sync("PROJ") == 2
+        assert store.watermark("PROJ") == datetime.datetime(2024, 1, 2, 0, 0, tzinfo=datetime.timezone.utc)
+
+        _serve(jira_server, [_issue(1, "2024-01-03T09:00:00.000+0900", summary="updated")])
+        assert store.sync("PROJ") == 1
+        assert store.count("PROJ") == 2
+        assert store.get("PROJ-1").fields.summary == "updated"
+        assert [issue.key for issue in store.iter_issues("PROJ")] == ["PROJ-1", "PROJ-2"]
+        assert store.watermark("PROJ") == datetime.datetime(2024, 1, 3, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def test_incremental_sync_uses_a_timezone_independent_jql(jira_server):
+    recent = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=-5))) - datetime.timedelta(minutes=30)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client, \
+            JiraIssueStore(":memory:", client) as store:
+        _serve(jira_server, [_issue(1, recent.strftime("%Y-%m-%dT%H:%M:%S.000%z"))])
+        store.sync("PROJ")
+        received = _serve(jira_server, [])
+        store.sync("PROJ", overlap=datetime.timedelta(minutes=5))
+        assert received[0] in ('project = "PROJ" AND updated >= "-35m" ORDER BY updated ASC',
+                               'project = "PROJ" AND updated >= "-36m" ORDER BY updated ASC')
+
+
+def test_unparseable_updated_raises_without_advancing(jira_server):
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client, \
+            JiraIssueStore(":memory:", client) as store:
+        _serve(jira_server, [_issue(1, "2024-01-01T09:00:00.000+0900")])
+        store.sync("PROJ")
+
+        _serve(jira_server, [_issue(2, "2024-01-05T09:00:00.000+0900"), _issue(3, "yesterday")])
+        with pytest.raises(ValueError, match="PROJ-3"):
+            store.sync("PROJ")
+        assert store.count("PROJ") == 1
+        assert store.watermark("PROJ") == datetime.datetime(2024, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
@@ -0,0 +1,49 @@
+import pytest
+
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.jql import issue_sort_key, key_range_partitions, split_order_by
+from jira_api_client.models.base import JiraParseModeEnum
+
+
+def _raw_issue(key, **fields):
+    return {"id": key.split("-")[1], "key": key, "fields": fields}
+
+
+@pytest.mark.parametrize("order_by", ["status ASC", "created DESC, assignee", "customfield_10016 DESC"])
+def test_unsortable_order_by_fails_before_any_request(jira_server, order_by):
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        issues = client.iter_tickets_by_jql_parallel(f"project = PROJ ORDER BY {order_by}", ["key < PROJ-10", ""])
+        with pytest.raises(ValueError, match="並び替えできません"):
+            next(issues)
+    assert jira_server.requests == []
+
+
+@pytest.mark.parametrize("jql, expected", [
+    ('summary ~ "sort order by date"', ('summary ~ "sort order by date"', "")),
+    ('summary ~ "sort order by date" ORDER BY key', ('summary ~ "sort order by date"', "key")),
+    ("text ~ 'a order by b' order  by created DESC", ("text ~ 'a order by b'", "created DESC")),
+    ("ORDER BY key", ("", "key")),
+])
+def test_split_order_by_ignores_quoted_text(jql, expected):
+    assert split_order_by(jql) == expected
+
+
+def test_sort_key_orders_keys_numerically_and_puts_missing_values_last():
+    sort_key = issue_sort_key("duedate DESC, key ASC")
+    due_dates = [("PROJ-10", None), ("PROJ-9", "2024-01-01"), ("PROJ-2", "2024-02-01"), ("PROJ-1", None)]
+    issues = [_raw_issue(key, duedate=due) for key, due in due_dates]
+    assert [issue["key"] for issue in sorted(issues, key=sort_key)] == ["PROJ-2", "PROJ-9", "PROJ-1", "PROJ-10"]
+
+
+def test_partitions_are_merged_in_order_without_duplicates(mock_jira):
+    # モックサーバーはJQLの条件を解釈しないため、全てのパーティションが同じ20件を返す (重複の除去を確認する)
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        issues = list(
+            client.iter_tickets_by_jql_parallel("project = PROJ ORDER BY key ASC",
+                                                key_range_partitions("PROJ", 1, 20, 3),
+                                                max_workers=2,
+                                                page_size=5,
+                                                parse_mode=JiraParseModeEnum.RAW))
+    keys = [issue["key"] for issue in issues]
+    assert len(keys) == len(set(keys)) == 20
+    assert keys == sorted(keys, key=lambda key: int(key.split("-")[1]))
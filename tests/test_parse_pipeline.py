@@ -0,0 +1,102 @@
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+import requests
+from fixtures import build_issue
+from pydantic import ValidationError
+
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.models.base import JiraParseModeEnum
+
+JQL = "project = PROJ"
+
+
+class ReversingExecutor(ThreadPoolExecutor):
+    """先に投入された解析ほど遅く完了させ、完了順と要求順を逆にする Executor。"""
+
+    def __init__(self, pages: int):
+        super().__init__(max_workers=pages)
+        self.__pages = pages
+        self.__submitted = itertools.count()
+        self.__lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        with self.__lock:
+            delay = 0.05 * max(self.__pages - next(self.__submitted), 0)
+
+        def delayed():
+            time.sleep(delay)
+            return fn(*args, **kwargs)
+
+        return super().submit(delayed)
+
+
+def _keys(client, **kwargs):
+    return [issue["key"] for issue in client.iter_tickets_by_jql(JQL, parse_mode=JiraParseModeEnum.RAW, **kwargs)]
+
+
+def test_pages_are_yielded_in_request_order(mock_jira):
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        expected = _keys(client, page_size=5)
+    with ReversingExecutor(pages=4) as executor, \
+            JiraClinet(mock_jira.base_url, "user@example.com", "token", parse_executor=executor) as client:
+        assert _keys(client, page_size=5) == expected
+        assert _keys(client, page_size=5, max_results=7) == expected[:7]
+    assert len(expected) == 20
+
+
+def test_process_pool_parses_full_models(mock_jira):
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        expected = list(client.iter_tickets_by_jql(JQL, page_size=10, parse_mode=JiraParseModeEnum.FULL))
+    with ProcessPoolExecutor(max_workers=1) as executor, \
+            JiraClinet(mock_jira.base_url, "user@example.com", "token", parse_executor=executor) as client:
+        issues = list(client.iter_tickets_by_jql(JQL, page_size=10, parse_mode=JiraParseModeEnum.FULL))
+    assert issues == expected
+
+
+def test_closing_early_stops_the_fetcher(jira_server):
+
+    def handler(request):
+        page = int(request.path.partition("nextPageToken=")[2] or 0)
+        body = {"issues": [build_issue(page)], "isLast": page == 9, "nextPageToken": str(page + 1)}
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+    jira_server.handler = handler
+    with ThreadPoolExecutor(max_workers=2) as executor, \
+            JiraClinet(jira_server.base_url, "user@example.com", "token", parse_executor=executor,
+                       parse_prefetch=1) as client:
+        pages = client.iter_pages(JQL, parse_mode=JiraParseModeEnum.RAW)
+        assert len(next(pages).issues) == 1
+        pages.close()
+        time.sleep(0.2)
+    # 消費した1ページと、先読みの上限 (1ページ) と受け渡しを待つ1ページを超えて要求しない
+    assert len(jira_server.requests) <= 3
+
+
+def _scripted_pages(jira_server, second_page):
+    first_page = {"issues": [build_issue(1)], "isLast": False, "nextPageToken": "2"}
+
+    def handler(request):
+        if "nextPageToken=2" in request.path:
+            return second_page
+        return 200, {"Content-Type": "application/json"}, json.dumps(first_page).encode()
+
+    jira_server.handler = handler
+
+
+@pytest.mark.parametrize("second_page, error", [
+    ((400, {}, b'{"errorMessages": ["bad token"]}'), requests.exceptions.HTTPError),
+    ((200, {}, b'{"issues": [{"id": "2"}], "isLast": true}'), ValidationError),
+])
+def test_errors_surface_after_the_pages_before_them(jira_server, second_page, error):
+    _scripted_pages(jira_server, second_page)
+    with ThreadPoolExecutor(max_workers=2) as executor, \
+            JiraClinet(jira_server.base_url, "user@example.com", "token", parse_executor=executor) as client:
+        pages = client.iter_pages(JQL, parse_mode=JiraParseModeEnum.FULL)
+        assert [issue.key for issue in next(pages).issues] == ["PROJ-1"]
+        with pytest.raises(error):
+            next(pages)
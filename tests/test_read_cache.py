@@ -0,0 +1,171 @@
+import threading
+import time
+
+from jira_api_client.instrumentation import JiraInMemoryMetricsCollector
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.models.base import JiraParseModeEnum, JiraStatusNameEnum
+from jira_api_client.read_cache import JiraReadCache
+
+JQL = "project = PROJ"
+
+
+def _search_count(metrics: JiraInMemoryMetricsCollector) -> int:
+    return sum(1 for event in metrics.requests if event.endpoint == "search")
+
+
+def test_writes_invalidate_cached_searches(mock_jira):
+    metrics = JiraInMemoryMetricsCollector()
+    with JiraClinet(mock_jira.base_url,
+                    "user@example.com",
+                    "token",
+                    read_cache=JiraReadCache(ttl=60.0),
+                    metrics=metrics) as client:
+        before = client.get_tickets_by_jql(JQL, parse_mode=JiraParseModeEnum.RAW)
+        client.get_tickets_by_jql(JQL, parse_mode=JiraParseModeEnum.RAW)
+        assert _search_count(metrics) == 2  # 2ページ (10件/ページ) を1回だけ取得
+
+        key = before.issues[0]["key"]
+        target = JiraStatusNameEnum.DONE if before.issues[0]["fields"]["status"]["name"] != "Done" \
+            else JiraStatusNameEnum.IN_PROGRESS
+        assert client.transition_issues([key], target).updated
+
+        after = client.get_tickets_by_jql(JQL, parse_mode=JiraParseModeEnum.RAW)
+        assert _search_count(metrics) == 4
+        assert after.issues[0]["fields"]["status"]["name"] == target.value
+
+
+def test_failed_writes_also_invalidate(mock_jira):
+    cache = JiraReadCache(ttl=60.0)
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token", read_cache=cache) as client:
+        client.get_tickets_by_jql(JQL, parse_mode=JiraParseModeEnum.RAW)
+        assert len(cache) == 1
+        result = client.edit_issues(["NOPE-1"], fields={"summary": "x"})
+        assert result.failed
+        assert len(cache) == 0
+
+
+def test_cached_results_are_copied_per_caller(mock_jira):
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token", read_cache=JiraReadCache(ttl=60.0)) as client:
+        first = client.get_tickets_by_jql(JQL)
+        first.issues[0].fields.summary = "changed by the first caller"
+        first.issues.clear()
+
+        second = client.get_tickets_by_jql(JQL)
+        assert len(second.issues) == 20
+        assert second.issues[0].fields.summary != "changed by the first caller"
+
+
+def test_copy_results_false_shares_instances(mock_jira):
+    with JiraClinet(mock_jira.base_url,
+                    "user@example.com",
+                    "token",
+                    read_cache=JiraReadCache(ttl=60.0, copy_results=False)) as client:
+        first = client.get_tickets_by_jql(JQL)
+        second = client.get_tickets_by_jql(JQL)
+        assert first is second
+
+
+def _blocking_loader(started, release, value, calls):
+
+    def loader():
+        calls.append(1)
+        started.set()
+        assert release.wait(5)
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    return loader
+
+
+def _run_concurrently(cache, key, loader, callers):
+    results = [None] * callers
+
+    def call(index):
+        try:
+            results[index] = cache.get_or_load(key, loader)
+        except BaseException as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(callers)]
+    return threads, results
+
+
+def _wait_for_waiters(cache, waiters):
+    deadline = time.monotonic() + 5
+    while cache.stats().coalesced < waiters:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_concurrent_lookups_share_one_load():
+    cache = JiraReadCache(ttl=60.0)
+    started, release, calls = threading.Event(), threading.Event(), []
+    threads, results = _run_concurrently(cache, ("k",), _blocking_loader(started, release, {"v": 1}, calls), 8)
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_for_waiters(cache, 7)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"v": 1}] * 8
+    assert len({id(result) for result in results}) == 8  # copy_results=True: 呼び出しごとの複製
+    stats = cache.stats()
+    assert (stats.misses, stats.coalesced, stats.hits) == (1, 7, 0)
+    assert cache.get_or_load(("k",), lambda: {"v": 2}) == {"v": 1}
+    assert cache.stats().hits == 1
+
+
+def test_load_errors_are_shared_with_waiters_and_not_cached():
+    cache = JiraReadCache(ttl=60.0)
+    started, release, calls = threading.Event(), threading.Event(), []
+    error = RuntimeError("boom")
+    threads, results = _run_concurrently(cache, ("k",), _blocking_loader(started, release, error, calls), 3)
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_for_waiters(cache, 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is error for result in results)
+    assert len(cache) == 0
+    assert cache.get_or_load(("k",), lambda: "retried") == "retried"
+
+
+def test_clear_during_a_load_does_not_cache_the_stale_result():
+    cache = JiraReadCache(ttl=60.0)
+    started, release, calls = threading.Event(), threading.Event(), []
+    threads, results = _run_concurrently(cache, ("k",), _blocking_loader(started, release, "stale", calls), 1)
+    threads[0].start()
+    assert started.wait(5)
+    cache.clear()
+    release.set()
+    threads[0].join()
+
+    assert results == ["stale"]
+    assert len(cache) == 0
+    assert cache.get_or_load(("k",), lambda: "fresh") == "fresh"
+
+
+def test_entries_expire_and_are_evicted_least_recently_used(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = JiraReadCache(ttl=10.0, max_entries=2)
+    for key in ("a", "b"):
+        cache.get_or_load((key,), lambda key=key: key)
+    cache.get_or_load(("a",), lambda: "unused")  # a を最近使ったエントリにする
+    cache.get_or_load(("c",), lambda: "c")
+    assert cache.get_or_load(("b",), lambda: "reloaded") == "reloaded"
+    assert cache.stats().evictions == 2
+
+    now[0] += 11.0
+    assert cache.get_or_load(("c",), lambda: "expired") == "expired"
+    assert cache.stats().expirations == 1
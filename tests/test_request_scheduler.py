@@ -0,0 +1,139 @@
+import datetime
+import email.utils
+
+import pytest
+import requests
+
+from jira_api_client import request_scheduler
+from jira_api_client.request_scheduler import JiraRequestScheduler, JiraTokenBucket
+
+
+class FakeClock(object):
+    """time.monotonic() と time.sleep() の代わりに、待機せずに時刻を進める時計。"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse(object):
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(request_scheduler.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(request_scheduler.time, "sleep", fake.sleep)
+    # Retry-After に加えるジッターを固定する
+    monkeypatch.setattr(request_scheduler.random, "uniform", lambda low, high: high)
+    return fake
+
+
+def _replies(*responses):
+    sent = []
+    iterator = iter(responses)
+
+    def send():
+        response = next(iterator)
+        sent.append(response)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return send, sent
+
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    bucket = JiraTokenBucket(rate=10.0, capacity=2)
+    assert [bucket.reserve() for _ in range(4)] == pytest.approx([0.0, 0.0, 0.1, 0.2])
+    clock.now += 0.35  # 3.5トークン分補充され、予約済みの2つを返済して1.5残る
+    assert bucket.reserve() == 0.0
+    assert bucket.acquire() == pytest.approx(0.05)
+    assert clock.sleeps == [pytest.approx(0.05)]
+
+
+def test_token_bucket_rejects_a_non_positive_rate():
+    with pytest.raises(ValueError):
+        JiraTokenBucket(rate=0)
+
+
+def test_429_waits_for_retry_after_and_blocks_other_requests(clock):
+    scheduler = JiraRequestScheduler(backoff_base=0.5)
+    send, sent = _replies(FakeResponse(429, {"Retry-After": "3"}), FakeResponse(201))
+    response = scheduler.send("POST", send)
+    assert response.status_code == 201
+    assert sent[0].closed
+    assert clock.sleeps == [pytest.approx(3.5)]
+
+    # 制限を受けている間は、他のリクエストも解除まで待機する
+    scheduler._block_for(2.0)
+    assert scheduler._slot_delay() == pytest.approx(2.0)
+
+
+def test_retry_after_http_date_and_rate_limit_reset(clock):
+    retry_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+    assert request_scheduler._parse_retry_after(email.utils.format_datetime(retry_at)) == pytest.approx(30, abs=1.5)
+    assert request_scheduler._parse_retry_after("-5") == 0.0
+    assert request_scheduler._parse_retry_after("soon") is None
+    reset = retry_at.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+    assert request_scheduler._parse_rate_limit_reset(reset) == pytest.approx(30, abs=1.5)
+    assert request_scheduler._parse_rate_limit_reset("not a date") is None
+
+
+def test_exhausted_rate_limit_blocks_until_reset(clock):
+    scheduler = JiraRequestScheduler(backoff_max=60.0)
+    reset = (datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=20)).isoformat()
+    send, _ = _replies(FakeResponse(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}))
+    assert scheduler.send("GET", send).status_code == 200
+    assert scheduler._slot_delay() == pytest.approx(20, abs=1.5)
+
+
+def test_5xx_is_retried_only_for_idempotent_requests(clock):
+    scheduler = JiraRequestScheduler(backoff_base=0.25)
+    send, sent = _replies(FakeResponse(503), FakeResponse(200))
+    assert scheduler.send("GET", send).status_code == 200
+    assert len(sent) == 2 and clock.sleeps == [0.25]
+
+    send, sent = _replies(FakeResponse(503), FakeResponse(201))
+    assert scheduler.send("POST", send).status_code == 503
+    assert len(sent) == 1
+
+    send, sent = _replies(FakeResponse(503), FakeResponse(201))
+    assert scheduler.send("POST", send, retryable=True).status_code == 201
+
+
+def test_connection_errors_are_retried_only_for_idempotent_requests(clock):
+    scheduler = JiraRequestScheduler()
+    send, sent = _replies(requests.exceptions.ConnectionError("reset"), FakeResponse(200))
+    assert scheduler.send("PUT", send).status_code == 200
+    assert len(sent) == 2
+
+    send, _ = _replies(requests.exceptions.ConnectionError("reset"), FakeResponse(201))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        scheduler.send("POST", send)
+
+
+def test_retries_stop_after_max_retries_or_for_non_replayable_bodies(clock):
+    scheduler = JiraRequestScheduler(max_retries=2)
+    send, sent = _replies(*(FakeResponse(429) for _ in range(3)))
+    assert scheduler.send("GET", send).status_code == 429
+    assert len(sent) == 3 and len(clock.sleeps) == 2
+
+    send, sent = _replies(FakeResponse(429), FakeResponse(200))
+    assert scheduler.send("POST", send, replayable=False).status_code == 429
+    assert len(sent) == 1
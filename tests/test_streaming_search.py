@@ -0,0 +1,93 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+from fixtures import build_issue
+
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.models.base import JiraParseModeEnum
+
+JQL = "project = PROJ"
+PAGES = 3
+PAGE_SIZE = 2
+
+
+def _query(request):
+    return {name: values[0] for name, values in parse_qs(urlparse(request.path).query).items()}
+
+
+def _serve_pages(jira_server):
+    """PAGES ページ (1ページ PAGE_SIZE 件) の検索結果を nextPageToken で返します。"""
+
+    def handler(request):
+        page = int(_query(request).get("nextPageToken", 0))
+        issues = [build_issue(page * PAGE_SIZE + n) for n in range(PAGE_SIZE)]
+        body = {"issues": issues, "isLast": page == PAGES - 1}
+        if page < PAGES - 1:
+            body["nextPageToken"] = str(page + 1)
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+    jira_server.handler = handler
+
+
+def _tokens(jira_server):
+    return [_query(request).get("nextPageToken") for request in jira_server.requests]
+
+
+def test_pages_are_requested_one_at_a_time(jira_server):
+    _serve_pages(jira_server)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        pages = client.iter_pages(JQL, page_size=PAGE_SIZE)
+        assert jira_server.requests == []  # 最初の next() まで送信しない
+        first = next(pages)
+        assert [issue.key for issue in first.issues] == ["PROJ-0", "PROJ-1"]
+        assert _tokens(jira_server) == [None]
+        next(pages)
+        # 次のページは前のページの nextPageToken で要求される
+        assert _tokens(jira_server) == [None, "1"]
+        assert len(list(pages)) == 1
+    assert _tokens(jira_server) == [None, "1", "2"]
+    assert _query(jira_server.requests[0])["jql"] == JQL
+
+
+def test_issues_are_yielded_as_each_page_arrives(jira_server):
+    _serve_pages(jira_server)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        issues = client.iter_tickets_by_jql(JQL, page_size=PAGE_SIZE, parse_mode=JiraParseModeEnum.RAW)
+        assert [next(issues)["key"], next(issues)["key"]] == ["PROJ-0", "PROJ-1"]
+        assert len(jira_server.requests) == 1  # 1ページ目の課題は2ページ目を待たずに返される
+        assert next(issues)["key"] == "PROJ-2"
+        assert len(jira_server.requests) == 2
+        assert [issue["key"] for issue in issues] == ["PROJ-3", "PROJ-4", "PROJ-5"]
+
+
+def test_iter_tickets_streams_the_project_search(jira_server):
+    _serve_pages(jira_server)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        issues = client.iter_tickets("PROJ", parse_mode=JiraParseModeEnum.RAW)
+        assert next(issues)["key"] == "PROJ-0"
+        assert len(jira_server.requests) == 1
+        assert "PROJ" in _query(jira_server.requests[0])["jql"]
+        assert len(list(issues)) == PAGES * PAGE_SIZE - 1
+
+
+def test_closing_early_sends_no_further_requests(jira_server):
+    _serve_pages(jira_server)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        issues = client.iter_tickets_by_jql(JQL, page_size=PAGE_SIZE, parse_mode=JiraParseModeEnum.RAW)
+        assert next(issues)["key"] == "PROJ-0"
+        issues.close()
+        assert list(issues) == []
+
+        pages = client.iter_pages(JQL, page_size=PAGE_SIZE)
+        for page in pages:
+            break
+        pages.close()
+    assert _tokens(jira_server) == [None, None]
+
+
+def test_max_results_truncates_the_last_page_and_stops(jira_server):
+    _serve_pages(jira_server)
+    with JiraClinet(jira_server.base_url, "user@example.com", "token") as client:
+        keys = [issue.key for issue in client.iter_tickets_by_jql(JQL, max_results=3, page_size=PAGE_SIZE)]
+    assert keys == ["PROJ-0", "PROJ-1", "PROJ-2"]
+    assert _tokens(jira_server) == [None, "1"]
@@ -0,0 +1,138 @@
+import email.parser
+import io
+import os
+import threading
+
+from jira_api_client.jira_client import JiraClinet
+from jira_api_client.multipart import MultipartUploadBody, build_upload_parts
+
+DATA = bytes(range(256)) * 1024  # パイプのバッファ (64KiB) を超えるサイズ
+
+
+def _parts(body):
+    """ボディを最後まで読み出し、(ファイル名, Content-Type, データ) のリストに戻します。"""
+    payload = b"".join(bytes(chunk) for chunk in body)
+    header = f"Content-Type: {body.content_type}\r\n\r\n".encode()
+    message = email.parser.BytesParser().parsebytes(header + payload)
+    return [(part.get_filename(), part.get_content_type(), part.get_payload(decode=True))
+            for part in message.get_payload()]
+
+
+def _pipe(data):
+    """data を別スレッドから書き込むパイプの読み出し側を返します。"""
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with os.fdopen(write_fd, "wb") as f:
+            f.write(data)
+
+    threading.Thread(target=write, daemon=True).start()
+    return os.fdopen(read_fd, "rb")
+
+
+class CountingReader(object):
+    """読み出したバイト数を tell() で返すラッパー (進捗表示用のラッパーなど)。seek はできません。"""
+
+    def __init__(self, f):
+        self.f = f
+        self.position = 0
+
+    def fileno(self):
+        return self.f.fileno()
+
+    def tell(self):
+        return self.position
+
+    def seekable(self):
+        return False
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.position += len(data)
+        return data
+
+
+def _upload(mock_jira, files, **kwargs):
+    with JiraClinet(mock_jira.base_url, "user@example.com", "token") as client:
+        return client.upload_attachments("PROJ-1", files, **kwargs)
+
+
+def test_pipe_is_sent_with_chunked_transfer(mock_jira):
+    with _pipe(DATA) as source:
+        body = MultipartUploadBody(build_upload_parts([("stdin.bin", source)]), chunk_size=4096)
+        # fstat の st_size はパイプの内容のサイズではないため、サイズ不明 (chunked 転送) になる
+        assert body.total_size is None and len(body) == 0
+        assert not body.replayable
+        assert _parts(body) == [("stdin.bin", "application/octet-stream", DATA)]
+
+    with _pipe(DATA) as source:
+        attachments = _upload(mock_jira, [("stdin.bin", source)], chunk_size=4096)
+    assert [(item.filename, item.size) for item in attachments] == [("stdin.bin", len(DATA))]
+
+    # tell() が例外にならないラッパーでも、パイプのバッファ内のバイト数をサイズとして扱わない
+    with _pipe(DATA) as source:
+        reader = CountingReader(source)
+        source.peek()  # 書き込みを待ち、パイプに未読のデータがある状態にする
+        assert build_upload_parts([("stdin.bin", reader)])[0].size is None
+        attachments = _upload(mock_jira, [("stdin.bin", reader)])
+    assert attachments[0].size == len(DATA)
+
+
+def test_file_objects_use_the_remaining_size(tmp_path):
+    path = tmp_path / "report.bin"
+    path.write_bytes(DATA)
+    with open(path, "rb") as f:
+        f.seek(1000)
+        stream = io.BytesIO(DATA)
+        stream.seek(2000)
+        parts = build_upload_parts([f, ("memory.bin", stream)])
+        assert [part.size for part in parts] == [len(DATA) - 1000, len(DATA) - 2000]
+        body = MultipartUploadBody(parts)
+        assert [(name, data) for name, _, data in _parts(body)] == [("report.bin", DATA[1000:]),
+                                                                    ("memory.bin", DATA[2000:])]
+
+
+def test_buffers_are_sent_without_copies_and_can_be_replayed():
+    view = memoryview(bytearray(DATA))
+    body = MultipartUploadBody(build_upload_parts([("a.bin", DATA), ("b.bin", view, "image/png")]), chunk_size=4096)
+    assert body.replayable
+    assert all(isinstance(chunk, (bytes, memoryview)) for chunk in body)
+    first = _parts(body)
+    assert first == [("a.bin", "application/octet-stream", DATA), ("b.bin", "image/png", DATA)]
+    assert _parts(body) == first
+    assert body.total_size == body.bytes_sent
+
+
+def test_chunk_iterables_have_unknown_size(mock_jira):
+    chunks = [DATA[offset:offset + 5000] for offset in range(0, len(DATA), 5000)]
+    body = MultipartUploadBody(build_upload_parts([("chunks.bin", iter(chunks))]))
+    assert body.total_size is None and not body.replayable
+    assert _parts(body)[0][2] == DATA
+
+    attachments = _upload(mock_jira, [("chunks.bin", iter(chunks))])
+    assert attachments[0].size == len(DATA)
+
+
+def test_multiple_files_in_one_request(mock_jira, tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"notes")
+    attachments = _upload(mock_jira, [str(path), ("data.bin", DATA), ("empty.bin", b"", "text/plain")])
+    assert [(item.filename, item.size) for item in attachments] == [("notes.txt", 5), ("data.bin", len(DATA)),
+                                                                    ("empty.bin", 0)]
+    assert attachments[2].mimeType == "text/plain"
+
+
+def test_progress_callback_reports_every_chunk(mock_jira):
+    calls = []
+    _upload(mock_jira, [("data.bin", DATA)],
+            chunk_size=65536,
+            progress_callback=lambda sent, total: calls.append((sent, total)))
+    sent = [call[0] for call in calls]
+    assert sent == sorted(sent) and len(calls) >= len(DATA) // 65536
+    total = calls[-1][1]
+    assert calls[-1] == (total, total) and all(call[1] == total for call in calls)
+
+    calls.clear()
+    with _pipe(DATA) as source:
+        _upload(mock_jira, [("stdin.bin", source)], progress_callback=lambda sent, total: calls.append((sent, total)))
+    assert calls[-1][0] > len(DATA) and all(call[1] is None for call in calls)